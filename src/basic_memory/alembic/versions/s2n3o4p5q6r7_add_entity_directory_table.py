@@ -0,0 +1,90 @@
+"""Add the materialized entity directory index.
+
+Revision ID: s2n3o4p5q6r7
+Revises: 2d26b287813b
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+import posixpath
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+
+revision: str = "s2n3o4p5q6r7"
+down_revision: Union[str, None] = "2d26b287813b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create entity_directory and backfill it from existing entity paths."""
+    entity_directory = op.create_table(
+        "entity_directory",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("parent_path", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.Column("file_count", sa.Integer(), nullable=False),
+        sa.Column("total_file_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uix_entity_directory_project_path",
+        "entity_directory",
+        ["project_id", "path"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_entity_directory_project_parent",
+        "entity_directory",
+        ["project_id", "parent_path"],
+        unique=False,
+    )
+
+    # Counts per (project_id, directory): [files directly in it, files in its subtree]
+    counts: dict[tuple[int, str], list[int]] = defaultdict(lambda: [0, 0])
+    for project_id, file_path in op.get_bind().execute(
+        text("SELECT project_id, file_path FROM entity")
+    ):
+        directory = posixpath.dirname(file_path)
+        if not directory:
+            continue
+        counts[(project_id, directory)][0] += 1
+        parts = directory.split("/")
+        for depth in range(1, len(parts) + 1):
+            counts[(project_id, "/".join(parts[:depth]))][1] += 1
+
+    now = datetime.now(timezone.utc)
+    op.bulk_insert(
+        entity_directory,
+        [
+            {
+                "project_id": project_id,
+                "path": path,
+                "parent_path": posixpath.dirname(path),
+                "name": posixpath.basename(path),
+                "depth": path.count("/") + 1,
+                "file_count": file_count,
+                "total_file_count": total_file_count,
+                "updated_at": now,
+            }
+            for (project_id, path), (file_count, total_file_count) in sorted(counts.items())
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Drop the entity directory index."""
+    op.drop_index("ix_entity_directory_project_parent", table_name="entity_directory")
+    op.drop_index("uix_entity_directory_project_path", table_name="entity_directory")
+    op.drop_table("entity_directory")
@@ -6,6 +6,7 @@ Import endpoints use project_id in the path for consistency with other v2 endpoi
 
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from contextlib import nullcontext
 
 from fastapi import APIRouter, Form, HTTPException, Path, UploadFile, status
@@ -18,7 +19,14 @@ from basic_memory.deps import (
     MemoryJsonImporterV2ExternalDep,
     ReadCacheDep,
 )
-from basic_memory.importers import Importer
+from basic_memory.importers import (
+    Importer,
+    ImportSourceTooLargeError,
+    InvalidImportSourceError,
+    iter_json_array,
+    iter_json_lines,
+)
+from basic_memory.importers.streaming import ImportSource
 from basic_memory.read_cache import ReadCache, invalidate_cache
 from basic_memory.schemas.importer import (
     ChatImportResult,
@@ -31,6 +39,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/import", tags=["import-v2"])
 
+# Turns an upload into the source an importer consumes, enforcing the size cap.
+type ImportSourceLoader = Callable[[UploadFile, int], Awaitable[ImportSource]]
+
+RESUME_FROM_DESCRIPTION = (
+    "Number of leading items to skip. Pass the resume_from value reported by an "
+    "interrupted import of the same file to continue where it stopped."
+)
+
 
 async def read_import_upload(file: UploadFile, max_bytes: int) -> bytes:
     """Read an import upload with a hard cap before JSON parsing."""
@@ -43,6 +59,33 @@ async def read_import_upload(file: UploadFile, max_bytes: int) -> bytes:
     return content
 
 
+def check_import_upload_size(file: UploadFile, max_bytes: int) -> None:
+    """Reject an upload whose size is known to exceed the cap before anything is written.
+
+    Streamed sources also count bytes as they read, which covers uploads without
+    a known size, but by then earlier items may already be imported.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise ImportSourceTooLargeError(max_bytes)
+
+
+async def load_json_upload(file: UploadFile, max_bytes: int) -> ImportSource:
+    """Read and decode a whole JSON upload at once."""
+    return json.loads(await read_import_upload(file, max_bytes))
+
+
+async def stream_json_array_upload(file: UploadFile, max_bytes: int) -> ImportSource:
+    """Stream a JSON array upload one item at a time (ChatGPT and Claude chat exports)."""
+    check_import_upload_size(file, max_bytes)
+    return iter_json_array(file.read, max_bytes=max_bytes)
+
+
+async def stream_json_lines_upload(file: UploadFile, max_bytes: int) -> ImportSource:
+    """Stream a line-delimited JSON upload one line at a time (memory.json)."""
+    check_import_upload_size(file, max_bytes)
+    return iter_json_lines(file.read, max_bytes=max_bytes)
+
+
 @router.post("/chatgpt", response_model=ChatImportResult)
 async def import_chatgpt(
     importer: ChatGPTImporterV2ExternalDep,
@@ -51,13 +94,18 @@ async def import_chatgpt(
     read_cache: ReadCacheDep,
     project_id: str = Path(..., description="Project external UUID"),
     directory: str = Form("conversations"),
+    resume_from: int = Form(0, ge=0, description=RESUME_FROM_DESCRIPTION),
 ) -> ChatImportResult:
     """Import conversations from ChatGPT JSON export.
 
+    The export is parsed one conversation at a time, so its size does not
+    determine the memory an import needs.
+
     Args:
         project_id: Project external UUID from URL path
         file: The ChatGPT conversations.json file.
         directory: The directory to place the files in.
+        resume_from: Number of leading conversations to skip.
         importer: ChatGPT importer instance.
 
     Returns:
@@ -74,6 +122,8 @@ async def import_chatgpt(
         config.import_upload_max_bytes,
         read_cache=read_cache,
         project_external_id=project_id,
+        load_source=stream_json_array_upload,
+        resume_from=resume_from,
     )
 
 
@@ -85,13 +135,18 @@ async def import_claude_conversations(
     read_cache: ReadCacheDep,
     project_id: str = Path(..., description="Project external UUID"),
     directory: str = Form("conversations"),
+    resume_from: int = Form(0, ge=0, description=RESUME_FROM_DESCRIPTION),
 ) -> ChatImportResult:
     """Import conversations from Claude conversations.json export.
 
+    The export is parsed one conversation at a time, so its size does not
+    determine the memory an import needs.
+
     Args:
         project_id: Project external UUID from URL path
         file: The Claude conversations.json file.
         directory: The directory to place the files in.
+        resume_from: Number of leading conversations to skip.
         importer: Claude conversations importer instance.
 
     Returns:
@@ -108,6 +163,8 @@ async def import_claude_conversations(
         config.import_upload_max_bytes,
         read_cache=read_cache,
         project_external_id=project_id,
+        load_source=stream_json_array_upload,
+        resume_from=resume_from,
     )
 
 
@@ -153,6 +210,7 @@ async def import_memory_json(
     read_cache: ReadCacheDep,
     project_id: str = Path(..., description="Project external UUID"),
     directory: str = Form("conversations"),
+    resume_from: int = Form(0, ge=0, description=RESUME_FROM_DESCRIPTION),
 ) -> EntityImportResult:
     """Import entities and relations from a memory.json file.
 
@@ -160,6 +218,7 @@ async def import_memory_json(
         project_id: Project external UUID from URL path
         file: The memory.json file.
         directory: Optional destination directory within the project.
+        resume_from: Number of leading entities to skip.
         importer: Memory JSON importer instance.
 
     Returns:
@@ -169,44 +228,16 @@ async def import_memory_json(
         HTTPException: If import fails.
     """
     logger.info(f"V2 Importing memory.json for project {project_id}")
-    try:
-        file_data = []
-        file_bytes = await read_import_upload(file, config.import_upload_max_bytes)
-        file_str = file_bytes.decode("utf-8")
-        for line in file_str.splitlines():
-            json_data = json.loads(line)
-            file_data.append(json_data)
-
-        result = await run_import_with_invalidation(
-            importer,
-            file_data,
-            directory,
-            read_cache=read_cache,
-            project_external_id=project_id,
-        )
-        if not result.success:  # pragma: no cover
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.error_message or "Import failed",
-            )
-    except HTTPException:
-        raise
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
-        # Trigger: a line in the upload is not valid JSON, or the bytes are not
-        #   UTF-8 (truncated archive, wrong file, binary upload).
-        # Why: this is a client-input problem, not a server fault (#1276).
-        # Outcome: a 400 with the parse position instead of an opaque 500.
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Import file is not valid JSON: {e}",
-        )
-    except Exception as e:
-        logger.exception("V2 Import failed")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Import failed: {str(e)}",
-        )
-    return result
+    return await import_file(
+        importer,
+        file,
+        directory,
+        config.import_upload_max_bytes,
+        read_cache=read_cache,
+        project_external_id=project_id,
+        load_source=stream_json_lines_upload,
+        resume_from=resume_from,
+    )
 
 
 async def import_file[ImportResultT: ImportResult](
@@ -217,6 +248,8 @@ async def import_file[ImportResultT: ImportResult](
     *,
     read_cache: ReadCache | None,
     project_external_id: str,
+    load_source: ImportSourceLoader = load_json_upload,
+    resume_from: int = 0,
 ) -> ImportResultT:
     """Helper function to import a file using an importer instance.
 
@@ -225,6 +258,9 @@ async def import_file[ImportResultT: ImportResult](
         file: The file to import
         destination_directory: Destination directory for imported content
         max_bytes: Maximum upload size in bytes; raises HTTP 413 if exceeded
+        load_source: Turns the upload into the importer's source; decodes the
+            whole file by default, or streams it item by item
+        resume_from: Number of leading source items to skip
 
     Returns:
         Import result from the importer
@@ -234,33 +270,43 @@ async def import_file[ImportResultT: ImportResult](
     """
     try:
         # Process file
-        upload_bytes = await read_import_upload(file, max_bytes)
-        json_data = json.loads(upload_bytes)
+        source_data = await load_source(file, max_bytes)
         result = await run_import_with_invalidation(
             importer,
-            json_data,
+            source_data,
             destination_directory,
             read_cache=read_cache,
             project_external_id=project_external_id,
+            resume_from=resume_from,
         )
-        if not result.success:  # pragma: no cover
+        if not result.success:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.error_message or "Import failed",
+                detail=import_error_detail(
+                    result.error_message or "Import failed", result.resume_from
+                ),
             )
 
         return result
 
     except HTTPException:
         raise
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+    except ImportSourceTooLargeError as e:
+        # Streamed uploads only find out they are too large while being read.
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=import_error_detail(str(e), _advanced_checkpoint(e, resume_from)),
+        )
+    except (json.JSONDecodeError, UnicodeDecodeError, InvalidImportSourceError) as e:
         # Trigger: the upload is not valid JSON, or the bytes are not UTF-8
         #   (truncated archive, wrong file, binary upload).
         # Why: this is a client-input problem, not a server fault (#1276).
         # Outcome: a 400 with the parse position instead of an opaque 500.
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Import file is not valid JSON: {e}",
+            detail=import_error_detail(
+                f"Import file is not valid JSON: {e}", _advanced_checkpoint(e, resume_from)
+            ),
         )
     except Exception as e:
         logger.exception("V2 Import failed")
@@ -270,6 +316,25 @@ async def import_file[ImportResultT: ImportResult](
         )
 
 
+def import_error_detail(message: str, resume_from: int | None) -> str | dict[str, object]:
+    """Build an import error detail, structured when the import can be resumed.
+
+    Failures with nothing committed keep the plain message; otherwise the detail
+    also carries the ``resume_from`` to pass when retrying the same file.
+    """
+    if resume_from is None:
+        return message
+    return {"message": message, "resume_from": resume_from}
+
+
+def _advanced_checkpoint(error: Exception, resume_from: int) -> int | None:
+    """Return the checkpoint a source error reached past ``resume_from``, if any."""
+    checkpoint = getattr(error, "checkpoint", None)
+    if checkpoint is None or checkpoint <= resume_from:
+        return None
+    return checkpoint
+
+
 async def run_import_with_invalidation[ImportResultT: ImportResult](
     importer: Importer[ImportResultT],
     source_data: object,
@@ -277,9 +342,10 @@ async def run_import_with_invalidation[ImportResultT: ImportResult](
     *,
     read_cache: ReadCache | None,
     project_external_id: str,
+    resume_from: int = 0,
 ) -> ImportResultT:
     """Run one import attempt and invalidate files it may have written."""
-    # Importers write files one at a time and may return a failed result after
+    # Importers write files incrementally and may return a failed result after
     # earlier writes. Invalidate every attempted import so cached file-first
     # resources cannot survive either success or partial failure.
     invalidation_scope = (
@@ -288,4 +354,6 @@ async def run_import_with_invalidation[ImportResultT: ImportResult](
         else nullcontext()
     )
     async with invalidation_scope:
-        return await importer.import_data(source_data, destination_directory)
+        return await importer.import_data(
+            source_data, destination_directory, resume_from=resume_from
+        )
@@ -10,14 +10,16 @@ Key improvements:
 - Simplified caching strategies
 """
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from contextlib import nullcontext
 from hashlib import sha256
+import json
 import os
 import pathlib
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Response, Path, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, Path, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 import logfire
@@ -236,6 +238,134 @@ async def get_graph(
         return GraphResponse(nodes=nodes, edges=edges)
 
 
+GRAPH_EXPORT_MEDIA_TYPE = "application/x-ndjson"
+GRAPH_EXPORT_DEFAULT_LIMIT = 5000
+GRAPH_EXPORT_MAX_LIMIT = 50000
+
+
+def _parse_graph_cursor(cursor: str | None) -> tuple[str, int]:
+    """Split a graph export cursor into its section ("n" or "e") and last-seen id."""
+    if cursor is None:
+        return "n", 0
+    section, _, last_id = cursor.partition(":")
+    if section not in ("n", "e") or not last_id.isdigit():
+        raise HTTPException(status_code=400, detail=f"Invalid graph export cursor: {cursor!r}")
+    return section, int(last_id)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Apply If-None-Match's weak comparison against ``etag``."""
+    if if_none_match is None:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _graph_export_lines(
+    generation: str,
+    nodes: list[tuple[int, str, str, str, str]],
+    edges: list[tuple[int, int, int, str]],
+    next_cursor: str | None,
+) -> Iterator[bytes]:
+    yield _ndjson_line({"kind": "header", "generation": generation})
+    for node_id, external_id, title, note_type, file_path in nodes:
+        yield _ndjson_line(
+            {
+                "kind": "node",
+                "id": node_id,
+                "external_id": external_id,
+                "title": title,
+                "note_type": note_type,
+                "file_path": file_path,
+            }
+        )
+    for _, from_id, to_id, relation_type in edges:
+        yield _ndjson_line(
+            {"kind": "edge", "from": from_id, "to": to_id, "relation_type": relation_type}
+        )
+    yield _ndjson_line({"kind": "end", "next_cursor": next_cursor})
+
+
+def _ndjson_line(record: Mapping[str, object]) -> bytes:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+@router.get(
+    "/graph/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {GRAPH_EXPORT_MEDIA_TYPE: {}}}, 304: {}},
+)
+async def export_graph(
+    project_id: ProjectExternalIdPathDep,
+    entity_repository: EntityRepositoryV2ExternalDep,
+    relation_repository: RelationRepositoryV2ExternalDep,
+    session: SessionDep,
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page's end record; omit for the first page"
+    ),
+    limit: int = Query(
+        GRAPH_EXPORT_DEFAULT_LIMIT,
+        ge=1,
+        le=GRAPH_EXPORT_MAX_LIMIT,
+        description="Maximum node and edge records in this page",
+    ),
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
+    """Export the knowledge graph as paged NDJSON for visualizers.
+
+    Each page is a ``header`` record carrying the graph generation, then ``node``
+    records (all nodes come before any edge, ordered by id), then ``edge``
+    records that reference nodes by their integer ``id``, then an ``end`` record
+    whose ``next_cursor`` fetches the following page (null on the last one).
+
+    Rows are read as a column projection and encoded one line at a time, so
+    neither ORM entities nor a whole-graph response body are held in memory.
+    The ETag is the graph generation: pollers send ``If-None-Match`` and get
+    304 until an entity or resolved relation changes.
+    """
+    with logfire.span(
+        "api.request.knowledge.export_graph",
+        entrypoint="api",
+        domain="knowledge",
+        action="export_graph",
+    ):
+        section, after_id = _parse_graph_cursor(cursor)
+
+        node_version = await entity_repository.get_graph_node_version(session)
+        edge_version = await relation_repository.get_graph_edge_version(session)
+        generation = sha256(repr((node_version, edge_version)).encode()).hexdigest()[:32]
+        etag = f'W/"graph-{generation}"'
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"etag": etag})
+
+        nodes: list[tuple[int, str, str, str, str]] = []
+        edges: list[tuple[int, int, int, str]] = []
+        next_cursor = None
+        if section == "n":
+            nodes = await entity_repository.find_graph_nodes(
+                session, after_id=after_id, limit=limit
+            )
+            if len(nodes) == limit:
+                next_cursor = f"n:{nodes[-1][0]}"
+            after_id = 0
+        if next_cursor is None:
+            # Nodes are exhausted; fill the rest of the page with edges.
+            edges = await relation_repository.find_graph_edges(
+                session, after_id=after_id, limit=limit - len(nodes)
+            )
+            if len(nodes) + len(edges) == limit:
+                next_cursor = f"e:{edges[-1][0]}"
+
+        logger.info(
+            f"API v2 response: graph export page with {len(nodes)} nodes and {len(edges)} edges"
+        )
+        return StreamingResponse(
+            _graph_export_lines(generation, nodes, edges, next_cursor),
+            media_type=GRAPH_EXPORT_MEDIA_TYPE,
+            headers={"etag": etag},
+        )
+
+
 ## Orphan entities endpoint
 
 
@@ -1181,11 +1311,12 @@ async def move_directory(
             )
             async with invalidation_scope:
                 # Reindex moved entities
+                async with db.scoped_session(session_maker) as session:
+                    moved_entities = await entity_service.link_resolver.resolve_links(
+                        result.moved_files, session=session
+                    )
                 for file_path in result.moved_files:
-                    async with db.scoped_session(session_maker) as session:
-                        entity = await entity_service.link_resolver.resolve_link(
-                            file_path, session=session
-                        )
+                    entity = moved_entities.get(file_path)
                     if entity:
                         await search_service.index_entity(entity)
                         _schedule_post_write_followups(
@@ -571,6 +571,7 @@ def _run_webdav_directional_transfer(
             conflict_suffix=datetime.now().strftime("%Y%m%d-%H%M%S"),
             dry_run=dry_run,
             verbose=verbose,
+            concurrency=config.cloud_transfer_concurrency,
         )
     )
 
@@ -9,7 +9,7 @@ import aiofiles
 import httpx
 
 from basic_memory.cli.commands.cloud.webdav import webdav_path
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.ignore_utils import compile_ignore_patterns, load_gitignore_patterns
 from basic_memory.mcp.async_client import get_client
 
 # Archive file extensions that should be skipped during upload
@@ -210,6 +210,7 @@ def _get_files_to_upload(
 
     # Load ignore patterns from .bmignore and optionally .gitignore
     ignore_patterns = load_gitignore_patterns(directory, use_gitignore=use_gitignore)
+    ignore_matcher = compile_ignore_patterns(ignore_patterns)
 
     if verbose:
         gitignore_path = directory / ".gitignore"
@@ -230,7 +231,7 @@ def _get_files_to_upload(
         filtered_dirs = []
         for d in dirs:
             dir_path = root_path / d
-            if should_ignore_path(dir_path, directory, ignore_patterns):
+            if ignore_matcher.ignores(dir_path, directory):
                 if verbose:
                     rel_path = dir_path.relative_to(directory)
                     print(f"  [IGNORED DIR] {rel_path}/")
@@ -247,7 +248,7 @@ def _get_files_to_upload(
             remote_path = str(rel_path).replace("\\", "/")
 
             # Check if file should be ignored
-            if should_ignore_path(file_path, directory, ignore_patterns):
+            if ignore_matcher.ignores(file_path, directory):
                 ignored_files.append(remote_path)
                 if verbose:
                     print(f"  [IGNORED] {remote_path}")
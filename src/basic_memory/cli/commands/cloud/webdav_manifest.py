@@ -0,0 +1,182 @@
+"""Remembered content hashes for local files compared by WebDAV push/pull.
+
+Comparing a local file against the cloud's entity tag means hashing the whole
+file, and a project with large attachments would otherwise be re-read end to
+end on every ``bm cloud push`` / ``bm cloud pull``. The manifest keeps each
+file's MD5 keyed by the size and nanosecond mtime it was hashed under, so a file
+is only read again once its stat moves.
+
+The manifest is a cache, never a source of truth: a missing, unreadable, or
+foreign manifest just means files are hashed again.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from basic_memory.config import resolve_data_dir
+
+_MANIFEST_VERSION = 1
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+# A file modified this recently may still be written to within the same mtime
+# tick, so an edit that keeps its size would be invisible to the stat key. Such
+# hashes are used for this run but not remembered (git's "racily clean" rule).
+_RACY_WINDOW_NS = 2_000_000_000
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _project_dir_name(project: str) -> str:
+    """Turn a project name into one safe path segment.
+
+    Plain names are used as-is. Anything else (separators, "..", spaces, unicode)
+    is slugified and suffixed with a digest of the original name, so two names
+    that slugify alike still get separate manifests.
+    """
+    slug = _UNSAFE_PATH_CHARS.sub("-", project).strip(".-")
+    if slug and slug == project:
+        return slug
+    digest = hashlib.sha256(project.encode("utf-8")).hexdigest()[:12]
+    return f"{slug}-{digest}" if slug else digest
+
+
+def manifest_path(project: str) -> Path:
+    """Return where the content-hash manifest for a cloud project lives.
+
+    Honors ``BASIC_MEMORY_CONFIG_DIR`` like the bisync state, and stays outside
+    the project directory so the manifest is never itself transferred.
+    """
+    return resolve_data_dir() / "webdav-state" / _project_dir_name(project) / "content-hashes.json"
+
+
+def file_content_hash(path: Path) -> str:
+    """Hash a local file for comparison against the store's entity tag.
+
+    MD5 is not a choice here — it is the digest the object store reports for a
+    single-part object. This is a content fingerprint, never a security control.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class _ManifestEntry:
+    size: int
+    mtime_ns: int
+    md5: str
+
+
+@dataclass
+class LocalHashManifest:
+    """MD5s of one project's local files, keyed by the stat they were hashed under."""
+
+    path: Path
+    local_root: Path
+    _entries: dict[str, _ManifestEntry] = field(default_factory=dict)
+    _dirty: bool = False
+
+    @classmethod
+    def load(cls, project: str, local_root: Path) -> "LocalHashManifest":
+        """Load the project's manifest, starting empty when it cannot be trusted."""
+        path = manifest_path(project)
+        root = local_root.resolve()
+        manifest = cls(path=path, local_root=root)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "Ignoring unreadable WebDAV content manifest", path=str(path), error=str(exc)
+            )
+            return manifest
+
+        if not isinstance(data, dict) or not isinstance(data.get("files", {}), dict):
+            logger.warning("Ignoring malformed WebDAV content manifest", path=str(path))
+            return manifest
+        # Trigger: the project was re-pointed at another directory, or the format changed.
+        # Why: hashes of some other tree's files must never vouch for these files.
+        # Outcome: start over; the next save replaces the old manifest.
+        if data.get("version") != _MANIFEST_VERSION or data.get("local_root") != str(root):
+            return manifest
+        try:
+            manifest._entries = {
+                rel_path: _ManifestEntry(size=int(size), mtime_ns=int(mtime_ns), md5=str(md5))
+                for rel_path, (size, mtime_ns, md5) in data.get("files", {}).items()
+            }
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed WebDAV content manifest", path=str(path))
+        return manifest
+
+    def content_hash(self, rel_path: str, *, size: int, mtime_ns: int) -> str:
+        """Return the MD5 of a local file, hashing only when its stat moved."""
+        entry = self._entries.get(rel_path)
+        if entry is not None and entry.size == size and entry.mtime_ns == mtime_ns:
+            return entry.md5
+        md5 = file_content_hash(self.local_root / rel_path)
+        self.record(rel_path, size=size, mtime_ns=mtime_ns, md5=md5)
+        return md5
+
+    def record(self, rel_path: str, *, size: int, mtime_ns: int, md5: str) -> None:
+        """Remember a file's hash under the stat it was taken with."""
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            # Too fresh to trust the stat key; drop any older entry as well.
+            if self._entries.pop(rel_path, None) is not None:
+                self._dirty = True
+            return
+        entry = _ManifestEntry(size=size, mtime_ns=mtime_ns, md5=md5)
+        if self._entries.get(rel_path) != entry:
+            self._entries[rel_path] = entry
+            self._dirty = True
+
+    def retain(self, rel_paths: set[str]) -> None:
+        """Forget files that no longer exist locally."""
+        stale = self._entries.keys() - rel_paths
+        for rel_path in stale:
+            del self._entries[rel_path]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the manifest atomically when anything changed.
+
+        A failed save only costs re-hashing next time, so it is logged, not raised.
+        """
+        if not self._dirty:
+            return
+        data = {
+            "version": _MANIFEST_VERSION,
+            "local_root": str(self.local_root),
+            "files": {
+                rel_path: [entry.size, entry.mtime_ns, entry.md5]
+                for rel_path, entry in sorted(self._entries.items())
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part"
+            )
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    json.dump(data, stream, separators=(",", ":"))
+                os.replace(temp_name, self.path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning(
+                "Could not save WebDAV content manifest", path=str(self.path), error=str(exc)
+            )
+            return
+        self._dirty = False
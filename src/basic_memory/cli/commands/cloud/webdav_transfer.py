@@ -23,12 +23,20 @@ Comparison is by entity tag plus size, falling back to last-modified plus size
 when the service reports no entity tag we can treat as a content hash. See
 ``_compare`` for why that fallback errs toward reporting a conflict, and
 ``_drop_appeared_on_cloud`` for how a stale plan is kept from overwriting a note
-nobody compared.
+nobody compared. Local content hashes are remembered between runs in a
+``LocalHashManifest`` so an unchanged file is not re-read to be compared.
+
+Files move concurrently over one shared client, a bounded number at a time, so a
+project of many small notes is not paced by one round trip per file. Each file
+carries its own precondition and retries only failures that are safe to repeat;
+see ``_is_retryable``.
 """
 
+import asyncio
 import hashlib
 import os
 import tempfile
+import time
 from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
@@ -55,7 +63,8 @@ from basic_memory.cli.commands.cloud.webdav import (
     list_project_files,
     upload_file,
 )
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.cli.commands.cloud.webdav_manifest import LocalHashManifest, file_content_hash
+from basic_memory.ignore_utils import compile_ignore_patterns, load_gitignore_patterns
 from basic_memory.mcp.async_client import get_cloud_proxy_client
 
 console = Console()
@@ -69,7 +78,21 @@ ClientFactory = Callable[[], AbstractAsyncContextManager[httpx.AsyncClient]]
 # files identical, and losing an edit is the worse outcome.
 MODIFY_WINDOW_SECONDS = 1.0
 
-_HASH_CHUNK_BYTES = 1024 * 1024
+# Files in flight at once over the shared client. Small notes are latency-bound,
+# so overlapping round trips is what makes a large transfer fast.
+DEFAULT_TRANSFER_CONCURRENCY = 8
+
+# Per-file retry budget for transient failures, with exponential backoff.
+_TRANSFER_MAX_ATTEMPTS = 3
+_TRANSFER_RETRY_BASE_DELAY_SECONDS = 0.5
+
+# Statuses that mean "try again later". 429 and 503 are refusals issued before
+# the request was acted on; a gateway's 502/504 may hide a write that landed.
+_REFUSED_BEFORE_PROCESSING_STATUSES = frozenset({429, 503})
+_TRANSIENT_STATUSES = _REFUSED_BEFORE_PROCESSING_STATUSES | {502, 504}
+
+# Transport failures that guarantee the request never reached the service.
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
 
 # Whether two copies of a path hold the same bytes. "unknown" means the question
 # could not be answered at all — never a silent "same".
@@ -83,6 +106,7 @@ class LocalFile:
     path: str  # project-relative POSIX path
     size: int
     mtime: float
+    mtime_ns: int | None = None
 
 
 @dataclass(frozen=True)
@@ -127,11 +151,15 @@ async def webdav_project_diff(
     async with cm_factory() as client:
         remote_files = await list_project_files(client, project)
 
-    return build_transfer_plan(
+    manifest = LocalHashManifest.load(project, local_root)
+    plan = build_transfer_plan(
         local_root=local_root,
         remote_files=remote_files,
         direction=direction,
+        manifest=manifest,
     )
+    manifest.save()
+    return plan
 
 
 async def webdav_project_transfer(
@@ -145,6 +173,7 @@ async def webdav_project_transfer(
     conflict_suffix: str = "",
     dry_run: bool = False,
     verbose: bool = False,
+    concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
     client_cm_factory: ClientFactory | None = None,
 ) -> None:
     """Execute a directional transfer for the chosen conflict strategy.
@@ -154,9 +183,13 @@ async def webdav_project_transfer(
     has already passed and applies the resolution.
 
     Raises:
-        WebdavError: If any transfer fails, or if the cloud names a file that
-            would be written outside the project directory.
+        WebdavError: If any transfer fails after its retries, or if the cloud
+            names a file that would be written outside the project directory.
+            Transfers still in flight are cancelled first.
     """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
     # keep-both: preserve the destination's version and drop the incoming one
     # beside it as a conflict copy, then do an additive (new-only) pass.
     renames = (
@@ -195,21 +228,152 @@ async def webdav_project_transfer(
         else:
             appeared = []
 
-        transferred = 0
-        for transfer in transfers:
-            if verbose:
-                console.print(f"  {transfer.describe()}")
-            if direction == "pull":
-                written = await _pull_file(client, project, local_root, transfer)
-            else:
-                written = await _push_file(client, project, local_root, transfer)
-            if not written:
-                appeared.append(transfer.dest_rel)
-                continue
-            transferred += 1
+        started = time.monotonic()
+        progress = _TransferProgress(total=len(transfers))
+        manifest = LocalHashManifest.load(project, local_root)
+        try:
+            refused = await _run_transfers(
+                client,
+                project,
+                local_root,
+                direction,
+                transfers,
+                concurrency=concurrency,
+                progress=progress,
+                manifest=manifest,
+                verbose=verbose,
+            )
+        finally:
+            # Files that did land are remembered even when a later one failed.
+            manifest.save()
+        appeared.extend(refused)
+        elapsed = time.monotonic() - started
+
+    console.print(
+        f"[dim]Transferred {progress.transferred} file(s){progress.summary(elapsed)}.[/dim]"
+    )
+    _report_appeared(sorted(appeared))
+
+
+# --- Concurrent execution ---
+
+
+@dataclass
+class _TransferProgress:
+    """Aggregate counters shared by the concurrent transfers of one run."""
+
+    total: int
+    finished: int = 0
+    transferred: int = 0
+    transferred_bytes: int = 0
+
+    def record(self, written_bytes: int | None) -> None:
+        self.finished += 1
+        if written_bytes is not None:
+            self.transferred += 1
+            self.transferred_bytes += written_bytes
+
+    def summary(self, elapsed_seconds: float) -> str:
+        if not self.transferred:
+            return ""
+        megabytes = self.transferred_bytes / (1024 * 1024)
+        rate = megabytes / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        return f" ({megabytes:.1f} MiB in {elapsed_seconds:.1f}s, {rate:.1f} MiB/s)"
+
+
+async def _run_transfers(
+    client: httpx.AsyncClient,
+    project: str,
+    local_root: Path,
+    direction: TransferDirection,
+    transfers: list[_Transfer],
+    *,
+    concurrency: int,
+    progress: _TransferProgress,
+    manifest: LocalHashManifest,
+    verbose: bool,
+) -> list[str]:
+    """Move every file with at most ``concurrency`` in flight over one client.
+
+    Returns the destination paths whose create-only write was refused because
+    the path appeared after planning. The first failure cancels everything still
+    in flight and is raised as-is, so a refused upload stops the run the same
+    way it did when files moved one at a time.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    refused: list[str] = []
+
+    async def transfer_one(transfer: _Transfer) -> None:
+        async with semaphore:
+            written = await _transfer_with_retry(client, project, local_root, direction, transfer)
+        progress.record(written.size if written is not None else None)
+        if written is None:
+            refused.append(transfer.dest_rel)
+        elif written.local_stat is not None:
+            manifest.record(
+                written.local_rel,
+                size=written.local_stat.st_size,
+                mtime_ns=written.local_stat.st_mtime_ns,
+                md5=written.md5,
+            )
+        if verbose:
+            console.print(f"  [{progress.finished}/{progress.total}] {transfer.describe()}")
+
+    tasks = [asyncio.ensure_future(transfer_one(transfer)) for transfer in transfers]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return refused
 
-    console.print(f"[dim]Transferred {transferred} file(s).[/dim]")
-    _report_appeared(appeared)
+
+async def _transfer_with_retry(
+    client: httpx.AsyncClient,
+    project: str,
+    local_root: Path,
+    direction: TransferDirection,
+    transfer: _Transfer,
+) -> "_WrittenFile | None":
+    """Transfer one file, retrying transient failures with exponential backoff."""
+    # A create-only push is the one write that is not safe to blindly repeat: if
+    # the first attempt landed, the retry's `If-None-Match: *` would be refused
+    # and our own write reported as a teammate's.
+    idempotent = direction == "pull" or not transfer.create_only
+    attempt = 1
+    while True:
+        try:
+            if direction == "pull":
+                return await _pull_file(client, project, local_root, transfer)
+            return await _push_file(client, project, local_root, transfer)
+        except WebdavError as exc:
+            if attempt >= _TRANSFER_MAX_ATTEMPTS or not _is_retryable(exc, idempotent=idempotent):
+                raise
+            delay = _TRANSFER_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+            attempt += 1
+            console.print(
+                f"[dim]Retrying {transfer.describe()} in {delay:.1f}s "
+                f"(attempt {attempt} of {_TRANSFER_MAX_ATTEMPTS}): {exc}[/dim]"
+            )
+            await asyncio.sleep(delay)
+
+
+def _is_retryable(error: WebdavError, *, idempotent: bool) -> bool:
+    """Decide whether repeating a failed request can only help.
+
+    Idempotent requests retry any transient failure. A create-only upload
+    retries only when the service provably did not act on the first attempt: the
+    connection was never made, or the service refused before processing.
+    """
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        statuses = _TRANSIENT_STATUSES if idempotent else _REFUSED_BEFORE_PROCESSING_STATUSES
+        return cause.response.status_code in statuses
+    if isinstance(cause, httpx.TransportError):
+        return idempotent or isinstance(cause, _UNSENT_REQUEST_ERRORS)
+    return False
 
 
 # --- Planning ---
@@ -220,6 +384,7 @@ def build_transfer_plan(
     local_root: Path,
     remote_files: list[RemoteFile],
     direction: TransferDirection,
+    manifest: LocalHashManifest | None = None,
 ) -> TransferPlan:
     """Compare both sides and classify every path into the transfer plan.
 
@@ -229,6 +394,9 @@ def build_transfer_plan(
     """
     ignore_patterns = load_gitignore_patterns(local_root, use_gitignore=False)
     local_files = scan_local_files(local_root, ignore_patterns)
+    if manifest is not None:
+        manifest.retain(set(local_files))
+    ignore_matcher = compile_ignore_patterns(ignore_patterns)
 
     remote_by_path: dict[str, RemoteFile] = {}
     for remote in remote_files:
@@ -236,7 +404,7 @@ def build_transfer_plan(
         # outside the project is a broken or hostile response, and the user
         # should see that before a plan is presented, not mid-transfer.
         local_equivalent = _safe_local_path(local_root, remote.path)
-        if should_ignore_path(local_equivalent, local_root, ignore_patterns):
+        if ignore_matcher.ignores(local_equivalent, local_root):
             continue
         remote_by_path[remote.path] = remote
 
@@ -252,7 +420,7 @@ def build_transfer_plan(
     )
 
     for path in sorted(source_paths & dest_paths):
-        comparison = _compare(local_files[path], remote_by_path[path], local_root)
+        comparison = _compare(local_files[path], remote_by_path[path], local_root, manifest)
         if comparison == "differ":
             plan.conflicts.append(path)
         elif comparison == "unknown":
@@ -274,6 +442,7 @@ def scan_local_files(local_root: Path, ignore_patterns: set[str]) -> dict[str, L
     project scanner applies for the same reason.
     """
     files: dict[str, LocalFile] = {}
+    ignore_matcher = compile_ignore_patterns(ignore_patterns)
 
     for root, dirs, filenames in os.walk(local_root, followlinks=False):
         root_path = Path(root)
@@ -281,23 +450,33 @@ def scan_local_files(local_root: Path, ignore_patterns: set[str]) -> dict[str, L
             name
             for name in dirs
             if not (root_path / name).is_symlink()
-            and not should_ignore_path(root_path / name, local_root, ignore_patterns)
+            and not ignore_matcher.ignores(root_path / name, local_root)
         ]
 
         for filename in filenames:
             file_path = root_path / filename
             if file_path.is_symlink():
                 continue
-            if should_ignore_path(file_path, local_root, ignore_patterns):
+            if ignore_matcher.ignores(file_path, local_root):
                 continue
             stat = file_path.stat()
             rel_path = file_path.relative_to(local_root).as_posix()
-            files[rel_path] = LocalFile(path=rel_path, size=stat.st_size, mtime=stat.st_mtime)
+            files[rel_path] = LocalFile(
+                path=rel_path,
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                mtime_ns=stat.st_mtime_ns,
+            )
 
     return files
 
 
-def _compare(local: LocalFile, remote: RemoteFile, local_root: Path) -> Comparison:
+def _compare(
+    local: LocalFile,
+    remote: RemoteFile,
+    local_root: Path,
+    manifest: LocalHashManifest | None = None,
+) -> Comparison:
     """Decide whether two copies of a path hold the same bytes.
 
     Size settles it whenever it differs, and is checked first so a large file is
@@ -322,7 +501,8 @@ def _compare(local: LocalFile, remote: RemoteFile, local_root: Path) -> Comparis
 
     content_hash = etag_content_hash(remote.etag)
     if content_hash is not None:
-        return "same" if _file_content_hash(local_root / local.path) == content_hash else "differ"
+        local_hash = _local_content_hash(local, local_root, manifest)
+        return "same" if local_hash == content_hash else "differ"
 
     if remote.modified is None:
         return "unknown"
@@ -331,17 +511,15 @@ def _compare(local: LocalFile, remote: RemoteFile, local_root: Path) -> Comparis
     return "same" if drift <= MODIFY_WINDOW_SECONDS else "differ"
 
 
-def _file_content_hash(path: Path) -> str:
-    """Hash a local file for comparison against the store's entity tag.
-
-    MD5 is not a choice here — it is the digest the object store reports for a
-    single-part object. This is a content fingerprint, never a security control.
-    """
-    digest = hashlib.md5(usedforsecurity=False)
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+def _local_content_hash(
+    local: LocalFile,
+    local_root: Path,
+    manifest: LocalHashManifest | None,
+) -> str:
+    """Hash a local file, reusing the manifest's hash when its stat is unchanged."""
+    if manifest is None or local.mtime_ns is None:
+        return file_content_hash(local_root / local.path)
+    return manifest.content_hash(local.path, size=local.size, mtime_ns=local.mtime_ns)
 
 
 # --- Guarding against a destination that moved under the plan ---
@@ -411,17 +589,32 @@ def _report_appeared(appeared: list[str]) -> None:
 # --- Single-file transfers ---
 
 
+@dataclass(frozen=True)
+class _WrittenFile:
+    """What one successful transfer moved.
+
+    ``local_stat`` is the stat of the local copy that ``md5`` describes, so the
+    manifest can remember it; it is None when the local file may have changed
+    while the transfer ran and the pairing cannot be vouched for.
+    """
+
+    local_rel: str
+    size: int
+    md5: str
+    local_stat: os.stat_result | None
+
+
 async def _pull_file(
     client: httpx.AsyncClient,
     project: str,
     local_root: Path,
     transfer: _Transfer,
-) -> bool:
+) -> _WrittenFile | None:
     """Download one cloud file and land it under the destination path.
 
     Nothing is created at the destination until the bytes exist: the download
     lands in a sibling temp file, and only then is the name claimed. Returns
-    False when a create-only transfer found the name already taken, so the
+    None when a create-only transfer found the name already taken, so the
     caller can report it instead of replacing a note it never compared.
     """
     target = _safe_local_path(local_root, transfer.dest_rel)
@@ -434,16 +627,38 @@ async def _pull_file(
     temp_path = _write_temp_file(target, downloaded)
     try:
         if transfer.create_only:
-            return _publish_new(temp_path, target, downloaded)
-        # An explicit keep-cloud is an instruction to replace what is there.
-        os.replace(temp_path, target)
-        return True
+            if not _publish_new(temp_path, target, downloaded):
+                return None
+        else:
+            # An explicit keep-cloud is an instruction to replace what is there.
+            os.replace(temp_path, target)
+        return _WrittenFile(
+            local_rel=transfer.dest_rel,
+            size=len(downloaded.content),
+            md5=hashlib.md5(downloaded.content, usedforsecurity=False).hexdigest(),
+            local_stat=_published_stat(target, downloaded),
+        )
     finally:
         # After a rename the temp name is already gone; after a link or a
         # direct write it is the copy to drop.
         temp_path.unlink(missing_ok=True)
 
 
+def _published_stat(target: Path, downloaded: DownloadedFile) -> os.stat_result | None:
+    """Stat a pulled file, but only if it still looks exactly as this pull left it."""
+    if downloaded.modified is None:
+        return None
+    try:
+        stat = target.stat()
+    except OSError:
+        return None
+    if stat.st_size != len(downloaded.content):
+        return None
+    if abs(stat.st_mtime - downloaded.modified.timestamp()) > 0.001:
+        return None
+    return stat
+
+
 def _write_temp_file(target: Path, downloaded: DownloadedFile) -> Path:
     """Stage the downloaded bytes beside the destination, fully written."""
     handle, temp_name = tempfile.mkstemp(
@@ -526,23 +741,35 @@ async def _push_file(
     project: str,
     local_root: Path,
     transfer: _Transfer,
-) -> bool:
+) -> _WrittenFile | None:
     """Upload one local file to the destination path in the cloud project.
 
-    Returns False when a create-only upload was refused because the path now
+    Returns None when a create-only upload was refused because the path now
     exists in the cloud, mirroring the pull side.
     """
     source = _safe_local_path(local_root, transfer.source_rel)
     _refuse_symlink(source, transfer.source_rel)
     stat = source.stat()
-    return await upload_file(
+    content = source.read_bytes()
+    written = await upload_file(
         client,
         project,
         transfer.dest_rel,
-        content=source.read_bytes(),
+        content=content,
         mtime=int(stat.st_mtime),
         create_only=transfer.create_only,
     )
+    if not written:
+        return None
+    # The bytes describe the stat taken before reading only if nothing moved since.
+    after = source.stat()
+    unchanged = (after.st_size, after.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+    return _WrittenFile(
+        local_rel=transfer.source_rel,
+        size=len(content),
+        md5=hashlib.md5(content, usedforsecurity=False).hexdigest(),
+        local_stat=stat if unchanged and stat.st_size == len(content) else None,
+    )
 
 
 def _safe_local_path(local_root: Path, rel_path: str) -> Path:
@@ -53,6 +53,17 @@ def run_with_cleanup(coro: Coroutine[Any, Any, T]) -> T:
     return asyncio.run(_with_cleanup())
 
 
+def echo_resume_hint(resume_from: int | None) -> None:
+    """Tell the user how to continue an import that stopped partway through."""
+    if resume_from is None:
+        return
+    typer.echo(
+        f"Notes before item {resume_from} were imported. "
+        f"Rerun with --resume-from {resume_from} to continue.",
+        err=True,
+    )
+
+
 async def run_project_index(
     project: Optional[str] = None,
     force_full: bool = False,
@@ -3,13 +3,12 @@
 # PEP 563 lazy annotations keep heavy importer types out of module import (#886).
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Tuple
 
 import typer
 from basic_memory.cli.app import import_app
-from basic_memory.cli.commands.command_utils import run_with_cleanup
+from basic_memory.cli.commands.command_utils import echo_resume_hint, run_with_cleanup
 from basic_memory.config import ConfigManager, get_project_config
 from loguru import logger
 from rich.console import Console
@@ -45,6 +44,14 @@ def import_chatgpt(
     folder: Annotated[
         str, typer.Option(help="The folder to place the files in.")
     ] = "conversations",
+    resume_from: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help="Skip this many leading conversations, e.g. the checkpoint an "
+            "interrupted import reported.",
+        ),
+    ] = 0,
 ):
     """Import chat conversations from ChatGPT JSON format.
 
@@ -70,17 +77,30 @@ def import_chatgpt(
 
         # Create importer and run import
         # Deferred: importer stack loads at import-command run time only (#886).
-        from basic_memory.importers import ChatGPTImporter
+        from basic_memory.importers import ChatGPTImporter, file_chunk_reader, iter_json_array
 
         importer = ChatGPTImporter(
             config.home, markdown_processor, file_service, project_name=config.name
         )
-        with conversations_json.open("r", encoding="utf-8") as file:
-            json_data = json.load(file)
-            result = run_with_cleanup(importer.import_data(json_data, folder))
+        # The export is parsed one conversation at a time rather than loaded whole.
+        with (
+            conversations_json.open("rb") as file,
+            console.status("Importing conversations...") as status,
+        ):
+            result = run_with_cleanup(
+                importer.import_data(
+                    iter_json_array(file_chunk_reader(file)),
+                    folder,
+                    resume_from=resume_from,
+                    progress=lambda progress: status.update(
+                        f"Imported {progress.notes_written} conversations..."
+                    ),
+                )
+            )
 
-        if not result.success:  # pragma: no cover
+        if not result.success:
             typer.echo(f"Error during import: {result.error_message}", err=True)
+            echo_resume_hint(result.resume_from)
             raise typer.Exit(1)
 
         # Show results
@@ -95,7 +115,13 @@ def import_chatgpt(
 
         console.print("\nRun 'bm reindex --search' to index the new files.")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         logger.error("Import failed")
         typer.echo(f"Error during import: {e}", err=True)
+        # A source that turns malformed partway through still leaves earlier notes written.
+        checkpoint = getattr(e, "checkpoint", None)
+        if checkpoint is not None and checkpoint > resume_from:
+            echo_resume_hint(checkpoint)
         raise typer.Exit(1)
@@ -3,13 +3,12 @@
 # PEP 563 lazy annotations keep heavy importer types out of module import (#886).
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Tuple
 
 import typer
 from basic_memory.cli.app import claude_app
-from basic_memory.cli.commands.command_utils import run_with_cleanup
+from basic_memory.cli.commands.command_utils import echo_resume_hint, run_with_cleanup
 from basic_memory.config import ConfigManager, get_project_config
 from loguru import logger
 from rich.console import Console
@@ -45,6 +44,14 @@ def import_claude(
     folder: Annotated[
         str, typer.Option(help="The folder to place the files in.")
     ] = "conversations",
+    resume_from: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help="Skip this many leading conversations, e.g. the checkpoint an "
+            "interrupted import reported.",
+        ),
+    ] = 0,
 ):
     """Import chat conversations from conversations2.json format.
 
@@ -67,6 +74,7 @@ def import_claude(
 
         # Create the importer
         # Deferred: importer stack loads at import-command run time only (#886).
+        from basic_memory.importers import file_chunk_reader, iter_json_array
         from basic_memory.importers.claude_conversations_importer import ClaudeConversationsImporter
 
         importer = ClaudeConversationsImporter(
@@ -77,13 +85,25 @@ def import_claude(
         base_path = config.home / folder
         console.print(f"\nImporting chats from {conversations_json}...writing to {base_path}")
 
-        # Run the import
-        with conversations_json.open("r", encoding="utf-8") as file:
-            json_data = json.load(file)
-            result = run_with_cleanup(importer.import_data(json_data, folder))
+        # Run the import, parsing the export one conversation at a time
+        with (
+            conversations_json.open("rb") as file,
+            console.status("Importing conversations...") as status,
+        ):
+            result = run_with_cleanup(
+                importer.import_data(
+                    iter_json_array(file_chunk_reader(file)),
+                    folder,
+                    resume_from=resume_from,
+                    progress=lambda progress: status.update(
+                        f"Imported {progress.notes_written} conversations..."
+                    ),
+                )
+            )
 
-        if not result.success:  # pragma: no cover
+        if not result.success:
             typer.echo(f"Error during import: {result.error_message}", err=True)
+            echo_resume_hint(result.resume_from)
             raise typer.Exit(1)
 
         # Show results
@@ -98,7 +118,13 @@ def import_claude(
 
         console.print("\nRun 'bm reindex --search' to index the new files.")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         logger.error("Import failed")
         typer.echo(f"Error during import: {e}", err=True)
+        # A source that turns malformed partway through still leaves earlier notes written.
+        checkpoint = getattr(e, "checkpoint", None)
+        if checkpoint is not None and checkpoint > resume_from:
+            echo_resume_hint(checkpoint)
         raise typer.Exit(1)
@@ -247,6 +247,16 @@ class BasicMemoryConfig(BaseSettings):
         description="Maximum Redis connections used by standalone MCP read caching.",
         gt=0,
     )
+    read_cache_memory_max_bytes: int = Field(
+        default=0,
+        description="Byte budget for the in-process tier in front of the Redis read cache, e.g. 33554432 for 32 MiB. Repeat reads on the same worker skip the Redis round trip. 0 (the default) disables the tier.",
+        ge=0,
+    )
+    read_cache_memory_generation_ttl_seconds: float = Field(
+        default=1.0,
+        description="Seconds the in-process read-cache tier trusts a project's last observed generation before rechecking Redis. Bounds how long another worker's invalidation can go unseen.",
+        ge=0,
+    )
 
     # Semantic search configuration
     semantic_search_enabled: bool = Field(
@@ -408,6 +418,11 @@ class BasicMemoryConfig(BaseSettings):
         description="Maximum uploaded JSON export size accepted by API import endpoints.",
         gt=0,
     )
+    import_write_max_concurrent: int = Field(
+        default=8,
+        description="Maximum number of imported notes to write concurrently. Chat exports are parsed one conversation at a time, so this also bounds how many converted conversations an import holds in memory.",
+        gt=0,
+    )
     semantic_vector_k: int = Field(
         default=100,
         description="Vector candidate count for vector and hybrid retrieval.",
@@ -419,6 +434,28 @@ class BasicMemoryConfig(BaseSettings):
         ge=0.0,
         le=1.0,
     )
+    semantic_query_embedding_cache_size: int = Field(
+        default=512,
+        description="Maximum number of query embeddings kept in the in-process LRU cache, "
+        "keyed by embedding identity and whitespace-normalized query text. 0 disables caching.",
+        ge=0,
+    )
+    semantic_query_embedding_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        description="Seconds a cached query embedding stays valid in memory and on disk.",
+        gt=0,
+    )
+    semantic_query_embedding_cache_persist: bool = Field(
+        default=False,
+        description="Also persist cached query embeddings to query_embedding_cache.db in the "
+        "Basic Memory data directory so they survive process restarts.",
+    )
+    semantic_hybrid_concurrent: bool = Field(
+        default=True,
+        description="Run the full-text and vector legs of hybrid search concurrently on "
+        "independent sessions, so hybrid latency tracks the slower leg instead of their sum. "
+        "Disable to fall back to sequential leg execution.",
+    )
     default_search_type: Literal["text", "vector", "hybrid"] | None = Field(
         default=None,
         description="Default search type for search_notes when not specified per-query. "
@@ -475,6 +512,36 @@ class BasicMemoryConfig(BaseSettings):
         "returning the requested page. Larger widens recall at the cost of latency.",
         gt=0,
     )
+    reranker_stable_pool_ttl_seconds: float = Field(
+        default=300.0,
+        description="Seconds to remember the fixed reranker-prefix candidate pool of a query, "
+        "so later pages of a reranked search skip the second retrieval that pins prefix "
+        "membership. Local index writes invalidate it immediately. 0 disables the memo.",
+        ge=0,
+    )
+    reranker_score_cache_size: int = Field(
+        default=4096,
+        description="Number of reranker scores kept in memory, keyed by reranker model, query "
+        "text, and the exact candidate text scored. Repeated queries and later pages reuse "
+        "cached scores instead of rescoring the same candidates. 0 disables the cache.",
+        ge=0,
+    )
+    reranker_latency_budget_ms: float = Field(
+        default=0.0,
+        description="Target milliseconds for one rerank call. When the reranker's recent "
+        "per-candidate latency predicts a miss, only as many uncached candidates as fit the "
+        "budget are rescored and the rest keep retrieval order below them. 0 disables the budget.",
+        ge=0,
+    )
+
+    # Graph context configuration
+    context_adjacency_index: bool = Field(
+        default=True,
+        description="Traverse relations for build_context with an in-process adjacency index "
+        "instead of the recursive SQL query (SQLite only). The index is revalidated against a "
+        "per-project relation fingerprint before every traversal. Disable to use the "
+        "recursive query.",
+    )
 
     # Database connection pool configuration (Postgres only)
     db_pool_size: int = Field(
@@ -574,6 +641,17 @@ class BasicMemoryConfig(BaseSettings):
         description="Maximum number of markdown parse tasks to run concurrently inside one indexing batch.",
         gt=0,
     )
+    index_parse_workers: int = Field(
+        default=0,
+        description="Worker processes for parsing markdown in multi-file indexing batches. Parsing is CPU-bound, so full reindexes of large projects scale with cores when this is set. 0 (default) parses on the event loop thread.",
+        ge=0,
+    )
+    index_checksum_verify_sample_rate: float = Field(
+        default=0.0,
+        description="Fraction of files whose size and mtime match the index that are hashed anyway during a project scan. Unchanged stats normally skip reading the file; a small sample catches edits that preserved both. 0 (default) trusts the stat signature.",
+        ge=0.0,
+        le=1.0,
+    )
     index_entity_max_concurrent: int = Field(
         default=4,
         description="Maximum number of entity create/update tasks to run concurrently inside one indexing batch.",
@@ -605,6 +683,17 @@ class BasicMemoryConfig(BaseSettings):
         ),
     )
 
+    mcp_in_process_dispatch: bool = Field(
+        default=False,
+        description=(
+            "Serve local MCP tool calls by invoking the matching API route in-process "
+            "instead of sending them through httpx and the ASGI transport. Routing, "
+            "dependency injection, validation and error handling stay the same; the "
+            "request and response are never encoded to JSON. False (default) keeps the "
+            "HTTP path. Env: BASIC_MEMORY_MCP_IN_PROCESS_DISPATCH"
+        ),
+    )
+
     cli_output_style: Literal["rich", "plain"] = Field(
         default="rich",
         description=(
@@ -678,6 +767,12 @@ class BasicMemoryConfig(BaseSettings):
         description="Basic Memory Cloud host URL",
     )
 
+    cloud_transfer_concurrency: int = Field(
+        default=8,
+        description="Files transferred at once by `bm cloud push` / `bm cloud pull` on Team workspaces. Transfers of many small notes are latency-bound, so overlapping requests shortens them.",
+        gt=0,
+    )
+
     cloud_promo_opt_out: bool = Field(
         default=False,
         description="Disable CLI cloud promo messages when true.",
@@ -5,17 +5,27 @@ This module provides importer dependencies:
 - ClaudeConversationsImporter
 - ClaudeProjectsImporter
 - MemoryJsonImporter
+- ImportedFileIndexer, which indexes what those importers write in batches
 """
 
 from typing import Annotated
 
 from fastapi import Depends
 
+from basic_memory.deps.config import AppConfigDep
+from basic_memory.deps.db import SessionMakerDep
 from basic_memory.deps.projects import ProjectConfigV2ExternalDep
 from basic_memory.deps.read_cache import ReadCacheDep
+from basic_memory.deps.repositories import (
+    EntityRepositoryV2ExternalDep,
+    ObservationRepositoryV2ExternalDep,
+    RelationRepositoryV2ExternalDep,
+)
 from basic_memory.deps.services import (
+    EntityServiceV2ExternalDep,
     FileServiceV2ExternalDep,
     MarkdownProcessorV2ExternalDep,
+    SearchServiceV2ExternalDep,
 )
 from basic_memory.importers import (
     ChatGPTImporter,
@@ -24,6 +34,13 @@ from basic_memory.importers import (
     ImportReadCache,
     MemoryJsonImporter,
 )
+from basic_memory.index.imported_files import ImportedFileIndexer
+from basic_memory.index.local_dependencies import (
+    FileServiceNoteContentReconcileFileReader,
+    LocalIndexFileBatchIndexer,
+)
+from basic_memory.index.local_project import LocalImportedFileIndexer, LocalIndexFileBatchReader
+from basic_memory.indexing.index_batch_runtime import build_default_index_batch_runtime
 
 
 async def get_import_read_cache(
@@ -39,6 +56,49 @@ async def get_import_read_cache(
 ImportReadCacheDep = Annotated[ImportReadCache | None, Depends(get_import_read_cache)]
 
 
+# --- Imported File Indexing ---
+
+
+async def get_imported_file_indexer_v2_external(
+    app_config: AppConfigDep,
+    entity_service: EntityServiceV2ExternalDep,
+    entity_repository: EntityRepositoryV2ExternalDep,
+    observation_repository: ObservationRepositoryV2ExternalDep,
+    relation_repository: RelationRepositoryV2ExternalDep,
+    search_service: SearchServiceV2ExternalDep,
+    file_service: FileServiceV2ExternalDep,
+    session_maker: SessionMakerDep,
+) -> ImportedFileIndexer:
+    """Create the batch indexer chat and memory.json imports hand written files to."""
+    project_id = entity_repository.project_id
+    if project_id is None:  # pragma: no cover
+        raise RuntimeError("Imported file indexer requires a project-scoped entity repository")
+
+    batch_runtime = build_default_index_batch_runtime(
+        project_id=project_id,
+        app_config=app_config,
+        entity_service=entity_service,
+        entity_repository=entity_repository,
+        observation_repository=observation_repository,
+        relation_repository=relation_repository,
+        search_writer=search_service,
+        frontmatter_storage=file_service,
+        content_type_provider=file_service,
+        session_maker=session_maker,
+        file_reader=FileServiceNoteContentReconcileFileReader(file_service=file_service),
+    )
+    return LocalImportedFileIndexer(
+        reader=LocalIndexFileBatchReader(file_service=file_service),
+        indexer=LocalIndexFileBatchIndexer(batch_runtime),
+        max_concurrent=app_config.index_entity_max_concurrent,
+    )
+
+
+ImportedFileIndexerDep = Annotated[
+    ImportedFileIndexer, Depends(get_imported_file_indexer_v2_external)
+]
+
+
 # --- ChatGPT Importer ---
 
 
@@ -47,6 +107,7 @@ async def get_chatgpt_importer_v2_external(
     markdown_processor: MarkdownProcessorV2ExternalDep,
     file_service: FileServiceV2ExternalDep,
     read_cache: ImportReadCacheDep,
+    file_indexer: ImportedFileIndexerDep,
 ) -> ChatGPTImporter:
     """Create ChatGPTImporter with v2 external_id dependencies."""
     return ChatGPTImporter(
@@ -55,6 +116,7 @@ async def get_chatgpt_importer_v2_external(
         file_service,
         project_name=project_config.name,
         read_cache=read_cache,
+        file_indexer=file_indexer,
     )
 
 
@@ -69,6 +131,7 @@ async def get_claude_conversations_importer_v2_external(
     markdown_processor: MarkdownProcessorV2ExternalDep,
     file_service: FileServiceV2ExternalDep,
     read_cache: ImportReadCacheDep,
+    file_indexer: ImportedFileIndexerDep,
 ) -> ClaudeConversationsImporter:
     """Create ClaudeConversationsImporter with v2 external_id dependencies."""
     return ClaudeConversationsImporter(
@@ -77,6 +140,7 @@ async def get_claude_conversations_importer_v2_external(
         file_service,
         project_name=project_config.name,
         read_cache=read_cache,
+        file_indexer=file_indexer,
     )
 
 
@@ -117,6 +181,7 @@ async def get_memory_json_importer_v2_external(
     markdown_processor: MarkdownProcessorV2ExternalDep,
     file_service: FileServiceV2ExternalDep,
     read_cache: ImportReadCacheDep,
+    file_indexer: ImportedFileIndexerDep,
 ) -> MemoryJsonImporter:
     """Create MemoryJsonImporter with v2 external_id dependencies."""
     return MemoryJsonImporter(
@@ -125,6 +190,7 @@ async def get_memory_json_importer_v2_external(
         file_service,
         project_name=project_config.name,
         read_cache=read_cache,
+        file_indexer=file_indexer,
     )
 
 
@@ -251,6 +251,7 @@ async def get_context_service_v2_external(
     observation_repository: ObservationRepositoryV2ExternalDep,
     link_resolver: LinkResolverV2ExternalDep,
     session_maker: SessionMakerDep,
+    app_config: AppConfigDep,
 ) -> ContextService:
     """Create ContextService for v2 API (uses external_id)."""
     return ContextService(
@@ -259,6 +260,7 @@ async def get_context_service_v2_external(
         observation_repository=observation_repository,
         link_resolver=link_resolver,
         session_maker=session_maker,
+        app_config=app_config,
     )
 
 
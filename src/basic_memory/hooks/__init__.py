@@ -11,6 +11,6 @@ Modules:
   - ``envelope``  the SPEC-55 producer envelope contract
   - ``inbox``     append-only WAL under the Basic Memory home dir
   - ``adapters``  per-harness hook stdin normalization
-  - ``archive``   idempotent local audit-archive sweep
+  - ``archive``   idempotent local audit-archive sweep (replay keys via the inbox ledger)
   - ``project_ref`` project-name / project-id routing helpers
 """
@@ -29,18 +29,6 @@ class FlushResult:
     skipped: bool = False
 
 
-def _processed_idempotency_keys() -> set[str]:
-    """Read replay keys already present in the local audit archive."""
-    keys: set[str] = set()
-    for path in inbox.processed_dir().glob("*.json"):
-        try:
-            envelope = envelope_from_json(path.read_text(encoding="utf-8"))
-        except (OSError, ValueError, json.JSONDecodeError):
-            continue
-        keys.add(envelope.idempotency_key)
-    return keys
-
-
 async def flush(older_than_days: int = inbox.DEFAULT_RETENTION_DAYS) -> FlushResult:
     """Archive the pending lifecycle trace without creating graph notes.
 
@@ -58,40 +46,44 @@ async def flush(older_than_days: int = inbox.DEFAULT_RETENTION_DAYS) -> FlushRes
 def _flush_locked(older_than_days: int) -> FlushResult:
     """Archive one inbox snapshot while :func:`flush` holds the lock."""
     result = FlushResult()
-    seen_keys = _processed_idempotency_keys()
-
-    for path in inbox.list_envelopes():
-        result.swept += 1
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError as exc:
-            # A file can vanish after listing when another process owns it. It
-            # is neither corrupt nor proof of a failed archive, so skip it.
-            logger.debug(f"skipping unreadable envelope {path.name}: {exc}")
-            continue
-
-        try:
-            envelope: Envelope = envelope_from_json(text)
-        except (ValueError, json.JSONDecodeError) as exc:
-            # Unknown trace must remain observable; never delete or reinterpret it.
-            logger.warning(f"skipping invalid envelope {path.name}: {exc}")
-            result.invalid += 1
-            continue
-
-        duplicate = envelope.idempotency_key in seen_keys
-        try:
-            inbox.mark_processed(path)
-        except OSError as exc:
-            logger.warning(f"flush could not archive {path.name}: {exc}")
-            result.pending += 1
-            continue
-
-        if duplicate:
-            result.duplicates += 1
-        else:
-            seen_keys.add(envelope.idempotency_key)
-            result.archived += 1
 
+    # Trigger: session-start and pre-compact hooks flush on the interactive path.
+    # Why: parsing every archived envelope per sweep made cost grow with the archive.
+    # Outcome: replay checks are indexed ledger lookups, so a sweep scales with the inbox.
+    with inbox.processed_ledger() as ledger:
+        for path in inbox.list_envelopes():
+            result.swept += 1
+            try:
+                text = path.read_text(encoding="utf-8")
+            except OSError as exc:
+                # A file can vanish after listing when another process owns it. It
+                # is neither corrupt nor proof of a failed archive, so skip it.
+                logger.debug(f"skipping unreadable envelope {path.name}: {exc}")
+                continue
+
+            try:
+                envelope: Envelope = envelope_from_json(text)
+            except (ValueError, json.JSONDecodeError) as exc:
+                # Unknown trace must remain observable; never delete or reinterpret it.
+                logger.warning(f"skipping invalid envelope {path.name}: {exc}")
+                result.invalid += 1
+                continue
+
+            duplicate = ledger.contains(envelope.idempotency_key)
+            try:
+                archived = inbox.mark_processed(path)
+            except OSError as exc:
+                logger.warning(f"flush could not archive {path.name}: {exc}")
+                result.pending += 1
+                continue
+
+            ledger.record(archived, envelope.idempotency_key)
+            if duplicate:
+                result.duplicates += 1
+            else:
+                result.archived += 1
+
+    # Prune after the ledger commits: pruning compacts the same SQLite file.
     result.pruned = inbox.prune_processed(older_than_days)
     inbox.record_flush()
     return result
@@ -8,15 +8,20 @@ on uninstall) and uninstalling a plugin must never delete captured memory
 trace.
 
 No structure is written at capture time — ever. Processed envelopes move to
-``processed/`` for audit and are pruned after a retention window.
+``processed/`` for audit and are pruned after a retention window. The replay
+keys of archived envelopes are indexed in a small SQLite ledger beside them, so
+a flush checks each pending envelope without re-reading the whole archive.
 """
 
 from __future__ import annotations
 
 import contextlib
+import json
 import os
+import sqlite3
 import uuid
 from collections.abc import Callable, Iterator
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -26,6 +31,7 @@ from basic_memory.config import CONFIG_DIR_MODE, CONFIG_FILE_MODE, resolve_data_
 from basic_memory.hooks._uuid7 import uuid7_unix_ms
 from basic_memory.hooks.envelope import (
     Envelope,
+    envelope_from_json,
     envelope_to_json,
 )
 
@@ -33,6 +39,9 @@ INBOX_DIR_NAME = "inbox"
 PROCESSED_DIR_NAME = "processed"
 LAST_FLUSH_FILE_NAME = ".last-flush"
 FLUSH_LOCK_FILE_NAME = ".flush.lock"
+LEDGER_FILE_NAME = ".idempotency-ledger.db"
+# Bumped when the ledger schema changes; 0 means the archive was never backfilled.
+LEDGER_VERSION = 1
 
 DEFAULT_RETENTION_DAYS = 30
 
@@ -114,6 +123,19 @@ def mark_processed(path: Path) -> Path:
     return destination
 
 
+def _captured_ms(path: Path) -> int | None:
+    """Capture time from a uuid7 filename, or None when the name can't be dated."""
+    try:
+        return uuid7_unix_ms(uuid.UUID(path.stem))
+    except ValueError:
+        return None
+
+
+def _retention_cutoff_ms(older_than_days: int) -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    return int(cutoff.timestamp() * 1000)
+
+
 def _prune_dir(
     directory: Path,
     older_than_days: int,
@@ -133,17 +155,13 @@ def _prune_dir(
     the unresolvable trace, never a corrupt file or a mapped write-failure that
     should self-heal.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-    cutoff_ms = int(cutoff.timestamp() * 1000)
+    cutoff_ms = _retention_cutoff_ms(older_than_days)
     removed = 0
     for path in directory.glob("*.json"):
         if not path.is_file():
             continue
-        try:
-            captured_ms = uuid7_unix_ms(uuid.UUID(path.stem))
-        except ValueError:
-            continue
-        if captured_ms >= cutoff_ms:
+        captured_ms = _captured_ms(path)
+        if captured_ms is None or captured_ms >= cutoff_ms:
             continue
         if should_prune is not None and not should_prune(path):
             continue
@@ -153,8 +171,105 @@ def _prune_dir(
 
 
 def prune_processed(older_than_days: int = DEFAULT_RETENTION_DAYS) -> int:
-    """Delete processed envelopes older than the retention window."""
-    return _prune_dir(processed_dir(), older_than_days)
+    """Delete processed envelopes older than the retention window.
+
+    The ledger drops the same envelopes, so it stays the size of the archive.
+    """
+    removed = _prune_dir(processed_dir(), older_than_days)
+    ledger = processed_dir() / LEDGER_FILE_NAME
+    if ledger.is_file():
+        # Rows carry the capture time of their file, so the cutoff that expired
+        # the file expires its row; undatable names (NULL) are kept like the files.
+        with closing(sqlite3.connect(ledger)) as connection, connection:
+            connection.execute(
+                "DELETE FROM processed WHERE captured_ms < ?",
+                (_retention_cutoff_ms(older_than_days),),
+            )
+    return removed
+
+
+# --- Idempotency ledger (replay keys of the processed archive) ---
+
+
+class ProcessedLedger:
+    """Indexed replay keys of archived envelopes, one row per archive file.
+
+    Rows are keyed by envelope filename, so re-recording a file (a concurrent
+    sweep, a rebuilt ledger) never double counts it.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def contains(self, idempotency_key: str) -> bool:
+        """Whether an envelope with this replay key is already archived."""
+        row = self._connection.execute(
+            "SELECT 1 FROM processed WHERE idempotency_key = ? LIMIT 1",
+            (idempotency_key,),
+        ).fetchone()
+        return row is not None
+
+    def record(self, archived: Path, idempotency_key: str) -> None:
+        """Index an envelope file that now lives in ``processed/``."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO processed (envelope_id, idempotency_key, captured_ms) "
+            "VALUES (?, ?, ?)",
+            (archived.stem, idempotency_key, _captured_ms(archived)),
+        )
+
+    def _backfill(self, directory: Path) -> None:
+        """Index every envelope already archived before the ledger existed."""
+        for path in directory.glob("*.json"):
+            try:
+                envelope = envelope_from_json(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError, json.JSONDecodeError):
+                continue
+            self.record(path, envelope.idempotency_key)
+
+
+def _open_ledger(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=1.0)
+    try:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            "envelope_id TEXT PRIMARY KEY, idempotency_key TEXT NOT NULL, captured_ms INTEGER)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_processed_idempotency_key ON processed (idempotency_key)"
+        )
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
+
+
+@contextlib.contextmanager
+def processed_ledger() -> Iterator[ProcessedLedger]:
+    """Open the archive's idempotency ledger; changes commit when the block exits.
+
+    The first open after an upgrade (or after the ledger was lost) indexes the
+    existing archive once; every later sweep only touches its pending envelopes.
+    A ledger SQLite cannot read is rebuilt the same way — the archive files are
+    the source of truth, the ledger only an index over them.
+    """
+    directory = _ensure_private_dir(processed_dir())
+    path = directory / LEDGER_FILE_NAME
+    try:
+        connection = _open_ledger(path)
+    except sqlite3.DatabaseError:
+        path.unlink(missing_ok=True)
+        connection = _open_ledger(path)
+    _secure_file(path)
+
+    with closing(connection), connection:
+        ledger = ProcessedLedger(connection)
+        # Trigger: the ledger is new, or a previous backfill never committed.
+        # Why: archives written before the ledger existed still hold replay keys.
+        # Outcome: the backfill and its version stamp commit together, exactly once.
+        if connection.execute("PRAGMA user_version").fetchone()[0] < LEDGER_VERSION:
+            ledger._backfill(directory)
+            connection.execute(f"PRAGMA user_version = {LEDGER_VERSION}")
+        yield ledger
 
 
 # --- Flush bookkeeping (the `bm hook status` debuggability surface) ---
@@ -1,7 +1,11 @@
 """Utilities for handling .gitignore patterns and file filtering."""
 
 import fnmatch
-from pathlib import Path
+import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path, PurePath
 from typing import Set
 
 from basic_memory.config import resolve_data_dir
@@ -220,67 +224,143 @@ def load_gitignore_patterns(base_path: Path, use_gitignore: bool = True) -> Set[
     return patterns
 
 
-def should_ignore_path(file_path: Path, base_path: Path, ignore_patterns: Set[str]) -> bool:
-    """Check if a file path should be ignored based on gitignore patterns.
+_GLOB_CHARACTERS = frozenset("*?[")
 
-    Args:
-        file_path: The file path to check
-        base_path: The base directory for relative path calculation
-        ignore_patterns: Set of patterns to match against
+# Directory and file names repeat across a tree, so per-name verdicts are memoized.
+# The bound only keeps a pathological tree from growing the memo without limit.
+_NAME_VERDICT_CACHE_LIMIT = 65536
 
-    Returns:
-        True if the path should be ignored, False otherwise
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Combine fnmatch patterns into one regex, normalized the way fnmatch.fnmatch does."""
+    translated = [
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in sorted(patterns)
+    ]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+class IgnoreMatcher:
+    """A pattern set compiled once for repeated ``should_ignore_path`` checks.
+
+    Matching is identical to evaluating every pattern with fnmatch, but literal
+    patterns become set lookups and the globs share one combined regex, so a
+    check costs a few hash probes instead of one fnmatch call per pattern per
+    path part.
     """
-    # Get the relative path from base
-    try:
-        relative_path = file_path.relative_to(base_path)
-        relative_str = str(relative_path)
-        relative_posix = relative_path.as_posix()  # Use forward slashes for matching
 
-        # Check each pattern
+    def __init__(self, ignore_patterns: Iterable[str]) -> None:
+        root_directory_names: set[str] = set()
+        root_globs: set[str] = set()
+        exact_names: set[str] = set()
+        literal_names: set[str] = set()
+        globs: set[str] = set()
+
         for pattern in ignore_patterns:
-            # Handle patterns starting with / (root relative)
+            # Patterns starting with / are anchored at the project root
             if pattern.startswith("/"):
-                root_pattern = pattern[1:]  # Remove leading /
-
-                # For directory patterns ending with /
+                root_pattern = pattern[1:]
                 if root_pattern.endswith("/"):
-                    dir_name = root_pattern[:-1]  # Remove trailing /
-                    # Check if the first part of the path matches the directory name
-                    if len(relative_path.parts) > 0 and relative_path.parts[0] == dir_name:
-                        return True
+                    root_directory_names.add(root_pattern[:-1])
                 else:
-                    # Regular root-relative pattern
-                    if fnmatch.fnmatch(relative_posix, root_pattern):
-                        return True
+                    root_globs.add(root_pattern)
                 continue
 
-            # Handle directory patterns (ending with /)
+            # Directory patterns (ending with /) only match whole path parts
             if pattern.endswith("/"):
-                dir_name = pattern[:-1]  # Remove trailing /
-                # Check if any path part matches the directory name
-                if dir_name in relative_path.parts:
-                    return True
+                exact_names.add(pattern[:-1])
                 continue
 
-            # Direct name match (e.g., ".git", "node_modules")
-            if pattern in relative_path.parts:
-                return True
+            # Everything else matches a path part or the full relative path
+            exact_names.add(pattern)
+            if _GLOB_CHARACTERS.isdisjoint(pattern):
+                literal_names.add(os.path.normcase(pattern))
+            else:
+                globs.add(pattern)
+
+        self._root_directory_names = frozenset(root_directory_names)
+        self._root_glob = _compile_globs(root_globs)
+        self._exact_names = frozenset(exact_names)
+        self._literal_names = frozenset(literal_names)
+        self._glob = _compile_globs(globs)
+        self._name_verdicts: dict[str, bool] = {}
+
+    def _matches_pattern(self, name: str) -> bool:
+        """Return whether a non-anchored pattern fnmatches ``name`` (a part or a full path)."""
+        normalized = os.path.normcase(name)
+        if normalized in self._literal_names:
+            return True
+        return self._glob is not None and self._glob.match(normalized) is not None
+
+    def _ignores_part(self, part: str) -> bool:
+        verdict = self._name_verdicts.get(part)
+        if verdict is None:
+            if len(self._name_verdicts) >= _NAME_VERDICT_CACHE_LIMIT:
+                self._name_verdicts.clear()
+            verdict = part in self._exact_names or self._matches_pattern(part)
+            self._name_verdicts[part] = verdict
+        return verdict
+
+    def ignores_relative(self, relative_path: PurePath) -> bool:
+        """Return True if a project-relative path matches any pattern."""
+        parts = relative_path.parts
+        if parts and parts[0] in self._root_directory_names:
+            return True
+
+        relative_posix = relative_path.as_posix()
+        if (
+            self._root_glob is not None
+            and self._root_glob.match(os.path.normcase(relative_posix)) is not None
+        ):
+            return True
+
+        if any(self._ignores_part(part) for part in parts):
+            return True
+
+        # Full-path matches cover globs that span directories, such as "docs/*.tmp"
+        relative_str = str(relative_path)
+        return self._matches_pattern(relative_posix) or (
+            relative_str != relative_posix and self._matches_pattern(relative_str)
+        )
+
+    def ignores(self, file_path: Path, base_path: Path) -> bool:
+        """Return True if ``file_path`` under ``base_path`` matches any pattern."""
+        try:
+            relative_path = file_path.relative_to(base_path)
+        except ValueError:
+            # If we can't get relative path, don't ignore
+            return False
+        return self.ignores_relative(relative_path)
+
+
+@lru_cache(maxsize=64)
+def _compile_ignore_pattern_set(ignore_patterns: frozenset[str]) -> IgnoreMatcher:
+    return IgnoreMatcher(ignore_patterns)
 
-            # Check if any individual path part matches the glob pattern
-            # This handles cases like ".*" matching ".hidden.md" in "concept/.hidden.md"
-            for part in relative_path.parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
 
-            # Glob pattern match on full path
-            if fnmatch.fnmatch(relative_posix, pattern) or fnmatch.fnmatch(relative_str, pattern):
-                return True  # pragma: no cover
+def compile_ignore_patterns(ignore_patterns: Iterable[str]) -> IgnoreMatcher:
+    """Return the compiled matcher for a pattern set.
+
+    Matchers are cached by pattern content, so every scan of one project reuses
+    the same matcher, and editing .bmignore or .gitignore yields a new one the
+    next time the patterns are loaded.
+    """
+    return _compile_ignore_pattern_set(frozenset(ignore_patterns))
+
+
+def should_ignore_path(file_path: Path, base_path: Path, ignore_patterns: Set[str]) -> bool:
+    """Check if a file path should be ignored based on gitignore patterns.
 
-        return False
-    except ValueError:
-        # If we can't get relative path, don't ignore
-        return False
+    Args:
+        file_path: The file path to check
+        base_path: The base directory for relative path calculation
+        ignore_patterns: Set of patterns to match against
+
+    Returns:
+        True if the path should be ignored, False otherwise
+    """
+    return compile_ignore_patterns(ignore_patterns).ignores(file_path, base_path)
 
 
 def filter_files(
@@ -299,11 +379,12 @@ def filter_files(
     if ignore_patterns is None:
         ignore_patterns = load_gitignore_patterns(base_path)
 
+    matcher = compile_ignore_patterns(ignore_patterns)
     filtered_files = []
     ignored_count = 0
 
     for file_path in files:
-        if should_ignore_path(file_path, base_path, ignore_patterns):
+        if matcher.ignores(file_path, base_path):
             ignored_count += 1
         else:
             filtered_files.append(file_path)
@@ -1,6 +1,12 @@
 """Import services for Basic Memory."""
 
-from basic_memory.importers.base import Importer, ImportReadCache
+from basic_memory.importers.base import (
+    ImportedFileIndexer,
+    Importer,
+    ImportInterruptedError,
+    ImportProgress,
+    ImportReadCache,
+)
 from basic_memory.importers.chatgpt_importer import ChatGPTImporter
 from basic_memory.importers.claude_conversations_importer import (
     ClaudeConversationsImporter,
@@ -13,6 +19,14 @@ from basic_memory.importers.project_zip_import import (
     ProjectZipImportPlan,
     build_project_zip_import_plan,
 )
+from basic_memory.importers.streaming import (
+    ImportSourceError,
+    ImportSourceTooLargeError,
+    InvalidImportSourceError,
+    file_chunk_reader,
+    iter_json_array,
+    iter_json_lines,
+)
 from basic_memory.schemas.importer import (
     ChatImportResult,
     EntityImportResult,
@@ -22,7 +36,13 @@ from basic_memory.schemas.importer import (
 
 __all__ = [
     "Importer",
+    "ImportedFileIndexer",
+    "ImportInterruptedError",
+    "ImportProgress",
     "ImportReadCache",
+    "ImportSourceError",
+    "ImportSourceTooLargeError",
+    "InvalidImportSourceError",
     "ChatGPTImporter",
     "ClaudeConversationsImporter",
     "ClaudeProjectsImporter",
@@ -35,4 +55,7 @@ __all__ = [
     "EntityImportResult",
     "ProjectImportResult",
     "build_project_zip_import_plan",
+    "file_chunk_reader",
+    "iter_json_array",
+    "iter_json_lines",
 ]
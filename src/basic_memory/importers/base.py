@@ -1,12 +1,16 @@
 """Base import service for Basic Memory."""
 
+import asyncio
 import logging
 from abc import abstractmethod
+from collections.abc import AsyncIterable, Callable
 from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
+from basic_memory.importers.streaming import ImportSourceError
+from basic_memory.index.imported_files import ImportedFileIndexer
 from basic_memory.markdown.markdown_processor import MarkdownProcessor
 from basic_memory.markdown.schemas import EntityMarkdown
 from basic_memory.read_cache import ReadCacheInvalidator, invalidate_cache
@@ -20,6 +24,10 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=ImportResult)
 
+# Used when the file service has no app config (CLI and tests); see BasicMemoryConfig.
+DEFAULT_IMPORT_WRITE_MAX_CONCURRENT = 8
+DEFAULT_IMPORT_INDEX_BATCH_SIZE = 32
+
 
 @dataclass(frozen=True, slots=True)
 class ImportReadCache:
@@ -29,6 +37,34 @@ class ImportReadCache:
     project_id: str
 
 
+@dataclass(frozen=True, slots=True)
+class ImportProgress:
+    """How far one import has come.
+
+    ``checkpoint`` counts source items, from the start of the source, whose notes
+    are all written. Passing it back as ``resume_from`` continues an interrupted
+    import without converting or writing those items again.
+    """
+
+    checkpoint: int
+    notes_written: int
+    notes_indexed: int
+
+
+type ImportProgressCallback = Callable[[ImportProgress], None]
+
+
+class ImportInterruptedError(Exception):
+    """Writing or indexing failed partway through an import.
+
+    Importers turn it into a failed result whose ``resume_from`` is ``checkpoint``.
+    """
+
+    def __init__(self, checkpoint: int, error: BaseException) -> None:
+        super().__init__(f"{error} (resume with resume_from={checkpoint})")
+        self.checkpoint = checkpoint
+
+
 class Importer[T: ImportResult]:
     """Base class for all import services.
 
@@ -44,6 +80,7 @@ class Importer[T: ImportResult]:
         project_name: Optional[str] = None,
         *,
         read_cache: ImportReadCache | None = None,
+        file_indexer: ImportedFileIndexer | None = None,
     ):
         """Initialize the import service.
 
@@ -51,6 +88,8 @@ class Importer[T: ImportResult]:
             base_path: Base path for the project.
             markdown_processor: MarkdownProcessor instance for markdown serialization.
             file_service: FileService instance for all file operations.
+            file_indexer: Optional indexer for written files. Without one, imported
+                files are indexed by the next sync or reindex.
         """
         self.base_path = base_path.resolve()  # Get absolute path
         self.markdown_processor = markdown_processor
@@ -58,6 +97,7 @@ class Importer[T: ImportResult]:
         self.project_name = project_name
         self.project_permalink = generate_permalink(project_name) if project_name else None
         self.read_cache = read_cache
+        self.file_indexer = file_indexer
 
     @abstractmethod
     async def import_data(self, source_data, destination_folder: str, **kwargs: Any) -> T:
@@ -102,6 +142,157 @@ class Importer[T: ImportResult]:
             # FileService.write_file handles directory creation and returns checksum
             return await self.file_service.write_file(file_path, content)
 
+    async def write_entities(
+        self,
+        entities: AsyncIterable[tuple[str, EntityMarkdown]],
+        *,
+        resume_from: int = 0,
+        progress: ImportProgressCallback | None = None,
+    ) -> ImportProgress:
+        """Write converted notes through a bounded pool and index them in batches.
+
+        ``entities`` yields one ``(file_path, entity)`` pair per source item,
+        starting at source item ``resume_from``. Up to ``import_write_max_concurrent``
+        writes run at once, and the next item is not pulled until a slot frees, so a
+        streamed source is only parsed as fast as its notes are written. Written
+        files go to the file indexer ``index_batch_size`` at a time.
+
+        Args:
+            entities: Converted notes, in source order.
+            resume_from: Index of the first source item ``entities`` yields.
+            progress: Optional callback invoked after every written note.
+
+        Returns:
+            The final progress of the import.
+
+        Raises:
+            ImportInterruptedError: A write or index batch failed. Notes before its
+                ``checkpoint`` are written; files may exist past it as well.
+            ImportSourceError: The source turned out unreadable partway through;
+                its ``checkpoint`` is set the same way.
+        """
+        app_config = self.file_service.app_config
+        write_limit = (
+            app_config.import_write_max_concurrent
+            if app_config is not None
+            else DEFAULT_IMPORT_WRITE_MAX_CONCURRENT
+        )
+        index_batch_size = (
+            app_config.index_batch_size
+            if app_config is not None
+            else DEFAULT_IMPORT_INDEX_BATCH_SIZE
+        )
+
+        slots = asyncio.Semaphore(write_limit)
+        pending: set[asyncio.Task[None]] = set()
+        # Two items can map to the same file (same title on the same day). The later
+        # write waits for the earlier one, so the last item in the source still wins.
+        latest_write_by_path: dict[str, asyncio.Task[None]] = {}
+        finished_offsets: set[int] = set()
+        unindexed_paths: dict[str, None] = {}
+        failures: list[BaseException] = []
+        checkpoint = resume_from
+        notes_written = 0
+        notes_indexed = 0
+
+        def report() -> ImportProgress:
+            current = ImportProgress(
+                checkpoint=checkpoint,
+                notes_written=notes_written,
+                notes_indexed=notes_indexed,
+            )
+            if progress is not None:
+                progress(current)
+            return current
+
+        async def write(
+            offset: int,
+            file_path: str,
+            entity: EntityMarkdown,
+            previous: asyncio.Task[None] | None,
+        ) -> None:
+            nonlocal checkpoint, notes_written
+            try:
+                if previous is not None:
+                    await asyncio.wait([previous])
+                await self.write_entity(entity, file_path)
+            except Exception as e:
+                failures.append(e)
+                return
+            finally:
+                slots.release()
+                if latest_write_by_path.get(file_path) is asyncio.current_task():
+                    del latest_write_by_path[file_path]
+
+            notes_written += 1
+            finished_offsets.add(offset)
+            while checkpoint in finished_offsets:
+                finished_offsets.remove(checkpoint)
+                checkpoint += 1
+            if self.file_indexer is not None:
+                unindexed_paths[file_path] = None
+            report()
+
+        async def index_written() -> None:
+            nonlocal notes_indexed
+            if self.file_indexer is None or not unindexed_paths:
+                return
+            batch = list(unindexed_paths)
+            unindexed_paths.clear()
+            try:
+                notes_indexed += await self.file_indexer.index_imported_files(batch)
+            except Exception as e:
+                raise ImportInterruptedError(checkpoint, e) from e
+            logger.info(
+                "Import progress: %s notes written, %s indexed, checkpoint %s",
+                notes_written,
+                notes_indexed,
+                checkpoint,
+            )
+
+        offset = resume_from
+        try:
+            async for file_path, entity in entities:
+                await slots.acquire()
+                if failures:
+                    slots.release()
+                    break
+                task = asyncio.create_task(
+                    write(offset, file_path, entity, latest_write_by_path.get(file_path))
+                )
+                latest_write_by_path[file_path] = task
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                offset += 1
+                if len(unindexed_paths) >= index_batch_size:
+                    await index_written()
+        except ImportSourceError as e:
+            # Trigger: a malformed or oversized item surfaced after earlier notes were written.
+            # Why: the caller can only resume a corrected source from a committed position.
+            # Outcome: in-flight writes settle and are indexed, then the error carries
+            #   that position.
+            await asyncio.gather(*pending, return_exceptions=True)
+            if not failures:
+                await index_written()
+            e.checkpoint = checkpoint
+            raise
+        finally:
+            # Trigger: the source failed to parse, or the import was cancelled.
+            # Why: in-flight writes hold converted notes and open temp files.
+            # Outcome: they finish before the error propagates.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if failures:
+            raise ImportInterruptedError(checkpoint, failures[0]) from failures[0]
+        await index_written()
+        return report()
+
+    def handle_interruption(self, error: ImportInterruptedError) -> T:
+        """Report an interrupted import as a failed result that says where to resume."""
+        result = self.handle_error("Import interrupted", error.__cause__ or error)
+        result.resume_from = error.checkpoint
+        return result
+
     def canonical_permalink(self, path: str) -> str:
         """Build a canonical permalink for imported content."""
         include_project = True
@@ -1,11 +1,17 @@
 """Claude conversations import service for Basic Memory."""
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import override, Any, Dict, List, Optional
 
 from basic_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown
-from basic_memory.importers.base import Importer
+from basic_memory.importers.base import (
+    Importer,
+    ImportInterruptedError,
+    ImportProgressCallback,
+)
+from basic_memory.importers.streaming import ImportSource, ImportSourceError, iter_import_items
 from basic_memory.schemas.importer import ChatImportResult
 from basic_memory.importers.utils import clean_filename, format_timestamp
 
@@ -31,13 +37,23 @@ class ClaudeConversationsImporter(Importer[ChatImportResult]):
 
     @override
     async def import_data(
-        self, source_data, destination_folder: str, **kwargs: Any
+        self,
+        source_data: ImportSource,
+        destination_folder: str,
+        *,
+        resume_from: int = 0,
+        progress: ImportProgressCallback | None = None,
+        **kwargs: Any,
     ) -> ChatImportResult:
         """Import conversations from Claude JSON export.
 
         Args:
-            source_data: Path to the Claude conversations.json file.
+            source_data: Conversations from conversations.json, as a list or as a
+                stream from ``iter_json_array``.
             destination_folder: Destination folder within the project.
+            resume_from: Number of leading conversations to skip, i.e. the
+                checkpoint reached by an interrupted import of the same export.
+            progress: Optional callback invoked after every written conversation.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -47,40 +63,40 @@ class ClaudeConversationsImporter(Importer[ChatImportResult]):
             # Ensure the destination folder exists
             await self.ensure_folder_exists(destination_folder)
 
-            conversations = source_data
-
             # Process each conversation
             messages_imported = 0
             chats_imported = 0
 
-            for chat in conversations:
-                # Get name, providing default for unnamed conversations
-                chat_name = chat.get("name") or f"Conversation {chat.get('uuid', 'untitled')}"
-                date_prefix = datetime.fromisoformat(
-                    chat["created_at"].replace("Z", "+00:00")
-                ).strftime("%Y%m%d")
-                clean_title = clean_filename(chat_name)
-                relative_path = (
-                    f"{destination_folder}/{date_prefix}-{clean_title}"
-                    if destination_folder
-                    else f"{date_prefix}-{clean_title}"
-                )
-                permalink, file_path = self.build_import_paths(relative_path)
-
-                # Convert to entity
-                entity = self._format_chat_content(
-                    name=chat_name,
-                    messages=chat["chat_messages"],
-                    created_at=chat["created_at"],
-                    modified_at=chat["updated_at"],
-                    permalink=permalink,
-                )
-
-                # Write file using relative path - FileService handles base_path
-                await self.write_entity(entity, file_path)
-
-                chats_imported += 1
-                messages_imported += len(chat["chat_messages"])
+            async def entities() -> AsyncIterator[tuple[str, EntityMarkdown]]:
+                nonlocal messages_imported, chats_imported
+                async for chat in iter_import_items(source_data, start=resume_from):
+                    # Get name, providing default for unnamed conversations
+                    chat_name = chat.get("name") or f"Conversation {chat.get('uuid', 'untitled')}"
+                    date_prefix = datetime.fromisoformat(
+                        chat["created_at"].replace("Z", "+00:00")
+                    ).strftime("%Y%m%d")
+                    clean_title = clean_filename(chat_name)
+                    relative_path = (
+                        f"{destination_folder}/{date_prefix}-{clean_title}"
+                        if destination_folder
+                        else f"{date_prefix}-{clean_title}"
+                    )
+                    permalink, file_path = self.build_import_paths(relative_path)
+
+                    chats_imported += 1
+                    messages_imported += len(chat["chat_messages"])
+
+                    # Convert to entity; write_entities writes it with a relative path
+                    entity = self._format_chat_content(
+                        name=chat_name,
+                        messages=chat["chat_messages"],
+                        created_at=chat["created_at"],
+                        modified_at=chat["updated_at"],
+                        permalink=permalink,
+                    )
+                    yield file_path, entity
+
+            await self.write_entities(entities(), resume_from=resume_from, progress=progress)
 
             return ChatImportResult(
                 import_count={"conversations": chats_imported, "messages": messages_imported},
@@ -89,6 +105,12 @@ class ClaudeConversationsImporter(Importer[ChatImportResult]):
                 messages=messages_imported,
             )
 
+        except ImportSourceError:
+            # The export itself is unreadable; callers report that as bad input.
+            raise
+        except ImportInterruptedError as e:
+            logger.warning("Import of Claude conversations interrupted: %s", e)
+            return self.handle_interruption(e)
         except Exception as e:  # pragma: no cover
             logger.exception("Failed to import Claude conversations")
             return self.handle_error("Failed to import Claude conversations", e)
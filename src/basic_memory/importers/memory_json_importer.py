@@ -1,10 +1,17 @@
 """Memory JSON import service for Basic Memory."""
 
 import logging
+from collections.abc import AsyncIterator
+from itertools import islice
 from typing import override, Any, Dict, List, Optional
 
 from basic_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown, Observation, Relation
-from basic_memory.importers.base import Importer
+from basic_memory.importers.base import (
+    Importer,
+    ImportInterruptedError,
+    ImportProgressCallback,
+)
+from basic_memory.importers.streaming import ImportSource, ImportSourceError, iter_import_items
 from basic_memory.schemas.importer import EntityImportResult
 
 logger = logging.getLogger(__name__)
@@ -30,13 +37,27 @@ class MemoryJsonImporter(Importer[EntityImportResult]):
 
     @override
     async def import_data(
-        self, source_data, destination_folder: str = "", **kwargs: Any
+        self,
+        source_data: ImportSource,
+        destination_folder: str = "",
+        *,
+        resume_from: int = 0,
+        progress: ImportProgressCallback | None = None,
+        **kwargs: Any,
     ) -> EntityImportResult:
         """Import entities and relations from a memory.json file.
 
+        Relations are listed separately from the entity they start from, so every
+        line is read before the first entity is written; only the parsed entities
+        and relations are held, not the raw file.
+
         Args:
-            source_data: Path to the memory.json file.
+            source_data: memory.json lines, as a list or as a stream from
+                ``iter_json_lines``.
             destination_folder: Optional destination folder within the project.
+            resume_from: Number of leading entities to skip, i.e. the checkpoint
+                reached by an interrupted import of the same file.
+            progress: Optional callback invoked after every written entity.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -53,7 +74,7 @@ class MemoryJsonImporter(Importer[EntityImportResult]):
                 await self.ensure_folder_exists(destination_folder)
 
             # First pass - collect entities and relations
-            for line in source_data:
+            async for line in iter_import_items(source_data):
                 data = line
                 if data["type"] == "entity":
                     # Handle different possible name keys
@@ -77,43 +98,48 @@ class MemoryJsonImporter(Importer[EntityImportResult]):
 
             # Second pass - create and write entities
             entities_created = 0
-            for name, entity_data in entities.items():
-                # Get entity type with fallback
-                entity_type = entity_data.get("entityType") or entity_data.get("type") or "entity"
-
-                # Build permalink with optional destination folder prefix
-                relative_path = (
-                    f"{destination_folder}/{entity_type}/{name}"
-                    if destination_folder
-                    else f"{entity_type}/{name}"
-                )
-                permalink, file_path = self.build_import_paths(relative_path)
-
-                # Ensure entity type directory exists using FileService with relative path
-                entity_type_dir = (
-                    f"{destination_folder}/{entity_type}" if destination_folder else entity_type
-                )
-                await self.file_service.ensure_directory(entity_type_dir)
-
-                # Get observations with fallback to empty list
-                observations = entity_data.get("observations", [])
-
-                entity = EntityMarkdown(
-                    frontmatter=EntityFrontmatter(
-                        metadata={
-                            "type": entity_type,
-                            "title": name,
-                            "permalink": permalink,
-                        }
-                    ),
-                    content=f"# {name}\n",
-                    observations=[Observation(content=obs) for obs in observations],
-                    relations=entity_relations.get(name, []),
-                )
-
-                # Write file using relative path - FileService handles base_path
-                await self.write_entity(entity, file_path)
-                entities_created += 1
+
+            async def entity_files() -> AsyncIterator[tuple[str, EntityMarkdown]]:
+                nonlocal entities_created
+                for name, entity_data in islice(entities.items(), resume_from, None):
+                    # Get entity type with fallback
+                    entity_type = (
+                        entity_data.get("entityType") or entity_data.get("type") or "entity"
+                    )
+
+                    # Build permalink with optional destination folder prefix
+                    relative_path = (
+                        f"{destination_folder}/{entity_type}/{name}"
+                        if destination_folder
+                        else f"{entity_type}/{name}"
+                    )
+                    permalink, file_path = self.build_import_paths(relative_path)
+
+                    # Ensure entity type directory exists using FileService with relative path
+                    entity_type_dir = (
+                        f"{destination_folder}/{entity_type}" if destination_folder else entity_type
+                    )
+                    await self.file_service.ensure_directory(entity_type_dir)
+
+                    # Get observations with fallback to empty list
+                    observations = entity_data.get("observations", [])
+
+                    entity = EntityMarkdown(
+                        frontmatter=EntityFrontmatter(
+                            metadata={
+                                "type": entity_type,
+                                "title": name,
+                                "permalink": permalink,
+                            }
+                        ),
+                        content=f"# {name}\n",
+                        observations=[Observation(content=obs) for obs in observations],
+                        relations=entity_relations.get(name, []),
+                    )
+                    entities_created += 1
+                    yield file_path, entity
+
+            await self.write_entities(entity_files(), resume_from=resume_from, progress=progress)
 
             relations_count = sum(len(rels) for rels in entity_relations.values())
 
@@ -125,6 +151,15 @@ class MemoryJsonImporter(Importer[EntityImportResult]):
                 skipped_entities=skipped_entities,
             )
 
+        except ImportSourceError as e:
+            # The file itself is unreadable; callers report that as bad input. Nothing
+            # is written before every line is read, so a retry resumes where this began.
+            if e.checkpoint is None:
+                e.checkpoint = resume_from
+            raise
+        except ImportInterruptedError as e:
+            logger.warning("Import of memory.json interrupted: %s", e)
+            return self.handle_interruption(e)
         except Exception as e:  # pragma: no cover
             logger.exception("Failed to import memory.json")
             return self.handle_error("Failed to import memory.json", e)
@@ -0,0 +1,228 @@
+"""Incremental readers for JSON import sources.
+
+Chat exports are one JSON array of conversations and memory.json is one JSON
+value per line. Decoding either with a single ``json.loads`` holds the raw
+bytes, the decoded text and the whole object tree in memory at once, so a
+multi-GB export needs several times its size in RAM. The readers here pull the
+source in fixed-size chunks and yield one top-level item at a time: an import
+holds roughly one conversation however large the export is.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, BinaryIO
+
+# Reads up to the requested number of bytes; b"" means the source is exhausted.
+# ``UploadFile.read`` has this shape, and ``file_chunk_reader`` adapts open files.
+type ImportChunkReader = Callable[[int], Awaitable[bytes]]
+
+# Either an already-decoded list of items or a stream from the readers below.
+type ImportSource = Iterable[Any] | AsyncIterable[Any]
+
+IMPORT_READ_CHUNK_BYTES = 1024 * 1024
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+
+class ImportSourceError(Exception):
+    """The import source itself is unusable; nothing about it is worth retrying.
+
+    ``checkpoint`` is set when the problem surfaced partway through an import. It
+    counts the leading source items whose notes are written, so a corrected source
+    can be imported again with ``resume_from=checkpoint``.
+    """
+
+    checkpoint: int | None = None
+
+
+class ImportSourceTooLargeError(ImportSourceError):
+    """The import source is larger than the configured upload limit."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"Import file exceeds maximum size of {max_bytes} bytes.")
+        self.max_bytes = max_bytes
+
+
+class InvalidImportSourceError(ImportSourceError):
+    """The import source is not valid UTF-8 JSON in the expected shape."""
+
+
+def file_chunk_reader(file: BinaryIO) -> ImportChunkReader:
+    """Adapt a binary file opened for reading to an ``ImportChunkReader``."""
+
+    async def read(size: int) -> bytes:
+        return file.read(size)
+
+    return read
+
+
+async def _read_text(
+    read: ImportChunkReader,
+    *,
+    max_bytes: int | None,
+    chunk_size: int,
+) -> AsyncIterator[str]:
+    """Yield the source as decoded text chunks, enforcing ``max_bytes`` as it goes."""
+    # utf-8-sig accepts exports saved with a byte-order mark, as json.loads(bytes) does.
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    bytes_read = 0
+    while True:
+        chunk = await read(chunk_size)
+        bytes_read += len(chunk)
+        if max_bytes is not None and bytes_read > max_bytes:
+            raise ImportSourceTooLargeError(max_bytes)
+        try:
+            text = decoder.decode(chunk, final=not chunk)
+        except UnicodeDecodeError as e:
+            raise InvalidImportSourceError(str(e)) from e
+        if text:
+            yield text
+        if not chunk:
+            return
+
+
+class _JsonTextBuffer:
+    """Decoded source text that is read on demand and trimmed as values are consumed."""
+
+    def __init__(self, chunks: AsyncIterator[str], *, chunk_size: int) -> None:
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.text = ""
+        self.position = 0
+        self.exhausted = False
+
+    async def read_more(self, min_chars: int = 1) -> None:
+        """Append at least ``min_chars`` of text unless the source ends first."""
+        # Consumed text is dropped here, and new chunks are joined once, so a large
+        # value is copied a bounded number of times rather than once per chunk.
+        pieces = [self.text[self.position :]]
+        added = 0
+        while added < min_chars and not self.exhausted:
+            chunk = await anext(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                break
+            pieces.append(chunk)
+            added += len(chunk)
+        self.text = "".join(pieces)
+        self.position = 0
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the source."""
+        while True:
+            match = _NON_WHITESPACE.search(self.text, self.position)
+            if match is not None:
+                self.position = match.start()
+                return match.group()
+            self.position = len(self.text)
+            if self.exhausted:
+                return ""
+            await self.read_more()
+
+    async def decode_value(self) -> Any:
+        """Decode the JSON value that starts at the next non-whitespace character."""
+        await self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.position)
+            except json.JSONDecodeError as e:
+                if self.exhausted:
+                    raise InvalidImportSourceError(str(e)) from e
+            else:
+                # A number that ends the buffer may continue in the next chunk.
+                if end < len(self.text) or self.exhausted:
+                    self.position = end
+                    return value
+            # The value is incomplete. Parsing restarts from its beginning, so wait
+            # until the pending text has doubled to keep the total work linear.
+            await self.read_more(max(len(self.text) - self.position, self._chunk_size))
+
+
+async def iter_json_array(
+    read: ImportChunkReader,
+    *,
+    max_bytes: int | None = None,
+    chunk_size: int = IMPORT_READ_CHUNK_BYTES,
+) -> AsyncIterator[Any]:
+    """Yield the items of a top-level JSON array one at a time.
+
+    Raises:
+        InvalidImportSourceError: The source is not UTF-8 or not a JSON array.
+        ImportSourceTooLargeError: More than ``max_bytes`` were read.
+    """
+    buffer = _JsonTextBuffer(
+        _read_text(read, max_bytes=max_bytes, chunk_size=chunk_size), chunk_size=chunk_size
+    )
+    if await buffer.peek() != "[":
+        raise InvalidImportSourceError("Expecting '[' to start the export array")
+    buffer.position += 1
+
+    if await buffer.peek() == "]":
+        buffer.position += 1
+    else:
+        while True:
+            yield await buffer.decode_value()
+            delimiter = await buffer.peek()
+            if delimiter == "]":
+                buffer.position += 1
+                break
+            if delimiter != ",":
+                raise InvalidImportSourceError("Expecting ',' delimiter between items")
+            buffer.position += 1
+
+    if await buffer.peek():
+        raise InvalidImportSourceError("Extra data after the export array")
+
+
+async def iter_json_lines(
+    read: ImportChunkReader,
+    *,
+    max_bytes: int | None = None,
+    chunk_size: int = IMPORT_READ_CHUNK_BYTES,
+) -> AsyncIterator[Any]:
+    """Yield one decoded JSON value per line, as in a memory.json export.
+
+    Raises:
+        InvalidImportSourceError: The source is not UTF-8 or a line is not JSON.
+        ImportSourceTooLargeError: More than ``max_bytes`` were read.
+    """
+    pending = ""
+    async for text in _read_text(read, max_bytes=max_bytes, chunk_size=chunk_size):
+        lines = (pending + text).splitlines(keepends=True)
+        # The last line may continue in the next chunk; even a trailing "\r" may be
+        # the first half of "\r\n".
+        pending = lines.pop() if lines else ""
+        for line in lines:
+            yield _decode_line(line)
+    if pending:
+        yield _decode_line(pending)
+
+
+def _decode_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise InvalidImportSourceError(str(e)) from e
+
+
+async def iter_import_items(source: ImportSource, *, start: int = 0) -> AsyncIterator[Any]:
+    """Yield the items of a decoded list or a streamed source, skipping the first ``start``.
+
+    Skipped items of a stream are still parsed, since the position of an item in
+    the source is only known by reading up to it, but they are not converted or
+    written again.
+    """
+    index = 0
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            if index >= start:
+                yield item
+            index += 1
+        return
+    for item in source:
+        if index >= start:
+            yield item
+        index += 1
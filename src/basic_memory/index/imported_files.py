@@ -0,0 +1,12 @@
+"""Runtime-neutral capability for indexing the files an import writes."""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+
+class ImportedFileIndexer(Protocol):
+    """Capability that indexes a batch of files an import has just written."""
+
+    async def index_imported_files(self, file_paths: Sequence[str]) -> int:
+        """Index the files and return how many were indexed."""
+        ...
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import os
-from collections.abc import Mapping, Sequence
+import random
+from collections.abc import Callable, Mapping, Sequence
 from contextlib import nullcontext
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path, PurePath
 from typing import Any, override, Protocol
 
 from loguru import logger
@@ -16,7 +18,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from basic_memory import db
 from basic_memory.file_utils import FileError, FileMetadata, compute_checksum
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.ignore_utils import (
+    IgnoreMatcher,
+    compile_ignore_patterns,
+    load_gitignore_patterns,
+)
+from basic_memory.index.imported_files import ImportedFileIndexer
 from basic_memory.index.filesystem import local_relative_path_is_filtered
 from basic_memory.index.local_dependencies import (
     DefaultLocalIndexProjectDependencyProvider,
@@ -165,6 +172,26 @@ class RepositoryLocalProjectIndexedFileStatSource(LocalProjectIndexedFileStatSou
         }
 
 
+@dataclass(frozen=True, slots=True)
+class LocalProjectScannedFile:
+    """One regular file found by the project walk, with the stat taken while walking."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+    inode: int
+
+    @property
+    def metadata(self) -> FileMetadata:
+        """Return the same metadata FileService.get_file_metadata would report."""
+        return FileMetadata(
+            size=self.size,
+            created_at=datetime.fromtimestamp(self.ctime_ns / 1_000_000_000).astimezone(),
+            modified_at=datetime.fromtimestamp(self.mtime_ns / 1_000_000_000).astimezone(),
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class LocalProjectIndexScan:
     """Walk result for one local project scan.
@@ -172,11 +199,30 @@ class LocalProjectIndexScan:
     ``unreadable_directories`` names project-relative directories whose listing
     failed mid-walk; their contents are absent from ``file_paths`` even though
     the files may still exist, so callers must never treat that absence as a
-    delete signal.
+    delete signal. ``files`` carries the walk's stat for each path, when the
+    scan came from the filesystem walker.
     """
 
     file_paths: tuple[str, ...]
     unreadable_directories: tuple[str, ...]
+    files: tuple[LocalProjectScannedFile, ...] = ()
+
+
+@dataclass(slots=True)
+class LocalProjectScanStatHandoff:
+    """Hand the observation scan's stats to the batch reader of the same runtime.
+
+    The reader takes each stat at most once, so a file is stat'ed by the walk and
+    never again while it is indexed in that run.
+    """
+
+    _files: dict[str, LocalProjectScannedFile] = field(default_factory=dict)
+
+    def publish(self, files: Sequence[LocalProjectScannedFile]) -> None:
+        self._files = {scanned.path: scanned for scanned in files}
+
+    def take(self, file_path: str) -> LocalProjectScannedFile | None:
+        return self._files.pop(file_path, None)
 
 
 def record_local_project_scan_walk_error(
@@ -185,13 +231,12 @@ def record_local_project_scan_walk_error(
     project_root: Path,
     unreadable_directories: list[str],
 ) -> None:
-    """Classify one os.walk error raised during a local project scan."""
+    """Classify one directory listing error raised during a local project scan."""
     # Trigger: the walk error carries no directory attribution.
     # Why: without a directory we cannot carry its indexed rows through the
     # snapshot, so finishing the scan could still plan a mass delete for an
     # unknown subtree.
-    # Outcome: fail the whole scan (RuntimeError bypasses the walk loop's
-    # partial-snapshot OSError handling); the next scan retries.
+    # Outcome: fail the whole scan; the next scan retries.
     if error.filename is None:
         raise RuntimeError("Local project scan failed without a directory attribution") from error
     # Trigger: the project root itself is unreadable (missing/unmounted).
@@ -225,64 +270,85 @@ def scan_local_project_index_files(
 ) -> LocalProjectIndexScan:
     """Walk one local project and report eligible files plus unreadable subtrees."""
     project_root = project_root.expanduser().resolve()
-    active_ignore_patterns = (
+    ignore_matcher = compile_ignore_patterns(
         ignore_patterns if ignore_patterns is not None else load_gitignore_patterns(project_root)
     )
-    file_paths: list[str] = []
+    files: list[LocalProjectScannedFile] = []
     unreadable_directories: list[str] = []
 
-    # os.walk lets us prune ignored/hidden directories *before* descending —
-    # rglob("*") would stat every file inside node_modules/.venv/.git first — and
-    # does not follow symlinked directories (followlinks=False). Symlinked files
-    # are skipped explicitly so the batch reader never reads outside the project
-    # boundary. This restores the pre-refactor scanner's no-follow + dir-pruning.
-    def _scan_error(error: OSError) -> None:
-        record_local_project_scan_walk_error(
-            error,
-            project_root=project_root,
-            unreadable_directories=unreadable_directories,
-        )
-
-    walker = os.walk(project_root, followlinks=False, onerror=_scan_error)
-    while True:
+    # The walk is built on os.scandir so every decision comes from DirEntry data:
+    # file type is known from the listing and each eligible file costs exactly one
+    # lstat, which is handed on so nothing stats it again. Ignored and hidden
+    # directories are pruned before descent, symlinked directories are never
+    # followed, and symlinked files are skipped so the batch reader never reads
+    # outside the project boundary.
+    pending: list[tuple[str, str]] = [(str(project_root), "")]
+    while pending:
+        directory, relative_prefix = pending.pop()
         try:
-            dirpath, dirnames, filenames = next(walker)
-        except StopIteration:
-            break
-        except OSError:
-            # The root scan failed (onerror re-raised). Never return an empty,
-            # delete-everything snapshot; files discovered before a deeper traversal
-            # error are kept.
-            if not file_paths:
-                raise
-            break
-
-        root_path = Path(dirpath)
-        # Prune in place so os.walk never descends into ignored/hidden directories.
-        dirnames[:] = [
-            name
-            for name in dirnames
-            if not name.startswith(".")
-            and not should_ignore_path(root_path / name, project_root, active_ignore_patterns)
-        ]
-
-        for name in filenames:
-            path = root_path / name
+            with os.scandir(directory) as listing:
+                entries = list(listing)
+        except OSError as error:
+            # Raises for the project root or an unattributed error; a subtree
+            # failure is recorded so its indexed rows are carried, not deleted.
+            record_local_project_scan_walk_error(
+                error,
+                project_root=project_root,
+                unreadable_directories=unreadable_directories,
+            )
+            continue
+
+        for entry in entries:
+            relative_path = relative_prefix + entry.name
             try:
-                if path.is_symlink() or not path.is_file():
-                    continue
+                is_directory = entry.is_dir(follow_symlinks=False)
             except OSError:
+                is_directory = False
+            if is_directory:
+                if not entry.name.startswith(".") and not ignore_matcher.ignores_relative(
+                    PurePath(relative_path)
+                ):
+                    pending.append((entry.path, f"{relative_path}/"))
                 continue
-            relative_path = path.relative_to(project_root).as_posix()
-            if local_relative_path_is_filtered(relative_path):
-                continue
-            if should_ignore_path(path, project_root, active_ignore_patterns):
-                continue
-            file_paths.append(relative_path)
 
+            scanned = _scan_local_project_file(entry, relative_path, ignore_matcher)
+            if scanned is not None:
+                files.append(scanned)
+
+    files.sort(key=lambda scanned: scanned.path)
     return LocalProjectIndexScan(
-        file_paths=tuple(sorted(file_paths)),
+        file_paths=tuple(scanned.path for scanned in files),
         unreadable_directories=tuple(unreadable_directories),
+        files=tuple(files),
+    )
+
+
+def _scan_local_project_file(
+    entry: os.DirEntry[str],
+    relative_path: str,
+    ignore_matcher: IgnoreMatcher,
+) -> LocalProjectScannedFile | None:
+    """Return the scan record for an eligible regular file, or None to skip it."""
+    try:
+        # follow_symlinks=False: symlinked files are never indexed.
+        if not entry.is_file(follow_symlinks=False):
+            return None
+    except OSError:
+        return None
+    if local_relative_path_is_filtered(relative_path):
+        return None
+    if ignore_matcher.ignores_relative(PurePath(relative_path)):
+        return None
+    try:
+        stat_result = entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+    return LocalProjectScannedFile(
+        path=relative_path,
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        ctime_ns=stat_result.st_ctime_ns,
+        inode=entry.inode(),
     )
 
 
@@ -293,6 +359,11 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
     file_service: FileService
     ignore_patterns: LocalProjectIndexIgnorePatterns | None = None
     indexed_stat_source: LocalProjectIndexedFileStatSource | None = None
+    stat_handoff: LocalProjectScanStatHandoff | None = None
+    # Fraction of stat-unchanged files hashed anyway, to catch edits that kept
+    # both size and mtime (restored backups, tools that reset timestamps).
+    checksum_verify_sample_rate: float = 0.0
+    checksum_verify_sampler: Callable[[], float] = random.random
 
     @override
     async def list_observed_index_files(self) -> tuple[RuntimeObservedIndexFile, ...]:
@@ -302,6 +373,9 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
             ignore_patterns=self.ignore_patterns,
         )
         file_paths = scan.file_paths
+        scanned_files = {scanned.path: scanned for scanned in scan.files}
+        if self.stat_handoff is not None:
+            self.stat_handoff.publish(scan.files)
         # Trigger: a stat source is wired (local runtime); it is absent in
         # cloud/tests that observe without a database.
         # Why: hashing every file on every startup is O(project bytes) and
@@ -319,10 +393,17 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
         observed_files: list[RuntimeObservedIndexFile] = []
         for file_path in file_paths:
             try:
-                metadata = await self.file_service.get_file_metadata(file_path)
+                scanned = scanned_files.get(file_path)
+                metadata = (
+                    scanned.metadata
+                    if scanned is not None
+                    else await self.file_service.get_file_metadata(file_path)
+                )
                 checksum = self._reuse_indexed_checksum(file_path, metadata, indexed_stats)
                 if checksum is None:
                     checksum = await self.file_service.compute_checksum(file_path)
+                elif self._sampled_for_verification():
+                    checksum = await self._verify_reused_checksum(file_path, checksum)
             except (OSError, FileError, FileOperationError) as exc:
                 # Trigger: a path the walk just listed fails stat/checksum
                 # (transient permission or mount error, or deleted mid-scan).
@@ -379,6 +460,25 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
             )
         return tuple(observed_files)
 
+    def _sampled_for_verification(self) -> bool:
+        return (
+            self.checksum_verify_sample_rate > 0
+            and self.checksum_verify_sampler() < self.checksum_verify_sample_rate
+        )
+
+    async def _verify_reused_checksum(self, file_path: str, indexed_checksum: str) -> str:
+        """Hash a stat-unchanged file and return its real checksum."""
+        checksum = await self.file_service.compute_checksum(file_path)
+        if checksum != indexed_checksum:
+            # Trigger: size and mtime matched the indexed row but the bytes did not.
+            # Why: the stat gate alone would have kept the stale index forever.
+            # Outcome: report the real checksum so change detection reindexes it.
+            logger.warning(
+                "Sampled checksum verification found a change the stat gate missed",
+                path=file_path,
+            )
+        return checksum
+
     async def _observed_file_confirmed_missing(self, file_path: RuntimeFilePath) -> bool:
         """Return True only when storage positively confirms the file is gone."""
         try:
@@ -493,6 +593,7 @@ class LocalIndexFileBatchReader(IndexFileBatchReader[IndexInputFile]):
     """Load current local files for the shared index-file batch runner."""
 
     file_service: FileService
+    stat_handoff: LocalProjectScanStatHandoff | None = None
 
     @override
     async def read_current_files(
@@ -513,7 +614,16 @@ class LocalIndexFileBatchReader(IndexFileBatchReader[IndexInputFile]):
     ) -> IndexFileBatchReadOutcome[IndexInputFile]:
         try:
             file_bytes = await self.file_service.read_file_bytes(file_path)
-            file_metadata = await self.file_service.get_file_metadata(file_path)
+            scanned = self.stat_handoff.take(file_path) if self.stat_handoff is not None else None
+            # Trigger: the project scan already stat'ed this file.
+            # Why: a second stat per file dominates cold indexing on network filesystems.
+            # Outcome: reuse the scan's stat unless the bytes we read disagree with its
+            # size, which means the file changed after the scan and needs a fresh stat.
+            file_metadata = (
+                scanned.metadata
+                if scanned is not None and scanned.size == len(file_bytes)
+                else await self.file_service.get_file_metadata(file_path)
+            )
         except FileOperationError as exc:
             if isinstance(exc.__cause__, FileNotFoundError):
                 return IndexFileBatchReadOutcome.terminal(
@@ -544,6 +654,39 @@ class LocalIndexFileBatchReader(IndexFileBatchReader[IndexInputFile]):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class LocalImportedFileIndexer(ImportedFileIndexer):
+    """Index batches of files an import just wrote through the shared batch indexer.
+
+    Imports write many files at once; indexing them here as batches replaces one
+    watcher-driven sync per file.
+    """
+
+    reader: IndexFileBatchReader[IndexInputFile]
+    indexer: IndexFileBatchIndexer[IndexInputFile]
+    max_concurrent: int = 8
+
+    @override
+    async def index_imported_files(self, file_paths: Sequence[str]) -> int:
+        read_result = await self.reader.read_current_files(
+            file_paths,
+            max_concurrent=self.max_concurrent,
+        )
+        if not read_result.files:
+            return 0
+
+        index_result = await self.indexer.index_files(
+            read_result.files,
+            max_concurrent=self.max_concurrent,
+            parse_max_concurrent=self.max_concurrent,
+            metadata_update_max_concurrent=self.max_concurrent,
+        )
+        # A file that fails to index is still imported; the next sync retries it.
+        for file_path, error in index_result.errors:
+            logger.warning("Imported file failed to index: path={} error={}", file_path, error)
+        return len(index_result.indexed)
+
+
 @dataclass(frozen=True, slots=True)
 class LocalProjectIndexBatchEnqueuer(ProjectIndexBatchEnqueuer):
     """Run project-index child batches through the shared batch-index runner."""
@@ -644,6 +787,8 @@ class LocalProjectIndexRuntimeFactory:
             if self.read_cache is not None
             else maintenance_store
         )
+        stat_handoff = LocalProjectScanStatHandoff()
+        app_config = dependencies.entity_service.app_config
         return LocalProjectIndexRuntime(
             observed_file_source=LocalProjectIndexObservedFileSource(
                 dependencies.file_service,
@@ -651,6 +796,10 @@ class LocalProjectIndexRuntimeFactory:
                     session_maker=dependencies.session_maker,
                     entity_repository=dependencies.entity_repository,
                 ),
+                stat_handoff=stat_handoff,
+                checksum_verify_sample_rate=(
+                    app_config.index_checksum_verify_sample_rate if app_config is not None else 0.0
+                ),
             ),
             change_detector=ChangeDetector(
                 session_maker=dependencies.session_maker,
@@ -667,7 +816,10 @@ class LocalProjectIndexRuntimeFactory:
             ),
             batch_enqueuer=LocalProjectIndexBatchEnqueuer(
                 checker=checker,
-                reader=LocalIndexFileBatchReader(dependencies.file_service),
+                reader=LocalIndexFileBatchReader(
+                    dependencies.file_service,
+                    stat_handoff=stat_handoff,
+                ),
                 indexer=dependencies.file_batch_indexer,
                 content_classifier=dependencies.file_service,
                 read_cache=self.read_cache,
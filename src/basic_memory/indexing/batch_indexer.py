@@ -33,6 +33,10 @@ from basic_memory.indexing.models import (
     IndexInputFile,
     RelationGenerationBatchResult,
 )
+from basic_memory.indexing.markdown_parse_pool import (
+    MarkdownParsePool,
+    get_markdown_parse_pool,
+)
 from basic_memory.indexing.relation_resolution import RepositoryRelationResolutionRuntime
 from basic_memory.indexing.relation_persistence import RelationGenerationPublisher
 from basic_memory.models import Entity
@@ -51,6 +55,33 @@ from basic_memory.services.exceptions import SyncFatalError
 T = TypeVar("T")
 
 
+class _PermalinkReservations:
+    """Permalinks taken during one indexing batch.
+
+    Hands out ``desired``, ``desired-1``, ``desired-2`` ... like the repository's
+    allocator, but remembers where each base's search stopped. Reservations only
+    ever grow, so every suffix below that point is still taken and a batch of many
+    same-titled notes costs one probe per note instead of one per earlier note.
+    """
+
+    def __init__(self, taken: set[str]) -> None:
+        self._taken = taken
+        self._next_suffix: dict[str, int] = {}
+
+    def add(self, permalink: str) -> None:
+        self._taken.add(permalink)
+
+    def reserve(self, desired_permalink: str) -> str:
+        permalink = desired_permalink
+        if permalink in self._taken:
+            suffix = self._next_suffix.get(desired_permalink, 1)
+            while (permalink := f"{desired_permalink}-{suffix}") in self._taken:
+                suffix += 1
+            self._next_suffix[desired_permalink] = suffix + 1
+        self._taken.add(permalink)
+        return permalink
+
+
 @dataclass(frozen=True, slots=True)
 class MarkdownOnlyIndexEntitySearchWriter:
     """Filter regular file entities out of batch search indexing."""
@@ -153,6 +184,11 @@ class BatchIndexer:
             entity_indexer=RelationResolutionSearchWriter(search_service),
         )
 
+    @property
+    def parse_pool(self) -> MarkdownParsePool | None:
+        """Return the shared markdown parse pool, or None when process parsing is off."""
+        return get_markdown_parse_pool(self.app_config.index_parse_workers)
+
     async def index_files(
         self,
         files: Mapping[str, IndexInputFile],
@@ -175,10 +211,14 @@ class BatchIndexer:
         markdown_paths = [path for path in ordered_paths if self._is_markdown(files[path])]
         regular_paths = [path for path in ordered_paths if path not in markdown_paths]
 
+        # A single file is not worth the round trip to a worker process.
+        use_parse_pool = len(markdown_paths) > 1
         prepared_markdown, parse_errors = await self._run_bounded(
             markdown_paths,
             limit=parse_limit,
-            worker=lambda path: self._prepare_markdown_file(files[path]),
+            worker=lambda path: self._prepare_markdown_file(
+                files[path], use_parse_pool=use_parse_pool
+            ),
         )
         error_by_path.update(parse_errors)
 
@@ -260,11 +300,13 @@ class BatchIndexer:
             with logfire.span("index.markdown_file.load_permalink_map", path=file.path):
                 existing_permalink_by_path = await self._get_file_path_to_permalink_map()
 
-        reserved_permalinks = {
-            permalink
-            for path, permalink in existing_permalink_by_path.items()
-            if path != file.path and permalink
-        }
+        reserved_permalinks = _PermalinkReservations(
+            {
+                permalink
+                for path, permalink in existing_permalink_by_path.items()
+                if path != file.path and permalink
+            }
+        )
         with logfire.span("index.markdown_file.normalize", path=file.path):
             prepared = await self._normalize_markdown_file(prepared, reserved_permalinks)
         existing_permalink_by_path[file.path] = prepared.markdown.frontmatter.permalink
@@ -325,19 +367,37 @@ class BatchIndexer:
 
     # --- Preparation ---
 
-    async def _prepare_markdown_file(self, file: IndexInputFile) -> _PreparedMarkdownFile:
+    async def _prepare_markdown_file(
+        self,
+        file: IndexInputFile,
+        *,
+        use_parse_pool: bool = False,
+    ) -> _PreparedMarkdownFile:
         if file.content is None:
             raise ValueError(f"Missing content for markdown file: {file.path}")
 
         content = file.content.decode("utf-8")
-        file_contains_frontmatter = has_frontmatter(content)
         final_checksum = await self._resolve_checksum(file)
-        entity_markdown = await self.entity_service.entity_parser.parse_markdown_content(
-            file_path=Path(file.path),
-            content=content,
-            mtime=file.last_modified.timestamp() if file.last_modified else None,
-            ctime=file.created_at.timestamp() if file.created_at else None,
-        )
+        mtime = file.last_modified.timestamp() if file.last_modified else None
+        ctime = file.created_at.timestamp() if file.created_at else None
+        parse_pool = self.parse_pool if use_parse_pool else None
+        if parse_pool is not None:
+            parsed = await parse_pool.parse(
+                path=file.path,
+                raw=file.content,
+                mtime=mtime,
+                ctime=ctime,
+            )
+            entity_markdown = parsed.markdown
+            file_contains_frontmatter = parsed.file_contains_frontmatter
+        else:
+            file_contains_frontmatter = has_frontmatter(content)
+            entity_markdown = await self.entity_service.entity_parser.parse_markdown_content(
+                file_path=Path(file.path),
+                content=content,
+                mtime=mtime,
+                ctime=ctime,
+            )
 
         return _PreparedMarkdownFile(
             file=file,
@@ -360,11 +420,13 @@ class BatchIndexer:
             existing_permalink_by_path = await self._get_file_path_to_permalink_map()
 
         batch_paths = set(prepared_markdown)
-        reserved_permalinks = {
-            permalink
-            for path, permalink in existing_permalink_by_path.items()
-            if path not in batch_paths and permalink
-        }
+        reserved_permalinks = _PermalinkReservations(
+            {
+                permalink
+                for path, permalink in existing_permalink_by_path.items()
+                if path not in batch_paths and permalink
+            }
+        )
 
         normalized: dict[str, _PreparedMarkdownFile] = {}
         errors: dict[str, str] = {}
@@ -385,7 +447,7 @@ class BatchIndexer:
     async def _normalize_markdown_file(
         self,
         prepared: _PreparedMarkdownFile,
-        reserved_permalinks: set[str],
+        reserved_permalinks: _PermalinkReservations,
     ) -> _PreparedMarkdownFile:
         final_checksum = prepared.final_checksum
         final_content = prepared.content
@@ -436,7 +498,7 @@ class BatchIndexer:
     async def _resolve_batch_permalink(
         self,
         prepared: _PreparedMarkdownFile,
-        reserved_permalinks: set[str],
+        reserved_permalinks: _PermalinkReservations,
     ) -> str | None:
         should_resolve_permalink = (
             not prepared.file_contains_frontmatter and self.app_config.ensure_frontmatter_on_sync
@@ -452,20 +514,7 @@ class BatchIndexer:
             markdown=prepared.markdown,
             skip_conflict_check=True,
         )
-        return self._reserve_batch_permalink(desired_permalink, reserved_permalinks)
-
-    def _reserve_batch_permalink(
-        self,
-        desired_permalink: str,
-        reserved_permalinks: set[str],
-    ) -> str:
-        permalink = desired_permalink
-        suffix = 1
-        while permalink in reserved_permalinks:
-            permalink = f"{desired_permalink}-{suffix}"
-            suffix += 1
-        reserved_permalinks.add(permalink)
-        return permalink
+        return reserved_permalinks.reserve(desired_permalink)
 
     # --- Persistence ---
 
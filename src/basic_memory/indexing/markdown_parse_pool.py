@@ -0,0 +1,125 @@
+"""Process-pool markdown parsing for multi-file indexing batches.
+
+Markdown tokenization, frontmatter YAML, and date parsing are CPU-bound, so
+running them as asyncio tasks only interleaves them on the event loop thread.
+This stage ships each file's raw bytes to a worker process and gets back the
+parsed ``EntityMarkdown`` record, so a full reindex scales with cores.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from basic_memory.file_utils import has_frontmatter
+from basic_memory.markdown.entity_parser import EntityParser
+from basic_memory.markdown.schemas import EntityMarkdown
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedMarkdownRecord:
+    """What a worker sends back for one file; the caller already holds the bytes."""
+
+    markdown: EntityMarkdown
+    file_contains_frontmatter: bool
+
+
+# One parser per worker process. parse_markdown_text never touches base_path.
+_worker_parser: EntityParser | None = None
+
+
+def _parse_in_worker(
+    path: str,
+    raw: bytes,
+    mtime: float | None,
+    ctime: float | None,
+) -> ParsedMarkdownRecord:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = EntityParser(Path("."))
+
+    content = raw.decode("utf-8")
+    return ParsedMarkdownRecord(
+        markdown=_worker_parser.parse_markdown_text(
+            file_path=Path(path),
+            content=content,
+            mtime=mtime,
+            ctime=ctime,
+        ),
+        file_contains_frontmatter=has_frontmatter(content),
+    )
+
+
+class MarkdownParsePool:
+    """Lazily started process pool that parses markdown bytes off the event loop."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawn, not fork: the parent runs an event loop, database engines,
+                # and background threads that must not be duplicated into workers.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    async def parse(
+        self,
+        *,
+        path: str,
+        raw: bytes,
+        mtime: float | None,
+        ctime: float | None,
+    ) -> ParsedMarkdownRecord:
+        """Parse one file in a worker, or inline if the pool has died."""
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, _parse_in_worker, path, raw, mtime, ctime
+            )
+        except BrokenProcessPool:
+            # Trigger: a worker was killed (OOM, signal) and the pool refuses new work.
+            # Why: one dead worker must not fail every remaining file in the reindex.
+            # Outcome: drop the pool so the next batch starts a fresh one; parse inline now.
+            logger.warning("Markdown parse pool broke; parsing inline", path=path)
+            self.shutdown(executor)
+            return _parse_in_worker(path, raw, mtime, ctime)
+
+    def shutdown(self, executor: ProcessPoolExecutor | None = None) -> None:
+        """Stop the pool; when ``executor`` is given, only if it is still the current one."""
+        with self._lock:
+            if self._executor is None or (executor is not None and executor is not self._executor):
+                return
+            stale, self._executor = self._executor, None
+        stale.shutdown(wait=False, cancel_futures=True)
+
+
+# Worker processes are expensive to start, so every indexer in the process shares one
+# pool per worker count instead of spawning a pool per batch.
+_PARSE_POOLS: dict[int, MarkdownParsePool] = {}
+_PARSE_POOLS_LOCK = threading.Lock()
+
+
+def get_markdown_parse_pool(workers: int) -> MarkdownParsePool | None:
+    """Return the shared parse pool for ``workers`` processes, or None when disabled."""
+    if workers <= 0:
+        return None
+    with _PARSE_POOLS_LOCK:
+        pool = _PARSE_POOLS.get(workers)
+        if pool is None:
+            pool = MarkdownParsePool(workers)
+            _PARSE_POOLS[workers] = pool
+        return pool
@@ -270,6 +270,20 @@ class EntityParser:
         Returns:
             EntityMarkdown with parsed content
         """
+        return self.parse_markdown_text(file_path, content, mtime=mtime, ctime=ctime)
+
+    def parse_markdown_text(
+        self,
+        file_path: Path,
+        content: str,
+        mtime: Optional[float] = None,
+        ctime: Optional[float] = None,
+    ) -> EntityMarkdown:
+        """Synchronous core of :meth:`parse_markdown_content`.
+
+        Parsing never awaits anything, so batch indexing can run this in a worker
+        process without an event loop.
+        """
         # Strip BOM before parsing (can be present in files from Windows or certain sources)
         # See issue #452
         from basic_memory.file_utils import strip_bom
@@ -1,15 +1,17 @@
 import os
-from asyncio import Lock
+from asyncio import AbstractEventLoop, Lock, get_running_loop
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from importlib.util import find_spec
 from threading import RLock
 from typing import TYPE_CHECKING, Annotated, Any, AsyncIterator, Callable, Optional
 
-from httpx import ASGITransport, AsyncClient, Timeout
+from httpx import ASGITransport, AsyncClient, Limits, Timeout
 from loguru import logger
 
 import logfire
 from basic_memory.config import ConfigManager, ProjectMode, has_cloud_credentials
+from basic_memory.mcp.local_dispatch import enable_local_dispatch
 
 if TYPE_CHECKING:
     # FastAPI is only needed when a request routes through the local ASGI
@@ -20,6 +22,14 @@ if TYPE_CHECKING:
 LocalDatabaseState = tuple["AsyncEngine", "async_sessionmaker[AsyncSession]"]
 _MISSING_STATE_VALUE = object()
 
+# Connection limits for pooled cloud clients: enough keep-alive connections for
+# a burst of concurrent tool calls, released after a minute of inactivity.
+_POOLED_CLIENT_LIMITS = Limits(
+    max_connections=32,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+
 
 @dataclass
 class _PreparedLocalAsgiDatabase:
@@ -223,7 +233,17 @@ async def _prepared_local_asgi_database(app: "FastAPI") -> AsyncIterator[None]:
 
 @asynccontextmanager
 async def _asgi_client(timeout: Timeout) -> AsyncIterator[AsyncClient]:
-    """Create a local ASGI client."""
+    """Create a local ASGI client, reusing the pooled one when a pool is active."""
+    from basic_memory.workspace_context import workspace_permalink_headers
+
+    route = ("local", *sorted(workspace_permalink_headers().items()))
+    async with _routed_client(route, lambda pooled: _fresh_asgi_client(timeout)) as client:
+        yield client
+
+
+@asynccontextmanager
+async def _fresh_asgi_client(timeout: Timeout) -> AsyncIterator[AsyncClient]:
+    """Create a local ASGI client with its own database preparation."""
     # Import on first local-client use so CLI help/version paths can import
     # routing helpers without constructing the full FastAPI router graph.
     from basic_memory.api.app import app as fastapi_app
@@ -235,9 +255,91 @@ async def _asgi_client(timeout: Timeout) -> AsyncIterator[AsyncClient]:
     # lifespan startup would have provided.
     async with _prepared_local_asgi_database(fastapi_app):
         async with _build_asgi_client(fastapi_app, timeout) as client:
+            if ConfigManager().config.mcp_in_process_dispatch:
+                enable_local_dispatch(client, fastapi_app)
             yield client
 
 
+# --- Pooled clients ---
+# Trigger: a long-lived MCP server makes many small API calls per agent turn.
+# Why: building a client per tool call re-created the cloud connection pool (a
+#   fresh TLS handshake every time) and re-resolved local ASGI database state.
+# Outcome: inside ``pooled_clients()`` each route reuses one client until the
+#   block exits; outside it (CLI one-shots) every call builds its own client.
+
+type ClientRoute = tuple[object, ...]
+type ClientBuilder = Callable[[bool], AbstractAsyncContextManager[AsyncClient]]
+
+
+@dataclass
+class _ClientPool:
+    """Long-lived clients keyed by route, closed together when the pool exits."""
+
+    loop: AbstractEventLoop
+    exit_stack: AsyncExitStack
+    clients: dict[ClientRoute, AsyncClient] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock)
+
+    async def client(self, route: ClientRoute, build: ClientBuilder) -> AsyncClient:
+        client = self.clients.get(route)
+        if client is not None:
+            return client
+        async with self.lock:
+            client = self.clients.get(route)
+            if client is None:
+                client = await self.exit_stack.enter_async_context(build(True))
+                self.clients[route] = client
+            return client
+
+
+_client_pool: _ClientPool | None = None
+
+
+def _active_client_pool() -> _ClientPool | None:
+    """Return the client pool when one is open on the running event loop."""
+    pool = _client_pool
+    if pool is None:
+        return None
+    try:
+        loop = get_running_loop()
+    except RuntimeError:  # pragma: no cover
+        return None
+    # Connections belong to the loop that opened them; another loop gets fresh clients.
+    return pool if pool.loop is loop else None
+
+
+@asynccontextmanager
+async def pooled_clients() -> AsyncIterator[None]:
+    """Reuse one API client per route until the block exits.
+
+    Meant to wrap a long-lived process such as the MCP server. Nested blocks
+    share the outer pool.
+    """
+    global _client_pool
+    if _active_client_pool() is not None:
+        yield
+        return
+
+    async with AsyncExitStack() as exit_stack:
+        _client_pool = _ClientPool(loop=get_running_loop(), exit_stack=exit_stack)
+        try:
+            yield
+        finally:
+            # Stop handing out pooled clients before the stack closes them.
+            _client_pool = None
+
+
+@asynccontextmanager
+async def _routed_client(route: ClientRoute, build: ClientBuilder) -> AsyncIterator[AsyncClient]:
+    """Yield the pooled client for ``route``, or a fresh one when no pool is open."""
+    pool = _active_client_pool()
+    if pool is None:
+        async with build(False) as client:
+            yield client
+        return
+    yield await pool.client(route, build)
+
+
 async def _resolve_cloud_token(config) -> str:
     """Resolve cloud token with API key preferred, OAuth fallback."""
     with logfire.span(
@@ -283,6 +385,33 @@ def resolve_configured_workspace(
     return config.default_workspace
 
 
+@asynccontextmanager
+async def _build_cloud_client(
+    base_url: str,
+    headers: dict[str, str],
+    timeout: Timeout,
+    *,
+    pooled: bool = False,
+) -> AsyncIterator[AsyncClient]:
+    """Create a cloud proxy client; pooled clients keep connections alive across calls."""
+    logger.info(f"Creating HTTP client for cloud proxy at: {base_url}")
+    if not pooled:
+        async with AsyncClient(base_url=base_url, headers=headers, timeout=timeout) as client:
+            yield client
+        return
+
+    async with AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        limits=_POOLED_CLIENT_LIMITS,
+        # HTTP/2 multiplexes concurrent tool calls over one connection, but needs
+        # the optional h2 package; without it the pool keeps HTTP/1.1 connections.
+        http2=find_spec("h2") is not None,
+    ) as client:
+        yield client
+
+
 @asynccontextmanager
 async def _cloud_client(
     config,
@@ -298,12 +427,21 @@ async def _cloud_client(
     headers.update(workspace_permalink_headers())
     if workspace:
         headers["X-Workspace-ID"] = workspace
-    logger.info(f"Creating HTTP client for cloud proxy at: {proxy_base_url}")
-    async with AsyncClient(
-        base_url=proxy_base_url,
-        headers=headers,
-        timeout=timeout,
+    # Trigger: OAuth tokens refresh while the MCP server keeps running.
+    # Why: keying the pool on the Authorization header left one client, and its
+    #   connections, behind for every refreshed token until shutdown.
+    # Outcome: the route carries only the routing headers (workspace, permalink
+    #   context); the pooled client picks up the current token on each use.
+    route = (
+        "cloud",
+        proxy_base_url,
+        *sorted((name, value) for name, value in headers.items() if name != "Authorization"),
+    )
+    async with _routed_client(
+        route,
+        lambda pooled: _build_cloud_client(proxy_base_url, headers, timeout, pooled=pooled),
     ) as client:
+        client.headers["Authorization"] = headers["Authorization"]
         yield client
 
 
@@ -3,7 +3,13 @@
 Encapsulates all /v2/projects/{project_id}/knowledge/* endpoints.
 """
 
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from httpx import AsyncClient
 
@@ -21,6 +27,75 @@ from basic_memory.schemas.response import (
 from basic_memory.schemas.v2.graph import GraphNode, OrphanEntitiesResponse
 from basic_memory.schemas.v2.entity import EntityResolveResponse, EntityResponseV2
 
+# Trigger: edit_note, read_note and friends resolve an identifier before acting on it.
+# Why: on a pooled client an agent working one note repeatedly paid that extra
+#   round trip on every tool call.
+# Outcome: each HTTP client briefly remembers its resolutions, and any write made
+#   through a KnowledgeClient forgets the project's entries on every client. The
+#   TTL bounds staleness from changes that bypass this client, such as file sync.
+_RESOLVE_CACHE_MAX_ENTRIES = 256
+_RESOLVE_CACHE_TTL_SECONDS = 30.0
+
+type _ResolveKey = tuple[str, str, bool]
+
+
+class _ResolvedIdentifierCache:
+    """Small LRU of identifier resolutions for one HTTP client."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[_ResolveKey, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: _ResolveKey) -> dict[str, Any] | None:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        expires_at, data = cached
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Callers own what they get back; mutating it must not change the cached entry.
+        return copy.deepcopy(data)
+
+    def put(self, key: _ResolveKey, data: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + _RESOLVE_CACHE_TTL_SECONDS, copy.deepcopy(data))
+        self._entries.move_to_end(key)
+        while len(self._entries) > _RESOLVE_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def forget_project(self, project_id: str) -> None:
+        for key in [key for key in self._entries if key[0] == project_id]:
+            del self._entries[key]
+
+
+# Keyed weakly by client, so a per-call client takes its cache with it and only
+# pooled clients keep resolutions across tool calls.
+_resolve_caches: WeakKeyDictionary[AsyncClient, _ResolvedIdentifierCache] = WeakKeyDictionary()
+# Bumped by every write, so a resolve that overlapped one never caches its answer.
+_resolve_generations: dict[str, int] = {}
+
+
+def _resolve_cache_for(http_client: AsyncClient) -> _ResolvedIdentifierCache | None:
+    try:
+        cache = _resolve_caches.get(http_client)
+        if cache is None:
+            cache = _resolve_caches[http_client] = _ResolvedIdentifierCache()
+    except TypeError:
+        # Test doubles that cannot be weakly referenced simply go uncached.
+        return None
+    return cache
+
+
+@contextmanager
+def _forgets_resolutions(project_id: str) -> Iterator[None]:
+    """Forget the project's cached resolutions once a write finishes, even a failed one."""
+    try:
+        yield
+    finally:
+        _resolve_generations[project_id] = _resolve_generations.get(project_id, 0) + 1
+        for cache in list(_resolve_caches.values()):
+            cache.forget_project(project_id)
+
 
 class KnowledgeClient:
     """Typed client for knowledge graph entity operations.
@@ -63,10 +138,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_post
 
-        with logfire.span(
-            "mcp.client.knowledge.create_entity",
-            client_name="knowledge",
-            operation="create_entity",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.create_entity",
+                client_name="knowledge",
+                operation="create_entity",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_post(
                 self.http_client,
@@ -97,10 +175,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_put
 
-        with logfire.span(
-            "mcp.client.knowledge.update_entity",
-            client_name="knowledge",
-            operation="update_entity",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.update_entity",
+                client_name="knowledge",
+                operation="update_entity",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_put(
                 self.http_client,
@@ -159,10 +240,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_patch
 
-        with logfire.span(
-            "mcp.client.knowledge.patch_entity",
-            client_name="knowledge",
-            operation="patch_entity",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.patch_entity",
+                client_name="knowledge",
+                operation="patch_entity",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_patch(
                 self.http_client,
@@ -188,10 +272,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_delete
 
-        with logfire.span(
-            "mcp.client.knowledge.delete_entity",
-            client_name="knowledge",
-            operation="delete_entity",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.delete_entity",
+                client_name="knowledge",
+                operation="delete_entity",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_delete(
                 self.http_client,
@@ -217,10 +304,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_put
 
-        with logfire.span(
-            "mcp.client.knowledge.move_entity",
-            client_name="knowledge",
-            operation="move_entity",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.move_entity",
+                client_name="knowledge",
+                operation="move_entity",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_put(
                 self.http_client,
@@ -249,10 +339,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_post
 
-        with logfire.span(
-            "mcp.client.knowledge.move_directory",
-            client_name="knowledge",
-            operation="move_directory",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.move_directory",
+                client_name="knowledge",
+                operation="move_directory",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_post(
                 self.http_client,
@@ -281,10 +374,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_post
 
-        with logfire.span(
-            "mcp.client.knowledge.delete_directory",
-            client_name="knowledge",
-            operation="delete_directory",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.delete_directory",
+                client_name="knowledge",
+                operation="delete_directory",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_post(
                 self.http_client,
@@ -312,10 +408,13 @@ class KnowledgeClient:
         """
         from basic_memory.mcp.tools.utils import call_post
 
-        with logfire.span(
-            "mcp.client.knowledge.index_file",
-            client_name="knowledge",
-            operation="index_file",
+        with (
+            logfire.span(
+                "mcp.client.knowledge.index_file",
+                client_name="knowledge",
+                operation="index_file",
+            ),
+            _forgets_resolutions(self.project_id),
         ):
             response = await call_post(
                 self.http_client,
@@ -355,9 +454,15 @@ class KnowledgeClient:
         *,
         strict: bool = False,
     ) -> dict[str, Any]:
-        """Request the complete entity-resolution payload."""
+        """Request the complete entity-resolution payload, reusing a recent answer."""
         from basic_memory.mcp.tools.utils import call_post
 
+        cache = _resolve_cache_for(self.http_client)
+        key = (self.project_id, identifier, strict)
+        if cache is not None and (cached := cache.get(key)) is not None:
+            return cached
+
+        generation = _resolve_generations.get(self.project_id, 0)
         with logfire.span(
             "mcp.client.knowledge.resolve_entity",
             client_name="knowledge",
@@ -372,6 +477,8 @@ class KnowledgeClient:
                 path_template="/v2/projects/{project_id}/knowledge/resolve",
             )
         data: dict[str, Any] = response.json()
+        if cache is not None and _resolve_generations.get(self.project_id, 0) == generation:
+            cache.put(key, data)
         return data
 
     async def resolve_entity_response(
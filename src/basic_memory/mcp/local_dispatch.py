@@ -0,0 +1,330 @@
+"""In-process dispatch of local MCP API calls.
+
+Local MCP tools reach the API through httpx and ``ASGITransport``: the request
+body is encoded to JSON, routed through the middleware stack, decoded and
+validated by FastAPI, and the response model is encoded again only for the
+typed client to decode and validate it once more.
+
+With ``mcp_in_process_dispatch`` enabled, the ``call_*`` helpers hand requests
+for the knowledge, memory and search routers -- the routes behind
+``search_notes``, ``read_note``, ``build_context``, ``recent_activity`` and
+``write_note`` -- straight to the route that would have served them.
+Dependency injection, request validation, response-model serialization,
+background tasks and the app's exception handlers all run as they do over
+HTTP, but neither the JSON body nor the response payload becomes bytes. The
+HTTP path stays the reference: any other request returns None here and goes
+over the ASGI transport as before.
+
+Middleware is skipped. The only API middleware installs the workspace permalink
+context from request headers, and in-process that context is already the
+caller's own.
+
+Running a route without its ASGI handler relies on FastAPI internals, so
+pyproject caps FastAPI below the next release and tests/mcp/test_tool_utils.py
+checks those internals before the cap is raised.
+"""
+
+import importlib
+import inspect
+from collections.abc import Callable
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, MutableMapping, override
+from weakref import WeakKeyDictionary
+
+from httpx import URL, AsyncClient, Request, Response
+from httpx._types import HeaderTypes, QueryParamTypes
+
+if TYPE_CHECKING:
+    # FastAPI stays out of CLI startup; see async_client (#886).
+    from fastapi import FastAPI
+    from fastapi.routing import APIRoute
+    from starlette.requests import Request as StarletteRequest
+    from starlette.responses import Response as StarletteResponse
+
+# Routers the app mounts under _PROJECT_PREFIX, in the app's include order.
+_DISPATCHED_ROUTER_MODULES = (
+    "basic_memory.api.v2.routers.knowledge_router",
+    "basic_memory.api.v2.routers.memory_router",
+    "basic_memory.api.v2.routers.search_router",
+)
+_PROJECT_PREFIX = "/v2/projects/{project_id}"
+
+_local_apps: WeakKeyDictionary[AsyncClient, "FastAPI"] = WeakKeyDictionary()
+_dispatched_routes: list["APIRoute"] | None = None
+
+
+def enable_local_dispatch(client: AsyncClient, app: "FastAPI") -> None:
+    """Serve supported requests made through ``client`` by calling ``app``'s routes directly."""
+    _local_apps[client] = app
+
+
+class DispatchedResponse(Response):
+    """A JSON response produced in-process.
+
+    ``json()`` returns the serialized payload as-is; the body is only encoded if
+    something reads ``content`` or ``text``.
+    """
+
+    def __init__(self, status_code: int, data: Any, *, headers: Any, request: Request) -> None:
+        super().__init__(status_code, headers=headers, request=request)
+        self._data = data
+        self._encoded = False
+
+    @override
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:  # pragma: no cover
+            return super().json(**kwargs)
+        return self._data
+
+    @property
+    @override
+    def content(self) -> bytes:
+        if not self._encoded:
+            import json
+
+            self._content = json.dumps(self._data, separators=(",", ":")).encode("utf-8")
+            self._encoded = True
+        return self._content
+
+
+async def dispatch_request(
+    client: AsyncClient,
+    method: str,
+    url: URL | str,
+    *,
+    params: QueryParamTypes | None = None,
+    headers: HeaderTypes | None = None,
+    json: Any = None,
+) -> Response | None:
+    """Serve a local API call in-process, or return None to send it over HTTP."""
+    app = _local_apps.get(client)
+    if app is None:
+        return None
+
+    # build_request resolves the URL, query string and headers exactly as a real
+    # send would, so the route sees the same path, parameters and headers.
+    request = client.build_request(method, url, params=params, headers=headers)
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": request.method,
+        "headers": [(key.lower(), value) for key, value in request.headers.raw],
+        "scheme": request.url.scheme,
+        "path": request.url.path,
+        "raw_path": request.url.raw_path.split(b"?")[0],
+        "query_string": request.url.query,
+        "server": (request.url.host, request.url.port),
+        "client": ("127.0.0.1", 123),
+        "root_path": "",
+        "app": app,
+    }
+    route = _match_route(scope)
+    if route is None:
+        return None
+    return await _call_route(app, route, scope, request, json)
+
+
+def _routes() -> list["APIRoute"]:
+    """Rebuild the dispatched routes under the prefix the app includes them with.
+
+    The prefix has to be part of each route's own path so ``project_id`` is
+    solved as the path parameter the project dependencies declare, the same as
+    in the app's routing table.
+    """
+    global _dispatched_routes
+    if _dispatched_routes is None:
+        from fastapi.routing import APIRoute
+
+        _dispatched_routes = [
+            APIRoute(
+                _PROJECT_PREFIX + route.path,
+                route.endpoint,
+                methods=route.methods,
+                name=route.name,
+                status_code=route.status_code,
+                dependencies=route.dependencies,
+                response_model=route.response_model,
+                response_class=route.response_class,
+                response_model_include=route.response_model_include,
+                response_model_exclude=route.response_model_exclude,
+                response_model_by_alias=route.response_model_by_alias,
+                response_model_exclude_unset=route.response_model_exclude_unset,
+                response_model_exclude_defaults=route.response_model_exclude_defaults,
+                response_model_exclude_none=route.response_model_exclude_none,
+                include_in_schema=False,
+            )
+            for module_name in _DISPATCHED_ROUTER_MODULES
+            for route in importlib.import_module(module_name).router.routes
+            if isinstance(route, APIRoute)
+        ]
+    return _dispatched_routes
+
+
+def _match_route(scope: dict[str, Any]) -> "APIRoute | None":
+    """Find the route the app would dispatch to; None leaves the request to HTTP."""
+    from starlette.routing import Match
+
+    for route in _routes():
+        match, child_scope = route.matches(scope)
+        if match is Match.NONE:
+            continue
+        # A method mismatch (405) or a streaming endpoint keeps its HTTP behavior.
+        if match is Match.PARTIAL or inspect.isasyncgenfunction(route.endpoint):
+            return None
+        scope.update(child_scope)
+        return route
+    return None
+
+
+async def _call_route(
+    app: "FastAPI",
+    route: "APIRoute",
+    scope: dict[str, Any],
+    request: Request,
+    body: Any,
+) -> Response:
+    """Run one route the way FastAPI's request handler does, minus the byte encoding."""
+    from fastapi.dependencies.utils import solve_dependencies
+    from fastapi.exceptions import RequestValidationError
+    from fastapi.routing import run_endpoint_function, serialize_response
+    from fastapi.utils import is_body_allowed_for_status_code
+    from starlette.requests import Request as StarletteRequest
+    from starlette.responses import Response as StarletteResponse
+
+    app_request = StarletteRequest(scope)
+    is_coroutine = inspect.iscoroutinefunction(route.endpoint)
+    data: Any = None
+    try:
+        # Function-scoped dependencies close when the endpoint returns; request-scoped
+        # ones (the DB session) close after the response and its background tasks.
+        async with AsyncExitStack() as request_stack:
+            scope["fastapi_inner_astack"] = request_stack
+            async with AsyncExitStack() as function_stack:
+                scope["fastapi_function_astack"] = function_stack
+                solved = await solve_dependencies(
+                    request=app_request,
+                    dependant=route.dependant,
+                    body=body if route.body_field is not None else None,
+                    dependency_overrides_provider=app,
+                    async_exit_stack=request_stack,
+                    embed_body_fields=route._embed_body_fields,  # pyright: ignore[reportPrivateUsage]
+                )
+                if solved.errors:
+                    raise RequestValidationError(solved.errors, body=body)
+                raw = await run_endpoint_function(
+                    dependant=route.dependant,
+                    values=solved.values,
+                    is_coroutine=is_coroutine,
+                )
+                if not isinstance(raw, StarletteResponse):
+                    data = await serialize_response(
+                        field=route.response_field,
+                        response_content=raw,
+                        include=route.response_model_include,
+                        exclude=route.response_model_exclude,
+                        by_alias=route.response_model_by_alias,
+                        exclude_unset=route.response_model_exclude_unset,
+                        exclude_defaults=route.response_model_exclude_defaults,
+                        exclude_none=route.response_model_exclude_none,
+                        is_coroutine=is_coroutine,
+                    )
+
+            if isinstance(raw, StarletteResponse):
+                if raw.background is None:
+                    raw.background = solved.background_tasks
+                return await _collect(raw, scope, request)
+
+            # The ASGI transport waits for background tasks too, so they finish here.
+            if solved.background_tasks is not None:
+                await solved.background_tasks()
+            status_code = solved.response.status_code or route.status_code or 200
+            if not is_body_allowed_for_status_code(status_code):
+                return Response(status_code, headers=solved.response.headers.raw, request=request)
+            headers = [(b"content-type", b"application/json"), *solved.response.headers.raw]
+            return DispatchedResponse(status_code, data, headers=headers, request=request)
+    except Exception as exc:
+        handled = await _handle_exception(app, app_request, exc)
+        if handled is None:
+            raise
+        return await _collect(handled, scope, request)
+
+
+async def _handle_exception(
+    app: "FastAPI",
+    request: "StarletteRequest",
+    exc: Exception,
+) -> "StarletteResponse | None":
+    """Turn an exception into the response the app's handlers would send.
+
+    Mirrors Starlette's lookup: a status-code handler for HTTP exceptions, then
+    the exception's MRO. Anything left is an unhandled server error, which the
+    ASGI transport re-raises to the caller, so it is re-raised here as well once
+    the app's catch-all handler has logged it.
+    """
+    from starlette.exceptions import HTTPException
+
+    handlers = app.exception_handlers
+    handler = None
+    if isinstance(exc, HTTPException):
+        handler = handlers.get(exc.status_code)
+    if handler is None:
+        handler = next(
+            (
+                handlers[exc_class]
+                for exc_class in type(exc).__mro__
+                if exc_class is not Exception and exc_class in handlers
+            ),
+            None,
+        )
+    if handler is None:
+        server_error_handler = handlers.get(500) or handlers.get(Exception)
+        if server_error_handler is not None:
+            await _run_handler(server_error_handler, request, exc)
+        return None
+    return await _run_handler(handler, request, exc)
+
+
+async def _run_handler(
+    handler: Callable[..., Any],
+    request: "StarletteRequest",
+    exc: Exception,
+) -> "StarletteResponse":
+    """Call an exception handler the way Starlette does, sync handlers in the threadpool."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import Response as StarletteResponse
+
+    if inspect.iscoroutinefunction(handler):
+        response = await handler(request, exc)
+    else:
+        response = await run_in_threadpool(handler, request, exc)
+        # A callable object can still be async without being a coroutine function.
+        if inspect.isawaitable(response):
+            response = await response
+    assert isinstance(response, StarletteResponse)
+    return response
+
+
+async def _collect(
+    response: "StarletteResponse",
+    scope: dict[str, Any],
+    request: Request,
+) -> Response:
+    """Run a Starlette response (and its background tasks) and capture what it sends."""
+    status_code = 500
+    headers: list[tuple[bytes, bytes]] = []
+    body = bytearray()
+
+    async def receive() -> dict[str, Any]:  # pragma: no cover
+        return {"type": "http.disconnect"}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        nonlocal status_code, headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await response(scope, receive, send)
+    return Response(status_code, headers=headers, content=bytes(body), request=request)
@@ -16,6 +16,7 @@ from basic_memory.cli.auth import CLIAuth
 from basic_memory.index.note_content_materialization import drain_pending_materializations
 from basic_memory.db import scoped_session
 from basic_memory.index.local_schedulers import drain_background_tasks
+from basic_memory.mcp.async_client import pooled_clients
 from basic_memory.mcp.client_info import MCPClientInfoMiddleware
 from basic_memory.mcp.container import McpContainer, set_container
 from basic_memory.read_cache import ReadCache, ReadCacheUnavailable
@@ -98,6 +99,8 @@ async def lifespan(app: FastMCP):
     async with open_redis_read_cache(
         standalone_redis_url,
         max_connections=config.redis_max_connections,
+        memory_max_bytes=config.read_cache_memory_max_bytes,
+        memory_generation_ttl_seconds=config.read_cache_memory_generation_ttl_seconds,
     ) as read_cache:
         container.read_cache = read_cache
         set_container(container)
@@ -179,7 +182,10 @@ async def lifespan(app: FastMCP):
                 await watch_coordinator.start()
 
             try:
-                yield
+                # Tool calls reuse one API client per route for the server's lifetime;
+                # the pool closes (and releases local DB state) before shutdown below.
+                async with pooled_clients():
+                    yield
             finally:
                 # Shutdown - coordinator handles clean task cancellation
                 with logfire.span(
@@ -1,5 +1,6 @@
 """Recent activity tool for Basic Memory MCP server."""
 
+import asyncio
 from datetime import timezone
 from pathlib import PurePosixPath
 from typing import Any, Annotated, List, Union, Optional, Literal
@@ -24,6 +25,13 @@ from basic_memory.schemas.memory import (
 from basic_memory.schemas.project_info import ProjectList, ProjectItem
 from basic_memory.schemas.search import SearchItemType
 
+# Discovery mode fans out one activity request per project. Agents call it at session
+# start, so projects are queried concurrently (bounded, so a large project list does
+# not flood a cloud tenant), and one slow or failing project is reported rather than
+# holding up or failing the whole summary.
+DISCOVERY_MAX_CONCURRENT_PROJECTS = 8
+DISCOVERY_PROJECT_TIMEOUT_SECONDS = 15.0
+
 
 @mcp.tool(
     title="Recent Activity",
@@ -115,7 +123,8 @@ async def recent_activity(
                 it routes to the exact project regardless of name collisions across cloud
                 workspaces. Takes precedence over `project`. Get from list_memory_projects().
         output_format: "text" returns human-readable summary text. "json" returns
-            a flat list of recent items.
+            a flat list of recent items; in discovery mode, a project whose activity
+            timed out or failed is listed as a row with ``"unavailable": true``.
         context: Optional FastMCP context for performance caching.
 
     Returns:
@@ -210,44 +219,65 @@ async def recent_activity(
             response = await call_get(client, "/v2/projects/")
             project_list = ProjectList.model_validate(response.json())
 
-            projects_activity = {}
-            total_items = 0
-            total_entities = 0
-            total_relations = 0
-            total_observations = 0
-            most_active_project = None
-            most_active_count = 0
-            active_projects = 0
-
-            # Query each project's activity
-            for project_info in project_list.projects:
-                project_activity = await _get_project_activity(client, project_info, params, depth)
-                projects_activity[project_info.name] = project_activity
-
-                # Aggregate stats
-                item_count = project_activity.item_count
-                if item_count > 0:
-                    active_projects += 1
-                    total_items += item_count
-
-                    # Count by type
-                    for result in project_activity.activity.results:
-                        if result.primary_result.type == "entity":
-                            total_entities += 1
-                        elif result.primary_result.type == "relation":
-                            total_relations += 1
-                        elif result.primary_result.type == "observation":
-                            total_observations += 1
-
-                    # Track most active project
-                    if item_count > most_active_count:
-                        most_active_count = item_count
-                        most_active_project = project_info.name
+            fetched_activity = await _gather_project_activity(
+                client, project_list.projects, params, depth
+            )
+
+        projects_activity = {}
+        unavailable_projects: list[str] = []
+        total_items = 0
+        total_entities = 0
+        total_relations = 0
+        total_observations = 0
+        most_active_project = None
+        most_active_count = 0
+        active_projects = 0
+
+        for project_info, project_activity in zip(
+            project_list.projects, fetched_activity, strict=True
+        ):
+            if isinstance(project_activity, BaseException):
+                unavailable_projects.append(project_info.name)
+                continue
+            projects_activity[project_info.name] = project_activity
+
+            # Aggregate stats
+            item_count = project_activity.item_count
+            if item_count > 0:
+                active_projects += 1
+                total_items += item_count
+
+                # Count by type
+                for result in project_activity.activity.results:
+                    if result.primary_result.type == "entity":
+                        total_entities += 1
+                    elif result.primary_result.type == "relation":
+                        total_relations += 1
+                    elif result.primary_result.type == "observation":
+                        total_observations += 1
+
+                # Track most active project
+                if item_count > most_active_count:
+                    most_active_count = item_count
+                    most_active_project = project_info.name
+
+        # Trigger: every project's activity request failed.
+        # Why: an empty summary would read as "no recent activity anywhere".
+        # Outcome: surface the first failure, as the sequential loop used to.
+        if project_list.projects and not projects_activity:
+            first_error = next(
+                error for error in fetched_activity if isinstance(error, BaseException)
+            )
+            raise first_error
 
         if output_format == "json":
             rows: list[dict[str, Any]] = []
             for project_name, project_activity in projects_activity.items():
                 rows.extend(_extract_recent_rows(project_activity.activity, project_name))
+            # Trigger: some projects timed out or failed during discovery.
+            # Why: a JSON caller would otherwise read a missing project as "no activity".
+            # Outcome: each one gets a marker row with the same keys and no item data.
+            rows.extend(_unavailable_project_row(name) for name in unavailable_projects)
             return rows
 
         # Build summary stats
@@ -292,6 +322,11 @@ async def recent_activity(
                         f"Ask user: 'Should I use {suggested_project} for this task, or would you prefer a different project?'"
                     )
 
+        if unavailable_projects:
+            guidance_lines.append(
+                "Activity unavailable (timed out or failed) for: " + ", ".join(unavailable_projects)
+            )
+
         guidance_lines.extend(
             [
                 "",
@@ -343,6 +378,37 @@ async def recent_activity(
             )
 
 
+async def _gather_project_activity(
+    client, projects: list[ProjectItem], params: dict[str, Any], depth: int
+) -> list[ProjectActivity | BaseException]:
+    """Fetch every project's activity concurrently, in project-list order.
+
+    Each entry is either the project's activity or the exception that stopped it,
+    so one unreachable project leaves the rest of the summary intact.
+    """
+    semaphore = asyncio.Semaphore(DISCOVERY_MAX_CONCURRENT_PROJECTS)
+
+    async def fetch(project_info: ProjectItem) -> ProjectActivity:
+        async with semaphore:
+            try:
+                async with asyncio.timeout(DISCOVERY_PROJECT_TIMEOUT_SECONDS):
+                    return await _get_project_activity(client, project_info, params, depth)
+            except Exception as exc:
+                logger.warning(
+                    f"Recent activity unavailable for project {project_info.name}: {exc!r}"
+                )
+                raise
+
+    results = await asyncio.gather(
+        *(fetch(project_info) for project_info in projects), return_exceptions=True
+    )
+    for result in results:
+        # Cancellation and interpreter exits are not per-project failures.
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return results
+
+
 async def _get_project_activity(
     client, project_info: ProjectItem, params: dict[str, Any], depth: int
 ) -> ProjectActivity:
@@ -355,7 +421,7 @@ async def _get_project_activity(
         depth: Graph traversal depth
 
     Returns:
-        ProjectActivity with activity data or empty activity on error
+        ProjectActivity with the project's activity data
     """
     activity_response = await call_get(
         client,
@@ -416,6 +482,19 @@ def _extract_recent_rows(
     return rows
 
 
+def _unavailable_project_row(project_name: str) -> dict[str, Any]:
+    """Build the JSON marker row for a project whose activity could not be fetched."""
+    return {
+        "type": None,
+        "title": None,
+        "permalink": None,
+        "file_path": None,
+        "created_at": None,
+        "project": project_name,
+        "unavailable": True,
+    }
+
+
 def _format_discovery_output(
     projects_activity: dict[str, Any], summary: ActivityStats, timeframe: str, guidance: str
 ) -> str:
@@ -1,6 +1,13 @@
 """Search tools for Basic Memory MCP server."""
 
+import asyncio
+import base64
+import hashlib
+import heapq
+import itertools
+import json
 import re
+from dataclasses import dataclass
 from textwrap import dedent
 from typing import Annotated, List, Optional, Dict, Any, Literal, cast
 from uuid import UUID
@@ -42,6 +49,11 @@ from basic_memory.schemas.search import (
 
 _SERVICE_UNAVAILABLE_HEADING = "# Search Failed - Service Temporarily Unavailable"
 
+# search_all_projects fans out one search per project: bound how many run at once,
+# and give each its own deadline so one slow project cannot hold up the merged page.
+SEARCH_ALL_PROJECTS_MAX_CONCURRENCY = 8
+SEARCH_ALL_PROJECTS_PROJECT_TIMEOUT_SECONDS = 20.0
+
 
 def _default_search_type() -> str:
     """Pick default search mode from config, falling back to auto-detection.
@@ -542,14 +554,6 @@ def _qualify_results_for_project(
     return qualified
 
 
-def _result_total(results: dict[str, Any], raw_results: list[SearchResult | dict[str, Any]]) -> int:
-    """Return the best available total for a per-project search payload."""
-    total = results.get("total")
-    if isinstance(total, int) and total > 0:
-        return total
-    return len(raw_results) + (1 if results.get("has_more") is True else 0)
-
-
 def _result_total_is_exact(results: dict[str, Any]) -> bool:
     """Return whether a per-project payload explicitly guarantees an exact total."""
     return results.get("total_is_exact") is True
@@ -560,11 +564,109 @@ def _project_ref_label(project_ref: dict[str, str | None]) -> str:
     return project_ref.get("project") or project_ref.get("project_id") or "<unknown project>"
 
 
+@dataclass(frozen=True, slots=True)
+class _ProjectSearchWindow:
+    """One project's slice of an all-projects search, in the order its API ranked it."""
+
+    results: list[dict[str, Any]]
+    total: int
+    total_is_exact: bool
+    has_more: bool
+
+
+def _search_cursor_fingerprint(search_args: dict[str, Any], page_size: int) -> str:
+    """Fingerprint the search a cursor belongs to, so it cannot page a different one."""
+    encoded = json.dumps([search_args, page_size], sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _encode_search_cursor(fingerprint: str, offsets: dict[str, int], *, page: int) -> str:
+    payload = json.dumps({"v": 1, "f": fingerprint, "o": offsets, "p": page}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_search_cursor(cursor: str, fingerprint: str) -> tuple[dict[str, int], int]:
+    """Return the per-project offsets and the page number an all-projects cursor resumes."""
+    payload: Any = None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        payload = None
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid search cursor; start again without one")
+
+    offsets = payload.get("o")
+    page = payload.get("p")
+    if (
+        payload.get("v") != 1
+        or not isinstance(offsets, dict)
+        or not all(isinstance(offset, int) and offset >= 0 for offset in offsets.values())
+        or not isinstance(page, int)
+        or page < 1
+    ):
+        raise ValueError("Invalid search cursor; start again without one")
+    if payload.get("f") != fingerprint:
+        raise ValueError("This search cursor belongs to a different query; start again without one")
+    return cast(dict[str, int], offsets), page
+
+
+async def _search_project_window(
+    project_ref: dict[str, str | None],
+    *,
+    offset: int,
+    count: int,
+    project_id: str | None,
+    search_args: dict[str, Any],
+    context: Context | None,
+) -> _ProjectSearchWindow | str:
+    """Fetch ``count`` ranked results of one project starting at ``offset``.
+
+    The search API pages in fixed ``page_size`` steps, so an offset that does not
+    fall on a page boundary is read from the two pages that straddle it. Either
+    way a project costs at most 2 * ``count`` rows, however deep the caller pages.
+    """
+    first_page, shift = divmod(offset, count)
+    payloads: list[dict[str, Any]] = []
+    for page in range(first_page + 1, first_page + (3 if shift else 2)):
+        payload = await search_notes(
+            project=project_ref["project"],
+            project_id=project_id,
+            page=page,
+            page_size=count,
+            output_format="json",
+            search_all_projects=False,
+            context=context,
+            **search_args,
+        )
+        if isinstance(payload, str):
+            return payload
+        payloads.append(payload)
+        if payload.get("has_more") is not True:
+            break
+
+    raw_results = [
+        result for payload in payloads for result in _raw_results_from_search_payload(payload)
+    ]
+    window = _qualify_results_for_project(raw_results[shift : shift + count], project_ref)
+    has_more = len(raw_results) > shift + count or payloads[-1].get("has_more") is True
+    total = payloads[0].get("total")
+    if not isinstance(total, int) or total <= 0:
+        total = offset + len(window) + (1 if has_more else 0)
+    return _ProjectSearchWindow(
+        results=window,
+        total=total,
+        total_is_exact=all(_result_total_is_exact(payload) for payload in payloads),
+        has_more=has_more,
+    )
+
+
 async def _search_all_projects(
     *,
     query: str | None,
     page: int,
     page_size: int,
+    cursor: str | None,
     search_type: str | None,
     output_format: Literal["text", "json"],
     note_types: list[str],
@@ -577,9 +679,35 @@ async def _search_all_projects(
     min_similarity: float | None,
     context: Context | None,
 ) -> dict[str, Any] | str:
-    """Search every accessible project when the caller explicitly opts in."""
+    """Search every accessible project when the caller explicitly opts in.
+
+    Projects are searched concurrently (bounded, each under its own deadline) and
+    their ranked results are k-way merged by score. The response carries a
+    ``next_cursor`` recording how far into each project the merge has read; passing
+    it back fetches the next page at the cost of one page per project, instead of
+    re-reading every earlier page as ``page=N`` must.
+    """
     requested_page = max(page, 1)
     requested_page_size = max(page_size, 1)
+    search_args: dict[str, Any] = {
+        "query": query,
+        "search_type": search_type,
+        "note_types": note_types or None,
+        "entity_types": entity_types or None,
+        "categories": categories or None,
+        "after_date": after_date,
+        "metadata_filters": metadata_filters,
+        "tags": tags,
+        "status": status,
+        "min_similarity": min_similarity,
+    }
+    fingerprint = _search_cursor_fingerprint(search_args, requested_page_size)
+    offsets: dict[str, int] = {}
+    if cursor:
+        # The cursor knows which page it resumes, so current_page stays meaningful
+        # and any page argument passed alongside it is ignored.
+        offsets, requested_page = _decode_search_cursor(cursor, fingerprint)
+
     project_refs = await _load_search_project_refs(context=context)
     if not project_refs:
         response = SearchResponse(
@@ -594,12 +722,6 @@ async def _search_all_projects(
             return response.model_dump(mode="json", exclude_none=True)
         return _format_search_markdown(response, "all projects", query)
 
-    per_project_page_size = requested_page * requested_page_size
-    merged_results: list[dict[str, Any]] = []
-    total = 0
-    total_is_exact = True
-    any_project_has_more = False
-
     # Trigger: caller asked for an account-wide search.
     # Why: project_id (external UUID) routes through the cloud v2 API path,
     #      which 401s on local installs because there's no JWT to present.
@@ -617,60 +739,89 @@ async def _search_all_projects(
         or has_cloud_credentials(config)
     )
 
-    for project_ref in project_refs:
-        recursive_project_id = project_ref["project_id"] if use_cloud_routing else None
-        try:
-            results = await search_notes(
-                query=query,
-                project=project_ref["project"],
-                project_id=recursive_project_id,
-                page=1,
-                page_size=per_project_page_size,
-                search_type=search_type,
-                output_format="json",
-                note_types=note_types or None,
-                entity_types=entity_types or None,
-                categories=categories or None,
-                after_date=after_date,
-                metadata_filters=metadata_filters,
-                tags=tags,
-                status=status,
-                min_similarity=min_similarity,
-                search_all_projects=False,
-                context=context,
-            )
-        except Exception as exc:
-            logger.warning(
-                f"Multi-project search failed for project {_project_ref_label(project_ref)}: {exc}"
-            )
+    # A cursor resumes each project where the merge left it; page=N without one has
+    # to read the first N pages of every project and skip what earlier pages showed.
+    if cursor:
+        fetch_count = requested_page_size
+        skip = 0
+    else:
+        fetch_count = requested_page * requested_page_size
+        skip = (requested_page - 1) * requested_page_size
+    semaphore = asyncio.Semaphore(SEARCH_ALL_PROJECTS_MAX_CONCURRENCY)
+
+    async def search_project(project_ref: dict[str, str | None]) -> _ProjectSearchWindow | str:
+        async with semaphore:
+            async with asyncio.timeout(SEARCH_ALL_PROJECTS_PROJECT_TIMEOUT_SECONDS):
+                return await _search_project_window(
+                    project_ref,
+                    offset=offsets.get(_project_ref_label(project_ref), 0),
+                    count=fetch_count,
+                    project_id=project_ref["project_id"] if use_cloud_routing else None,
+                    search_args=search_args,
+                    context=context,
+                )
+
+    outcomes = await asyncio.gather(
+        *(search_project(project_ref) for project_ref in project_refs), return_exceptions=True
+    )
+
+    windows: list[tuple[str, _ProjectSearchWindow]] = []
+    next_offsets = dict(offsets)
+    total = 0
+    total_is_exact = True
+    for project_ref, outcome in zip(project_refs, outcomes, strict=True):
+        label = _project_ref_label(project_ref)
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            logger.warning(f"Multi-project search failed for project {label}: {outcome!r}")
             total_is_exact = False
             continue
 
-        if isinstance(results, str):
-            if results.startswith(_SERVICE_UNAVAILABLE_HEADING):
-                return results
-            if not results.startswith("# Search Failed"):
-                return results
-            logger.warning(
-                "Multi-project search failed for project "
-                f"{_project_ref_label(project_ref)}: {results}"
-            )
+        if isinstance(outcome, str):
+            if outcome.startswith(_SERVICE_UNAVAILABLE_HEADING):
+                return outcome
+            if not outcome.startswith("# Search Failed"):
+                return outcome
+            logger.warning(f"Multi-project search failed for project {label}: {outcome}")
             total_is_exact = False
             continue
 
-        raw_results = _raw_results_from_search_payload(results)
-        total += _result_total(results, raw_results)
-        total_is_exact = total_is_exact and _result_total_is_exact(results)
-        any_project_has_more = any_project_has_more or results.get("has_more") is True
-        merged_results.extend(_qualify_results_for_project(raw_results, project_ref))
+        windows.append((label, outcome))
+        total += outcome.total
+        total_is_exact = total_is_exact and outcome.total_is_exact
 
     # Each project owns retrieval and optional reranking behind its typed API client.
     # The MCP process only merges returned scores; it must not instantiate repository
     # providers with local credentials for content fetched through another route.
-    sorted_results = sorted(merged_results, key=_result_score, reverse=True)
-    start = (requested_page - 1) * requested_page_size
-    end = start + requested_page_size
-    paged_results = sorted_results[start:end]
+    # Each project's results keep the order its API returned them in (a reranked
+    # project is not re-sorted by raw score); ties keep project order.
+    merged = heapq.merge(
+        *(zip(itertools.repeat(label), window.results) for label, window in windows),
+        key=lambda item: _result_score(item[1]),
+        reverse=True,
+    )
+    consumed: dict[str, int] = {}
+    paged_results: list[dict[str, Any]] = []
+    for position, (label, result) in enumerate(
+        itertools.islice(merged, skip + requested_page_size)
+    ):
+        consumed[label] = consumed.get(label, 0) + 1
+        if position >= skip:
+            paged_results.append(result)
+
+    has_more = False
+    for label, window in windows:
+        read = consumed.get(label, 0)
+        next_offsets[label] = offsets.get(label, 0) + read
+        has_more = has_more or window.has_more or read < len(window.results)
+    has_more = has_more or total > sum(next_offsets.values())
+    next_cursor = (
+        _encode_search_cursor(fingerprint, next_offsets, page=requested_page + 1)
+        if has_more
+        else None
+    )
+
     response = SearchResponse.model_validate(
         {
             "results": paged_results,
@@ -678,13 +829,19 @@ async def _search_all_projects(
             "page_size": requested_page_size,
             "total": total,
             "total_is_exact": total_is_exact,
-            "has_more": any_project_has_more or total > end or len(sorted_results) > end,
+            "has_more": has_more,
         }
     )
 
     if output_format == "json":
-        return response.model_dump(mode="json", exclude_none=True)
-    return _format_search_markdown(response, "all projects", query)
+        payload = response.model_dump(mode="json", exclude_none=True)
+        if next_cursor:
+            payload["next_cursor"] = next_cursor
+        return payload
+    markdown = _format_search_markdown(response, "all projects", query)
+    if next_cursor and response.results:
+        markdown += f'\n*next page: pass cursor="{next_cursor}" with the same search*'
+    return markdown
 
 
 @mcp.tool(
@@ -789,6 +946,7 @@ async def search_notes(
             validation_alias=AliasChoices("min_similarity", "threshold", "similarity_threshold"),
         ),
     ] = None,
+    cursor: Optional[str] = None,
     context: Context | None = None,
 ) -> dict[str, Any] | str:
     """Search across all content in the knowledge base with comprehensive syntax support.
@@ -903,6 +1061,11 @@ async def search_notes(
         min_similarity: Optional float to override the global semantic_min_similarity threshold
                        for this query. E.g., 0.0 to see all vector results, or 0.8 for high precision.
                        Only applies to vector and hybrid search types.
+        cursor: Optional `next_cursor` from a previous search_all_projects=True response.
+               Resumes the merged results where that page ended; pass the same query,
+               filters and page_size with it. The cursor carries its own page number,
+               so `page` is ignored and `current_page` reports the resumed page.
+               Only used with search_all_projects=True.
         context: Optional FastMCP context for performance caching.
 
     Returns:
@@ -1052,6 +1215,7 @@ async def search_notes(
             query=query,
             page=page,
             page_size=page_size,
+            cursor=cursor,
             search_type=search_type,
             output_format=output_format,
             note_types=note_types,
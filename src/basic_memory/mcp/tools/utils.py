@@ -33,6 +33,7 @@ from loguru import logger
 from fastmcp.exceptions import ToolError
 
 from basic_memory.config import ConfigManager
+from basic_memory.mcp.local_dispatch import dispatch_request
 
 
 def _classify_http_outcome(status_code: int) -> str:
@@ -82,6 +83,26 @@ def _request_headers(headers: HeaderTypes | None) -> HeaderTypes | None:
     return merged_headers
 
 
+async def _dispatch_json_request(
+    client: AsyncClient,
+    method: str,
+    url: URL | str,
+    content: RequestContent | None,
+    data: RequestData | None,
+    files: RequestFiles | None,
+    json: typing.Any | None,
+    params: QueryParamTypes | None,
+    headers: HeaderTypes | None,
+) -> Response | None:
+    """Dispatch a JSON-bodied request in-process when local dispatch allows it."""
+    if content is not None or data is not None or files is not None:
+        # Raw, form and multipart bodies are only ever parsed by the HTTP path.
+        return None
+    return await dispatch_request(
+        client, method, url, params=params, headers=_request_headers(headers), json=json
+    )
+
+
 def get_error_message(
     status_code: int, url: URL | str, method: str, msg: Optional[str] = None
 ) -> str:
@@ -274,7 +295,9 @@ async def call_get(
             has_query=bool(params),
             has_body=False,
         ) as request_span:
-            response = await client.get(
+            response = await dispatch_request(
+                client, "GET", url, params=params, headers=_request_headers(headers)
+            ) or await client.get(
                 url,
                 params=params,
                 headers=_request_headers(headers),
@@ -379,7 +402,9 @@ async def call_put(
             has_query=bool(params),
             has_body=any(value is not None for value in (content, data, files, json)),
         ) as request_span:
-            response = await client.put(
+            response = await _dispatch_json_request(
+                client, "PUT", url, content, data, files, json, params, headers
+            ) or await client.put(
                 url,
                 content=content,
                 data=data,
@@ -488,7 +513,9 @@ async def call_patch(
             has_query=bool(params),
             has_body=any(value is not None for value in (content, data, files, json)),
         ) as request_span:
-            response = await client.patch(
+            response = await _dispatch_json_request(
+                client, "PATCH", url, content, data, files, json, params, headers
+            ) or await client.patch(
                 url,
                 content=content,
                 data=data,
@@ -603,7 +630,9 @@ async def call_post(
             has_query=bool(params),
             has_body=any(value is not None for value in (content, data, files, json)),
         ) as request_span:
-            response = await client.post(
+            response = await _dispatch_json_request(
+                client, "POST", url, content, data, files, json, params, headers
+            ) or await client.post(
                 url=url,
                 content=content,
                 data=data,
@@ -691,7 +720,9 @@ async def call_query(
             has_query=bool(params),
             has_body=any(value is not None for value in (content, data, files, json)),
         ) as request_span:
-            response = await client.request(
+            response = await _dispatch_json_request(
+                client, "QUERY", url, content, data, files, json, params, headers
+            ) or await client.request(
                 "QUERY",
                 url=url,
                 content=content,
@@ -819,7 +850,9 @@ async def call_delete(
             has_query=bool(params),
             has_body=False,
         ) as request_span:
-            response = await client.delete(
+            response = await dispatch_request(
+                client, "DELETE", url, params=params, headers=_request_headers(headers)
+            ) or await client.delete(
                 url=url,
                 params=params,
                 headers=_request_headers(headers),
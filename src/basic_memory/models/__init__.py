@@ -2,6 +2,7 @@
 
 import basic_memory
 from basic_memory.models.base import Base
+from basic_memory.models.entity_directory import EntityDirectory
 from basic_memory.models.knowledge import (
     Entity,
     NoteContent,
@@ -15,6 +16,7 @@ from basic_memory.models.relation_search_refresh import RelationSearchRefresh
 __all__ = [
     "Base",
     "Entity",
+    "EntityDirectory",
     "NoteContent",
     "NoteFileVacate",
     "Observation",
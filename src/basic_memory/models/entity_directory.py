@@ -0,0 +1,372 @@
+"""Materialized directory index derived from entity file paths.
+
+Directories only exist as prefixes of ``Entity.file_path``. ``EntityDirectory``
+keeps them materialized so directory reads can address a subtree instead of
+scanning every entity.
+
+Entity rows are written through ORM flushes (repository add/update/delete,
+upserts, moves that assign ``file_path``) and through Core statements such as
+``delete(Entity)`` and the batched move ``update(Entity)``. Rather than asking
+every one of those call sites to remember the index, session events defined
+here observe them all:
+
+- ``after_flush`` turns new, moved and deleted ``Entity`` instances into count
+  deltas for their directory and every ancestor.
+- ``do_orm_execute`` wraps ORM-enabled DELETE and UPDATE statements against
+  ``Entity``. It adds the file location to the statement's RETURNING clause, so
+  deltas come from the rows the statement actually changed rather than from a
+  separate read that a concurrent writer could invalidate. Updates that do not
+  assign ``file_path`` or ``project_id`` pass straight through.
+
+Deltas are written on the session's own connection, so they commit or roll back
+with the entity change that produced them. ``rebuild_entity_directories``
+recomputes a project's rows from its entity paths; a full search reindex runs it
+to repair any drift, and the listener falls back to it when an update's old
+locations cannot be known.
+"""
+
+import posixpath
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Mapping
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    bindparam,
+    delete,
+    event,
+    inspect,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import FrozenResult, Result
+from sqlalchemy.orm import Mapped, ORMExecuteState, Session, mapped_column
+
+from basic_memory.models.base import Base
+from basic_memory.models.knowledge import Entity
+
+
+class EntityDirectory(Base):
+    """One directory that contains at least one entity file, directly or below it.
+
+    Rows are maintained incrementally as entities are created, moved and deleted,
+    and removed once no file remains beneath them.
+    """
+
+    __tablename__ = "entity_directory"
+    __table_args__ = (
+        Index("uix_entity_directory_project_path", "project_id", "path", unique=True),
+        Index("ix_entity_directory_project_parent", "project_id", "parent_path"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("project.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Directory path without leading or trailing slash, e.g. "notes/meetings"
+    path: Mapped[str] = mapped_column(String, nullable=False)
+    # Parent directory path; "" for top-level directories
+    parent_path: Mapped[str] = mapped_column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    # Number of path segments: "notes" is 1, "notes/meetings" is 2
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Files directly in this directory
+    file_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Files in this directory and every directory below it
+    total_file_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Last time a file was added to, moved within, or removed from this subtree
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now().astimezone(),
+    )
+
+
+# Entity columns whose change moves a file between directories.
+_LOCATION_COLUMNS = frozenset({"file_path", "project_id"})
+
+type DirectoryKey = tuple[int, str]
+
+
+def directory_ancestors(directory: str) -> list[str]:
+    """Return ``directory`` and every parent above it, outermost first.
+
+    ``"notes/meetings"`` yields ``["notes", "notes/meetings"]``; the root ("")
+    has no row and yields nothing.
+    """
+    parts = [part for part in directory.split("/") if part]
+    return ["/".join(parts[: depth + 1]) for depth in range(len(parts))]
+
+
+class DirectoryDeltas:
+    """File-count changes per directory, accumulated before they are written."""
+
+    def __init__(self) -> None:
+        # (project_id, path) -> [direct file delta, subtree file delta]
+        self._counts: dict[DirectoryKey, list[int]] = defaultdict(lambda: [0, 0])
+
+    def add_file(self, project_id: int, file_path: str) -> None:
+        self._record(project_id, file_path, 1)
+
+    def remove_file(self, project_id: int, file_path: str) -> None:
+        self._record(project_id, file_path, -1)
+
+    def _record(self, project_id: int, file_path: str, sign: int) -> None:
+        directory = posixpath.dirname(file_path.strip("/"))
+        if not directory:
+            return
+        self._counts[(project_id, directory)][0] += sign
+        for ancestor in directory_ancestors(directory):
+            self._counts[(project_id, ancestor)][1] += sign
+
+    def changed(self) -> dict[DirectoryKey, tuple[int, int]]:
+        """Return the directories whose counts actually moved."""
+        return {
+            key: (direct, total) for key, (direct, total) in self._counts.items() if direct or total
+        }
+
+
+def apply_directory_deltas(connection: Connection, deltas: DirectoryDeltas) -> None:
+    """Write accumulated count changes and drop directories left without files."""
+    changed = deltas.changed()
+    if not changed:
+        return
+
+    now = datetime.now().astimezone()
+    table = EntityDirectory.__table__
+
+    # Trigger: a directory gains files (possibly one that does not exist yet).
+    # Why: an upsert creates the row or adds to its counts in one statement.
+    # Outcome: growing directories never need a read-before-write.
+    grown = [
+        {
+            "project_id": project_id,
+            "path": path,
+            "parent_path": posixpath.dirname(path),
+            "name": posixpath.basename(path),
+            "depth": path.count("/") + 1,
+            "file_count": direct,
+            "total_file_count": total,
+            "updated_at": now,
+        }
+        for (project_id, path), (direct, total) in sorted(changed.items())
+        if total > 0
+    ]
+    if grown:
+        insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+        statement = insert(table)
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.project_id, table.c.path],
+                set_={
+                    "file_count": table.c.file_count + statement.excluded.file_count,
+                    "total_file_count": (
+                        table.c.total_file_count + statement.excluded.total_file_count
+                    ),
+                    "updated_at": statement.excluded.updated_at,
+                },
+            ),
+            grown,
+        )
+
+    # Shrinking or unchanged-total directories already exist, unless their project is
+    # being deleted and the rows went with it, so these are plain updates, never inserts.
+    shrunk = [
+        {"b_project_id": project_id, "b_path": path, "b_direct": direct, "b_total": total}
+        for (project_id, path), (direct, total) in sorted(changed.items())
+        if total <= 0
+    ]
+    if shrunk:
+        connection.execute(
+            update(table)
+            .where(
+                table.c.project_id == bindparam("b_project_id"),
+                table.c.path == bindparam("b_path"),
+            )
+            .values(
+                file_count=table.c.file_count + bindparam("b_direct"),
+                total_file_count=table.c.total_file_count + bindparam("b_total"),
+                updated_at=now,
+            ),
+            shrunk,
+        )
+        connection.execute(
+            delete(table).where(
+                tuple_(table.c.project_id, table.c.path).in_(
+                    [(row["b_project_id"], row["b_path"]) for row in shrunk]
+                ),
+                table.c.total_file_count <= 0,
+            )
+        )
+
+
+def rebuild_entity_directories(connection: Connection, project_id: int) -> None:
+    """Recompute one project's directory rows from its entity paths.
+
+    The incremental listeners keep the index current; this is the repair path
+    for anything they could not account for.
+    """
+    table = EntityDirectory.__table__
+    connection.execute(delete(table).where(table.c.project_id == project_id))
+    deltas = DirectoryDeltas()
+    for file_path in connection.execute(
+        select(Entity.file_path).where(Entity.project_id == project_id)
+    ).scalars():
+        deltas.add_file(project_id, file_path)
+    apply_directory_deltas(connection, deltas)
+
+
+def _history_value(entity: Entity, key: str) -> Any:
+    """Return the value ``key`` had in the database before this flush."""
+    history = inspect(entity).attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(entity, key)
+
+
+@event.listens_for(Session, "before_flush")
+def _load_deleted_entity_locations(session: Session, flush_context: Any, instances: Any) -> None:
+    """Make sure deleted entities still carry their path once the row is gone."""
+    for instance in session.deleted:
+        if isinstance(instance, Entity):
+            _ = (instance.project_id, instance.file_path)  # loads expired attributes
+
+
+@event.listens_for(Session, "after_flush")
+def _index_flushed_entities(session: Session, flush_context: Any) -> None:
+    deltas = DirectoryDeltas()
+    for instance in session.new:
+        if isinstance(instance, Entity):
+            deltas.add_file(instance.project_id, instance.file_path)
+    for instance in session.deleted:
+        if isinstance(instance, Entity):
+            deltas.remove_file(
+                _history_value(instance, "project_id"), _history_value(instance, "file_path")
+            )
+    for instance in session.dirty:
+        if not isinstance(instance, Entity):
+            continue
+        state = inspect(instance)
+        if not any(state.attrs[key].history.has_changes() for key in _LOCATION_COLUMNS):
+            continue
+        deltas.remove_file(
+            _history_value(instance, "project_id"), _history_value(instance, "file_path")
+        )
+        deltas.add_file(instance.project_id, instance.file_path)
+    apply_directory_deltas(session.connection(), deltas)
+
+
+def _moves_entities(orm_execute_state: ORMExecuteState) -> bool:
+    """Return whether an UPDATE may assign a column that locates an entity's file.
+
+    ``get_children()`` lists the SET columns at the top level of the statement,
+    while a column compared in the WHERE clause stays nested in its expression.
+    A RETURNING column can also match, which only costs an unneeded pass below.
+    """
+    assigned = {
+        child.key
+        for child in orm_execute_state.statement.get_children()
+        if isinstance(child, ColumnElement)
+    }
+    # ORM bulk updates by primary key carry their SET values in the parameter rows.
+    parameters = orm_execute_state.parameters
+    for row in parameters if isinstance(parameters, list) else ():
+        assigned.update(row)
+    return not _LOCATION_COLUMNS.isdisjoint(assigned)
+
+
+def _caller_result(frozen: FrozenResult, width: int) -> Result:
+    """Replay a located statement's result without the columns added for the index."""
+    result = frozen().columns(*range(width)) if width else frozen.with_new_rows([])()
+    # Repository helpers read ``rowcount`` from DML results; with RETURNING it is
+    # exactly the number of rows returned.
+    result.rowcount = len(frozen.data)  # pyright: ignore[reportAttributeAccessIssue]
+    return result
+
+
+def _rebuild_after_bulk_update(orm_execute_state: ORMExecuteState, rows: list[Any]) -> Any:
+    """Run a bulk update by primary key, then rebuild every project it touched.
+
+    RETURNING is not available for executemany updates, so old locations cannot
+    be paired with new ones; recomputing the affected projects stays exact.
+    """
+    session = orm_execute_state.session
+    ids = [row["id"] for row in rows if isinstance(row, Mapping) and "id" in row]
+    touched = select(Entity.project_id).where(Entity.id.in_(ids)).distinct()
+    projects = set(session.execute(touched).scalars())
+    result = orm_execute_state.invoke_statement()
+    projects.update(session.execute(touched).scalars())
+    for project_id in sorted(projects):
+        rebuild_entity_directories(session.connection(), project_id)
+    return result
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _index_entity_statements(orm_execute_state: ORMExecuteState) -> Any:
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not Entity:
+        return None
+    if orm_execute_state.is_update and not _moves_entities(orm_execute_state):
+        return None
+
+    parameters = orm_execute_state.parameters
+    if isinstance(parameters, list):
+        return _rebuild_after_bulk_update(orm_execute_state, parameters)
+
+    session = orm_execute_state.session
+    statement: Any = orm_execute_state.statement
+    width = len(statement.returning_column_descriptions)
+    deltas = DirectoryDeltas()
+
+    if orm_execute_state.is_delete:
+        # Trigger: a guarded DELETE can skip rows a separate read would have counted.
+        # Why: under READ COMMITTED a concurrent commit changes which rows qualify
+        #   between that read and the statement, and the counts drift.
+        # Outcome: RETURNING reports exactly the rows this statement removed.
+        frozen = orm_execute_state.invoke_statement(
+            statement=statement.returning(Entity.project_id, Entity.file_path)
+        ).freeze()
+        for *_, project_id, file_path in frozen.data:
+            deltas.remove_file(project_id, file_path)
+        apply_directory_deltas(session.connection(), deltas)
+        return _caller_result(frozen, width)
+
+    # RETURNING only reports new values, so old locations are read first. Locking the
+    # rows keeps them from moving before the UPDATE runs; rows it changes that the
+    # read did not see have unknown origins, so their project is rebuilt instead.
+    whereclause = statement.whereclause
+    previous = {
+        entity_id: (project_id, file_path)
+        for entity_id, project_id, file_path in session.execute(
+            select(Entity.id, Entity.project_id, Entity.file_path)
+            .where(*(() if whereclause is None else (whereclause,)))
+            .with_for_update(),
+            parameters if isinstance(parameters, dict) else None,
+        )
+    }
+    frozen = orm_execute_state.invoke_statement(
+        statement=statement.returning(Entity.id, Entity.project_id, Entity.file_path)
+    ).freeze()
+    unaccounted: set[int] = set()
+    for *_, entity_id, project_id, file_path in frozen.data:
+        if entity_id not in previous:
+            unaccounted.add(project_id)
+            continue
+        deltas.remove_file(*previous[entity_id])
+        deltas.add_file(project_id, file_path)
+    apply_directory_deltas(session.connection(), deltas)
+    for project_id in sorted(unaccounted):
+        rebuild_entity_directories(session.connection(), project_id)
+    return _caller_result(frozen, width)
@@ -9,6 +9,7 @@ from basic_memory.read_cache.contract import (
     ReadCacheLookup,
     ReadCacheOperation,
     ReadCacheStoreStatus,
+    ReadCacheTier,
     ReadCacheUnavailable,
 )
 from basic_memory.read_cache.invalidation import (
@@ -30,6 +31,7 @@ __all__ = [
     "ReadCacheOperation",
     "ReadCacheScope",
     "ReadCacheStoreStatus",
+    "ReadCacheTier",
     "ReadCacheUnavailable",
     "finish_project_read_cache_invalidation",
     "invalidate_cache",
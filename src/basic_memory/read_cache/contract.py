@@ -25,6 +25,13 @@ class ReadCacheStoreStatus(StrEnum):
     superseded = "superseded"
 
 
+class ReadCacheTier(StrEnum):
+    """Cache tier that answered one lookup."""
+
+    memory = "memory"
+    shared = "shared"
+
+
 class ReadCacheInvalidationStatus(StrEnum):
     """Outcome of one project-generation invalidation attempt."""
 
@@ -74,6 +81,7 @@ class ReadCacheLookup:
     generation: str
     payload: bytes | None = None
     remaining_ttl_seconds: float | None = None
+    tier: ReadCacheTier = ReadCacheTier.shared
 
     def __post_init__(self) -> None:
         if not self.generation:
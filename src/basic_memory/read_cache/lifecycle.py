@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from loguru import logger
 
 from basic_memory.read_cache.contract import ReadCache
+from basic_memory.read_cache.memory import MemoryReadCache
 
 
 STANDALONE_CACHE_NAMESPACE = "standalone"
@@ -24,8 +25,13 @@ async def open_redis_read_cache(
     redis_url: str | None,
     *,
     max_connections: int = 20,
+    memory_max_bytes: int = 0,
+    memory_generation_ttl_seconds: float = 1.0,
 ) -> AsyncIterator[ReadCache | None]:
-    """Open one process-owned Redis cache when standalone caching is configured."""
+    """Open one process-owned Redis cache when standalone caching is configured.
+
+    A positive ``memory_max_bytes`` puts an in-process tier in front of Redis.
+    """
     if max_connections <= 0:
         raise ValueError("Redis max_connections must be positive")
     if redis_url is None or not redis_url.strip():
@@ -39,8 +45,18 @@ async def open_redis_read_cache(
         normalize_redis_url(redis_url),
         max_connections=max_connections,
     )
-    logger.info("Standalone Redis read cache enabled")
+    read_cache: ReadCache = RedisReadCache(client=client, namespace=STANDALONE_CACHE_NAMESPACE)
+    if memory_max_bytes > 0:
+        read_cache = MemoryReadCache(
+            backend=read_cache,
+            max_bytes=memory_max_bytes,
+            generation_ttl_seconds=memory_generation_ttl_seconds,
+        )
+    logger.info(
+        "Standalone Redis read cache enabled",
+        memory_tier_max_bytes=memory_max_bytes,
+    )
     try:
-        yield RedisReadCache(client=client, namespace=STANDALONE_CACHE_NAMESPACE)
+        yield read_cache
     finally:
         await client.aclose()
@@ -0,0 +1,206 @@
+"""In-process LRU tier in front of a shared read-cache backend.
+
+A worker that served a key moments ago can answer it again without a Redis round
+trip. Entries carry the project generation they were stored under, and the tier
+trusts the generation it last observed for a project only for a short window;
+after that the next lookup goes to the backend, which reports the authoritative
+generation. Invalidations issued through this tier take effect locally at once.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import logfire
+
+from basic_memory.read_cache.contract import (
+    ReadCache,
+    ReadCacheInvalidationStatus,
+    ReadCacheKey,
+    ReadCacheLookup,
+    ReadCacheOperation,
+    ReadCacheStoreStatus,
+    ReadCacheTier,
+    canonical_read_cache_project_id,
+)
+
+DEFAULT_MEMORY_READ_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MEMORY_READ_CACHE_GENERATION_TTL_SECONDS = 1.0
+
+type MemoryReadCacheEntryKey = tuple[str, ReadCacheOperation, str]
+
+
+def _record_event(operation: str, event: str) -> None:
+    # Hits and misses are counted by the read-through layer from ``lookup.tier``;
+    # only events no other layer can see are recorded here.
+    logfire.metric_counter("basic_memory_read_cache_events_total").add(
+        1,
+        attributes={
+            "operation": operation,
+            "event": event,
+            "tier": "memory",
+        },
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _ObservedGeneration:
+    generation: str
+    observed_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _MemoryEntry:
+    generation: str
+    payload: bytes
+    expires_at: float
+
+
+class MemoryReadCache:
+    """Byte-bounded LRU that answers repeat reads locally and falls through to ``backend``."""
+
+    def __init__(
+        self,
+        *,
+        backend: ReadCache,
+        max_bytes: int = DEFAULT_MEMORY_READ_CACHE_MAX_BYTES,
+        generation_ttl_seconds: float = DEFAULT_MEMORY_READ_CACHE_GENERATION_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("read-cache max_bytes must be positive")
+        if generation_ttl_seconds < 0:
+            raise ValueError("read-cache generation_ttl_seconds must not be negative")
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.generation_ttl_seconds = generation_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[MemoryReadCacheEntryKey, _MemoryEntry] = OrderedDict()
+        self._generations: dict[str, _ObservedGeneration] = {}
+        # Bumped when a local invalidation starts and ends, so a backend read that
+        # overlapped it cannot re-install the generation the invalidation retires.
+        self._invalidation_epochs: dict[str, int] = {}
+        self._pending_invalidations: dict[str, int] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry_key(self, key: ReadCacheKey) -> MemoryReadCacheEntryKey:
+        return (key.project_id, key.operation, key.request_digest)
+
+    def _epoch(self, project_id: str) -> int:
+        return self._invalidation_epochs.get(project_id, 0)
+
+    def _bump_epoch(self, project_id: str) -> None:
+        self._invalidation_epochs[project_id] = self._epoch(project_id) + 1
+
+    def _may_install(self, project_id: str, epoch: int) -> bool:
+        return self._epoch(project_id) == epoch and not self._pending_invalidations.get(project_id)
+
+    def _current_generation(self, project_id: str, now: float) -> str | None:
+        observed = self._generations.get(project_id)
+        if observed is None or now - observed.observed_at > self.generation_ttl_seconds:
+            return None
+        return observed.generation
+
+    def _observe_generation(self, project_id: str, generation: str, now: float) -> None:
+        observed = self._generations.get(project_id)
+        if observed is not None and observed.generation != generation:
+            # Another worker moved the project on; everything stored locally is unreachable.
+            self._drop_project_entries(project_id)
+        self._generations[project_id] = _ObservedGeneration(generation, now)
+
+    def _remove(self, entry_key: MemoryReadCacheEntryKey) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.total_bytes -= len(entry.payload)
+
+    def _drop_project_entries(self, project_id: str) -> None:
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == project_id]:
+            self._remove(entry_key)
+
+    def _put(
+        self,
+        key: ReadCacheKey,
+        generation: str,
+        payload: bytes,
+        ttl_seconds: float,
+        now: float,
+    ) -> None:
+        entry_key = self._entry_key(key)
+        self._remove(entry_key)
+        if len(payload) > self.max_bytes or ttl_seconds <= 0:
+            return
+        self._entries[entry_key] = _MemoryEntry(generation, payload, now + ttl_seconds)
+        self.total_bytes += len(payload)
+        while self.total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            _record_event(oldest_key[1].value, "evicted")
+
+    async def lookup(self, key: ReadCacheKey) -> ReadCacheLookup:
+        now = self._clock()
+        generation = self._current_generation(key.project_id, now)
+        entry_key = self._entry_key(key)
+        entry = self._entries.get(entry_key)
+        if generation is not None and entry is not None:
+            if entry.generation == generation and entry.expires_at > now:
+                self._entries.move_to_end(entry_key)
+                return ReadCacheLookup(
+                    generation=generation,
+                    payload=entry.payload,
+                    remaining_ttl_seconds=entry.expires_at - now,
+                    tier=ReadCacheTier.memory,
+                )
+            self._remove(entry_key)
+
+        epoch = self._epoch(key.project_id)
+        lookup = await self.backend.lookup(key)
+        if not self._may_install(key.project_id, epoch):
+            return lookup
+        now = self._clock()
+        self._observe_generation(key.project_id, lookup.generation, now)
+        if lookup.payload is not None and lookup.remaining_ttl_seconds is not None:
+            # Promote a shared-tier hit so the next read on this worker stays local.
+            self._put(key, lookup.generation, lookup.payload, lookup.remaining_ttl_seconds, now)
+        return lookup
+
+    async def store(
+        self,
+        key: ReadCacheKey,
+        lookup: ReadCacheLookup,
+        payload: bytes,
+        *,
+        ttl_seconds: int,
+    ) -> ReadCacheStoreStatus:
+        epoch = self._epoch(key.project_id)
+        status = await self.backend.store(key, lookup, payload, ttl_seconds=ttl_seconds)
+        if status is ReadCacheStoreStatus.superseded:
+            # The backend saw a newer generation than ``lookup``; stop trusting ours.
+            self._generations.pop(key.project_id, None)
+            self._drop_project_entries(key.project_id)
+        elif self._may_install(key.project_id, epoch):
+            self._put(key, lookup.generation, payload, ttl_seconds, self._clock())
+        return status
+
+    async def invalidate_project(self, project_id: str) -> ReadCacheInvalidationStatus:
+        # Local state goes first so this worker never serves the old generation, even
+        # when the shared backend is unavailable and the call below raises.
+        canonical_project_id = canonical_read_cache_project_id(project_id)
+        self._bump_epoch(canonical_project_id)
+        self._pending_invalidations[canonical_project_id] = (
+            self._pending_invalidations.get(canonical_project_id, 0) + 1
+        )
+        self._generations.pop(canonical_project_id, None)
+        self._drop_project_entries(canonical_project_id)
+        try:
+            return await self.backend.invalidate_project(project_id)
+        finally:
+            remaining = self._pending_invalidations[canonical_project_id] - 1
+            if remaining:
+                self._pending_invalidations[canonical_project_id] = remaining
+            else:
+                del self._pending_invalidations[canonical_project_id]
+            self._bump_epoch(canonical_project_id)
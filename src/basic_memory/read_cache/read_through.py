@@ -13,17 +13,20 @@ from basic_memory.read_cache.contract import (
     ReadCacheDataError,
     ReadCacheInvalidationStatus,
     ReadCacheKey,
+    ReadCacheTier,
     ReadCacheUnavailable,
 )
 
 
-def _record_event(key: ReadCacheKey, event: str) -> None:
+def _record_event(key: ReadCacheKey, event: str, tier: ReadCacheTier | None = None) -> None:
+    # Lookup outcomes carry the tier that answered them; a layered backend reports
+    # through here only, so each read is counted exactly once.
+    attributes = {"operation": key.operation.value, "event": event}
+    if tier is not None:
+        attributes["tier"] = tier.value
     logfire.metric_counter("basic_memory_read_cache_events_total").add(
         1,
-        attributes={
-            "operation": key.operation.value,
-            "event": event,
-        },
+        attributes=attributes,
     )
 
 
@@ -121,11 +124,11 @@ class ModelReadCache[ModelT: BaseModel]:
                     # telemetry, while falling back would weaken the fail-fast contract.
                     # Outcome: mark the lookup corrupt and re-raise the validation error unchanged.
                     lookup_attributes["cache.lookup.outcome"] = "corrupt"
-                    _record_event(key, "corrupt")
+                    _record_event(key, "corrupt", lookup.tier)
                     span.set_attributes(lookup_attributes)
                     raise
 
-                _record_event(key, "hit")
+                _record_event(key, "hit", lookup.tier)
                 span.set_attributes(lookup_attributes)
                 yield ReadCacheScope(
                     value=cached_value,
@@ -133,7 +136,7 @@ class ModelReadCache[ModelT: BaseModel]:
                 )
                 return
 
-            _record_event(key, "miss")
+            _record_event(key, "miss", lookup.tier)
             span.set_attributes(lookup_attributes)
             result = ReadCacheScope[ModelT]()
             yield result
@@ -4,7 +4,7 @@ import unicodedata
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import override, List, Optional, Sequence, Union, Any
+from typing import override, List, Optional, Sequence, Union, Any, cast
 
 from loguru import logger
 from sqlalchemy import case, exists, func, or_, select
@@ -14,6 +14,7 @@ from sqlalchemy.orm import load_only, selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.engine import Row
 
+from basic_memory.models.entity_directory import EntityDirectory, rebuild_entity_directories
 from basic_memory.models.knowledge import Entity, Observation, Relation
 from basic_memory.models.relation_search_refresh import RelationSearchRefresh
 from basic_memory.repository.repository import Repository
@@ -235,6 +236,39 @@ class EntityRepository(Repository[Entity]):
             load_relations=load_relations,
         )
 
+    async def find_by_link_identities(
+        self,
+        session: AsyncSession,
+        *,
+        permalinks: Sequence[str] = (),
+        titles: Sequence[str] = (),
+        file_paths: Sequence[Union[Path, str]] = (),
+        load_relations: bool = True,
+    ) -> Sequence[Entity]:
+        """Fetch every entity matching any exact permalink, title, or file path in one query.
+
+        Link resolution applies its own precedence over these identities, so this only
+        gathers the candidates; each entity is returned once, shortest path first.
+        """
+        conditions = []
+        if permalinks:
+            conditions.append(Entity.permalink.in_(list(dict.fromkeys(permalinks))))
+        if titles:
+            conditions.append(Entity.title.in_(list(dict.fromkeys(titles))))
+        if file_paths:
+            normalized_paths = [Path(file_path).as_posix() for file_path in file_paths]
+            conditions.append(Entity.file_path.in_(list(dict.fromkeys(normalized_paths))))
+        if not conditions:
+            return []
+
+        query = (
+            self.select()
+            .where(or_(*conditions))
+            .order_by(func.length(Entity.file_path), Entity.file_path)
+        )
+        result = await self.execute_query(session, query, use_query_options=load_relations)
+        return list(result.scalars().unique().all())
+
     # -------------------------------------------------------------------------
     # Lightweight methods for permalink resolution (no eager loading)
     # -------------------------------------------------------------------------
@@ -256,6 +290,59 @@ class EntityRepository(Repository[Entity]):
         result = await self.execute_query(session, query, use_query_options=False)
         return result.scalar_one_or_none() is not None
 
+    async def allocate_permalinks(
+        self,
+        session: AsyncSession,
+        base_permalink: str,
+        count: int = 1,
+        *,
+        include_base: bool = True,
+    ) -> List[str]:
+        """Return the next free permalinks in the ``base``, ``base-1``, ``base-2`` sequence.
+
+        One query reads every taken permalink in the sequence, so the cost does not
+        grow with the number of same-titled notes already in the project (daily logs,
+        imported chats all named "New chat").
+
+        Args:
+            base_permalink: Permalink the sequence starts from
+            count: Number of free permalinks to hand out
+            include_base: Whether ``base_permalink`` itself may be handed out
+
+        Returns:
+            ``count`` free permalinks, lowest suffix first
+        """
+        prefix = f"{base_permalink}-"
+        query = select(Entity.permalink).where(
+            or_(
+                Entity.permalink == base_permalink,
+                Entity.permalink.startswith(prefix, autoescape=True),
+            )
+        )
+        query = self._add_project_filter(query)
+        result = await self.execute_query(session, query, use_query_options=False)
+
+        base_taken = False
+        taken_suffixes: set[int] = set()
+        for permalink in result.scalars().all():
+            if permalink == base_permalink:
+                base_taken = True
+                continue
+            # LIKE is case-insensitive on SQLite; keep exact generated suffixes only.
+            suffix = permalink[len(prefix) :] if permalink.startswith(prefix) else ""
+            if suffix.isdigit() and str(int(suffix)) == suffix:
+                taken_suffixes.add(int(suffix))
+
+        permalinks: List[str] = []
+        if include_base and not base_taken and count > 0:
+            permalinks.append(base_permalink)
+        suffix = 1
+        while len(permalinks) < count:
+            if suffix not in taken_suffixes:
+                permalinks.append(f"{prefix}{suffix}")
+            suffix += 1
+        return permalinks
+
     async def get_file_path_for_permalink(
         self, session: AsyncSession, permalink: str
     ) -> Optional[str]:
@@ -603,6 +690,30 @@ class EntityRepository(Repository[Entity]):
         result = await self.execute_query(session, query, use_query_options=False)
         return list(result.scalars().all())
 
+    async def find_graph_nodes(
+        self, session: AsyncSession, *, after_id: int, limit: int
+    ) -> list[tuple[int, str, str, str, str]]:
+        """Return graph node columns for entities after ``after_id``, in id order.
+
+        A column projection rather than ORM entities, so exporting a large graph
+        never materializes ``Entity`` objects or their relationships.
+        """
+        query = (
+            select(Entity.id, Entity.external_id, Entity.title, Entity.note_type, Entity.file_path)
+            .where(Entity.project_id == self.project_id, Entity.id > after_id)
+            .order_by(Entity.id)
+            .limit(limit)
+        )
+        result = await self.execute_query(session, query, use_query_options=False)
+        return [(row[0], row[1], row[2], row[3], row[4]) for row in result.all()]
+
+    async def get_graph_node_version(self, session: AsyncSession) -> tuple[Any, ...]:
+        """Return (count, max id, latest update) for the project's entities."""
+        query = select(func.count(Entity.id), func.max(Entity.id), func.max(Entity.updated_at))
+        query = self._add_project_filter(query)
+        result = await self.execute_query(session, query, use_query_options=False)
+        return tuple(result.one())
+
     async def find_without_relations(self, session: AsyncSession) -> Sequence[Entity]:
         """Find entities that have no incoming or outgoing relations."""
         # Trigger: entity appears as a source in any relation.
@@ -620,35 +731,54 @@ class EntityRepository(Repository[Entity]):
         return list(result.scalars().all())
 
     async def get_distinct_directories(self, session: AsyncSession) -> List[str]:
-        """Extract unique directory paths from file_path column.
+        """Return every directory that contains an entity file, directly or below it.
 
-        Optimized method for getting directory structure without loading full entities
-        or relationships. Returns a sorted list of unique directory paths.
+        Reads the materialized directory index instead of deriving directories from
+        every entity's file_path.
 
         Returns:
             List of unique directory paths (e.g., ["notes", "notes/meetings", "specs"])
         """
-        # Query only file_path column, no entity objects or relationships
-        query = select(Entity.file_path).distinct()
-        query = self._add_project_filter(query)
+        return await self.find_directories(session, "")
 
-        # Execute with use_query_options=False to skip eager loading
-        result = await self.execute_query(session, query, use_query_options=False)
-        file_paths = [row for row in result.scalars().all()]
+    async def find_directories(
+        self, session: AsyncSession, directory_prefix: str, max_depth: Optional[int] = None
+    ) -> List[str]:
+        """Return the directories below a prefix from the materialized directory index.
 
-        # Parse file paths to extract unique directories
-        directories = set()
-        for file_path in file_paths:
-            parts = [p for p in file_path.split("/") if p]
-            # Add all parent directories (exclude filename which is the last part)
-            for i in range(len(parts) - 1):
-                dir_path = "/".join(parts[: i + 1])
-                directories.add(dir_path)
+        Args:
+            directory_prefix: Directory path prefix (e.g., "docs"); empty string for root
+            max_depth: Optional number of levels below the prefix to include
+
+        Returns:
+            Sorted directory paths strictly below the prefix
+        """
+        directory_prefix = directory_prefix.strip("/")
+        query = select(EntityDirectory.path)
+        if self.project_id is not None:
+            query = query.where(EntityDirectory.project_id == self.project_id)
+        base_depth = 0
+        if directory_prefix:
+            base_depth = directory_prefix.count("/") + 1
+            query = query.where(EntityDirectory.path.like(f"{directory_prefix}/%"))
+        if max_depth is not None:
+            query = query.where(EntityDirectory.depth <= base_depth + max_depth)
 
-        return sorted(directories)
+        result = await self.execute_query(session, query, use_query_options=False)
+        return sorted(result.scalars().all())
+
+    async def rebuild_directories(self, session: AsyncSession) -> None:
+        """Recompute this project's directory index from its entity paths."""
+        project_id = self.project_id
+        if project_id is None:  # pragma: no cover
+            raise RuntimeError("EntityRepository requires project_id to rebuild directories")
+        connection = await session.connection()
+        await connection.run_sync(
+            lambda sync_connection: rebuild_entity_directories(sync_connection, project_id)
+        )
 
     async def find_by_directory_prefix(
-        self, session: AsyncSession, directory_prefix: str
+        self, session: AsyncSession, directory_prefix: str, max_depth: Optional[int] = None
     ) -> Sequence[Entity]:
         """Find entities whose file_path starts with the given directory prefix.
 
@@ -658,47 +788,41 @@ class EntityRepository(Repository[Entity]):
         Args:
             directory_prefix: Directory path prefix (e.g., "docs", "docs/guides")
                              Empty string returns all entities (root directory)
+            max_depth: Optional number of levels below the prefix to include
+                       (1 = files directly in the directory)
 
         Returns:
             Sequence of entities in the specified directory and subdirectories
         """
-        # Build SQL LIKE pattern
-        if directory_prefix == "" or directory_prefix == "/":
-            # Root directory - return all entities
-            return await self.find_all(session)
-
         # Remove leading/trailing slashes for consistency
         directory_prefix = directory_prefix.strip("/")
 
-        # Query entities with file_path starting with prefix
-        # Pattern matches "prefix/" to ensure we get files IN the directory,
-        # not just files whose names start with the prefix
-        pattern = f"{directory_prefix}/%"
-
-        query = self.select().where(Entity.file_path.like(pattern))
-
         # Skip eager loading - we only need basic entity fields for directory trees
+        query = self.select()
+        base_depth = 0
+        if directory_prefix:
+            # Pattern matches "prefix/" to ensure we get files IN the directory,
+            # not just files whose names start with the prefix
+            base_depth = directory_prefix.count("/") + 1
+            query = query.where(Entity.file_path.like(f"{directory_prefix}/%"))
+        if max_depth is not None:
+            # A file's depth is its number of "/" separators; both backends spell it this way.
+            separators = func.length(Entity.file_path) - func.length(
+                func.replace(Entity.file_path, "/", "")
+            )
+            query = query.where(separators < base_depth + max_depth)
+
         result = await self.execute_query(session, query, use_query_options=False)
         return list(result.scalars().all())
 
     async def _handle_permalink_conflict(self, entity: Entity, session: AsyncSession) -> Entity:
         """Handle permalink conflicts by generating a unique permalink."""
-        base_permalink = entity.permalink
-        suffix = 1
-
-        # Find a unique permalink
-        while True:
-            test_permalink = f"{base_permalink}-{suffix}"
-            existing = await session.execute(
-                select(Entity).where(
-                    Entity.permalink == test_permalink, Entity.project_id == entity.project_id
-                )
-            )
-            if existing.scalar_one_or_none() is None:
-                # Found unique permalink
-                entity.permalink = test_permalink
-                break
-            suffix += 1
+        # Only a non-null permalink can violate the unique index, so one is set here.
+        # It is taken; claim the lowest free numeric suffix.
+        base_permalink = cast(str, entity.permalink)
+        (entity.permalink,) = await self.allocate_permalinks(
+            session, base_permalink, include_base=False
+        )
 
         # Insert with unique permalink
         session.add(entity)
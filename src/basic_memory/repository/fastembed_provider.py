@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import math
 import shutil
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -34,6 +33,11 @@ _MISSING_ARTIFACT_ERROR_MARKERS = (
 )
 
 
+def _vector_values(vector: Any) -> list[float]:
+    """Return plain values for a non-ndarray vector (test doubles, older FastEmbed builds)."""
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
 class FastEmbedEmbeddingProvider:
     """Local ONNX embedding provider backed by FastEmbed."""
 
@@ -294,22 +298,29 @@ class FastEmbedEmbeddingProvider:
         )
 
         def _embed_batch() -> list[list[float]]:
+            import numpy as np
+
             embed_kwargs: dict[str, int] = {"batch_size": self.batch_size}
             if effective_parallel is not None:
                 embed_kwargs["parallel"] = effective_parallel
-            vectors = list(model.embed(texts, **embed_kwargs))
+            # FastEmbed yields one ndarray per text; stack them into a single matrix so
+            # normalization and the final float conversion run in numpy rather than a
+            # per-element Python loop that rivals ONNX inference on large reindexes.
+            matrix = np.array(
+                [
+                    vector if isinstance(vector, np.ndarray) else _vector_values(vector)
+                    for vector in model.embed(texts, **embed_kwargs)
+                ],
+                dtype=np.float64,
+            )
             # sqlite_search_repository.py uses a distance-to-similarity formula that assumes
             # unit-normalized vectors (see the comment on line 65-67 of that file).
             # Some models (e.g. multilingual ones) return vectors with norm > 1, so we
             # L2-normalize here to satisfy that contract regardless of the chosen model.
-            normalized: list[list[float]] = []
-            for vector in vectors:
-                values = vector.tolist() if hasattr(vector, "tolist") else list(vector)
-                norm = math.sqrt(sum(x * x for x in values))
-                if norm > 0:
-                    values = [x / norm for x in values]
-                normalized.append([float(v) for v in values])
-            return normalized
+            # Zero rows are left untouched instead of dividing by zero.
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+            return matrix.tolist()
 
         vectors = await asyncio.to_thread(_embed_batch)
         if vectors and len(vectors[0]) != self.dimensions:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import math
 import os
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -26,6 +27,47 @@ _TRANSIENT_DOWNLOAD_STATUS_CODES = frozenset({408, 425, 429})
 _TRUE_ENV_VALUES = frozenset({"1", "ON", "YES", "TRUE"})
 
 
+@dataclass(slots=True)
+class _PendingRerank:
+    """One caller's rerank request waiting for the next coalesced model call."""
+
+    query: str
+    documents: list[str]
+    future: asyncio.Future[list[float]] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+def _score_pending_batch(
+    model: "TextCrossEncoder",
+    batch: list[tuple[str, list[str]]],
+) -> list[list[float]]:
+    """Return raw logits per request, scoring the whole batch in one model call."""
+    if len(batch) == 1:
+        query, documents = batch[0]
+        return [[float(score) for score in model.rerank(query, documents)]]
+
+    rerank_pairs = getattr(model, "rerank_pairs", None)
+    if rerank_pairs is None:
+        # Compatibility: cross-encoders without pair scoring still share one thread hop.
+        return [
+            [float(score) for score in model.rerank(query, documents)] for query, documents in batch
+        ]
+
+    pairs = [(query, document) for query, documents in batch for document in documents]
+    logits = [float(score) for score in rerank_pairs(pairs)]
+    if len(logits) != len(pairs):
+        raise RerankProviderContractError(
+            f"Reranker returned {len(logits)} scores for {len(pairs)} documents."
+        )
+    split: list[list[float]] = []
+    start = 0
+    for _, documents in batch:
+        split.append(logits[start : start + len(documents)])
+        start += len(documents)
+    return split
+
+
 def _consume_model_load_exception(task: asyncio.Task["TextCrossEncoder"]) -> None:
     """Retrieve background load failures when the request that started them was cancelled."""
     if not task.cancelled():
@@ -82,6 +124,8 @@ class FastEmbedRerankProvider:
         # Serialize the one-time model load; concurrent first queries must not each
         # construct (and download) the ONNX model.
         self._model_lock = asyncio.Lock()
+        self._pending: list[_PendingRerank] = []
+        self._drain_task: asyncio.Task[None] | None = None
 
     def runtime_log_attrs(self) -> dict[str, Any]:
         return {"model_name": self.model_name, "threads": self.threads}
@@ -139,17 +183,53 @@ class FastEmbedRerankProvider:
         # caller still exits promptly while the next caller joins the same worker.
         return await asyncio.shield(load_task)
 
+    async def _drain_pending(self, model: "TextCrossEncoder") -> None:
+        """Score queued requests, coalescing everything that arrived during a model call."""
+        live: list[_PendingRerank] = []
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                live = [request for request in batch if not request.future.done()]
+                if not live:
+                    continue
+                try:
+                    results = await asyncio.to_thread(
+                        _score_pending_batch,
+                        model,
+                        [(request.query, request.documents) for request in live],
+                    )
+                except Exception as exc:
+                    for request in live:
+                        if not request.future.done():
+                            request.future.set_exception(exc)
+                    continue
+                for request, logits in zip(live, results):
+                    if not request.future.done():
+                        request.future.set_result(logits)
+        finally:
+            self._drain_task = None
+            # A cancelled drain must not strand callers awaiting a result forever.
+            for request in [*live, *self._pending]:
+                request.future.cancel()
+            self._pending = []
+
     async def rerank(self, query: str, documents: list[str]) -> list[float]:
         if not documents:
             return []
         model = await self._load_model()
-        # TextCrossEncoder.rerank is sync/CPU-bound and yields one raw logit per doc
-        # in input order; run it off the event loop and squash to [0, 1] so callers
-        # get a bounded relevance on the same scale as API-based rerankers.
-        scores = await asyncio.to_thread(
-            lambda: [_sigmoid(float(score)) for score in model.rerank(query, documents)]
-        )
-        return validate_rerank_scores(scores, len(documents))
+        # Trigger: concurrent searches each rerank their own candidate pool.
+        # Why: one thread hop per request serializes on the ONNX session anyway, and
+        # tiny per-request batches leave the cross-encoder's batching unused.
+        # Outcome: requests queued while a model call runs are scored together in
+        # the next call; a lone request still goes straight to the model.
+        request = _PendingRerank(query, documents)
+        self._pending.append(request)
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain_pending(model))
+        logits = await request.future
+        # TextCrossEncoder yields one raw logit per doc in input order; squash to
+        # [0, 1] so callers get a bounded relevance on the same scale as API rerankers.
+        return validate_rerank_scores([_sigmoid(logit) for logit in logits], len(documents))
 
 
 def _sigmoid(x: float) -> float:
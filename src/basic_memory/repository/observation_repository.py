@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from typing import override, Dict, List, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
@@ -129,7 +129,44 @@ class ObservationRepository(Repository[Observation]):
         if current_generation is None:
             return ObservationGenerationWriteResult(generation_is_current=False)
 
-        await self.delete_by_fields(session, entity_id=entity_id)
+        # Trigger: every accepted save re-derives the note's full observation list.
+        # Why: replacing all rows gave unchanged observations new ids, so the search
+        #   projection (keyed by row id) rewrote every observation on a one-line edit.
+        #   Entity.observations reads back in id order, so only a leading run can keep
+        #   its ids without moving edited observations out of file order.
+        # Outcome: the unchanged prefix keeps its rows; everything from the first
+        #   changed position is deleted and re-inserted in markdown order.
+        existing = await session.execute(
+            select(
+                Observation.id,
+                Observation.category,
+                Observation.content,
+                Observation.context,
+                Observation.tags,
+            )
+            .where(
+                Observation.project_id == self.project_id,
+                Observation.entity_id == entity_id,
+            )
+            .order_by(Observation.id)
+        )
+        existing_rows = existing.all()
+        kept = 0
+        for row, obs in zip(existing_rows, observations):
+            if _observation_identity(
+                row.category, row.content, row.context, row.tags
+            ) != _observation_identity(obs.category, obs.content, obs.context, obs.tags):
+                break
+            kept += 1
+
+        stale_ids = [row.id for row in existing_rows[kept:]]
+        if stale_ids:
+            await session.execute(
+                delete(Observation).where(
+                    Observation.project_id == self.project_id,
+                    Observation.id.in_(stale_ids),
+                )
+            )
         rows = [
             Observation(
                 project_id=self.project_id,
@@ -139,7 +176,14 @@ class ObservationRepository(Repository[Observation]):
                 context=obs.context,
                 tags=obs.tags,
             )
-            for obs in observations
+            for obs in observations[kept:]
         ]
         await self.add_all_no_return(session, rows)
         return ObservationGenerationWriteResult(generation_is_current=True)
+
+
+def _observation_identity(
+    category: str | None, content: str, context: str | None, tags: Sequence[str] | None
+) -> tuple:
+    """Compare observations by every persisted field except their id."""
+    return category, content, context, None if tags is None else tuple(tags)
@@ -17,8 +17,11 @@ from basic_memory import db
 from basic_memory.config import BasicMemoryConfig, ConfigManager, DatabaseBackend
 from basic_memory.repository.embedding_provider import EmbeddingProvider
 from basic_memory.repository.embedding_provider_factory import create_embedding_provider
+from basic_memory.repository.query_embedding_cache import get_query_embedding_cache
 from basic_memory.repository.rerank_provider import RerankProvider
 from basic_memory.repository.rerank_provider_factory import create_rerank_provider
+from basic_memory.repository.rerank_score_cache import get_rerank_score_cache
+from basic_memory.repository.rerank_stable_pool_cache import get_rerank_stable_pool_cache
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.search_query import relaxed_query_words
 from basic_memory.repository.semantic_chunking import VectorChunkRecord
@@ -85,6 +88,7 @@ class PostgresSearchRepository(SearchRepositoryBase):
         self._semantic_enabled = self._app_config.semantic_search_enabled
         self._semantic_vector_k = self._app_config.semantic_vector_k
         self._semantic_min_similarity = self._app_config.semantic_min_similarity
+        self._semantic_hybrid_concurrent = self._app_config.semantic_hybrid_concurrent
         self._semantic_embedding_sync_batch_size = (
             self._app_config.semantic_embedding_sync_batch_size
         )
@@ -96,6 +100,11 @@ class PostgresSearchRepository(SearchRepositoryBase):
         self._rerank_provider = rerank_provider
         self._reranker_candidates = self._app_config.reranker_candidates
         self._reranker_max_document_chars = self._app_config.reranker_max_document_chars
+        self._reranker_latency_budget_ms = self._app_config.reranker_latency_budget_ms
+        self._rerank_stable_pool_cache = get_rerank_stable_pool_cache(
+            self._app_config,
+            session_maker,
+        )
         self._vector_dimensions = 384
         self._vector_tables_initialized = False
         self._vector_tables_lock = asyncio.Lock()
@@ -105,8 +114,17 @@ class PostgresSearchRepository(SearchRepositoryBase):
         # create_rerank_provider returns None unless reranking is enabled.
         if self._semantic_enabled and self._rerank_provider is None:
             self._rerank_provider = create_rerank_provider(self._app_config)
+        if self._rerank_provider is not None:
+            self._rerank_score_cache = get_rerank_score_cache(
+                self._rerank_provider,
+                self._app_config.reranker_score_cache_size,
+            )
         if self._embedding_provider is not None:
             self._vector_dimensions = self._embedding_provider.dimensions
+            self._query_embedding_cache = get_query_embedding_cache(
+                self._app_config,
+                self._embedding_provider,
+            )
             effective_name = vector_index_name or resolve_semantic_vector_index_name(
                 self._app_config,
                 DatabaseBackend.POSTGRES,
@@ -201,6 +219,7 @@ class PostgresSearchRepository(SearchRepositoryBase):
             )
             logger.debug(f"indexed row {search_index_row}")
             await session.commit()
+        self._invalidate_stable_pools()
 
     # ------------------------------------------------------------------
     # tsquery preparation (backend-specific)
@@ -659,6 +678,7 @@ class PostgresSearchRepository(SearchRepositoryBase):
             )
             logger.debug(f"Bulk indexed {len(search_index_rows)} rows")
             await session.commit()
+        self._invalidate_stable_pools()
 
     # ------------------------------------------------------------------
     # FTS search (Postgres-specific)
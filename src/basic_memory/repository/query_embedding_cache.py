@@ -0,0 +1,260 @@
+"""Process-local cache of query embeddings, with an optional on-disk tier.
+
+Semantic and hybrid search embed the query text on every request, and agents
+repeat (or retry) the same query constantly. The embedding is a pure function
+of the provider identity and the query text, so it can be reused safely as long
+as the cache key carries the same identity that owns persisted vectors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import logfire
+from loguru import logger
+
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.repository.embedding_provider import EmbeddingProvider
+
+QUERY_EMBEDDING_CACHE_FILENAME = "query_embedding_cache.db"
+# The disk tier outlives the process, so it is allowed to hold more entries than
+# the in-memory LRU before the oldest rows are pruned.
+DISK_ENTRY_MULTIPLIER = 16
+
+type QueryEmbeddingCacheKey = tuple[str, str]
+
+
+def normalize_query_text(text: str) -> str:
+    """Collapse whitespace so trivially reformatted retries share one entry.
+
+    Case is preserved: cased embedding models produce different vectors for
+    differently cased text.
+    """
+    return " ".join(text.split())
+
+
+@dataclass(slots=True)
+class QueryEmbeddingCacheStats:
+    """Running counters for one cache instance."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.lookups
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+def _record_event(event: str, tier: str) -> None:
+    logfire.metric_counter("basic_memory_query_embedding_cache_events_total").add(
+        1,
+        {"event": event, "tier": tier},
+    )
+
+
+class _DiskTier:
+    """Tiny SQLite key/value table holding float64 query vectors."""
+
+    def __init__(self, path: Path, *, max_entries: int, ttl_seconds: float) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=1.0)) as connection, connection:
+            if not self._ready:
+                self._create_schema(connection)
+            yield connection
+
+    def _create_schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings ("
+            "identity TEXT NOT NULL, query TEXT NOT NULL, vector BLOB NOT NULL, "
+            "created_at REAL NOT NULL, PRIMARY KEY (identity, query))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_query_embeddings_created_at "
+            "ON query_embeddings (created_at)"
+        )
+        self._ready = True
+
+    def get(self, key: QueryEmbeddingCacheKey, now: float) -> list[float] | None:
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT vector, created_at FROM query_embeddings WHERE identity = ? AND query = ?",
+                key,
+            ).fetchone()
+        if row is None or now - float(row[1]) > self.ttl_seconds:
+            return None
+        values = array("d")
+        values.frombytes(row[0])
+        return values.tolist()
+
+    def put(self, key: QueryEmbeddingCacheKey, vector: list[float], now: float) -> None:
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO query_embeddings (identity, query, vector, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (*key, array("d", vector).tobytes(), now),
+            )
+            connection.execute(
+                "DELETE FROM query_embeddings WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+            connection.execute(
+                "DELETE FROM query_embeddings WHERE rowid IN ("
+                "SELECT rowid FROM query_embeddings ORDER BY created_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU of query embeddings with TTL expiry and an optional disk tier."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        disk_path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = QueryEmbeddingCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[QueryEmbeddingCacheKey, tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+        self._disk = (
+            _DiskTier(
+                disk_path,
+                max_entries=max_entries * DISK_ENTRY_MULTIPLIER,
+                ttl_seconds=ttl_seconds,
+            )
+            if disk_path is not None
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_memory(self, key: QueryEmbeddingCacheKey, now: float) -> list[float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created_at, vector = entry
+        if now - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return vector
+
+    def _put_memory(self, key: QueryEmbeddingCacheKey, vector: list[float], now: float) -> None:
+        self._entries[key] = (now, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _disk_call[ResultT](self, operation: Callable[[], ResultT]) -> ResultT | None:
+        # The disk tier is an accelerator only: a locked or unwritable cache file
+        # must never fail the search that asked for the embedding.
+        try:
+            return await asyncio.to_thread(operation)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Query embedding disk cache unavailable: {error}", error=exc)
+            return None
+        except (ValueError, TypeError) as exc:
+            # A truncated or foreign row cannot be decoded; treat it as a miss and
+            # let the fresh embedding overwrite it.
+            logger.warning("Query embedding disk cache entry unreadable: {error}", error=exc)
+            return None
+
+    async def get_or_embed(
+        self,
+        identity: str,
+        text: str,
+        embed: Callable[[str], Awaitable[list[float]]],
+    ) -> list[float]:
+        """Return the cached embedding for ``text`` or compute and store it."""
+        key = (identity, normalize_query_text(text))
+        now = self._clock()
+
+        if (vector := self._get_memory(key, now)) is not None:
+            self.stats.memory_hits += 1
+            _record_event("hit", "memory")
+            return vector
+
+        disk = self._disk
+        if disk is not None:
+            vector = await self._disk_call(lambda: disk.get(key, now))
+            if vector is not None:
+                self.stats.disk_hits += 1
+                _record_event("hit", "disk")
+                self._put_memory(key, vector, now)
+                return vector
+
+        self.stats.misses += 1
+        _record_event("miss", "memory" if disk is None else "disk")
+        vector = await embed(text)
+        self._put_memory(key, vector, now)
+        if disk is not None:
+            stored = vector
+            await self._disk_call(lambda: disk.put(key, stored, now))
+        return vector
+
+
+# Keyed by provider object: real providers are process singletons from the
+# embedding provider factory, so every per-request repository shares one cache,
+# while separately constructed providers never see each other's vectors.
+_QUERY_EMBEDDING_CACHES: weakref.WeakKeyDictionary[EmbeddingProvider, QueryEmbeddingCache] = (
+    weakref.WeakKeyDictionary()
+)
+_QUERY_EMBEDDING_CACHES_LOCK = threading.Lock()
+
+
+def get_query_embedding_cache(
+    app_config: BasicMemoryConfig,
+    provider: EmbeddingProvider,
+) -> QueryEmbeddingCache | None:
+    """Return the shared query embedding cache for ``provider``, or None when disabled."""
+    if app_config.semantic_query_embedding_cache_size <= 0:
+        return None
+    with _QUERY_EMBEDDING_CACHES_LOCK:
+        cache = _QUERY_EMBEDDING_CACHES.get(provider)
+        if cache is None:
+            cache = QueryEmbeddingCache(
+                max_entries=app_config.semantic_query_embedding_cache_size,
+                ttl_seconds=app_config.semantic_query_embedding_cache_ttl_seconds,
+                disk_path=(
+                    app_config.data_dir_path / QUERY_EMBEDDING_CACHE_FILENAME
+                    if app_config.semantic_query_embedding_cache_persist
+                    else None
+                ),
+            )
+            _QUERY_EMBEDDING_CACHES[provider] = cache
+        return cache
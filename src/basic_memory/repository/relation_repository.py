@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from itertools import batched
-from typing import override, Sequence, List, Optional
+from typing import Any, override, Sequence, List, Optional
 
 from sqlalchemy import (
     Integer,
@@ -12,6 +12,7 @@ from sqlalchemy import (
     case,
     delete,
     exists,
+    func,
     literal,
     or_,
     select,
@@ -559,6 +560,35 @@ class RelationRepository(Repository[Relation]):
             )
         return RelationGenerationWriteResult(generation_is_current=True)
 
+    async def find_graph_edges(
+        self, session: AsyncSession, *, after_id: int, limit: int
+    ) -> list[tuple[int, int, int, str]]:
+        """Return (id, from_id, to_id, relation_type) for resolved relations after ``after_id``.
+
+        Endpoints are entity ids rather than loaded entities, so a graph export
+        can send edges as integer node references.
+        """
+        query = (
+            select(Relation.id, Relation.from_id, Relation.to_id, Relation.relation_type)
+            .where(
+                Relation.project_id == self.project_id,
+                Relation.to_id.is_not(None),
+                Relation.id > after_id,
+            )
+            .order_by(Relation.id)
+            .limit(limit)
+        )
+        result = await self.execute_query(session, query, use_query_options=False)
+        return [(row[0], row[1], row[2], row[3]) for row in result.all()]
+
+    async def get_graph_edge_version(self, session: AsyncSession) -> tuple[Any, ...]:
+        """Return (count, max id, generation sum) for the project's resolved relations."""
+        query = select(
+            func.count(Relation.id), func.max(Relation.id), func.sum(Relation.generation)
+        ).where(Relation.project_id == self.project_id, Relation.to_id.is_not(None))
+        result = await self.execute_query(session, query, use_query_options=False)
+        return tuple(result.one())
+
     async def find_unresolved_relations(self, session: AsyncSession) -> Sequence[Relation]:
         """Find unresolved relations owned by their source's current generation."""
         query = self.select().filter(
@@ -0,0 +1,174 @@
+"""Process-local cache of cross-encoder scores plus a running rerank latency estimate.
+
+Every page of a reranked search rescores the same fixed candidate prefix, and
+agents repeat queries constantly. A cross-encoder score is a pure function of the
+model, the query, and the exact document text it read, so it can be reused for as
+long as that text is unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+import logfire
+
+from basic_memory.repository.rerank_provider import RerankProvider
+
+# Weight of the newest observation in the per-document latency average. High enough
+# that a backlog shows up within a few searches, low enough to ride out one slow call.
+LATENCY_SMOOTHING = 0.3
+# Budgeted rerank windows remembered per query; each is one small int. The TTL
+# spans a paging session, so one load spike does not cut a query's prefix for good.
+RERANK_WINDOW_MAX_ENTRIES = 512
+RERANK_WINDOW_TTL_SECONDS = 300.0
+
+type RerankScoreKey = tuple[str, str, str]
+
+
+def _document_digest(document: str) -> str:
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def _pool_digest(documents: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for document in documents:
+        digest.update(_document_digest(document).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _record_event(event: str, count: int) -> None:
+    if count:
+        logfire.metric_counter("basic_memory_rerank_score_cache_events_total").add(
+            count,
+            {"event": event},
+        )
+
+
+class RerankScoreCache:
+    """Bounded LRU of rerank scores keyed by (model, query, document text digest).
+
+    Also tracks a smoothed per-document rerank latency for the provider it belongs
+    to, which the search pipeline uses to size the pool under a latency budget, and
+    the window that budget chose for each query so every page reranks the same prefix.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.per_document_ms: float | None = None
+        self._clock = clock
+        self._entries: OrderedDict[RerankScoreKey, float] = OrderedDict()
+        self._windows: OrderedDict[RerankScoreKey, tuple[float, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self,
+        model_name: str,
+        query: str,
+        documents: Sequence[str],
+    ) -> list[float | None]:
+        """Return the cached score per document, or None where it must be computed."""
+        scores: list[float | None] = []
+        for document in documents:
+            key = (model_name, query, _document_digest(document))
+            score = self._entries.get(key)
+            if score is not None:
+                self._entries.move_to_end(key)
+            scores.append(score)
+        hits = sum(score is not None for score in scores)
+        _record_event("hit", hits)
+        _record_event("miss", len(scores) - hits)
+        return scores
+
+    def put_many(
+        self,
+        model_name: str,
+        query: str,
+        documents: Sequence[str],
+        scores: Sequence[float],
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        for document, score in zip(documents, scores):
+            key = (model_name, query, _document_digest(document))
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def rerank_window(self, model_name: str, query: str, documents: Sequence[str]) -> int | None:
+        """Return the prefix length chosen earlier for this query and pool, if any."""
+        key = (model_name, query, _pool_digest(documents))
+        entry = self._windows.get(key)
+        if entry is None:
+            return None
+        created_at, window = entry
+        if self._clock() - created_at > RERANK_WINDOW_TTL_SECONDS:
+            del self._windows[key]
+            return None
+        self._windows.move_to_end(key)
+        return window
+
+    def remember_window(
+        self,
+        model_name: str,
+        query: str,
+        documents: Sequence[str],
+        window: int,
+    ) -> None:
+        """Pin the reranked prefix length for this query and pool."""
+        key = (model_name, query, _pool_digest(documents))
+        self._windows[key] = (self._clock(), window)
+        self._windows.move_to_end(key)
+        while len(self._windows) > RERANK_WINDOW_MAX_ENTRIES:
+            self._windows.popitem(last=False)
+
+    def observe_latency(self, document_count: int, elapsed_ms: float) -> None:
+        """Fold one provider call into the smoothed per-document latency."""
+        if document_count <= 0:
+            return
+        observed = elapsed_ms / document_count
+        if self.per_document_ms is None:
+            self.per_document_ms = observed
+        else:
+            self.per_document_ms += LATENCY_SMOOTHING * (observed - self.per_document_ms)
+
+    def document_budget(self, budget_ms: float) -> int | None:
+        """Return how many uncached documents fit in ``budget_ms``, or None for no limit.
+
+        Without a latency observation there is nothing to predict from, so the first
+        call always runs in full. At least one document is always allowed so the
+        reranked prefix keeps a relevance floor for the demoted tail.
+        """
+        if budget_ms <= 0 or not self.per_document_ms:
+            return None
+        return max(1, int(budget_ms / self.per_document_ms))
+
+
+# Keyed by provider object: reranker providers are process singletons from the
+# provider factory, so every per-request repository shares one score cache.
+_RERANK_SCORE_CACHES: weakref.WeakKeyDictionary[RerankProvider, RerankScoreCache] = (
+    weakref.WeakKeyDictionary()
+)
+_RERANK_SCORE_CACHES_LOCK = threading.Lock()
+
+
+def get_rerank_score_cache(provider: RerankProvider, max_entries: int) -> RerankScoreCache:
+    """Return the shared score cache and latency estimate for ``provider``."""
+    with _RERANK_SCORE_CACHES_LOCK:
+        cache = _RERANK_SCORE_CACHES.get(provider)
+        if cache is None:
+            cache = RerankScoreCache(max_entries=max_entries)
+            _RERANK_SCORE_CACHES[provider] = cache
+        return cache
@@ -0,0 +1,103 @@
+"""Short-lived memo of the fixed reranker-prefix pool for paginated searches.
+
+A reranked vector or hybrid page deeper than ``reranker_candidates`` needs the
+candidate pool retrieved at the fixed rerank window so prefix membership never
+shifts between pages. Without a memo every deep page pays for that retrieval a
+second time; with it, a pagination session retrieves the fixed window once.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.repository.search_index_row import SearchIndexRow
+
+STABLE_POOL_CACHE_MAX_ENTRIES = 256
+
+type StablePoolKey = tuple[int, Hashable]
+
+
+def stable_pool_query_key(**query: Any) -> str:
+    """Serialize the query shape that determines a stable pool into a hashable key."""
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+class RerankStablePoolCache:
+    """Bounded LRU of stable rerank pools with TTL expiry and per-project invalidation."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int = STABLE_POOL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[StablePoolKey, tuple[float, list[SearchIndexRow]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, project_id: int, query_key: Hashable) -> list[SearchIndexRow] | None:
+        key = (project_id, query_key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created_at, rows = entry
+        if self._clock() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return rows
+
+    def put(self, project_id: int, query_key: Hashable, rows: list[SearchIndexRow]) -> None:
+        key = (project_id, query_key)
+        self._entries[key] = (self._clock(), list(rows))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_project(self, project_id: int) -> None:
+        """Drop every pool for ``project_id`` after its search index changed."""
+        for key in [key for key in self._entries if key[0] == project_id]:
+            del self._entries[key]
+
+
+# Keyed by session maker: per-request repositories for one database share a memo,
+# while separate databases (and test fixtures) can never see each other's rows even
+# when their project ids coincide.
+_STABLE_POOL_CACHES: weakref.WeakKeyDictionary[
+    async_sessionmaker[AsyncSession], RerankStablePoolCache
+] = weakref.WeakKeyDictionary()
+_STABLE_POOL_CACHES_LOCK = threading.Lock()
+
+
+def get_rerank_stable_pool_cache(
+    app_config: BasicMemoryConfig,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> RerankStablePoolCache | None:
+    """Return the shared stable pool memo for ``session_maker``, or None when disabled."""
+    # Repositories built without a session maker (provider wiring in tests) never search.
+    if app_config.reranker_stable_pool_ttl_seconds <= 0 or session_maker is None:
+        return None
+    with _STABLE_POOL_CACHES_LOCK:
+        cache = _STABLE_POOL_CACHES.get(session_maker)
+        if cache is None:
+            cache = RerankStablePoolCache(
+                ttl_seconds=app_config.reranker_stable_pool_ttl_seconds,
+            )
+            _STABLE_POOL_CACHES[session_maker] = cache
+        return cache
@@ -6,7 +6,7 @@ The actual repository implementations are backend-specific:
 - PostgresSearchRepository: Uses tsvector/tsquery with GIN indexes
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from typing import Any, Callable, List, Optional, Protocol
 
@@ -125,6 +125,10 @@ class SearchRepository(Protocol):
         """Return the stored vector-chunk manifest for one entity."""
         ...
 
+    async def delete_index_rows(self, keys: Iterable[tuple[str, int]]) -> None:
+        """Delete specific rows by (type, id)."""
+        ...
+
     async def delete_by_permalink(self, permalink: str) -> None:
         """Delete item by permalink."""
         ...
@@ -1,5 +1,6 @@
 """Abstract base class for search repository implementations."""
 
+import asyncio
 import hashlib
 import time
 from abc import ABC, abstractmethod
@@ -7,11 +8,11 @@ from collections.abc import Iterable, Mapping, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, cast
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, cast
 
 import logfire as logfire
 from loguru import logger
-from sqlalchemy import Executable, Result, inspect, text
+from sqlalchemy import Executable, Result, bindparam, inspect, text
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -25,12 +26,18 @@ from basic_memory.repository.embedding_provider import (
 from basic_memory.repository.embedding_provider_factory import (
     configured_embedding_provider_identity,
 )
+from basic_memory.repository.query_embedding_cache import QueryEmbeddingCache
 from basic_memory.repository.rerank_provider import (
     RerankProvider,
     build_rerank_document,
     demote_tail_scores,
     validate_rerank_scores,
 )
+from basic_memory.repository.rerank_score_cache import RerankScoreCache
+from basic_memory.repository.rerank_stable_pool_cache import (
+    RerankStablePoolCache,
+    stable_pool_query_key,
+)
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.search_trace import (
     BelowThreshold,
@@ -149,6 +156,28 @@ class ChunkManifestRow:
         object.__setattr__(self, "updated_at", ensure_timezone_aware(updated_at))
 
 
+async def _gather_legs[FirstT, SecondT](
+    first: Awaitable[FirstT],
+    second: Awaitable[SecondT],
+) -> tuple[FirstT, SecondT]:
+    """Await two retrieval legs concurrently, cancelling the survivor if one fails.
+
+    Plain ``asyncio.gather`` leaves the sibling running after the first failure,
+    which would keep a database session checked out for a result nobody reads.
+    ``TaskGroup`` would wrap the original error in an ``ExceptionGroup`` and change
+    the exception type callers of hybrid search already handle.
+    """
+    first_task = asyncio.ensure_future(first)
+    second_task = asyncio.ensure_future(second)
+    try:
+        return await asyncio.gather(first_task, second_task)
+    except BaseException:
+        for task in (first_task, second_task):
+            task.cancel()
+        await asyncio.gather(first_task, second_task, return_exceptions=True)
+        raise
+
+
 async def purge_stale_search_index_rows(
     session_maker: async_sessionmaker[AsyncSession],
     project_id: int,
@@ -207,6 +236,11 @@ class SearchRepositoryBase(ABC):
     _rerank_provider: Optional[RerankProvider] = None
     _reranker_candidates: int = 20
     _reranker_max_document_chars: int = 0
+    _semantic_hybrid_concurrent: bool = True
+    _query_embedding_cache: QueryEmbeddingCache | None = None
+    _rerank_stable_pool_cache: RerankStablePoolCache | None = None
+    _rerank_score_cache: RerankScoreCache | None = None
+    _reranker_latency_budget_ms: float = 0.0
     _semantic_embedding_sync_batch_size: int
     _vector_dimensions: int
     _vector_tables_initialized: bool
@@ -971,7 +1005,9 @@ class SearchRepositoryBase(ABC):
     # ------------------------------------------------------------------
 
     async def purge_stale_search_rows(self) -> int:
-        return await purge_stale_search_index_rows(self.session_maker, self.project_id)
+        purged = await purge_stale_search_index_rows(self.session_maker, self.project_id)
+        self._invalidate_stable_pools()
+        return purged
 
     async def index_item(self, search_index_row: SearchIndexRow) -> None:
         """Index or update a single item.
@@ -1015,6 +1051,7 @@ class SearchRepositoryBase(ABC):
             )
             logger.debug(f"indexed row {search_index_row}")
             await session.commit()
+        self._invalidate_stable_pools()
 
     async def bulk_index_items(self, search_index_rows: List[SearchIndexRow]) -> None:
         """Index multiple items in a single batch operation.
@@ -1062,6 +1099,7 @@ class SearchRepositoryBase(ABC):
             )
             logger.debug(f"Bulk indexed {len(search_index_rows)} rows")
             await session.commit()
+        self._invalidate_stable_pools()
 
     async def get_entity_search_rows(self, entity_id: int) -> list[SearchIndexRow]:
         """Return every search projection owned by one entity."""
@@ -1128,6 +1166,31 @@ class SearchRepositoryBase(ABC):
                 {"entity_id": entity_id, "project_id": self.project_id},
             )
             await session.commit()
+        self._invalidate_stable_pools()
+
+    async def delete_index_rows(self, keys: Iterable[SearchIndexKey]) -> None:
+        """Delete specific search rows by (type, id), e.g. the stale rows of one entity.
+
+        One statement per row type, so SQLite scans its FTS table at most three
+        times however many rows go.
+        """
+        ids_by_type: dict[str, list[int]] = {}
+        for row_type, row_id in keys:
+            ids_by_type.setdefault(row_type, []).append(row_id)
+        if not ids_by_type:
+            return
+
+        async with db.scoped_session(self.session_maker) as session:
+            for row_type, row_ids in ids_by_type.items():
+                await session.execute(
+                    text(
+                        "DELETE FROM search_index WHERE project_id = :project_id "
+                        "AND type = :type AND id IN :ids"
+                    ).bindparams(bindparam("ids", expanding=True)),
+                    {"project_id": self.project_id, "type": row_type, "ids": row_ids},
+                )
+            await session.commit()
+        self._invalidate_stable_pools()
 
     async def delete_by_permalink(self, permalink: str) -> None:
         """Delete a search index entry by permalink.
@@ -1142,6 +1205,7 @@ class SearchRepositoryBase(ABC):
                 {"permalink": permalink, "project_id": self.project_id},
             )
             await session.commit()
+        self._invalidate_stable_pools()
 
     async def execute_query(
         self,
@@ -1177,6 +1241,7 @@ class SearchRepositoryBase(ABC):
                 staged_deletions=staged_deletions,
             )
         )
+        self._invalidate_stable_pools()
 
     async def delete_external_entity_vectors(
         self,
@@ -1362,6 +1427,7 @@ class SearchRepositoryBase(ABC):
                 session,
                 strict_adapter_cleanup=strict_adapter_cleanup,
             )
+            self._invalidate_stable_pools()
             return
 
         async with db.scoped_session(self.session_maker) as owned_session:
@@ -1371,6 +1437,7 @@ class SearchRepositoryBase(ABC):
             )
             if changed:
                 await owned_session.commit()
+        self._invalidate_stable_pools()
 
     async def _delete_project_vector_rows_in_session(
         self,
@@ -1658,12 +1725,15 @@ class SearchRepositoryBase(ABC):
         continue_on_error: bool,
     ) -> VectorSyncBatchResult:
         """Run shared vector sync orchestration for one or many entities."""
-        return await semantic_vector_sync.sync_entity_vectors_internal(
-            self,
-            entity_ids,
-            progress_callback,
-            continue_on_error,
-        )
+        try:
+            return await semantic_vector_sync.sync_entity_vectors_internal(
+                self,
+                entity_ids,
+                progress_callback,
+                continue_on_error,
+            )
+        finally:
+            self._invalidate_stable_pools()
 
     def _vector_prepare_window_size(self) -> int:
         """Return the number of entities to prepare in one orchestration window."""
@@ -1967,6 +2037,54 @@ class SearchRepositoryBase(ABC):
             self._reranker_candidates * RERANK_POOL_CHUNK_FANOUT,
         )
 
+    def _stable_pool_key(self, retrieval_mode: SearchRetrievalMode, **query: Any) -> str | None:
+        """Return the memo key of this query's fixed rerank pool, or None when disabled."""
+        if self._rerank_stable_pool_cache is None:
+            return None
+        return stable_pool_query_key(
+            retrieval_mode=retrieval_mode.value,
+            embedding_model=self._embedding_model_key(),
+            rerank_candidate_limit=self._rerank_candidate_limit(),
+            semantic_min_similarity=self._semantic_min_similarity,
+            **query,
+        )
+
+    def _remember_stable_pool(self, pool_key: str | None, rows: list[SearchIndexRow]) -> None:
+        """Record the rows retrieved at the fixed rerank window for later pages."""
+        if pool_key is not None and self._rerank_stable_pool_cache is not None:
+            self._rerank_stable_pool_cache.put(self.project_id, pool_key, rows)
+
+    async def _fetch_stable_pool(
+        self,
+        pool_key: str | None,
+        refetch: Callable[[], Awaitable[List[SearchIndexRow]]],
+        trace: SearchTraceCollector | None,
+    ) -> List[SearchIndexRow]:
+        """Return the fixed-window pool, retrieving it only when no page memoized it.
+
+        Trigger: a page extends past the fixed rerank window, so its own retrieval
+        ran at a larger candidate limit than the one that owns prefix membership.
+        Why: re-running retrieval at the fixed window doubles the cost of every deep
+        page, although earlier pages of the same query already produced that pool.
+        Outcome: a pagination session retrieves the fixed window once; a cold deep
+        page still refetches, and its result serves the pages after it.
+        """
+        cache = self._rerank_stable_pool_cache
+        if pool_key is not None and cache is not None:
+            cached_rows = cache.get(self.project_id, pool_key)
+            if cached_rows is not None:
+                return cached_rows
+        if trace is not None:
+            trace.stable_pool_refetched = True
+        rows = await refetch()
+        self._remember_stable_pool(pool_key, rows)
+        return rows
+
+    def _invalidate_stable_pools(self) -> None:
+        """Forget memoized rerank pools once this project's searchable rows change."""
+        if self._rerank_stable_pool_cache is not None:
+            self._rerank_stable_pool_cache.invalidate_project(self.project_id)
+
     def _candidate_limit(self, limit: int, offset: int, query_text: str) -> int:
         """Size the retrieval candidate *chunk* pool for vector/hybrid search.
 
@@ -2062,14 +2180,11 @@ class SearchRepositoryBase(ABC):
         if trace is not None:
             pre_rerank_scores = {(row.type, row.id): row.score or 0.0 for row in ordered_rows}
         documents = [self._rerank_document_text(row) for row in pool]
-        # A transient provider failure must surface instead of switching this page
-        # back to retrieval order. A prior page may already have returned reranked
-        # order, so degrading here can duplicate one result and omit another.
         rerank_start = time.perf_counter() if trace is not None else None
-        scores = validate_rerank_scores(
-            await self._rerank_provider.rerank(query_text, documents),
-            len(pool),
-        )
+        scored_pool, scores = await self._score_rerank_pool(query_text, pool, documents)
+        # Rows the latency budget left unscored lead the tail in retrieval order.
+        tail = pool[len(scored_pool) :] + tail
+        pool = scored_pool
 
         order = sorted(range(len(pool)), key=lambda i: scores[i], reverse=True)
         reranked = [replace(pool[i], score=scores[i]) for i in order]
@@ -2099,6 +2214,94 @@ class SearchRepositoryBase(ABC):
             )
         return reranked_rows[offset:page_end]
 
+    async def _score_rerank_pool(
+        self,
+        query_text: str,
+        pool: list[SearchIndexRow],
+        documents: list[str],
+    ) -> tuple[list[SearchIndexRow], list[float]]:
+        """Score the rerank pool, reusing cached scores and honouring the latency budget.
+
+        Returns the scored prefix of ``pool`` with one score per row. The prefix is
+        shorter than ``pool`` only when the latency budget cut uncached candidates.
+        """
+        assert self._rerank_provider is not None
+        model_name = self._rerank_provider.model_name
+        cache = self._rerank_score_cache
+        cached_scores: list[float | None] = (
+            cache.get_many(model_name, query_text, documents)
+            if cache is not None
+            else [None] * len(documents)
+        )
+        missing = [index for index, score in enumerate(cached_scores) if score is None]
+
+        # Trigger: the reranker's recent per-candidate latency predicts this call
+        # would overrun the configured budget (typically under concurrent load).
+        # Why: a cross-encoder falling behind turns every search into a tail-latency
+        # outlier, and the queue only grows while each request rescores its full pool.
+        # Outcome: keep the pool prefix whose uncached rows fit the budget; rows past
+        # the cut keep their retrieval order below the reranked floor.
+        window = len(pool)
+        if cache is not None and self._reranker_latency_budget_ms > 0:
+            # The first page of a query fixes the window and later pages reuse it.
+            # A cut that moved with load would reorder the pages against each other
+            # and duplicate one result while omitting another.
+            remembered = cache.rerank_window(model_name, query_text, documents)
+            if remembered is not None:
+                window = remembered
+            else:
+                allowance = cache.document_budget(self._reranker_latency_budget_ms)
+                if allowance is not None and len(missing) > allowance:
+                    window = missing[allowance]
+                    logger.debug(
+                        "Rerank latency budget truncated pool: pool={pool} kept={kept} "
+                        "budget_ms={budget_ms}",
+                        pool=len(pool),
+                        kept=window,
+                        budget_ms=self._reranker_latency_budget_ms,
+                    )
+                cache.remember_window(model_name, query_text, documents, window)
+        if window < len(pool):
+            pool = pool[:window]
+            documents = documents[:window]
+            cached_scores = cached_scores[:window]
+            missing = [index for index in missing if index < window]
+
+        if missing:
+            # A transient provider failure must surface instead of switching this page
+            # back to retrieval order. A prior page may already have returned reranked
+            # order, so degrading here can duplicate one result and omit another.
+            missing_documents = [documents[index] for index in missing]
+            provider_start = time.perf_counter()
+            fresh_scores = validate_rerank_scores(
+                await self._rerank_provider.rerank(query_text, missing_documents),
+                len(missing_documents),
+            )
+            if cache is not None:
+                cache.observe_latency(
+                    len(missing_documents),
+                    (time.perf_counter() - provider_start) * 1000,
+                )
+                cache.put_many(model_name, query_text, missing_documents, fresh_scores)
+            for index, score in zip(missing, fresh_scores):
+                cached_scores[index] = score
+        return pool, [score for score in cached_scores if score is not None]
+
+    async def _embed_query(self, query_text: str) -> list[float]:
+        """Embed one query, reusing a cached vector for repeated query text.
+
+        The cache key carries the same identity that owns persisted vectors, so a
+        provider or prefix change can never serve a vector from another model.
+        """
+        assert self._embedding_provider is not None
+        if self._query_embedding_cache is None:
+            return await self._embedding_provider.embed_query(query_text)
+        return await self._query_embedding_cache.get_or_embed(
+            self._embedding_model_key(),
+            query_text,
+            self._embedding_provider.embed_query,
+        )
+
     async def _search_vector_only(
         self,
         *,
@@ -2136,7 +2339,7 @@ class SearchRepositoryBase(ABC):
             candidate_limit = self._candidate_limit(limit, offset, query_text)
         query_start = time.perf_counter()
         embed_start = time.perf_counter()
-        query_embedding = await self._embedding_provider.embed_query(query_text)
+        query_embedding = await self._embed_query(query_text)
         embed_ms = (time.perf_counter() - embed_start) * 1000
         vector_query_start = time.perf_counter()
 
@@ -2362,27 +2565,44 @@ class SearchRepositoryBase(ABC):
             stable_rows = ranked_rows
             if self._should_rerank(query_text):
                 stable_candidate_limit = self._rerank_candidate_limit()
+                pool_key = self._stable_pool_key(
+                    SearchRetrievalMode.VECTOR,
+                    search_text=search_text,
+                    permalink=permalink,
+                    permalink_match=permalink_match,
+                    title=title,
+                    note_types=note_types,
+                    after_date=after_date,
+                    search_item_types=search_item_types,
+                    categories=categories,
+                    metadata_filters=metadata_filters,
+                    min_similarity=min_similarity,
+                )
                 if candidate_limit > stable_candidate_limit:
-                    if trace is not None:
-                        trace.stable_pool_refetched = True
-                    stable_rows = await self._search_vector_only(
-                        search_text=search_text,
-                        permalink=permalink,
-                        permalink_match=permalink_match,
-                        title=title,
-                        note_types=note_types,
-                        after_date=after_date,
-                        search_item_types=search_item_types,
-                        categories=categories,
-                        metadata_filters=metadata_filters,
-                        min_similarity=min_similarity,
-                        limit=stable_candidate_limit,
-                        offset=0,
-                        candidate_limit=stable_candidate_limit,
-                        _emit_observability_log=False,
-                        _apply_rerank=False,
-                        trace=None,
+                    stable_rows = await self._fetch_stable_pool(
+                        pool_key,
+                        lambda: self._search_vector_only(
+                            search_text=search_text,
+                            permalink=permalink,
+                            permalink_match=permalink_match,
+                            title=title,
+                            note_types=note_types,
+                            after_date=after_date,
+                            search_item_types=search_item_types,
+                            categories=categories,
+                            metadata_filters=metadata_filters,
+                            min_similarity=min_similarity,
+                            limit=stable_candidate_limit,
+                            offset=0,
+                            candidate_limit=stable_candidate_limit,
+                            _emit_observability_log=False,
+                            _apply_rerank=False,
+                            trace=None,
+                        ),
+                        trace,
                     )
+                else:
+                    self._remember_stable_pool(pool_key, ranked_rows[:stable_candidate_limit])
             output = await self._rerank_and_paginate(
                 query_text,
                 ranked_rows,
@@ -2459,7 +2679,8 @@ class SearchRepositoryBase(ABC):
 
         Uses the search_index (type, id) pair as the fusion key. The formula
         ``max(vec, fts) + FUSION_BONUS * min(vec, fts)`` preserves
-        the dominant signal and rewards dual-source agreement.
+        the dominant signal and rewards dual-source agreement. The FTS and vector
+        legs run concurrently unless ``semantic_hybrid_concurrent`` is disabled.
         """
         self._assert_semantic_available()
         query_text = search_text.strip()
@@ -2471,51 +2692,70 @@ class SearchRepositoryBase(ABC):
             if _candidate_limit_override is not None
             else self._candidate_limit(limit, offset, query_text)
         )
-        fts_start = time.perf_counter()
-        # allow_relaxed: question-form queries rarely AND-match, and a dead FTS
-        # branch silently degrades hybrid to vector-only ranking. Fusion plus
-        # bm25 keep relaxed lexical candidates from dominating precision.
-        fts_results = await self.search(
-            search_text=search_text,
-            permalink=permalink,
-            permalink_match=permalink_match,
-            title=title,
-            note_types=note_types,
-            after_date=after_date,
-            search_item_types=search_item_types,
-            categories=categories,
-            metadata_filters=metadata_filters,
-            retrieval_mode=SearchRetrievalMode.FTS,
-            limit=candidate_limit,
-            offset=0,
-            allow_relaxed=True,
-            trace=trace,
-        )
-        fts_ms = (time.perf_counter() - fts_start) * 1000
-        vector_start = time.perf_counter()
-        vector_results = await self._search_vector_only(
-            search_text=search_text,
-            permalink=permalink,
-            permalink_match=permalink_match,
-            title=title,
-            note_types=note_types,
-            after_date=after_date,
-            search_item_types=search_item_types,
-            categories=categories,
-            metadata_filters=metadata_filters,
-            min_similarity=min_similarity,
-            limit=candidate_limit,
-            offset=0,
-            # Trigger: reranking owns a bounded candidate window shared by both legs.
-            # Why: the disabled path historically expands the vector leg again to
-            # preserve recall when many vector chunks collapse into a few search rows.
-            # Outcome: avoid double expansion only when reranking is actually active.
-            candidate_limit=candidate_limit if rerank_configured else None,
-            _emit_observability_log=False,
-            _apply_rerank=False,
-            trace=trace,
-        )
-        vector_ms = (time.perf_counter() - vector_start) * 1000
+
+        async def _run_fts_leg() -> tuple[List[SearchIndexRow], float]:
+            fts_start = time.perf_counter()
+            # allow_relaxed: question-form queries rarely AND-match, and a dead FTS
+            # branch silently degrades hybrid to vector-only ranking. Fusion plus
+            # bm25 keep relaxed lexical candidates from dominating precision.
+            rows = await self.search(
+                search_text=search_text,
+                permalink=permalink,
+                permalink_match=permalink_match,
+                title=title,
+                note_types=note_types,
+                after_date=after_date,
+                search_item_types=search_item_types,
+                categories=categories,
+                metadata_filters=metadata_filters,
+                retrieval_mode=SearchRetrievalMode.FTS,
+                limit=candidate_limit,
+                offset=0,
+                allow_relaxed=True,
+                trace=trace,
+            )
+            return rows, (time.perf_counter() - fts_start) * 1000
+
+        async def _run_vector_leg() -> tuple[List[SearchIndexRow], float]:
+            vector_start = time.perf_counter()
+            rows = await self._search_vector_only(
+                search_text=search_text,
+                permalink=permalink,
+                permalink_match=permalink_match,
+                title=title,
+                note_types=note_types,
+                after_date=after_date,
+                search_item_types=search_item_types,
+                categories=categories,
+                metadata_filters=metadata_filters,
+                min_similarity=min_similarity,
+                limit=candidate_limit,
+                offset=0,
+                # Trigger: reranking owns a bounded candidate window shared by both legs.
+                # Why: the disabled path historically expands the vector leg again to
+                # preserve recall when many vector chunks collapse into a few search rows.
+                # Outcome: avoid double expansion only when reranking is actually active.
+                candidate_limit=candidate_limit if rerank_configured else None,
+                _emit_observability_log=False,
+                _apply_rerank=False,
+                trace=trace,
+            )
+            return rows, (time.perf_counter() - vector_start) * 1000
+
+        # Trigger: hybrid needs both a lexical and a semantic candidate list.
+        # Why: the legs share no state — each opens its own session and writes a
+        # disjoint trace stage — so awaiting them in turn makes latency their sum,
+        # and the query embedding would idle behind lexical I/O.
+        # Outcome: the vector leg is scheduled first so its embedding call starts
+        # immediately, and both legs overlap; each still reports its own timing.
+        if self._semantic_hybrid_concurrent:
+            (vector_results, vector_ms), (fts_results, fts_ms) = await _gather_legs(
+                _run_vector_leg(),
+                _run_fts_leg(),
+            )
+        else:
+            fts_results, fts_ms = await _run_fts_leg()
+            vector_results, vector_ms = await _run_vector_leg()
         # Trigger: with reranking disabled the vector leg expands internally and can
         # hydrate more rows than the fusion window it returns.
         # Why: rows cut here never fuse — left in the trace they would surface as
@@ -2640,26 +2880,41 @@ class SearchRepositoryBase(ABC):
             candidates = [_materialize(entry) for entry in ranked]
             stable_candidates = candidates
             stable_candidate_limit = self._rerank_candidate_limit()
+            pool_key = self._stable_pool_key(
+                SearchRetrievalMode.HYBRID,
+                search_text=search_text,
+                permalink=permalink,
+                permalink_match=permalink_match,
+                title=title,
+                note_types=note_types,
+                after_date=after_date,
+                search_item_types=search_item_types,
+                categories=categories,
+                metadata_filters=metadata_filters,
+                min_similarity=min_similarity,
+            )
             if candidate_limit > stable_candidate_limit:
-                if trace is not None:
-                    trace.stable_pool_refetched = True
-                stable_candidates = await self._search_hybrid(
-                    search_text=search_text,
-                    permalink=permalink,
-                    permalink_match=permalink_match,
-                    title=title,
-                    note_types=note_types,
-                    after_date=after_date,
-                    search_item_types=search_item_types,
-                    categories=categories,
-                    metadata_filters=metadata_filters,
-                    min_similarity=min_similarity,
-                    limit=stable_candidate_limit,
-                    offset=0,
-                    _candidate_limit_override=stable_candidate_limit,
-                    _apply_rerank=False,
-                    _emit_observability_log=False,
-                    trace=None,
+                stable_candidates = await self._fetch_stable_pool(
+                    pool_key,
+                    lambda: self._search_hybrid(
+                        search_text=search_text,
+                        permalink=permalink,
+                        permalink_match=permalink_match,
+                        title=title,
+                        note_types=note_types,
+                        after_date=after_date,
+                        search_item_types=search_item_types,
+                        categories=categories,
+                        metadata_filters=metadata_filters,
+                        min_similarity=min_similarity,
+                        limit=stable_candidate_limit,
+                        offset=0,
+                        _candidate_limit_override=stable_candidate_limit,
+                        _apply_rerank=False,
+                        _emit_observability_log=False,
+                        trace=None,
+                    ),
+                    trace,
                 )
                 stable_keys = {(row.type, row.id) for row in stable_candidates}
                 expanded_tail = [entry for entry in ranked if entry[0] not in stable_keys]
@@ -2680,6 +2935,8 @@ class SearchRepositoryBase(ABC):
                     )
                 )
                 candidates = stable_candidates + [_materialize(entry) for entry in expanded_tail]
+            else:
+                self._remember_stable_pool(pool_key, candidates[:stable_candidate_limit])
             output = await self._rerank_and_paginate(
                 query_text,
                 candidates,
@@ -2697,7 +2954,8 @@ class SearchRepositoryBase(ABC):
                 "retrieval_mode={retrieval_mode} query_length={query_length} "
                 "candidate_limit={candidate_limit} fts_count={fts_count} "
                 "vector_count={vector_count} fts_ms={fts_ms:.2f} vector_ms={vector_ms:.2f} "
-                "fusion_ms={fusion_ms:.2f} total_ms={total_ms:.2f}",
+                "fusion_ms={fusion_ms:.2f} total_ms={total_ms:.2f} "
+                "concurrent_legs={concurrent_legs}",
                 project_id=self.project_id,
                 retrieval_mode="hybrid",
                 query_length=len(query_text),
@@ -2708,5 +2966,6 @@ class SearchRepositoryBase(ABC):
                 vector_ms=vector_ms,
                 fusion_ms=fusion_ms,
                 total_ms=total_ms,
+                concurrent_legs=self._semantic_hybrid_concurrent,
             )
         return output
@@ -24,8 +24,11 @@ from basic_memory.models.search import (
 )
 from basic_memory.repository.embedding_provider import EmbeddingProvider
 from basic_memory.repository.embedding_provider_factory import create_embedding_provider
+from basic_memory.repository.query_embedding_cache import get_query_embedding_cache
 from basic_memory.repository.rerank_provider import RerankProvider
 from basic_memory.repository.rerank_provider_factory import create_rerank_provider
+from basic_memory.repository.rerank_score_cache import get_rerank_score_cache
+from basic_memory.repository.rerank_stable_pool_cache import get_rerank_stable_pool_cache
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.search_query import relaxed_query_words
 from basic_memory.repository.search_repository_base import SearchRepositoryBase
@@ -68,6 +71,7 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         self._semantic_enabled = self._app_config.semantic_search_enabled
         self._semantic_vector_k = self._app_config.semantic_vector_k
         self._semantic_min_similarity = self._app_config.semantic_min_similarity
+        self._semantic_hybrid_concurrent = self._app_config.semantic_hybrid_concurrent
         self._semantic_embedding_sync_batch_size = (
             self._app_config.semantic_embedding_sync_batch_size
         )
@@ -76,6 +80,11 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         self._rerank_provider = rerank_provider
         self._reranker_candidates = self._app_config.reranker_candidates
         self._reranker_max_document_chars = self._app_config.reranker_max_document_chars
+        self._reranker_latency_budget_ms = self._app_config.reranker_latency_budget_ms
+        self._rerank_stable_pool_cache = get_rerank_stable_pool_cache(
+            self._app_config,
+            session_maker,
+        )
         self._sqlite_vec_load_lock = asyncio.Lock()
         self._sqlite_prepare_write_lock = asyncio.Lock()
         self._vector_tables_initialized = False
@@ -89,8 +98,17 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         # create_rerank_provider returns None unless reranking is enabled.
         if self._semantic_enabled and self._rerank_provider is None:
             self._rerank_provider = create_rerank_provider(self._app_config)
+        if self._rerank_provider is not None:
+            self._rerank_score_cache = get_rerank_score_cache(
+                self._rerank_provider,
+                self._app_config.reranker_score_cache_size,
+            )
         if self._embedding_provider is not None:
             self._vector_dimensions = self._embedding_provider.dimensions
+            self._query_embedding_cache = get_query_embedding_cache(
+                self._app_config,
+                self._embedding_provider,
+            )
             self._semantic_vector_index = vector_index or SQLiteVecIndex(
                 session_maker,
                 build_vector_index_scope(
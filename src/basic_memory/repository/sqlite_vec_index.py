@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from array import array
 from collections.abc import Sequence
 
 from loguru import logger
@@ -28,6 +28,17 @@ from basic_memory.repository.semantic_vector_index import (
 SQLITE_VEC_MAX_K = 4096
 
 
+def serialize_float32(values: Sequence[float]) -> bytes:
+    """Pack one vector into the raw float32 blob layout vec0 stores internally.
+
+    vec0 ``float[N]`` columns accept either JSON text or this blob, and persist the
+    same float32 bytes either way. Binding the blob skips formatting every
+    component as decimal text on write and re-parsing it inside SQLite on every
+    upsert and query, so existing tables keep working without a rebuild.
+    """
+    return array("f", values).tobytes()
+
+
 class SQLiteVecIndex:
     """Persist and query semantic vectors in SQLite with sqlite-vec."""
 
@@ -215,7 +226,7 @@ class SQLiteVecIndex:
                 [
                     {
                         "rowid": rowids_by_key[record.key],
-                        "embedding": json.dumps(record.values),
+                        "embedding": serialize_float32(record.values),
                         "source_hash": record.source_hash,
                     }
                     for record in current_records
@@ -353,7 +364,7 @@ class SQLiteVecIndex:
                     "c.entity_id ASC, c.chunk_key ASC LIMIT :limit"
                 ),
                 {
-                    "query": json.dumps(list(query)),
+                    "query": serialize_float32(query),
                     "vector_k": vector_k,
                     "project_id": self.scope.project_id,
                     "embedding_identity": self.scope.embedding_identity,
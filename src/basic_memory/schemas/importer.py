@@ -11,6 +11,8 @@ class ImportResult(BaseModel):
     import_count: Dict[str, int]
     success: bool
     error_message: Optional[str] = None
+    # Set when an import stopped partway: pass it back as resume_from to continue.
+    resume_from: Optional[int] = None
 
 
 class ChatImportResult(ImportResult):
@@ -3,9 +3,12 @@
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 import uuid as uuid_mod
+import weakref
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from basic_memory.config import BasicMemoryConfig
 from basic_memory.models import Entity, Project
@@ -85,7 +88,11 @@ class ProjectReferenceIndex:
 
 @dataclass(frozen=True, slots=True)
 class StrictProjectLinkMatch:
-    """Exact project-local match, including ambiguity that blocks fallback routing."""
+    """Exact project-local match, including ambiguity that blocks fallback routing.
+
+    ``ambiguous`` is also set on a match that won over several same-title notes, where
+    non-strict single-link resolution would have preferred the shortest title path.
+    """
 
     entity: Entity | None
     ambiguous: bool = False
@@ -165,7 +172,7 @@ class ProjectEntityIdentityIndex:
                 continue
             if ambiguous_title and candidate_permalink != exact_identifier:
                 break
-            return StrictProjectLinkMatch(entity)
+            return StrictProjectLinkMatch(entity, ambiguous_title)
 
         if len(title_matches) == 1:
             return StrictProjectLinkMatch(title_matches[0])
@@ -173,7 +180,7 @@ class ProjectEntityIdentityIndex:
         normalized_path = Path(identifier).as_posix()
         path_match = self.by_file_path.get(normalized_path)
         if path_match is not None:
-            return StrictProjectLinkMatch(path_match)
+            return StrictProjectLinkMatch(path_match, ambiguous_title)
 
         path_with_md = normalized_path
         can_use_stem_path = "/" in normalized_path or not ambiguous_title
@@ -182,12 +189,12 @@ class ProjectEntityIdentityIndex:
             path_with_md = f"{normalized_path}.md"
             path_match = self.by_file_path.get(path_with_md)
             if path_match is not None:
-                return StrictProjectLinkMatch(path_match)
+                return StrictProjectLinkMatch(path_match, ambiguous_title)
 
         if has_markdown_extension or can_use_stem_path:
             alias_match = self.by_file_path_alias.get(file_path_alias(path_with_md))
             if alias_match is not None:
-                return StrictProjectLinkMatch(alias_match)
+                return StrictProjectLinkMatch(alias_match, ambiguous_title)
 
         return StrictProjectLinkMatch(entity=None, ambiguous=ambiguous_title)
 
@@ -204,6 +211,10 @@ class BulkLinkResolutionSnapshot:
 
     def resolve(self, target: RelationTargetReference) -> Entity | None:
         """Resolve one parsed target without additional I/O."""
+        return self.resolve_match(target).entity
+
+    def resolve_match(self, target: RelationTargetReference) -> StrictProjectLinkMatch:
+        """Resolve one parsed target, keeping the title ambiguity of the deciding index."""
         current_index = self.entity_indexes[self.current_project_id]
 
         try:
@@ -213,7 +224,7 @@ class BulkLinkResolutionSnapshot:
         if external_id is not None:
             external_id_match = current_index.by_external_id.get(external_id)
             if external_id_match is not None:
-                return external_id_match
+                return StrictProjectLinkMatch(external_id_match)
 
         project_prefix, remainder = target.project_path()
         referenced_project = (
@@ -222,15 +233,11 @@ class BulkLinkResolutionSnapshot:
 
         if target.explicitly_qualified:
             if referenced_project is None:
-                return None
-            return (
-                self.entity_indexes[referenced_project.id]
-                .resolve_strict(
-                    remainder,
-                    include_project_permalinks=self.include_project_permalinks,
-                    workspace_permalink=self.workspace_permalink,
-                )
-                .entity
+                return StrictProjectLinkMatch(entity=None)
+            return self.entity_indexes[referenced_project.id].resolve_strict(
+                remainder,
+                include_project_permalinks=self.include_project_permalinks,
+                workspace_permalink=self.workspace_permalink,
             )
 
         current_match = current_index.resolve_strict(
@@ -238,27 +245,47 @@ class BulkLinkResolutionSnapshot:
             include_project_permalinks=self.include_project_permalinks,
             workspace_permalink=self.workspace_permalink,
         )
-        if current_match.entity is not None:
-            return current_match.entity
-        if current_match.ambiguous:
-            return None
+        if current_match.entity is not None or current_match.ambiguous:
+            return current_match
 
         if referenced_project is None or referenced_project.id == self.current_project_id:
-            return None
-        return (
-            self.entity_indexes[referenced_project.id]
-            .resolve_strict(
-                remainder,
-                include_project_permalinks=self.include_project_permalinks,
-                workspace_permalink=self.workspace_permalink,
-            )
-            .entity
+            return current_match
+        return self.entity_indexes[referenced_project.id].resolve_strict(
+            remainder,
+            include_project_permalinks=self.include_project_permalinks,
+            workspace_permalink=self.workspace_permalink,
         )
 
 
 # --- Snapshot loading ---
 
 
+def _required_project_ids(
+    targets: Sequence[RelationTargetReference],
+    project_index: ProjectReferenceIndex,
+    current_project_id: int,
+) -> set[int]:
+    """Return the current project plus every project a target's prefix can route to."""
+    required_project_ids = {current_project_id}
+    for target in targets:
+        project_prefix, _ = target.project_path()
+        referenced_project = (
+            project_index.find(project_prefix) if project_prefix is not None else None
+        )
+        if referenced_project is not None:
+            required_project_ids.add(referenced_project.id)
+    return required_project_ids
+
+
+def _workspace_permalink() -> str | None:
+    workspace_context = current_workspace_permalink_context()
+    return (
+        workspace_context.workspace_slug
+        if workspace_context and workspace_context.should_prefix_permalinks
+        else None
+    )
+
+
 async def load_bulk_link_resolution_snapshot(
     targets: Sequence[RelationTargetReference],
     *,
@@ -277,17 +304,8 @@ async def load_bulk_link_resolution_snapshot(
     if current_project_id not in project_index.projects_by_id:
         raise RuntimeError(f"Current project {current_project_id} does not exist")
 
-    required_project_ids = {current_project_id}
-    for target in targets:
-        project_prefix, _ = target.project_path()
-        referenced_project = (
-            project_index.find(project_prefix) if project_prefix is not None else None
-        )
-        if referenced_project is not None:
-            required_project_ids.add(referenced_project.id)
-
     entity_indexes: dict[int, ProjectEntityIdentityIndex] = {}
-    for project_id in sorted(required_project_ids):
+    for project_id in sorted(_required_project_ids(targets, project_index, current_project_id)):
         project = project_index.projects_by_id[project_id]
         project_entity_repository = (
             entity_repository
@@ -297,19 +315,156 @@ async def load_bulk_link_resolution_snapshot(
         entities = await project_entity_repository.find_all(session, use_load_options=False)
         entity_indexes[project_id] = ProjectEntityIdentityIndex.from_entities(project, entities)
 
-    workspace_context = current_workspace_permalink_context()
-    workspace_permalink = (
-        workspace_context.workspace_slug
-        if workspace_context and workspace_context.should_prefix_permalinks
-        else None
-    )
     return BulkLinkResolutionSnapshot(
         current_project_id=current_project_id,
         projects=project_index,
         entity_indexes=entity_indexes,
         include_project_permalinks=app_config.permalinks_include_project,
-        workspace_permalink=workspace_permalink,
+        workspace_permalink=_workspace_permalink(),
+    )
+
+
+# --- Cached snapshots ---
+
+type IdentityFingerprint = tuple[Any, ...]
+
+# Project ids start at 1, so row 0 carries the project registry's own fingerprint.
+# The identity checksum weights each id by the length of its permalink, title and path
+# so renames and moves shift it even when count, max id and updated_at stay put.
+_IDENTITY_FINGERPRINT_SQL = text("""
+    SELECT 0 AS project_id, COUNT(*), COALESCE(MAX(id), 0), MAX(updated_at), 0
+    FROM project
+    UNION ALL
+    SELECT
+        project_id,
+        COUNT(*),
+        COALESCE(MAX(id), 0),
+        MAX(updated_at),
+        COALESCE(
+            SUM(id * (LENGTH(title) + LENGTH(file_path) + COALESCE(LENGTH(permalink), 0))),
+            0
+        )
+    FROM entity
+    GROUP BY project_id
+""")
+
+_EMPTY_PROJECT_FINGERPRINT: IdentityFingerprint = (0, 0, None, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedProjectIdentities:
+    fingerprint: IdentityFingerprint
+    index: ProjectEntityIdentityIndex
+
+
+class LinkResolutionSnapshotCache:
+    """Identity indexes reused across resolution calls until the database moves on.
+
+    Every call runs one fingerprint query and rebuilds only the indexes whose
+    fingerprint changed, so writes from this process or a separate sync process are
+    seen by the next call. Cached entities are detached identity stand-ins (id,
+    project, external id, permalink, title, path); callers hydrate the real rows.
+    """
+
+    def __init__(self) -> None:
+        self._registry: tuple[IdentityFingerprint, ProjectReferenceIndex] | None = None
+        self._projects: dict[int, _CachedProjectIdentities] = {}
+
+    def invalidate(self, project_id: int | None = None) -> None:
+        """Drop one project's cached identities, or everything when no project is given."""
+        if project_id is None:
+            self._registry = None
+            self._projects.clear()
+        else:
+            self._projects.pop(project_id, None)
+
+    async def snapshot(
+        self,
+        targets: Sequence[RelationTargetReference],
+        *,
+        current_project_id: int,
+        app_config: BasicMemoryConfig,
+        session: AsyncSession,
+    ) -> BulkLinkResolutionSnapshot:
+        """Return a snapshot covering ``targets``, reloading only stale project indexes."""
+        result = await session.execute(_IDENTITY_FINGERPRINT_SQL)
+        fingerprints = {row[0]: tuple(row[1:]) for row in result.all()}
+
+        registry_fingerprint = fingerprints.pop(0)
+        if self._registry is None or self._registry[0] != registry_fingerprint:
+            project_rows = await session.execute(
+                select(Project.id, Project.name, Project.permalink)
+            )
+            projects = [
+                Project(id=project_id, name=name, permalink=permalink)
+                for project_id, name, permalink in project_rows.all()
+            ]
+            self._registry = (registry_fingerprint, ProjectReferenceIndex.from_projects(projects))
+            # A renamed project changes the permalink its index resolves against.
+            self._projects.clear()
+        project_index = self._registry[1]
+        if current_project_id not in project_index.projects_by_id:
+            raise RuntimeError(f"Current project {current_project_id} does not exist")
+
+        entity_indexes: dict[int, ProjectEntityIdentityIndex] = {}
+        for project_id in sorted(_required_project_ids(targets, project_index, current_project_id)):
+            fingerprint = fingerprints.get(project_id, _EMPTY_PROJECT_FINGERPRINT)
+            cached = self._projects.get(project_id)
+            if cached is None or cached.fingerprint != fingerprint:
+                cached = _CachedProjectIdentities(
+                    fingerprint=fingerprint,
+                    index=ProjectEntityIdentityIndex.from_entities(
+                        project_index.projects_by_id[project_id],
+                        await _load_identity_entities(session, project_id),
+                    ),
+                )
+                self._projects[project_id] = cached
+            entity_indexes[project_id] = cached.index
+
+        return BulkLinkResolutionSnapshot(
+            current_project_id=current_project_id,
+            projects=project_index,
+            entity_indexes=entity_indexes,
+            include_project_permalinks=app_config.permalinks_include_project,
+            workspace_permalink=_workspace_permalink(),
+        )
+
+
+async def _load_identity_entities(session: AsyncSession, project_id: int) -> list[Entity]:
+    """Load one project's identity columns as transient entities safe to keep across sessions."""
+    result = await session.execute(
+        select(
+            Entity.id,
+            Entity.external_id,
+            Entity.permalink,
+            Entity.title,
+            Entity.file_path,
+        ).where(Entity.project_id == project_id)
     )
+    return [
+        Entity(
+            id=entity_id,
+            project_id=project_id,
+            external_id=external_id,
+            permalink=permalink,
+            title=title,
+            file_path=file_path,
+        )
+        for entity_id, external_id, permalink, title, file_path in result.all()
+    ]
+
+
+# Keyed by session maker so separate databases (and test fixtures) never share identities.
+_SNAPSHOT_CACHES: weakref.WeakKeyDictionary[
+    async_sessionmaker[AsyncSession], LinkResolutionSnapshotCache
+] = weakref.WeakKeyDictionary()
+
+
+def get_link_resolution_snapshot_cache(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> LinkResolutionSnapshotCache:
+    """Return the shared identity snapshot cache for ``session_maker``."""
+    return _SNAPSHOT_CACHES.setdefault(session_maker, LinkResolutionSnapshotCache())
 
 
 # --- Resolver service ---
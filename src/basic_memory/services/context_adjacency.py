@@ -0,0 +1,229 @@
+"""In-process relation adjacency index for build_context graph traversal.
+
+The SQLite recursive CTE in ``ContextService`` enumerates every simple path from
+each seed, carrying visited entities as a concatenated string. On dense hubs at
+depth 2-3 that path explosion dominates ``memory://`` context latency even though
+the answer only needs the shortest depth of each reachable row.
+
+This module keeps a compact per-project copy of the relation endpoints, computes
+the same frontier breadth-first in memory, and lets the caller hydrate only the
+final rows from SQL. A cheap per-project fingerprint query revalidates the copy on
+every use, so writes from this process or from a separate sync process are picked
+up before the next traversal.
+"""
+
+from __future__ import annotations
+
+import weakref
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from basic_memory.repository.search_repository import SearchRepository
+
+type AdjacencyFingerprint = tuple[Any, ...]
+type RelatedKey = tuple[str, int, int]
+
+# Unresolved forward references have no target entity; 0 is never a row id.
+_NO_ENTITY = 0
+
+
+@dataclass(slots=True)
+class EntityNode:
+    """Traversal-relevant facts about one entity."""
+
+    project_id: int
+    created_at: Any
+
+
+@dataclass(slots=True)
+class ProjectAdjacency:
+    """Relation endpoints for one project, stored as parallel int arrays."""
+
+    project_id: int
+    fingerprint: AdjacencyFingerprint
+    relation_ids: array[int]
+    from_ids: array[int]
+    to_ids: array[int]
+    # Entity id -> positions in the parallel arrays of every relation touching it.
+    edges_by_entity: dict[int, array[int]]
+    # Raw created_at values of the project's entities, compared exactly like the CTE.
+    entity_created_at: dict[int, Any]
+
+
+@dataclass(slots=True)
+class RelatedHit:
+    """One row reached by traversal, before hydration."""
+
+    type: str
+    id: int
+    root_id: int
+    depth: int
+
+
+_FINGERPRINT_SQL = text("""
+    SELECT
+        (SELECT COUNT(*) FROM relation WHERE project_id = :project_id) AS relation_count,
+        (SELECT COALESCE(MAX(id), 0) FROM relation WHERE project_id = :project_id)
+            AS relation_max_id,
+        (SELECT TOTAL(COALESCE(to_id, 0)) + TOTAL(from_id) + TOTAL(generation)
+            FROM relation WHERE project_id = :project_id) AS relation_checksum,
+        (SELECT COUNT(*) FROM entity WHERE project_id = :project_id) AS entity_count,
+        (SELECT COALESCE(MAX(id), 0) FROM entity WHERE project_id = :project_id)
+            AS entity_max_id
+""")
+
+# Keyed by session maker so separate databases (and test fixtures) never share an index.
+_ADJACENCY_CACHES: weakref.WeakKeyDictionary[
+    async_sessionmaker[AsyncSession], dict[int, ProjectAdjacency]
+] = weakref.WeakKeyDictionary()
+
+
+class ContextAdjacencyIndex:
+    """Breadth-first traversal over cached per-project relation adjacency."""
+
+    def __init__(self, search_repository: SearchRepository) -> None:
+        self.search_repository = search_repository
+        self._projects = _ADJACENCY_CACHES.setdefault(search_repository.session_maker, {})
+        self._entity_nodes: dict[int, EntityNode | None] = {}
+        self._validated: set[int] = set()
+
+    async def _query(self, sql: str, params: dict[str, Any]) -> Sequence[Any]:
+        result = await self.search_repository.execute_query(text(sql), params=params)
+        return result.all()
+
+    async def _project(self, project_id: int) -> ProjectAdjacency:
+        """Return the project's adjacency, rebuilding it when its fingerprint moved."""
+        cached = self._projects.get(project_id)
+        if project_id in self._validated and cached is not None:
+            return cached
+
+        result = await self.search_repository.execute_query(
+            _FINGERPRINT_SQL, params={"project_id": project_id}
+        )
+        fingerprint = tuple(result.one())
+        if cached is None or cached.fingerprint != fingerprint:
+            cached = await self._load_project(project_id, fingerprint)
+            self._projects[project_id] = cached
+        self._validated.add(project_id)
+        return cached
+
+    async def _load_project(
+        self, project_id: int, fingerprint: AdjacencyFingerprint
+    ) -> ProjectAdjacency:
+        relation_rows = await self._query(
+            "SELECT id, from_id, to_id FROM relation WHERE project_id = :project_id ORDER BY id",
+            {"project_id": project_id},
+        )
+        entity_rows = await self._query(
+            "SELECT id, created_at FROM entity WHERE project_id = :project_id",
+            {"project_id": project_id},
+        )
+        relation_ids = array("q")
+        from_ids = array("q")
+        to_ids = array("q")
+        edges_by_entity: dict[int, array[int]] = {}
+        for position, (relation_id, from_id, to_id) in enumerate(relation_rows):
+            relation_ids.append(relation_id)
+            from_ids.append(from_id)
+            to_ids.append(to_id if to_id is not None else _NO_ENTITY)
+            edges_by_entity.setdefault(from_id, array("l")).append(position)
+            if to_id is not None and to_id != from_id:
+                edges_by_entity.setdefault(to_id, array("l")).append(position)
+        logger.debug(
+            "Built context adjacency index: project_id={project_id} relations={relations} "
+            "entities={entities}",
+            project_id=project_id,
+            relations=len(relation_ids),
+            entities=len(entity_rows),
+        )
+        return ProjectAdjacency(
+            project_id=project_id,
+            fingerprint=fingerprint,
+            relation_ids=relation_ids,
+            from_ids=from_ids,
+            to_ids=to_ids,
+            edges_by_entity=edges_by_entity,
+            entity_created_at={entity_id: created_at for entity_id, created_at in entity_rows},
+        )
+
+    async def _entity_node(self, entity_id: int, project: ProjectAdjacency) -> EntityNode | None:
+        """Resolve an entity's project and created_at, crossing projects only when needed."""
+        created_at = project.entity_created_at.get(entity_id)
+        if created_at is not None:
+            return EntityNode(project_id=project.project_id, created_at=created_at)
+        if entity_id not in self._entity_nodes:
+            rows = await self._query(
+                "SELECT project_id, created_at FROM entity WHERE id = :entity_id",
+                {"entity_id": entity_id},
+            )
+            self._entity_nodes[entity_id] = (
+                EntityNode(project_id=rows[0][0], created_at=rows[0][1]) if rows else None
+            )
+        return self._entity_nodes[entity_id]
+
+    async def traverse(
+        self,
+        seed_ids: Iterable[int],
+        *,
+        project_id: int,
+        max_depth: int,
+        since: Any = None,
+    ) -> list[RelatedHit]:
+        """Return every row reachable within ``max_depth`` steps, at its shortest depth.
+
+        Mirrors the recursive CTE: seeds must belong to ``project_id``; a relation is
+        followed from an entity only when it belongs to that entity's project and its
+        source entity lives there too; ``since`` filters seeds, reached entities, and
+        relation source entities. Rows come back ordered by ``(depth, type, id)``.
+        """
+
+        def is_recent(created_at: Any) -> bool:
+            return since is None or created_at >= since
+
+        seed_project = await self._project(project_id)
+        hits: list[RelatedHit] = []
+        for root_id in dict.fromkeys(seed_ids):
+            root_created_at = seed_project.entity_created_at.get(root_id)
+            if root_created_at is None or not is_recent(root_created_at):
+                continue
+
+            entity_depths: dict[int, int] = {root_id: 0}
+            seen_relations: set[int] = set()
+            frontier: list[tuple[int, int]] = [(root_id, project_id)]
+            depth = 0
+            while frontier and depth < max_depth:
+                next_frontier: list[tuple[int, int]] = []
+                for entity_id, entity_project_id in frontier:
+                    project = await self._project(entity_project_id)
+                    for position in project.edges_by_entity.get(entity_id, ()):
+                        from_id = project.from_ids[position]
+                        from_created_at = project.entity_created_at.get(from_id)
+                        if from_created_at is None or not is_recent(from_created_at):
+                            continue
+                        relation_id = project.relation_ids[position]
+                        if relation_id not in seen_relations:
+                            seen_relations.add(relation_id)
+                            hits.append(RelatedHit("relation", relation_id, root_id, depth + 1))
+                        if depth + 1 >= max_depth:
+                            continue
+
+                        target_id = project.to_ids[position] if from_id == entity_id else from_id
+                        if target_id == _NO_ENTITY or target_id in entity_depths:
+                            continue
+                        node = await self._entity_node(target_id, project)
+                        if node is None or not is_recent(node.created_at):
+                            continue
+                        entity_depths[target_id] = depth + 2
+                        hits.append(RelatedHit("entity", target_id, root_id, depth + 2))
+                        next_frontier.append((target_id, node.project_id))
+                frontier = next_frontier
+                depth += 2
+
+        hits.sort(key=lambda hit: (hit.depth, hit.type, hit.id, hit.root_id))
+        return hits
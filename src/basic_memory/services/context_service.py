@@ -13,12 +13,14 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 import logfire
 from basic_memory import db
+from basic_memory.config import BasicMemoryConfig
 from basic_memory.repository.entity_repository import EntityRepository
 from basic_memory.repository.observation_repository import ObservationRepository
 from basic_memory.repository.postgres_search_repository import PostgresSearchRepository
 from basic_memory.repository.search_repository import SearchRepository, SearchIndexRow
 from basic_memory.schemas.memory import MemoryUrl, memory_url_path
 from basic_memory.schemas.search import SearchItemType
+from basic_memory.services.context_adjacency import ContextAdjacencyIndex, RelatedHit
 from basic_memory.utils import generate_permalink
 from basic_memory.workspace_context import workspace_slug_for_canonical_permalinks
 
@@ -94,12 +96,14 @@ class ContextService:
         observation_repository: ObservationRepository,
         link_resolver: Optional[LinkResolver] = None,
         session_maker: async_sessionmaker[AsyncSession] | None = None,
+        app_config: Optional[BasicMemoryConfig] = None,
     ):
         self.search_repository = search_repository
         self.entity_repository = entity_repository
         self.observation_repository = observation_repository
         self.link_resolver = link_resolver
         self.session_maker = session_maker
+        self.app_config = app_config
 
     def _require_session_maker(self) -> async_sessionmaker[AsyncSession]:
         """Fail fast when a session-opening path runs without a session maker."""
@@ -395,6 +399,23 @@ class ContextService:
         # Detect database backend
         is_postgres = isinstance(self.search_repository, PostgresSearchRepository)
 
+        # Trigger: SQLite traversal with the adjacency index enabled (the default).
+        # Why: the recursive CTE enumerates every simple path and tracks visited
+        # entities by string concatenation, which explodes on dense hubs at depth 2-3.
+        # Outcome: compute shortest-depth frontiers in memory over cached relation
+        # endpoints, then hydrate only the rows that survive the result limit.
+        if not is_postgres and not (
+            self.app_config and not self.app_config.context_adjacency_index
+        ):
+            adjacency = ContextAdjacencyIndex(self.search_repository)
+            hits = await adjacency.traverse(
+                entity_ids,
+                project_id=self.search_repository.project_id,
+                max_depth=max_depth,
+                since=params.get("since_date"),
+            )
+            return await self._hydrate_related(hits[:max_results])
+
         if is_postgres:  # pragma: no cover
             query = self._build_postgres_query(
                 entity_id_values,
@@ -444,6 +465,83 @@ class ContextService:
         ]
         return context_rows
 
+    async def _hydrate_related(self, hits: List[RelatedHit]) -> List[ContextResultRow]:
+        """Load display columns for traversal hits, shaped like the CTE's result rows."""
+        entity_ids = [hit.id for hit in hits if hit.type == "entity"]
+        relation_ids = [hit.id for hit in hits if hit.type == "relation"]
+
+        entities: dict[int, Any] = {}
+        if entity_ids:
+            result = await self.search_repository.execute_query(
+                text(f"""
+                    SELECT id, title, COALESCE(permalink, '') AS permalink, file_path, created_at
+                    FROM entity
+                    WHERE id IN ({", ".join(str(i) for i in entity_ids)})
+                """),
+                params={},
+            )
+            entities = {row.id: row for row in result.all()}
+
+        relations: dict[int, Any] = {}
+        if relation_ids:
+            result = await self.search_repository.execute_query(
+                text(f"""
+                    SELECT
+                        r.id,
+                        r.relation_type || ': ' || r.to_name AS title,
+                        e_from.file_path,
+                        r.from_id,
+                        r.to_id,
+                        r.relation_type,
+                        r.to_name,
+                        e_from.created_at
+                    FROM relation r
+                    JOIN entity e_from ON e_from.id = r.from_id
+                    WHERE r.id IN ({", ".join(str(i) for i in relation_ids)})
+                """),
+                params={},
+            )
+            relations = {row.id: row for row in result.all()}
+
+        context_rows: List[ContextResultRow] = []
+        for hit in hits:
+            if hit.type == "entity":
+                # Rows deleted between traversal and hydration simply drop out.
+                if (entity := entities.get(hit.id)) is None:
+                    continue
+                context_rows.append(
+                    ContextResultRow(
+                        type="entity",
+                        id=entity.id,
+                        title=entity.title,
+                        permalink=entity.permalink,
+                        file_path=entity.file_path,
+                        depth=hit.depth,
+                        root_id=hit.root_id,
+                        created_at=entity.created_at,
+                    )
+                )
+            else:
+                if (relation := relations.get(hit.id)) is None:
+                    continue
+                context_rows.append(
+                    ContextResultRow(
+                        type="relation",
+                        id=relation.id,
+                        title=relation.title,
+                        permalink="",
+                        file_path=relation.file_path,
+                        from_id=relation.from_id,
+                        to_id=relation.to_id,
+                        relation_type=relation.relation_type,
+                        to_name=relation.to_name,
+                        depth=hit.depth,
+                        root_id=hit.root_id,
+                        created_at=relation.created_at,
+                    )
+                )
+        return context_rows
+
     def _build_postgres_query(  # pragma: no cover
         self,
         entity_id_values: str,
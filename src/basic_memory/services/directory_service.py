@@ -57,9 +57,9 @@ class DirectoryService:
     async def get_directory_tree(self) -> DirectoryNode:
         """Build a hierarchical directory tree from indexed files."""
 
-        # Get all files from DB (flat list)
+        # Get all files from DB (flat list); tree nodes only need entity columns
         async with db.scoped_session(self.session_maker) as session:
-            entity_rows = await self.entity_repository.find_all(session)
+            entity_rows = await self.entity_repository.find_all(session, use_load_options=False)
 
         # Create a root directory node
         root_node = DirectoryNode(name="Root", directory_path="/", type="directory")
@@ -132,7 +132,7 @@ class DirectoryService:
         Returns:
             DirectoryNode tree containing only folders (type="directory")
         """
-        # Get unique directories without loading entities
+        # Read directories from the materialized index without touching entities
         async with db.scoped_session(self.session_maker) as session:
             directories = await self.entity_repository.get_distinct_directories(session)
 
@@ -209,14 +209,20 @@ class DirectoryService:
         if dir_name != "/" and dir_name.endswith("/"):
             dir_name = dir_name.rstrip("/")
 
-        # Optimize: Query only entities in the target directory
-        # instead of loading the entire tree
+        # Optimize: Query only the requested levels of the target directory. Folders
+        # come from the directory index, so a folder whose files all sit deeper than
+        # `depth` is still listed without reading those files.
         dir_prefix = dir_name.lstrip("/")
         async with db.scoped_session(self.session_maker) as session:
-            entity_rows = await self.entity_repository.find_by_directory_prefix(session, dir_prefix)
+            directories = await self.entity_repository.find_directories(
+                session, dir_prefix, max_depth=depth
+            )
+            entity_rows = await self.entity_repository.find_by_directory_prefix(
+                session, dir_prefix, max_depth=depth
+            )
 
-        # Build a partial tree from only the relevant entities
-        root_tree = self._build_directory_tree_from_entities(entity_rows, dir_name)
+        # Build a partial tree from only the relevant directories and entities
+        root_tree = self._build_directory_tree_from_entities(entity_rows, dir_name, directories)
 
         # Find the target directory node
         target_node = self._find_directory_node(root_tree, dir_name)
@@ -291,13 +297,18 @@ class DirectoryService:
         )
 
     def _build_directory_tree_from_entities(
-        self, entity_rows: Sequence[Entity], root_path: str
+        self,
+        entity_rows: Sequence[Entity],
+        root_path: str,
+        directories: Sequence[str] = (),
     ) -> DirectoryNode:
         """Build a directory tree from a subset of entities.
 
         Args:
             entity_rows: Sequence of entity objects to build tree from
             root_path: Root directory path for the tree
+            directories: Directory paths (no leading slash) to include even when
+                none of their files are among entity_rows
 
         Returns:
             DirectoryNode representing the tree root
@@ -308,14 +319,14 @@ class DirectoryService:
         # Map to store directory nodes by path for easy lookup
         dir_map: Dict[str, DirectoryNode] = {root_path: root_node}
 
-        # First pass: create all directory nodes
-        for file in entity_rows:
+        # First pass: create all directory nodes, from the index and from file paths
+        for directory in [*directories, *(os.path.dirname(f.file_path) for f in entity_rows)]:
             # Process directory path components
-            parts = [p for p in file.file_path.split("/") if p]
+            parts = [p for p in directory.split("/") if p]
 
             # Create directory structure
             current_path = "/"
-            for i, part in enumerate(parts[:-1]):  # Skip the filename
+            for part in parts:
                 parent_path = current_path
                 # Build the directory path
                 current_path = (
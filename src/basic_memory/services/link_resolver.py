@@ -1,6 +1,8 @@
 """Service and helpers for resolving markdown links and permalink-like identifiers."""
 
 import uuid as uuid_mod
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Any, Optional, Tuple, Dict
 
 from loguru import logger
@@ -85,6 +87,30 @@ def normalize_link_text(link_text: str) -> tuple[str, str | None]:
     return text.strip(), alias
 
 
+class _ExactLinkCandidates:
+    """In-memory view of the entities one exact-identity query returned for a link."""
+
+    def __init__(self, entities: Sequence[Entity]):
+        self._by_permalink: dict[str, Entity] = {}
+        self._by_title: dict[str, list[Entity]] = {}
+        self._by_file_path: dict[str, Entity] = {}
+        # Entities arrive shortest path first, so title lists keep get_by_title ordering.
+        for entity in entities:
+            if entity.permalink is not None:
+                self._by_permalink.setdefault(entity.permalink, entity)
+            self._by_title.setdefault(entity.title, []).append(entity)
+            self._by_file_path[entity.file_path] = entity
+
+    def by_permalink(self, permalink: str) -> Optional[Entity]:
+        return self._by_permalink.get(permalink)
+
+    def by_title(self, title: str) -> list[Entity]:
+        return self._by_title.get(title, [])
+
+    def by_file_path(self, file_path: str) -> Optional[Entity]:
+        return self._by_file_path.get(Path(file_path).as_posix())
+
+
 class LinkResolver:
     """Service for resolving markdown links to permalinks.
 
@@ -275,6 +301,100 @@ class LinkResolver:
                 load_relations=load_relations,
             )
 
+    async def resolve_links(
+        self,
+        link_texts: Sequence[str],
+        *,
+        load_relations: bool = True,
+        session: AsyncSession | None = None,
+    ) -> Dict[str, Optional[Entity]]:
+        """Resolve many links at once, matching :meth:`resolve_link` with default options.
+
+        Exact matches come from the shared identity snapshot, so N links cost one
+        fingerprint query plus one hydration query per project. Links the snapshot cannot
+        settle on its own (no exact match, or a title shared by several notes where
+        single-link resolution prefers the shortest path) fall back to
+        :meth:`resolve_link`, including its fuzzy search.
+        """
+        # Imported here because bulk_link_resolver builds on this module's link parsing.
+        from basic_memory.services.bulk_link_resolver import (
+            RelationTargetReference,
+            get_link_resolution_snapshot_cache,
+        )
+
+        targets = [
+            RelationTargetReference.parse(link_text) for link_text in dict.fromkeys(link_texts)
+        ]
+        if not targets:
+            return {}
+
+        project_id = self.entity_repository.project_id
+        if project_id is None:  # pragma: no cover
+            raise RuntimeError("Batch link resolution requires a project-scoped repository")
+
+        snapshot_cache = get_link_resolution_snapshot_cache(self.session_maker)
+        async with db.scoped_session(self.session_maker, session) as active_session:
+            snapshot = await snapshot_cache.snapshot(
+                targets,
+                current_project_id=project_id,
+                app_config=self._app_config,
+                session=active_session,
+            )
+            # Trigger: an unqualified link only reached another project's exact match.
+            # Why: resolve_link tries fuzzy search in the current project before it
+            #   routes a project/path prefix elsewhere.
+            # Outcome: leave that link to resolve_link so both paths agree.
+            identities: Dict[str, Entity] = {}
+            for target in targets:
+                match = snapshot.resolve_match(target)
+                if (
+                    match.entity is not None
+                    and not match.ambiguous
+                    and (target.explicitly_qualified or match.entity.project_id == project_id)
+                ):
+                    identities[target.original] = match.entity
+
+            ids_by_project: Dict[int, list[int]] = {}
+            for identity in identities.values():
+                ids_by_project.setdefault(identity.project_id, []).append(identity.id)
+            hydrated: Dict[int, Entity] = {}
+            for entity_project_id, entity_ids in ids_by_project.items():
+                repository = self._entity_repository_cache.get(entity_project_id)
+                if repository is None:
+                    repository = EntityRepository(project_id=entity_project_id)
+                    self._entity_repository_cache[entity_project_id] = repository
+                result = await repository.execute_query(
+                    active_session,
+                    repository.select().where(Entity.id.in_(entity_ids)),
+                    use_query_options=load_relations,
+                )
+                hydrated.update((entity.id, entity) for entity in result.scalars().unique())
+
+            resolved: Dict[str, Optional[Entity]] = {}
+            for target in targets:
+                identity = identities.get(target.original)
+                entity = hydrated.get(identity.id) if identity is not None else None
+                # Trigger: the hydrated row no longer carries the identity the snapshot
+                #   matched on (an edit the fingerprint could not see).
+                # Why: a stale identity could hand back a note the link no longer names.
+                # Outcome: drop the project's snapshot and resolve this link the slow way.
+                if (
+                    entity is not None
+                    and identity is not None
+                    and (entity.permalink, entity.title, entity.file_path)
+                    != (identity.permalink, identity.title, identity.file_path)
+                ):
+                    snapshot_cache.invalidate(identity.project_id)
+                    entity = None
+                if entity is None:
+                    entity = await self.resolve_link(
+                        target.original,
+                        load_relations=load_relations,
+                        session=active_session,
+                    )
+                resolved[target.original] = entity
+            return resolved
+
     def _normalize_link_text(self, link_text: str) -> Tuple[str, Optional[str]]:
         """Normalize link text and extract alias if present.
 
@@ -331,6 +451,7 @@ class LinkResolver:
         # Trigger: source_path is provided AND link contains "/"
         # Why: Resolve paths like [[nested/deep-note]] relative to source folder first
         # Outcome: [[nested/deep-note]] from testing/link-test.md → testing/nested/deep-note.md
+        relative_paths: list[str] = []
         deferred_relative_alias_path: Optional[str] = None
         if source_path and "/" in clean_text:
             if not (
@@ -343,25 +464,10 @@ class LinkResolver:
                     # Construct relative path from source folder
                     relative_path = f"{source_folder}/{clean_text}"
 
-                    # Try with .md extension
+                    # Try with .md extension, then as-is (already has extension or is a permalink)
                     if not relative_path.endswith(".md"):
-                        relative_path_md = f"{relative_path}.md"
-                        entity = await entity_repository.get_by_file_path(
-                            session,
-                            relative_path_md,
-                            load_relations=load_relations,
-                        )
-                        if entity:
-                            return entity
-
-                    # Try as-is (already has extension or is a permalink)
-                    entity = await entity_repository.get_by_file_path(
-                        session,
-                        relative_path,
-                        load_relations=load_relations,
-                    )
-                    if entity:
-                        return entity
+                        relative_paths.append(f"{relative_path}.md")
+                    relative_paths.append(relative_path)
 
                     # Only exact relative paths may resolve this early. The forgiving
                     # alias spelling is deferred until every exact identity — permalink,
@@ -373,41 +479,49 @@ class LinkResolver:
                         else f"{relative_path}.md"
                     )
 
+        # Trigger: one link can match by several exact identities (each permalink
+        #   candidate, its title, its path with and without ``.md``).
+        # Why: a round trip per identity made every read/edit/move resolve pay up to
+        #   a dozen sequential queries before it even reached the fallbacks.
+        # Outcome: gather every exact candidate in one query and apply the resolution
+        #   precedence below in memory.
+        exact = _ExactLinkCandidates(
+            await entity_repository.find_by_link_identities(
+                session,
+                permalinks=permalink_candidates,
+                titles=[clean_text],
+                file_paths=[*relative_paths, clean_text, f"{clean_text}.md"],
+                load_relations=load_relations,
+            )
+        )
+
+        for relative_path in relative_paths:
+            entity = exact.by_file_path(relative_path)
+            if entity:
+                return entity
+
+        title_matches = exact.by_title(clean_text)
+
         # When source_path is provided, use context-aware resolution:
         # Check both permalink and title matches, prefer closest to source.
         # Example: [[testing]] from folder/note.md prefers folder/testing.md
         # over a root testing.md with permalink "testing".
         if source_path:
-            # Gather all potential matches
-            candidates: list[Entity] = []
-
-            # Check permalink match
+            # Gather all potential matches; a permalink match may also be a title match.
+            candidates: dict[int, Entity] = {}
             for candidate_permalink in permalink_candidates:
-                permalink_entity = await entity_repository.get_by_permalink(
-                    session,
-                    candidate_permalink,
-                    load_relations=load_relations,
-                )
-                if permalink_entity and permalink_entity.id not in [c.id for c in candidates]:
-                    candidates.append(permalink_entity)
-
-            # Check title matches
-            title_entities = await entity_repository.get_by_title(
-                session,
-                clean_text,
-                load_relations=load_relations,
-            )
-            for entity in title_entities:
-                # Avoid duplicates (permalink match might also be in title matches)
-                if entity.id not in [c.id for c in candidates]:
-                    candidates.append(entity)
+                permalink_entity = exact.by_permalink(candidate_permalink)
+                if permalink_entity:
+                    candidates.setdefault(permalink_entity.id, permalink_entity)
+            for entity in title_matches:
+                candidates.setdefault(entity.id, entity)
 
             if candidates:
                 if len(candidates) == 1:
-                    return candidates[0]
+                    return next(iter(candidates.values()))
                 else:
                     # Multiple candidates - pick closest to source
-                    return self._find_closest_entity(candidates, source_path)
+                    return self._find_closest_entity(list(candidates.values()), source_path)
 
         # Standard resolution (no source context): permalink first, then title.
         #
@@ -415,16 +529,10 @@ class LinkResolver:
         # — e.g. an original plus a `-1` duplicate — which is how edit/move landed on the wrong
         # entity (issue #1148). The trap is that the permalink step also matches the *slug* of the
         # title (`build_permalink_resolution_candidates` slugifies the input), so a duplicated title
-        # whose original owns the title-derived permalink would still resolve silently. Pre-read the
-        # title matches so the permalink loop can tell a caller-supplied exact permalink (input is
-        # already in slug form) from the slug of a shared title. Non-strict resolution keeps the
-        # fast path — the title is read only if the permalink loop misses.
-        strict_title_matches = (
-            await entity_repository.get_by_title(session, clean_text, load_relations=load_relations)
-            if strict
-            else None
-        )
-        strict_ambiguous_title = strict_title_matches is not None and len(strict_title_matches) > 1
+        # whose original owns the title-derived permalink would still resolve silently. The title
+        # matches let the permalink loop tell a caller-supplied exact permalink (input is already
+        # in slug form) from the slug of a shared title.
+        strict_ambiguous_title = strict and len(title_matches) > 1
         # The caller supplied an exact permalink when their verbatim (project-normalized) identifier
         # matches a stored permalink. That is the first, un-slugified candidate the builder emits,
         # so it also accepts explicit custom permalinks (e.g. "API_V2") that are not slug-shaped —
@@ -434,11 +542,7 @@ class LinkResolver:
 
         # 1. Try exact permalink match first (most efficient)
         for candidate_permalink in permalink_candidates:
-            entity = await entity_repository.get_by_permalink(
-                session,
-                candidate_permalink,
-                load_relations=load_relations,
-            )
+            entity = exact.by_permalink(candidate_permalink)
             if entity:
                 # The slugified form of a shared title must not silently win for a destructive op;
                 # only the caller's exact (verbatim) permalink candidate may bypass the guard.
@@ -449,28 +553,17 @@ class LinkResolver:
 
         # 2. Try exact title match. An exact file-path match below is more precise than a title and
         # can still disambiguate, so defer any ambiguity rejection until the path lookups have run.
-        found = (
-            strict_title_matches
-            if strict
-            else await entity_repository.get_by_title(
-                session, clean_text, load_relations=load_relations
-            )
-        )
         ambiguous_title_candidates: list[Entity] = []
-        if found:
-            if strict and len(found) > 1:
-                ambiguous_title_candidates = list(found)
+        if title_matches:
+            if strict and len(title_matches) > 1:
+                ambiguous_title_candidates = list(title_matches)
             else:
-                entity = found[0]
+                entity = title_matches[0]
                 logger.debug(f"Found title match: {entity.title}")
                 return entity
 
         # 3. Try file path
-        found_path = await entity_repository.get_by_file_path(
-            session,
-            clean_text,
-            load_relations=load_relations,
-        )
+        found_path = exact.by_file_path(clean_text)
         if found_path:
             logger.debug(f"Found entity with path: {found_path.file_path}")
             return found_path
@@ -484,11 +577,7 @@ class LinkResolver:
         has_markdown_extension = clean_text.casefold().endswith(".md")
         if not has_markdown_extension and can_use_stem_path:
             file_path_with_md = f"{clean_text}.md"
-            found_path_md = await entity_repository.get_by_file_path(
-                session,
-                file_path_with_md,
-                load_relations=load_relations,
-            )
+            found_path_md = exact.by_file_path(file_path_with_md)
             if found_path_md:
                 logger.debug(f"Found entity with path (with .md): {found_path_md.file_path}")
                 return found_path_md
@@ -238,11 +238,9 @@ async def resolve_permalink(
                 workspace_permalink=workspace_permalink,
             )
 
-        permalink = desired_permalink
-        suffix = 1
-        while await dependencies.entity_repository.permalink_exists(active_session, permalink):
-            permalink = f"{desired_permalink}-{suffix}"
-            suffix += 1
+        (permalink,) = await dependencies.entity_repository.allocate_permalinks(
+            active_session, desired_permalink
+        )
     return permalink
 
 
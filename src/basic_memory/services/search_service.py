@@ -2,6 +2,8 @@
 
 import asyncio
 import ast
+import hashlib
+import json
 import re
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, replace
@@ -32,6 +34,7 @@ from basic_memory.runtime.vector_sync import (
     VectorSyncBatchResult,
 )
 from basic_memory.services import FileService
+from basic_memory.utils import ensure_timezone_aware
 
 # Maximum size for content_stems field to stay under Postgres's 8KB index row limit.
 # We use 6000 characters to leave headroom for other indexed columns and overhead.
@@ -113,6 +116,33 @@ def describe_search_criteria(prepared: PreparedSearchQuery) -> str:
     return " ".join(f"{name}={value}" for name, value in criteria.items() if value is not None)
 
 
+def _search_row_fingerprint(row: SearchIndexRow) -> str:
+    """Hash the stored columns of a search row, for skipping rewrites of unchanged rows.
+
+    Observation and relation rows carry their note's ``updated_at``, which moves
+    on every save; it is left out for them so an untouched observation keeps its
+    row. Entity rows keep it, so the note itself still sorts as recently updated.
+    """
+    values: dict[str, Any] = {
+        "title": row.title,
+        "content_stems": row.content_stems,
+        "content_snippet": row.content_snippet,
+        "permalink": row.permalink,
+        "file_path": row.file_path,
+        "metadata": row.metadata or {},
+        "from_id": row.from_id,
+        "to_id": row.to_id,
+        "relation_type": row.relation_type,
+        "entity_id": row.entity_id,
+        "category": row.category,
+        "created_at": ensure_timezone_aware(row.created_at).isoformat(),
+    }
+    if row.type == SearchItemType.ENTITY.value:
+        values["updated_at"] = ensure_timezone_aware(row.updated_at).isoformat()
+    encoded = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _strip_nul(value: str) -> str:
     """Strip NUL bytes that PostgreSQL text columns cannot store.
 
@@ -165,6 +195,11 @@ class SearchService:
         for entity in entities:
             await self.index_entity(entity, background_tasks)
 
+        # The directory index is maintained incrementally; a full reindex is also
+        # where it gets recomputed, so any count drift is repaired here.
+        async with db.scoped_session(self.session_maker) as session:
+            await self.entity_repository.rebuild_directories(session)
+
         logger.info("Reindex complete")
 
     def prepare_query(self, query: SearchQuery) -> PreparedSearchQuery | None:
@@ -564,11 +599,11 @@ class SearchService:
                     # Outcome: storage errors remain visible before any search rows are deleted.
                     replacement_content = await self.file_service.read_entity_content(entity)
 
-                await self.repository.delete_by_entity_id(entity_id=entity.id)
-
                 if entity.is_markdown:
+                    # Diffs against the stored rows itself; see _replace_entity_rows.
                     await self.index_entity_markdown(entity, replacement_content)
                 else:
+                    await self.repository.delete_by_entity_id(entity_id=entity.id)
                     await self.index_entity_file(entity)
 
             logger.debug(
@@ -936,7 +971,45 @@ class SearchService:
                     )
                 )
 
-            await self.repository.bulk_index_items(rows_to_index)
+            await self._replace_entity_rows(entity.id, rows_to_index)
+
+    async def _replace_entity_rows(self, entity_id: int, rows: list[SearchIndexRow]) -> None:
+        """Make ``rows`` the entity's search projection, writing only what changed.
+
+        Trigger: every save re-derives all of a note's entity, observation and
+            relation rows.
+        Why: rewriting them all turns a one-word edit to a note with hundreds of
+            observations into hundreds of FTS deletes and inserts.
+        Outcome: rows whose stored columns already match are left in place;
+            changed rows are replaced and rows the note no longer produces are
+            deleted. Vector chunks of untouched rows keep their source hashes,
+            so they are not re-embedded either.
+        """
+        stored: dict[tuple[str, int], list[str]] = {}
+        for row in await self.repository.get_entity_search_rows(entity_id):
+            stored.setdefault((row.type, row.id), []).append(_search_row_fingerprint(row))
+
+        stale_keys: list[tuple[str, int]] = []
+        changed_rows: list[SearchIndexRow] = []
+        for row in rows:
+            key = (row.type, row.id)
+            existing = stored.pop(key, None)
+            if existing == [_search_row_fingerprint(row)]:
+                continue
+            if existing is not None:
+                stale_keys.append(key)
+            changed_rows.append(row)
+        # Whatever is left belongs to observations or relations the note no longer has.
+        stale_keys.extend(stored)
+
+        if stale_keys:
+            await self.repository.delete_index_rows(stale_keys)
+        if changed_rows:
+            await self.repository.bulk_index_items(changed_rows)
+        logger.debug(
+            f"Search rows for entity_id={entity_id}: {len(rows) - len(changed_rows)} unchanged, "
+            f"{len(changed_rows)} written, {len(stale_keys)} deleted"
+        )
 
     async def delete_by_permalink(self, permalink: str):
         """Delete an item from the search index."""
@@ -0,0 +1,100 @@
+"""Tests for the /knowledge/graph/export NDJSON endpoint."""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from basic_memory import db
+
+
+def _records(response) -> list[dict]:
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_graph_export_pages_cover_the_whole_graph(
+    client: AsyncClient,
+    test_graph,
+    v2_project_url,
+    session_maker,
+    entity_repository,
+    relation_repository,
+):
+    """Paging with a small limit yields every node and resolved edge exactly once."""
+    nodes: list[dict] = []
+    edges: list[dict] = []
+    generations = set()
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = await client.get(f"{v2_project_url}/knowledge/graph/export", params=params)
+        assert response.status_code == 200
+        records = _records(response)
+        pages += 1
+
+        assert records[0]["kind"] == "header"
+        assert records[-1]["kind"] == "end"
+        generations.add(records[0]["generation"])
+        body = records[1:-1]
+        assert len(body) <= 2
+        nodes.extend(record for record in body if record["kind"] == "node")
+        edges.extend(record for record in body if record["kind"] == "edge")
+        cursor = records[-1]["next_cursor"]
+        if cursor is None:
+            break
+
+    async with db.scoped_session(session_maker) as session:
+        entities = await entity_repository.find_all(session, use_load_options=False)
+        relations = [
+            relation
+            for relation in await relation_repository.find_all(session, use_load_options=False)
+            if relation.to_id
+        ]
+    assert [node["id"] for node in nodes] == sorted(entity.id for entity in entities)
+    assert {node["external_id"] for node in nodes} == {entity.external_id for entity in entities}
+    assert sorted((edge["from"], edge["to"], edge["relation_type"]) for edge in edges) == sorted(
+        (relation.from_id, relation.to_id, relation.relation_type) for relation in relations
+    )
+    assert edges
+    assert pages > 1
+    assert len(generations) == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_export_honors_if_none_match_until_the_graph_changes(
+    client: AsyncClient, v2_project_url
+):
+    """Pollers get 304 for an unchanged graph and a new ETag after a write."""
+    url = f"{v2_project_url}/knowledge/graph/export"
+    first = await client.get(url)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"graph-')
+
+    unchanged = await client.get(url, headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+
+    created = await client.post(
+        f"{v2_project_url}/knowledge/entities",
+        json={"title": "New Node", "directory": "graph", "content": "body"},
+    )
+    assert created.status_code == 202
+
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [record["title"] for record in _records(changed) if record["kind"] == "node"] == [
+        "New Node"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_graph_export_rejects_malformed_cursor(client: AsyncClient, v2_project_url):
+    response = await client.get(
+        f"{v2_project_url}/knowledge/graph/export", params={"cursor": "x:1"}
+    )
+
+    assert response.status_code == 400
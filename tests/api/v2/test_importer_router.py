@@ -6,6 +6,8 @@ from pathlib import Path
 import pytest
 from httpx import AsyncClient
 
+from basic_memory import db
+from basic_memory.importers import Importer
 from basic_memory.models import Project
 from basic_memory.schemas.importer import (
     ChatImportResult,
@@ -181,6 +183,40 @@ async def test_import_chatgpt(
     assert "This is a test response" in content
 
 
+@pytest.mark.asyncio
+async def test_import_chatgpt_resume_from_skips_imported_conversations(
+    client: AsyncClient,
+    tmp_path,
+    chatgpt_json_content,
+    file_service,
+    session_maker,
+    entity_repository,
+    v2_project_url: str,
+):
+    """Resuming skips leading conversations, and written notes are indexed right away."""
+    first = chatgpt_json_content[0]
+    second = {**first, "title": "Resumed Conversation"}
+    file_path = await create_test_upload_file(tmp_path, [first, second])
+
+    with open(file_path, "rb") as f:
+        files = {"file": ("conversations.json", f, "application/json")}
+        data = {"directory": "resumed", "resume_from": "1"}
+        response = await client.post(f"{v2_project_url}/import/chatgpt", files=files, data=data)
+
+    assert response.status_code == 200
+    result = ChatImportResult.model_validate(response.json())
+    assert result.success is True
+    assert result.conversations == 1
+
+    assert not await file_service.exists(Path("resumed") / "20250111-Test_Conversation.md")
+    resumed_path = "resumed/20250111-Resumed_Conversation.md"
+    assert await file_service.exists(resumed_path)
+    async with db.scoped_session(session_maker) as session:
+        entity = await entity_repository.get_by_file_path(session, resumed_path)
+    assert entity is not None
+    assert entity.title == "Resumed Conversation"
+
+
 @pytest.mark.asyncio
 async def test_import_chatgpt_invalid_file(client: AsyncClient, tmp_path, v2_project_url: str):
     """Test importing invalid ChatGPT file via v2 endpoint."""
@@ -202,6 +238,54 @@ async def test_import_chatgpt_invalid_file(client: AsyncClient, tmp_path, v2_pro
     assert "not valid JSON" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_import_chatgpt_truncated_file_reports_resume_from(
+    client: AsyncClient, tmp_path, chatgpt_json_content, file_service, v2_project_url: str
+):
+    """A source that breaks after complete conversations says where to resume."""
+    file_path = tmp_path / "truncated.json"
+    file_path.write_text(json.dumps(chatgpt_json_content)[:-1] + ', {"title": ', encoding="utf-8")
+
+    with open(file_path, "rb") as f:
+        files = {"file": ("conversations.json", f, "application/json")}
+        data = {"directory": "truncated"}
+        response = await client.post(f"{v2_project_url}/import/chatgpt", files=files, data=data)
+
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert "not valid JSON" in detail["message"]
+    assert detail["resume_from"] == 1
+    assert await file_service.exists(Path("truncated") / "20250111-Test_Conversation.md")
+
+
+@pytest.mark.asyncio
+async def test_import_chatgpt_interrupted_write_reports_resume_from(
+    client: AsyncClient, tmp_path, chatgpt_json_content, monkeypatch, v2_project_url: str
+):
+    """A write that fails mid-import returns the checkpoint instead of a bare error."""
+    first = chatgpt_json_content[0]
+    second = {**first, "title": "Failing Conversation"}
+    file_path = await create_test_upload_file(tmp_path, [first, second])
+    original_write_entity = Importer.write_entity
+
+    async def write_entity(self, entity, file_path):
+        if "Failing" in str(file_path):
+            raise OSError("disk full")
+        return await original_write_entity(self, entity, file_path)
+
+    monkeypatch.setattr(Importer, "write_entity", write_entity)
+
+    with open(file_path, "rb") as f:
+        files = {"file": ("conversations.json", f, "application/json")}
+        data = {"directory": "interrupted"}
+        response = await client.post(f"{v2_project_url}/import/chatgpt", files=files, data=data)
+
+    assert response.status_code == 500
+    detail = response.json()["detail"]
+    assert "disk full" in detail["message"]
+    assert detail["resume_from"] == 1
+
+
 @pytest.mark.asyncio
 async def test_import_chatgpt_invalid_utf8_file(client: AsyncClient, v2_project_url: str):
     """Invalid UTF-8 bytes are a client-input problem too, not a 500 (#1276)."""
@@ -5,6 +5,7 @@ surface, so every `--on-conflict` strategy is proven to behave the way it does o
 the Personal (rclone) path.
 """
 
+import asyncio
 import errno
 import hashlib
 import importlib
@@ -18,7 +19,10 @@ import httpx
 import pytest
 
 from basic_memory.cli.commands.cloud.transfer import TransferPlan
+from basic_memory.cli.commands.cloud import webdav_manifest as webdav_manifest_module
+from basic_memory.cli.commands.cloud import webdav_transfer as webdav_transfer_module
 from basic_memory.cli.commands.cloud.webdav import RemoteFile, WebdavError
+from basic_memory.cli.commands.cloud.webdav_manifest import LocalHashManifest
 from basic_memory.cli.commands.cloud.webdav_transfer import (
     build_transfer_plan,
     scan_local_files,
@@ -543,6 +547,95 @@ async def test_transfer_stops_on_a_refused_upload(config_home, tmp_path):
         )
 
 
+@pytest.mark.asyncio
+async def test_transfer_overlaps_files_up_to_the_concurrency_limit(config_home, tmp_path, capsys):
+    """Files move concurrently over the one client, never more than the limit at once."""
+    root = tmp_path / "research"
+    root.mkdir()
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=b"note")
+
+    await webdav_project_transfer(
+        "research",
+        root,
+        "pull",
+        TransferPlan(new=[f"n{index}.md" for index in range(10)]),
+        workspace_id="team-tenant",
+        concurrency=3,
+        client_cm_factory=_client_factory(handler),
+    )
+
+    assert peak == 3
+    assert sorted(p.name for p in root.iterdir()) == sorted(f"n{index}.md" for index in range(10))
+    assert "Transferred 10 file(s)" in _plain(capsys.readouterr().out)
+
+
+@pytest.mark.asyncio
+async def test_transfer_retries_transient_failures(config_home, tmp_path, monkeypatch):
+    """A busy service is retried with backoff instead of failing the whole pull."""
+    monkeypatch.setattr(webdav_transfer_module, "_TRANSFER_RETRY_BASE_DELAY_SECONDS", 0)
+    root = tmp_path / "research"
+    root.mkdir()
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            return httpx.Response(503, text="busy")
+        return httpx.Response(200, content=b"eventually")
+
+    await webdav_project_transfer(
+        "research",
+        root,
+        "pull",
+        TransferPlan(new=["a.md"]),
+        workspace_id="team-tenant",
+        client_cm_factory=_client_factory(handler),
+    )
+
+    assert attempts == 3
+    assert (root / "a.md").read_bytes() == b"eventually"
+
+
+@pytest.mark.asyncio
+async def test_create_only_push_is_not_retried_when_the_write_may_have_landed(
+    config_home, tmp_path, monkeypatch
+):
+    """Repeating a possibly-applied create would report our own write as a teammate's."""
+    monkeypatch.setattr(webdav_transfer_module, "_TRANSFER_RETRY_BASE_DELAY_SECONDS", 0)
+    root = tmp_path / "research"
+    _write(root, "a.md", "content")
+    puts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal puts
+        if request.method == "PROPFIND":
+            return httpx.Response(207, text=_propfind_body([]))
+        puts += 1
+        raise httpx.ReadTimeout("response lost", request=request)
+
+    with pytest.raises(WebdavError, match="response lost"):
+        await webdav_project_transfer(
+            "research",
+            root,
+            "push",
+            TransferPlan(new=["a.md"]),
+            workspace_id="team-tenant",
+            client_cm_factory=_client_factory(handler),
+        )
+
+    assert puts == 1
+
+
 # --- Diff over the wire ---
 
 
@@ -587,6 +680,99 @@ async def test_webdav_project_diff_lists_the_cloud_and_compares(config_home, tmp
     assert plan.dest_only == []
 
 
+def test_manifest_skips_rehashing_files_whose_stat_is_unchanged(config_home, tmp_path, monkeypatch):
+    root = tmp_path / "research"
+    path = _write(root, "a.md", "identical", mtime=MODIFIED.timestamp())
+    remote_files = [_remote("a.md", "identical")]
+    hashed: list[Path] = []
+    real_hash = webdav_manifest_module.file_content_hash
+
+    def counting_hash(target: Path) -> str:
+        hashed.append(target)
+        return real_hash(target)
+
+    monkeypatch.setattr(webdav_manifest_module, "file_content_hash", counting_hash)
+
+    def plan_with_saved_manifest() -> TransferPlan:
+        manifest = LocalHashManifest.load("research", root)
+        plan = build_transfer_plan(
+            local_root=root, remote_files=remote_files, direction="pull", manifest=manifest
+        )
+        manifest.save()
+        return plan
+
+    assert plan_with_saved_manifest().conflicts == []
+    assert plan_with_saved_manifest().conflicts == []
+    assert len(hashed) == 1
+
+    # Same size, new content: the moved mtime is what forces a fresh hash.
+    path.write_text("different", encoding="utf-8")
+    os.utime(path, (MODIFIED.timestamp() + 60, MODIFIED.timestamp() + 60))
+    assert plan_with_saved_manifest().conflicts == ["a.md"]
+    assert len(hashed) == 2
+
+
+@pytest.mark.parametrize("content", ["[]", '"text"', '{"version": 1, "files": []}'])
+def test_manifest_with_unexpected_json_shape_loads_empty(config_home, tmp_path, content):
+    root = tmp_path / "research"
+    _write(root, "a.md", "identical", mtime=MODIFIED.timestamp())
+    path = webdav_manifest_module.manifest_path("research")
+    path.parent.mkdir(parents=True)
+    path.write_text(content, encoding="utf-8")
+
+    manifest = LocalHashManifest.load("research", root)
+
+    assert manifest.content_hash("a.md", size=9, mtime_ns=0) == _md5(b"identical")
+
+
+def test_manifest_path_keeps_project_names_inside_one_directory(config_home):
+    state_dir = webdav_manifest_module.manifest_path("research").parent.parent
+
+    for project in ["../escape", "team/notes", "My Notes", "..", ""]:
+        path = webdav_manifest_module.manifest_path(project)
+        assert path.parent.parent == state_dir
+        assert path.parent.name not in {"", ".", ".."}
+    assert webdav_manifest_module.manifest_path("My Notes") != (
+        webdav_manifest_module.manifest_path("My-Notes")
+    )
+
+
+@pytest.mark.asyncio
+async def test_pull_remembers_the_hash_of_what_it_wrote(config_home, tmp_path, monkeypatch):
+    root = tmp_path / "research"
+    root.mkdir()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=b"from cloud",
+            headers={"Last-Modified": "Mon, 08 Jun 2026 10:30:00 GMT"},
+        )
+
+    await webdav_project_transfer(
+        "research",
+        root,
+        "pull",
+        TransferPlan(new=["new.md"]),
+        workspace_id="team-tenant",
+        client_cm_factory=_client_factory(handler),
+    )
+
+    def fail_hash(target: Path) -> str:
+        raise AssertionError(f"{target} should not be re-read")
+
+    monkeypatch.setattr(webdav_manifest_module, "file_content_hash", fail_hash)
+    manifest = LocalHashManifest.load("research", root)
+    plan = build_transfer_plan(
+        local_root=root,
+        remote_files=[_remote("new.md", "from cloud")],
+        direction="pull",
+        manifest=manifest,
+    )
+
+    assert plan.new == [] and plan.conflicts == []
+
+
 # --- Symlinks never let a transfer leave the project boundary ---
 
 
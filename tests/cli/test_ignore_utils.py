@@ -5,6 +5,7 @@ from pathlib import Path
 
 from basic_memory.ignore_utils import (
     DEFAULT_IGNORE_PATTERNS,
+    compile_ignore_patterns,
     get_bmignore_path,
     load_gitignore_patterns,
     should_ignore_path,
@@ -330,3 +331,48 @@ temp_*
         assert len(filtered_files) == 2
         assert set(filtered_files) == set(expected_kept)
         assert ignored_count == 2  # debug.log, temp_file.txt
+
+
+def test_compiled_matcher_matches_every_pattern_form():
+    """The compiled matcher keeps root, directory, literal, and glob semantics."""
+    base = Path("/project")
+    matcher = compile_ignore_patterns(
+        {"/build/", "/*.log", "cache/", "node_modules", "*.tmp", "docs/*.draft", "a[1]"}
+    )
+
+    ignored = [
+        "build/out.md",
+        "app.log",
+        "notes/cache/x.md",
+        "src/node_modules/pkg.md",
+        "notes/scratch.tmp",
+        "docs/plan.draft",
+        "a1/x.md",
+    ]
+    kept = [
+        "notes/build/out.md",
+        "cache.md",
+        "a[1]x/y.md",
+        "other/docs/plan.draft.md",
+    ]
+    for relative in ignored:
+        assert matcher.ignores(base / relative, base), relative
+    for relative in kept:
+        assert not matcher.ignores(base / relative, base), relative
+    assert not matcher.ignores(Path("/elsewhere/scratch.tmp"), base)
+
+
+def test_compiled_matcher_is_reused_until_patterns_change(tmp_path):
+    """Scans share one matcher per pattern set; editing .gitignore yields a new one."""
+    (tmp_path / ".gitignore").write_text("drafts/\n")
+    matcher = compile_ignore_patterns(load_gitignore_patterns(tmp_path))
+
+    assert compile_ignore_patterns(load_gitignore_patterns(tmp_path)) is matcher
+    assert matcher.ignores(tmp_path / "drafts" / "a.md", tmp_path)
+
+    (tmp_path / ".gitignore").write_text("archive/\n")
+    updated = compile_ignore_patterns(load_gitignore_patterns(tmp_path))
+
+    assert updated is not matcher
+    assert not updated.ignores(tmp_path / "drafts" / "a.md", tmp_path)
+    assert updated.ignores(tmp_path / "archive" / "a.md", tmp_path)
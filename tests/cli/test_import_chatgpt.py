@@ -175,6 +175,20 @@ def test_import_chatgpt_command_invalid_json(tmp_path):
     assert "Error during import" in result.output
 
 
+def test_import_chatgpt_truncated_file_prints_resume_hint(tmp_path, sample_conversation):
+    """A source that breaks after complete conversations tells the user how to resume."""
+    config = get_project_config()
+    config.home = tmp_path
+    json_file = tmp_path / "conversations.json"
+    json_file.write_text(json.dumps([sample_conversation])[:-1] + ', {"title": ')
+
+    result = runner.invoke(app, ["import", "chatgpt", str(json_file), "--folder", "chats"])
+
+    assert result.exit_code == 1
+    assert "Error during import" in result.output
+    assert "--resume-from 1" in result.output
+
+
 def test_import_chatgpt_with_custom_folder(tmp_path, sample_chatgpt_json, monkeypatch):
     """Test import with custom conversations folder."""
     # Set up test environment
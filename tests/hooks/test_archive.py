@@ -69,6 +69,30 @@ async def test_flush_deduplicates_replays_within_and_across_sweeps(bm_home: Path
     assert len(list(inbox.processed_dir().glob("*.json"))) == 3
 
 
+async def test_flush_detects_replays_without_reading_the_archive(bm_home: Path) -> None:
+    _capture(ts="2026-07-15T10:00:01+00:00")
+    await flush()
+    _capture(ts="2026-07-15T10:00:41+00:00")
+
+    with patch.object(inbox, "envelope_from_json", side_effect=AssertionError("archive read")):
+        result = await flush()
+
+    assert result.archived == 0
+    assert result.duplicates == 1
+
+
+async def test_flush_backfills_ledger_from_existing_archive(bm_home: Path) -> None:
+    """Archives written before the ledger existed still deduplicate replays."""
+    inbox.mark_processed(_capture(ts="2026-07-15T10:00:01+00:00"))
+    _capture(ts="2026-07-15T10:00:41+00:00")
+    _capture(session_id="s-2")
+
+    result = await flush()
+
+    assert result.archived == 1
+    assert result.duplicates == 1
+
+
 async def test_flush_counts_invalid_envelopes_and_leaves_them(bm_home: Path) -> None:
     valid = _capture()
     broken = valid.parent / f"{'0' * 8}-0000-7000-8000-{'0' * 12}.json"
@@ -173,3 +173,37 @@ def test_record_flush_defaults_to_now(bm_home: Path) -> None:
 
     stamp = inbox.last_flush()
     assert stamp is not None and stamp.startswith("20")
+
+
+def test_processed_ledger_records_and_finds_replay_keys(bm_home: Path) -> None:
+    archived = inbox.mark_processed(inbox.write_envelope(_envelope()))
+
+    with inbox.processed_ledger() as ledger:
+        assert not ledger.contains("abc123")
+        ledger.record(archived, "abc123")
+
+    with inbox.processed_ledger() as ledger:
+        assert ledger.contains("abc123")
+
+
+def test_processed_ledger_rebuilds_unreadable_ledger_from_archive(bm_home: Path) -> None:
+    envelope = _envelope()
+    inbox.mark_processed(inbox.write_envelope(envelope))
+    (inbox.processed_dir() / inbox.LEDGER_FILE_NAME).write_bytes(b"not a sqlite database")
+
+    with inbox.processed_ledger() as ledger:
+        assert ledger.contains(envelope.idempotency_key)
+
+
+def test_prune_processed_compacts_ledger(bm_home: Path) -> None:
+    old = _write_processed_with_age(days_old=45)
+    fresh = _write_processed_with_age(days_old=5)
+    with inbox.processed_ledger() as ledger:
+        ledger.record(old, "old-key")
+        ledger.record(fresh, "fresh-key")
+
+    assert inbox.prune_processed(older_than_days=30) == 1
+
+    with inbox.processed_ledger() as ledger:
+        assert not ledger.contains("old-key")
+        assert ledger.contains("fresh-key")
@@ -2,7 +2,8 @@
 
 import pytest
 
-from basic_memory.importers.base import Importer
+from basic_memory.importers.base import ImportInterruptedError, Importer
+from basic_memory.importers.streaming import InvalidImportSourceError
 from basic_memory.markdown.entity_parser import EntityParser
 from basic_memory.markdown.markdown_processor import MarkdownProcessor
 from basic_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown
@@ -116,3 +117,108 @@ async def test_handle_error(test_importer):
     assert "Error occurred" in result.error_message
     assert "Test exception" in result.error_message
     assert result.import_count == {}
+
+
+def _note(title: str) -> EntityMarkdown:
+    return EntityMarkdown(
+        frontmatter=EntityFrontmatter(metadata={"title": title, "type": "note"}),
+        content=f"{title} content",
+        observations=[],
+        relations=[],
+    )
+
+
+class RecordingFileIndexer:
+    """Collects the batches passed to ``index_imported_files``."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def index_imported_files(self, file_paths):
+        self.batches.append(list(file_paths))
+        return len(file_paths)
+
+
+@pytest.mark.asyncio
+async def test_write_entities_writes_and_indexes_every_note(test_importer):
+    """The last item for a path wins, and every written file is indexed."""
+    indexer = RecordingFileIndexer()
+    test_importer.file_indexer = indexer
+    reported = []
+
+    async def entities():
+        for i in range(5):
+            yield "notes/same.md", _note(f"Version {i}")
+        yield "notes/other.md", _note("Other")
+
+    progress = await test_importer.write_entities(
+        entities(), resume_from=10, progress=reported.append
+    )
+
+    assert progress.checkpoint == 16
+    assert progress.notes_written == 6
+    assert progress.notes_indexed == sum(len(batch) for batch in indexer.batches)
+    assert {path for batch in indexer.batches for path in batch} == {
+        "notes/same.md",
+        "notes/other.md",
+    }
+    assert [update.notes_written for update in reported[:6]] == [1, 2, 3, 4, 5, 6]
+    content = (test_importer.base_path / "notes/same.md").read_text(encoding="utf-8")
+    assert "Version 4 content" in content
+
+
+@pytest.mark.asyncio
+async def test_write_entities_reports_checkpoint_of_failed_write(test_importer, monkeypatch):
+    """A failed write stops the import at the first note that was not written."""
+    original_write_entity = test_importer.write_entity
+
+    async def write_entity(entity, file_path):
+        if file_path == "notes/2.md":
+            raise OSError("disk full")
+        return await original_write_entity(entity, file_path)
+
+    monkeypatch.setattr(test_importer, "write_entity", write_entity)
+
+    async def entities():
+        for i in range(5):
+            yield f"notes/{i}.md", _note(f"Note {i}")
+
+    with pytest.raises(ImportInterruptedError, match="resume_from=2") as exc_info:
+        await test_importer.write_entities(entities())
+
+    assert exc_info.value.checkpoint == 2
+    assert (test_importer.base_path / "notes/1.md").exists()
+
+
+@pytest.mark.asyncio
+async def test_write_entities_source_error_carries_checkpoint(test_importer):
+    """A source that turns malformed mid-stream reports where a retry should resume."""
+    indexer = RecordingFileIndexer()
+    test_importer.file_indexer = indexer
+
+    async def entities():
+        for i in range(3):
+            yield f"notes/{i}.md", _note(f"Note {i}")
+        raise InvalidImportSourceError("unexpected end of input")
+
+    with pytest.raises(InvalidImportSourceError) as exc_info:
+        await test_importer.write_entities(entities(), resume_from=4)
+
+    assert exc_info.value.checkpoint == 7
+    assert {path for batch in indexer.batches for path in batch} == {
+        "notes/0.md",
+        "notes/1.md",
+        "notes/2.md",
+    }
+
+
+@pytest.mark.asyncio
+async def test_handle_interruption_reports_resume_from(test_importer):
+    """An interrupted import becomes a failed result with a structured checkpoint."""
+    error = ImportInterruptedError(3, OSError("disk full"))
+
+    result = test_importer.handle_interruption(error)
+
+    assert not result.success
+    assert result.resume_from == 3
+    assert "disk full" in result.error_message
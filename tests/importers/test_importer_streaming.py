@@ -0,0 +1,88 @@
+"""Tests for the incremental JSON import readers."""
+
+import io
+import json
+
+import pytest
+
+from basic_memory.importers import (
+    ImportSourceTooLargeError,
+    InvalidImportSourceError,
+    file_chunk_reader,
+    iter_json_array,
+    iter_json_lines,
+)
+from basic_memory.importers.streaming import iter_import_items
+
+
+async def _collect(items) -> list:
+    return [item async for item in items]
+
+
+def _reader(data: bytes):
+    return file_chunk_reader(io.BytesIO(data))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+async def test_iter_json_array_yields_items_across_chunk_boundaries(chunk_size):
+    items = [
+        {"title": "Café ☕", "mapping": {"a": [1, 2.5, None, True]}},
+        12345,
+        'text with "quotes" and ] brackets',
+        [],
+    ]
+    data = ("﻿ \n" + json.dumps(items, indent=2) + "\n").encode("utf-8")
+
+    assert await _collect(iter_json_array(_reader(data), chunk_size=chunk_size)) == items
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_handles_empty_array():
+    assert await _collect(iter_json_array(_reader(b" [ ] "), chunk_size=1)) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data",
+    [b"", b'{"a": 1}', b"[1 2]", b"[1, 2", b"[1] [2]", b'[{"a": }]', b"[\xff]"],
+)
+async def test_iter_json_array_rejects_invalid_sources(data):
+    with pytest.raises(InvalidImportSourceError):
+        await _collect(iter_json_array(_reader(data), chunk_size=2))
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_enforces_max_bytes():
+    data = json.dumps([{"message": "x" * 100}] * 3).encode("utf-8")
+
+    with pytest.raises(ImportSourceTooLargeError, match="maximum size of 64 bytes"):
+        await _collect(iter_json_array(_reader(data), max_bytes=64, chunk_size=16))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 4096])
+async def test_iter_json_lines_splits_lines_across_chunks(chunk_size):
+    data = b'{"type": "entity"}\r\n{"type": "relation"}\n{"n": 1}'
+
+    assert await _collect(iter_json_lines(_reader(data), chunk_size=chunk_size)) == [
+        {"type": "entity"},
+        {"type": "relation"},
+        {"n": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_json_lines_rejects_invalid_line():
+    with pytest.raises(InvalidImportSourceError):
+        await _collect(iter_json_lines(_reader(b'{"type": "entity"}\n{"type": \n')))
+
+
+@pytest.mark.asyncio
+async def test_iter_import_items_skips_leading_items():
+    async def stream():
+        for item in range(5):
+            yield item
+
+    assert await _collect(iter_import_items(range(5), start=2)) == [2, 3, 4]
+    assert await _collect(iter_import_items(stream(), start=3)) == [3, 4]
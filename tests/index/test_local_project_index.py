@@ -17,12 +17,14 @@ from basic_memory import db
 from basic_memory.index.local_dependencies import LocalIndexProjectDependencies
 from basic_memory.index.local_project import (
     IndexedFileStat,
+    LocalIndexFileBatchReader,
     LocalProjectIndexBatchEnqueuer,
     LocalProjectIndexDeletePathVerifier,
     LocalProjectIndexObservedFileSource,
     LocalProjectIndexRuntime,
     LocalProjectIndexRuntimeFactory,
     LocalProjectIndexScan,
+    LocalProjectScanStatHandoff,
     RepositoryLocalProjectIndexedFileStatSource,
     local_project_index_file_paths,
     run_local_project_index,
@@ -178,15 +180,16 @@ async def test_local_project_index_observed_file_source_drops_confirmed_missing_
     ghost.write_bytes(b"# Ghost\n")
 
     file_service = FileService(tmp_path)
-    original_get_file_metadata = file_service.get_file_metadata
+    original_compute_checksum = file_service.compute_checksum
 
-    async def vanishing_metadata(path):
+    # The walk already stat'ed both files, so the first post-walk touch is the hash.
+    async def vanishing_checksum(path):
         if str(path).endswith("ghost.md"):
             ghost.unlink(missing_ok=True)
             raise FileNotFoundError(str(path))
-        return await original_get_file_metadata(path)
+        return await original_compute_checksum(path)
 
-    monkeypatch.setattr(file_service, "get_file_metadata", vanishing_metadata)
+    monkeypatch.setattr(file_service, "compute_checksum", vanishing_checksum)
 
     observed = await LocalProjectIndexObservedFileSource(
         file_service,
@@ -206,13 +209,13 @@ async def test_local_project_index_observed_file_source_carries_files_when_probe
 
     file_service = FileService(tmp_path)
 
-    async def failing_metadata(path):
+    async def failing_checksum(path):
         raise FileOperationError("mount error")
 
     async def failing_exists(path):
         raise FileOperationError("mount error")
 
-    monkeypatch.setattr(file_service, "get_file_metadata", failing_metadata)
+    monkeypatch.setattr(file_service, "compute_checksum", failing_checksum)
     monkeypatch.setattr(file_service, "exists", failing_exists)
 
     observed = await LocalProjectIndexObservedFileSource(
@@ -2802,6 +2805,40 @@ async def test_local_project_index_observed_source_reuses_checksum_when_stat_mat
     assert set(hashed_paths) == {"notes/remtimed.md", "notes/resized.md", "notes/new.md"}
 
 
+async def test_local_project_index_observed_source_samples_stat_matched_files_for_hashing(
+    tmp_path: Path,
+) -> None:
+    """Sampled verification hashes stat-matched files and catches edits that kept the stat."""
+    (tmp_path / "notes").mkdir()
+    edited = tmp_path / "notes" / "edited.md"
+    edited.write_bytes(b"# Before\n")
+    original_stat = os.stat(edited)
+    edited.write_bytes(b"# After!\n")
+    os.utime(edited, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    indexed_stats = {
+        "notes/edited.md": IndexedFileStat(
+            mtime=original_stat.st_mtime,
+            size=original_stat.st_size,
+            checksum=sha256(b"# Before\n").hexdigest(),
+        ),
+    }
+
+    async def observe(sample_rate: float) -> RuntimeObservedIndexFile:
+        (observed,) = await LocalProjectIndexObservedFileSource(
+            FileService(tmp_path),
+            ignore_patterns=set(),
+            indexed_stat_source=_StaticIndexedFileStatSource(indexed_stats),
+            checksum_verify_sample_rate=sample_rate,
+            checksum_verify_sampler=lambda: 0.5,
+        ).list_observed_index_files()
+        return observed
+
+    # Below the sample rate the stat gate alone decides, so the edit goes unseen.
+    assert (await observe(0.25)).checksum == sha256(b"# Before\n").hexdigest()
+    # Sampled: the file is hashed and its real checksum flows into change detection.
+    assert (await observe(0.75)).checksum == sha256(b"# After!\n").hexdigest()
+
+
 async def test_local_project_index_observed_source_carries_indexed_files_under_unreadable_directory(
     tmp_path: Path,
     monkeypatch,
@@ -2894,6 +2931,50 @@ async def test_local_project_index_observed_source_hashes_without_stat_source(
     assert hashed_paths == ["notes/a.md"]
 
 
+async def test_local_project_index_scan_stats_reach_the_batch_reader_once(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    """The walk's stat feeds observation and reads; only a changed file is re-stat'ed."""
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "a.md").write_bytes(b"# A\n")
+    (tmp_path / "notes" / "b.md").write_bytes(b"# B\n")
+
+    file_service = FileService(tmp_path)
+    original_get_file_metadata = file_service.get_file_metadata
+    stat_paths: list[str] = []
+
+    async def tracking_metadata(path):
+        stat_paths.append(str(path))
+        return await original_get_file_metadata(path)
+
+    monkeypatch.setattr(file_service, "get_file_metadata", tracking_metadata)
+    stat_handoff = LocalProjectScanStatHandoff()
+
+    observed = await LocalProjectIndexObservedFileSource(
+        file_service,
+        ignore_patterns=set(),
+        stat_handoff=stat_handoff,
+    ).list_observed_index_files()
+
+    assert [target.path for target in observed] == ["notes/a.md", "notes/b.md"]
+    assert stat_paths == []
+
+    # notes/b.md changes size between the scan and the read.
+    (tmp_path / "notes" / "b.md").write_bytes(b"# B, longer\n")
+    reader = LocalIndexFileBatchReader(file_service, stat_handoff=stat_handoff)
+    a_read = await reader.read_current_file("notes/a.md")
+    b_read = await reader.read_current_file("notes/b.md")
+
+    assert a_read.file is not None and a_read.file.size == len(b"# A\n")
+    assert b_read.file is not None and b_read.file.size == len(b"# B, longer\n")
+    assert stat_paths == ["notes/b.md"]
+
+    # The handoff is spent: a later read of the same path stats normally.
+    await reader.read_current_file("notes/a.md")
+    assert stat_paths == ["notes/b.md", "notes/a.md"]
+
+
 async def test_repository_indexed_file_stat_source_loads_indexed_rows(
     test_project: Project,
     entity_repository,
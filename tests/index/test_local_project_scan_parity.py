@@ -1,6 +1,7 @@
 """Local project scan parity with the legacy sync oracle."""
 
 import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ import basic_memory.index.local_project as local_project
 from basic_memory.index.local_project import (
     LocalProjectIndexObservedFileSource,
     LocalProjectIndexScan,
+    LocalProjectScannedFile,
     local_project_index_file_paths,
     record_local_project_scan_walk_error,
     scan_local_project_index_files,
@@ -16,6 +18,45 @@ from basic_memory.index.local_project import (
 from basic_memory.services import FileService
 
 
+class _Listing:
+    """Context-managed directory listing standing in for an os.scandir iterator."""
+
+    def __init__(self, entries: Iterator[object]) -> None:
+        self._entries = entries
+
+    def __enter__(self) -> Iterator[object]:
+        return self._entries
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _StatFailingEntry:
+    """DirEntry proxy whose stat fails, like a file that turns unreadable mid-scan."""
+
+    def __init__(self, entry: os.DirEntry[str]) -> None:
+        self._entry = entry
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._entry, name)
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        raise PermissionError("permission denied")
+
+
+def _patch_scandir(
+    monkeypatch,
+    listing: Callable[[str, list[os.DirEntry[str]]], Iterator[object]],
+) -> None:
+    real_scandir = os.scandir
+
+    def scandir(path: str) -> _Listing:
+        with real_scandir(path) as entries:
+            return _Listing(listing(str(path), list(entries)))
+
+    monkeypatch.setattr(local_project.os, "scandir", scandir)
+
+
 def test_local_project_index_file_paths_skips_unreadable_entries(
     monkeypatch,
     tmp_path: Path,
@@ -26,14 +67,11 @@ def test_local_project_index_file_paths_skips_unreadable_entries(
     accessible_path.write_text("# Accessible\n", encoding="utf-8")
     unreadable_path.write_text("# Restricted\n", encoding="utf-8")
 
-    original_is_file = Path.is_file
+    def listing(path: str, entries: list[os.DirEntry[str]]) -> Iterator[object]:
+        for entry in entries:
+            yield _StatFailingEntry(entry) if entry.path == str(unreadable_path) else entry
 
-    def is_file_or_permission_error(path: Path) -> bool:
-        if path == unreadable_path:
-            raise PermissionError("permission denied")
-        return original_is_file(path)
-
-    monkeypatch.setattr(Path, "is_file", is_file_or_permission_error)
+    _patch_scandir(monkeypatch, listing)
 
     assert local_project_index_file_paths(tmp_path, ignore_patterns=set()) == ("accessible.md",)
 
@@ -44,16 +82,22 @@ def test_local_project_index_file_paths_keeps_discovered_files_when_walk_fails(
 ) -> None:
     """A traversal error should not discard files discovered before the error."""
     project_root = tmp_path.resolve()
-    accessible_path = project_root / "accessible.md"
-    accessible_path.write_text("# Accessible\n", encoding="utf-8")
+    (project_root / "accessible.md").write_text("# Accessible\n", encoding="utf-8")
+    broken_dir = project_root / "broken"
+    broken_dir.mkdir()
+    (broken_dir / "note.md").write_text("# Broken\n", encoding="utf-8")
 
-    def walk_then_permission_error(top, *args, **kwargs):
-        yield (str(project_root), [], ["accessible.md"])
-        raise PermissionError("permission denied")
+    def listing(path: str, entries: list[os.DirEntry[str]]) -> Iterator[object]:
+        yield from entries
+        if path == str(broken_dir):
+            raise PermissionError(13, "Permission denied", path)
+
+    _patch_scandir(monkeypatch, listing)
 
-    monkeypatch.setattr(local_project.os, "walk", walk_then_permission_error)
+    scan = scan_local_project_index_files(project_root, ignore_patterns=set())
 
-    assert local_project_index_file_paths(project_root, ignore_patterns=set()) == ("accessible.md",)
+    assert scan.file_paths == ("accessible.md",)
+    assert scan.unreadable_directories == ("broken",)
 
 
 def test_local_project_index_file_paths_prunes_ignored_directories(
@@ -71,20 +115,18 @@ def test_local_project_index_file_paths_prunes_ignored_directories(
     (hidden / "secret.md").write_text("# secret\n", encoding="utf-8")
 
     visited: list[str] = []
-    original_is_file = Path.is_file
 
-    def recording_is_file(path: Path) -> bool:
-        visited.append(str(path))
-        return original_is_file(path)
+    def listing(path: str, entries: list[os.DirEntry[str]]) -> Iterator[object]:
+        visited.append(path)
+        return iter(entries)
 
-    monkeypatch.setattr(Path, "is_file", recording_is_file)
+    _patch_scandir(monkeypatch, listing)
 
     result = local_project_index_file_paths(project_root, ignore_patterns={"node_modules"})
 
     assert result == ("keep.md",)
-    # Pruning means the walker never descended into (or stat'd) the ignored dirs.
-    assert not any("node_modules" in path for path in visited)
-    assert not any(".hidden" in path for path in visited)
+    # Pruning means the walker never listed (or stat'd) the ignored dirs.
+    assert visited == [str(project_root)]
 
 
 def test_scan_local_project_index_files_records_unreadable_subdirectory(
@@ -98,20 +140,15 @@ def test_scan_local_project_index_files_records_unreadable_subdirectory(
     locked_dir.mkdir()
     (locked_dir / "note.md").write_text("# locked\n", encoding="utf-8")
 
-    real_walk = os.walk
+    real_scandir = os.scandir
 
-    def walk_with_locked_scandir_error(top, *, followlinks, onerror):
-        # Emulate exactly what os.walk does when scandir(locked) fails: report
-        # the directory through onerror and never yield its listing.
-        for dirpath, dirnames, filenames in real_walk(
-            top, followlinks=followlinks, onerror=onerror
-        ):
-            if Path(dirpath) == locked_dir:
-                onerror(PermissionError(13, "Permission denied", str(locked_dir)))
-                continue
-            yield dirpath, dirnames, filenames
+    def scandir_with_locked_error(path: str):
+        # Emulate exactly what the kernel reports when listing locked fails.
+        if Path(path) == locked_dir:
+            raise PermissionError(13, "Permission denied", str(locked_dir))
+        return real_scandir(path)
 
-    monkeypatch.setattr(local_project.os, "walk", walk_with_locked_scandir_error)
+    monkeypatch.setattr(local_project.os, "scandir", scandir_with_locked_error)
 
     scan = scan_local_project_index_files(project_root, ignore_patterns=set())
 
@@ -119,6 +156,27 @@ def test_scan_local_project_index_files_records_unreadable_subdirectory(
     assert scan.unreadable_directories == ("locked",)
 
 
+def test_scan_local_project_index_files_records_one_stat_per_file(tmp_path: Path) -> None:
+    """The walk reports each file's stat so later stages need not stat it again."""
+    project_root = tmp_path.resolve()
+    (project_root / "notes").mkdir()
+    note = project_root / "notes" / "a.md"
+    note.write_text("# A\n", encoding="utf-8")
+
+    scan = scan_local_project_index_files(project_root, ignore_patterns=set())
+
+    note_stat = note.stat()
+    assert scan.files == (
+        LocalProjectScannedFile(
+            path="notes/a.md",
+            size=note_stat.st_size,
+            mtime_ns=note_stat.st_mtime_ns,
+            ctime_ns=note_stat.st_ctime_ns,
+            inode=note_stat.st_ino,
+        ),
+    )
+
+
 def test_record_local_project_scan_walk_error_classifies_root_none_and_subtree(
     tmp_path: Path,
 ) -> None:
@@ -192,6 +192,71 @@ async def test_batch_indexer_parses_markdown_with_parallel_path(
     assert result.errors == []
 
 
+@pytest.mark.asyncio
+async def test_batch_indexer_parses_markdown_in_worker_processes(
+    app_config,
+    entity_service,
+    entity_repository,
+    relation_repository,
+    search_service,
+    file_service,
+    project_config,
+):
+    for name in ("alpha", "beta"):
+        await _create_file(
+            project_config.home / f"notes/{name}.md",
+            dedent(
+                f"""
+                ---
+                title: {name.title()}
+                type: note
+                created: 2024-01-15
+                ---
+                # {name.title()}
+
+                - [idea] {name} runs in a worker
+                - links_to [[Shared Target]]
+                """
+            ).strip(),
+        )
+    files = {
+        path: await _load_input(file_service, path) for path in ("notes/alpha.md", "notes/beta.md")
+    }
+    batch_indexer = _make_batch_indexer(
+        app_config.model_copy(update={"index_parse_workers": 2}),
+        entity_service,
+        entity_repository,
+        relation_repository,
+        search_service,
+        file_service,
+    )
+    assert batch_indexer.parse_pool is not None
+
+    async def fail_inline_parse(*args, **kwargs):
+        raise AssertionError("multi-file batches should parse in the worker pool")
+
+    original_parse = entity_service.entity_parser.parse_markdown_content
+    entity_service.entity_parser.parse_markdown_content = fail_inline_parse
+    try:
+        result = await batch_indexer.index_files(files, max_concurrent=2)
+    finally:
+        entity_service.entity_parser.parse_markdown_content = original_parse
+        batch_indexer.parse_pool.shutdown()
+
+    assert result.errors == []
+    indexed = {item.path: item for item in result.indexed}
+    assert set(indexed) == set(files)
+    assert [obs.content for obs in indexed["notes/alpha.md"].observations] == [
+        "alpha runs in a worker"
+    ]
+    assert [rel.target_name for rel in indexed["notes/beta.md"].relations] == ["Shared Target"]
+    async with db.scoped_session(search_service.session_maker) as session:
+        alpha = await entity_repository.get_by_file_path(session, "notes/alpha.md")
+    assert alpha is not None
+    assert alpha.title == "Alpha"
+    assert alpha.created_at.date().isoformat() == "2024-01-15"
+
+
 @pytest.mark.asyncio
 async def test_batch_indexer_creates_entities_with_real_db_session(
     app_config,
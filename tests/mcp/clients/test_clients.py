@@ -157,6 +157,57 @@ class TestKnowledgeClient:
         assert result.external_id == "entity-uuid-123"
         assert result.project_external_id == "project-uuid-456"
 
+    @pytest.mark.asyncio
+    async def test_resolve_entity_reuses_answers_until_a_write(self, monkeypatch):
+        """A client remembers resolutions; a write through any client forgets them."""
+        resolves = []
+
+        async def mock_call_post(client, url, **kwargs):
+            resolves.append(url)
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"external_id": f"entity-{len(resolves)}"}
+            return mock_response
+
+        async def mock_call_delete(client, url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"deleted": True}
+            return mock_response
+
+        monkeypatch.setattr("basic_memory.mcp.tools.utils.call_post", mock_call_post)
+        monkeypatch.setattr("basic_memory.mcp.tools.utils.call_delete", mock_call_delete)
+
+        http_client = MagicMock()
+        client = KnowledgeClient(http_client, "proj-cache")
+        assert await client.resolve_entity("my-note") == "entity-1"
+        assert await client.resolve_entity("my-note") == "entity-1"
+        assert await client.resolve_entity("my-note", strict=True) == "entity-2"
+        assert len(resolves) == 2
+
+        await KnowledgeClient(MagicMock(), "proj-cache").delete_entity("entity-1")
+
+        assert await client.resolve_entity("my-note") == "entity-3"
+        assert len(resolves) == 3
+
+    @pytest.mark.asyncio
+    async def test_resolve_entity_cache_hands_out_copies(self, monkeypatch):
+        """Mutating a resolved payload leaves the cached answer untouched."""
+
+        async def mock_call_post(client, url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"external_id": "entity-1", "project": {"id": 1}}
+            return mock_response
+
+        monkeypatch.setattr("basic_memory.mcp.tools.utils.call_post", mock_call_post)
+
+        client = KnowledgeClient(MagicMock(), "proj-copies")
+        first = await client._resolve_entity_data("my-note")
+        first["external_id"] = "mutated"
+        first["project"]["id"] = 2
+
+        again = await client._resolve_entity_data("my-note")
+        assert again == {"external_id": "entity-1", "project": {"id": 1}}
+        assert again is not first
+
     @pytest.mark.asyncio
     async def test_index_file(self, monkeypatch):
         """Test index_file posts the file path to the index-file endpoint."""
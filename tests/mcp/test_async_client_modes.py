@@ -10,6 +10,8 @@ from basic_memory.mcp import async_client as async_client_module
 from basic_memory.mcp.async_client import (
     get_client,
     get_cloud_control_plane_client,
+    get_cloud_proxy_client,
+    pooled_clients,
     set_client_factory,
 )
 
@@ -657,3 +659,95 @@ async def test_get_client_workspace_selector_without_credentials_fails_fast(
     with pytest.raises(RuntimeError, match="cloud workspace was requested"):
         async with get_client(workspace="team-slug"):
             pass
+
+
+@pytest.mark.asyncio
+async def test_pooled_clients_reuse_one_client_per_route(config_manager):
+    cfg = config_manager.load_config()
+    cfg.cloud_host = "https://cloud.example.test"
+    cfg.cloud_api_key = "bmc_test_key_123"
+    config_manager.save_config(cfg)
+
+    async with pooled_clients():
+        async with get_client(workspace="tenant-a") as first:
+            pass
+        async with get_client(workspace="tenant-a") as again:
+            assert again is first
+        async with get_client(workspace="tenant-b") as other:
+            assert other is not first
+            assert other.headers.get("X-Workspace-ID") == "tenant-b"
+        assert not first.is_closed
+
+    assert first.is_closed
+    assert other.is_closed
+    # Outside the pool every call builds, and closes, its own client again.
+    async with get_client(workspace="tenant-a") as fresh:
+        assert fresh is not first
+    assert fresh.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pooled_cloud_client_survives_token_refresh(config_manager, monkeypatch):
+    cfg = config_manager.load_config()
+    cfg.cloud_host = "https://cloud.example.test"
+    config_manager.save_config(cfg)
+
+    tokens = iter(["token-1", "token-2"])
+
+    async def refreshed_token(config):
+        return next(tokens)
+
+    monkeypatch.setattr(async_client_module, "_resolve_cloud_token", refreshed_token)
+
+    async with pooled_clients():
+        async with get_cloud_proxy_client(workspace="tenant-a") as first:
+            assert first.headers["Authorization"] == "Bearer token-1"
+        async with get_cloud_proxy_client(workspace="tenant-a") as again:
+            # A refreshed token reuses the route's client rather than pooling another.
+            assert again is first
+            assert again.headers["Authorization"] == "Bearer token-2"
+        assert not first.is_closed
+
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pooled_local_client_prepares_the_database_once(config_manager, monkeypatch):
+    from basic_memory import db
+    from basic_memory.api.app import app as fastapi_app
+
+    cfg = config_manager.load_config()
+    config_manager.save_config(cfg)
+
+    previous_engine = getattr(fastapi_app.state, "engine", None)
+    previous_session_maker = getattr(fastapi_app.state, "session_maker", None)
+    fastapi_app.state._state.pop("engine", None)  # pyright: ignore[reportPrivateUsage]
+    fastapi_app.state._state.pop("session_maker", None)  # pyright: ignore[reportPrivateUsage]
+
+    engine = object()
+    calls = []
+
+    async def fake_get_or_create_db(db_path):
+        calls.append(db_path)
+        return engine, object()
+
+    monkeypatch.setattr(db, "get_or_create_db", fake_get_or_create_db)
+
+    try:
+        async with pooled_clients():
+            for _ in range(3):
+                async with get_client() as client:
+                    assert isinstance(client._transport, httpx.ASGITransport)  # pyright: ignore[reportPrivateUsage]
+                assert fastapi_app.state.engine is engine
+            assert calls == [cfg.database_path]
+
+        assert not hasattr(fastapi_app.state, "engine")
+    finally:
+        if previous_engine is None:
+            fastapi_app.state._state.pop("engine", None)  # pyright: ignore[reportPrivateUsage]
+        else:
+            fastapi_app.state.engine = previous_engine
+        if previous_session_maker is None:
+            fastapi_app.state._state.pop("session_maker", None)  # pyright: ignore[reportPrivateUsage]
+        else:
+            fastapi_app.state.session_maker = previous_session_maker
@@ -61,8 +61,10 @@ async def test_mcp_lifespan_disables_cache_when_startup_invalidation_is_unavaila
         redis_url: str | None,
         *,
         max_connections: int,
+        memory_max_bytes: int,
+        memory_generation_ttl_seconds: float,
     ) -> AsyncIterator[UnavailableStartupCache]:
-        del redis_url, max_connections
+        del redis_url, max_connections, memory_max_bytes, memory_generation_ttl_seconds
         yield cache
 
     monkeypatch.setattr(server_module, "open_redis_read_cache", open_unavailable_cache)
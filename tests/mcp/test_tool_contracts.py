@@ -112,6 +112,7 @@ EXPECTED_TOOL_SIGNATURES: dict[str, list[str]] = {
         "tags",
         "status",
         "min_similarity",
+        "cursor",
     ],
     "view_note": ["identifier", "project", "project_id"],
     "write_note": [
@@ -695,3 +695,119 @@ async def test_recent_activity_entity_rows_include_external_id(client, test_grap
     assert any(re.search(uuid_pattern, line) for line in entity_lines), (
         f"entity rows missing external_id: {entity_lines!r}"
     )
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_discovery_fans_out_with_cap_and_partial_results(monkeypatch):
+    """Discovery mode queries projects concurrently and keeps healthy projects on failure."""
+    import asyncio
+    import importlib
+
+    recent_activity_module = importlib.import_module("basic_memory.mcp.tools.recent_activity")
+    monkeypatch.setattr(recent_activity_module, "DISCOVERY_MAX_CONCURRENT_PROJECTS", 2)
+    monkeypatch.setattr(recent_activity_module, "DISCOVERY_PROJECT_TIMEOUT_SECONDS", 0.2)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_get_project_activity(client, project_info, params, depth):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(5 if project_info.name == "slow" else 0.01)
+            if project_info.name == "broken":
+                raise RuntimeError("project unavailable")
+            return project_info.name
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(recent_activity_module, "_get_project_activity", fake_get_project_activity)
+
+    class P:
+        def __init__(self, name):
+            self.name = name
+
+    names = ["a", "slow", "b", "broken", "c"]
+    results = await recent_activity_module._gather_project_activity(
+        None, cast(Any, [P(name) for name in names]), {}, 1
+    )
+
+    assert results[0::2] == ["a", "b", "c"]
+    assert isinstance(results[1], TimeoutError)
+    assert isinstance(results[3], RuntimeError)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_discovery_json_lists_unavailable_projects(monkeypatch):
+    """Discovery JSON output marks projects whose activity could not be fetched."""
+    import importlib
+    from contextlib import asynccontextmanager
+    from unittest.mock import MagicMock
+
+    recent_activity_module = importlib.import_module("basic_memory.mcp.tools.recent_activity")
+
+    now = datetime.now(timezone.utc)
+    activity = GraphContext(
+        results=[
+            ContextResult(
+                primary_result=EntitySummary(
+                    external_id="550e8400-e29b-41d4-a716-446655440003",
+                    entity_id=3,
+                    permalink="docs/healthy",
+                    title="Healthy Note",
+                    content=None,
+                    file_path="docs/healthy.md",
+                    created_at=now,
+                ),
+                observations=[],
+                related_results=[],
+            )
+        ],
+        metadata=MemoryMetadata(depth=1, generated_at=now),
+    )
+
+    async def no_project(*args, **kwargs):
+        return None
+
+    @asynccontextmanager
+    async def fake_client():
+        yield MagicMock()
+
+    async def fake_call_get(client, url, **kwargs):
+        response = MagicMock()
+        response.json.return_value = {
+            "projects": [
+                {"id": 1, "external_id": "p-1", "name": "healthy", "path": "/healthy"},
+                {"id": 2, "external_id": "p-2", "name": "broken", "path": "/broken"},
+            ],
+            "default_project": None,
+        }
+        return response
+
+    async def fake_gather(client, projects, params, depth):
+        return [
+            ProjectActivity(
+                project_name="healthy",
+                project_path="/healthy",
+                activity=activity,
+                item_count=1,
+                last_activity=now,
+                active_folders=["docs"],
+            ),
+            RuntimeError("project unavailable"),
+        ]
+
+    monkeypatch.setattr(recent_activity_module, "resolve_project_parameter", no_project)
+    monkeypatch.setattr(recent_activity_module, "get_client", fake_client)
+    monkeypatch.setattr(recent_activity_module, "call_get", fake_call_get)
+    monkeypatch.setattr(recent_activity_module, "_gather_project_activity", fake_gather)
+
+    rows = await recent_activity(output_format="json")
+
+    assert [row["project"] for row in rows] == ["healthy", "broken"]
+    assert rows[0]["title"] == "Healthy Note"
+    assert "unavailable" not in rows[0]
+    assert rows[1]["unavailable"] is True
+    assert rows[1]["title"] is None
@@ -7,6 +7,7 @@ import pytest
 from fastmcp.exceptions import ToolError
 from httpx import HTTPStatusError, Request
 
+from basic_memory.mcp.local_dispatch import DispatchedResponse, enable_local_dispatch
 from basic_memory.mcp.tools.utils import (
     call_delete,
     call_get,
@@ -340,3 +341,106 @@ async def test_call_post_with_json(mock_response):
     method, _args, kwargs = client.calls[0]
     assert method == "post"
     assert kwargs["json"] == json_data
+
+
+@pytest.mark.asyncio
+async def test_local_dispatch_matches_the_http_path(client, app, test_project, monkeypatch):
+    """In-process dispatch returns what the ASGI transport would, errors included."""
+    knowledge_url = f"/v2/projects/{test_project.external_id}/knowledge"
+    created = await call_post(
+        client,
+        f"{knowledge_url}/entities",
+        json={"title": "Dispatched", "directory": "notes", "content": "body"},
+    )
+    entity_url = f"{knowledge_url}/entities/{created.json()['external_id']}"
+    over_http = await call_get(client, entity_url)
+    with pytest.raises(ToolError) as http_error:
+        await call_get(client, f"{knowledge_url}/entities/missing")
+
+    enable_local_dispatch(client, app)
+
+    async def no_http(*args, **kwargs):
+        raise AssertionError("dispatched requests must not reach the transport")
+
+    monkeypatch.setattr(client, "send", no_http)
+
+    dispatched = await call_get(client, entity_url)
+    assert isinstance(dispatched, DispatchedResponse)
+    assert dispatched.json() == over_http.json()
+
+    resolved = await call_post(
+        client, f"{knowledge_url}/resolve", json={"identifier": created.json()["permalink"]}
+    )
+    assert resolved.json()["external_id"] == created.json()["external_id"]
+
+    with pytest.raises(ToolError) as exc:
+        await call_get(client, f"{knowledge_url}/entities/missing")
+    assert str(exc.value) == str(http_error.value)
+    assert isinstance(exc.value.__cause__, HTTPStatusError)
+    assert exc.value.__cause__.response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_local_dispatch_runs_sync_exception_handlers(client, app, test_project, monkeypatch):
+    """Sync exception handlers are called the way Starlette calls them, not awaited."""
+    from starlette.exceptions import HTTPException
+    from starlette.responses import JSONResponse
+
+    from basic_memory.mcp.local_dispatch import dispatch_request
+
+    def sync_handler(request, exc):
+        return JSONResponse({"detail": f"sync: {exc.detail}"}, status_code=exc.status_code)
+
+    monkeypatch.setitem(app.exception_handlers, HTTPException, sync_handler)
+    enable_local_dispatch(client, app)
+
+    response = await dispatch_request(
+        client, "GET", f"/v2/projects/{test_project.external_id}/knowledge/entities/missing"
+    )
+
+    assert response is not None
+    assert response.status_code == 404
+    assert response.json()["detail"].startswith("sync: ")
+
+
+def test_local_dispatch_fastapi_internals_are_unchanged():
+    """Fail loudly when a FastAPI release changes the internals local dispatch relies on."""
+    import inspect
+
+    from fastapi.dependencies import utils as dependency_utils
+    from fastapi.routing import run_endpoint_function, serialize_response
+
+    from basic_memory.mcp import local_dispatch
+
+    def parameters(function) -> set[str]:
+        return set(inspect.signature(function).parameters)
+
+    assert {
+        "request",
+        "dependant",
+        "body",
+        "dependency_overrides_provider",
+        "async_exit_stack",
+        "embed_body_fields",
+    } <= parameters(dependency_utils.solve_dependencies)
+    assert {"dependant", "values", "is_coroutine"} <= parameters(run_endpoint_function)
+    assert {
+        "field",
+        "response_content",
+        "include",
+        "exclude",
+        "by_alias",
+        "exclude_unset",
+        "exclude_defaults",
+        "exclude_none",
+        "is_coroutine",
+    } <= parameters(serialize_response)
+
+    # Dependencies with yield find their exit stacks under these request-scope keys.
+    dependency_source = inspect.getsource(dependency_utils)
+    assert '"fastapi_inner_astack"' in dependency_source
+    assert '"fastapi_function_astack"' in dependency_source
+
+    routes = local_dispatch._routes()
+    assert routes
+    assert all(isinstance(route._embed_body_fields, bool) for route in routes)
@@ -1,7 +1,9 @@
 """Tests for optional multi-project search_notes behavior."""
 
+import asyncio
 from contextlib import asynccontextmanager
 import importlib
+from typing import Any
 
 from httpx import HTTPStatusError, Request, Response
 from fastmcp.exceptions import ToolError
@@ -450,3 +452,142 @@ async def test_search_notes_search_all_projects_local_omits_project_id(monkeypat
     )
     assert result["total"] == 2
     assert result["total_is_exact"] is True
+
+
+def _serve_scored_projects(monkeypatch, scores: dict[str, list[float]]) -> dict[str, Any]:
+    """Route every project's search to a stub that pages through ``scores`` in order."""
+    clients_mod = importlib.import_module("basic_memory.mcp.clients")
+    search_mod = importlib.import_module("basic_memory.mcp.tools.search")
+
+    project_refs = [{"project": name, "project_id": None} for name in scores]
+    stats: dict[str, Any] = {"requested_pages": [], "in_flight": 0, "max_in_flight": 0}
+
+    async def fake_load_search_project_refs(context=None):
+        return project_refs
+
+    class StubProject:
+        def __init__(self, name: str):
+            self.name = name
+            self.external_id = name
+
+    @asynccontextmanager
+    async def fake_get_project_client(project=None, context=None, project_id=None):
+        yield object(), StubProject(project)
+
+    async def fake_resolve_project_and_path(client, identifier, project=None, context=None):
+        return StubProject(project), identifier, False
+
+    class MockSearchClient:
+        def __init__(self, client, project_id):
+            self.project = project_id
+
+        async def search(self, payload, page, page_size):
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            await asyncio.sleep(0)
+            stats["in_flight"] -= 1
+            stats["requested_pages"].append((self.project, page, page_size))
+            start = (page - 1) * page_size
+            project_scores = scores[self.project]
+            return SearchResponse(
+                results=[
+                    SearchResult(
+                        title=f"{self.project} {index}",
+                        permalink=f"main/{self.project}-{index}",
+                        content="MCP content",
+                        type=SearchItemType.ENTITY,
+                        score=project_scores[index],
+                        file_path=f"/main/{self.project}-{index}.md",
+                    )
+                    for index in range(start, min(start + page_size, len(project_scores)))
+                ],
+                current_page=page,
+                page_size=page_size,
+                total=len(project_scores),
+                total_is_exact=True,
+                has_more=start + page_size < len(project_scores),
+            )
+
+    monkeypatch.setattr(search_mod, "_load_search_project_refs", fake_load_search_project_refs)
+    monkeypatch.setattr(search_mod, "get_project_client", fake_get_project_client)
+    monkeypatch.setattr(search_mod, "resolve_project_and_path", fake_resolve_project_and_path)
+    monkeypatch.setattr(clients_mod, "SearchClient", MockSearchClient)
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_search_notes_search_all_projects_pages_merged_results_with_cursor(
+    monkeypatch, local_routing
+):
+    """Projects are searched concurrently and a cursor pages the merge one window at a time."""
+    search_mod = importlib.import_module("basic_memory.mcp.tools.search")
+    stats = _serve_scored_projects(
+        monkeypatch,
+        {
+            "alpha": [0.95, 0.8, 0.6, 0.4, 0.2],
+            "beta": [0.9, 0.85, 0.5, 0.3],
+        },
+    )
+
+    pages: list[list[float]] = []
+    current_pages: list[int] = []
+    cursor = None
+    while True:
+        result = await search_mod.search_notes(
+            query="MCP Test Note",
+            search_all_projects=True,
+            page_size=3,
+            cursor=cursor,
+            output_format="json",
+        )
+        assert isinstance(result, dict)
+        assert result["total"] == 9
+        pages.append([item["score"] for item in result["results"]])
+        current_pages.append(result["current_page"])
+        cursor = result.get("next_cursor")
+        assert result["has_more"] is (cursor is not None)
+        if cursor is None:
+            break
+
+    assert pages == [[0.95, 0.9, 0.85], [0.8, 0.6, 0.5], [0.4, 0.3, 0.2]]
+    # The cursor carries the page it resumes, so current_page still counts pages.
+    assert current_pages == [1, 2, 3]
+    assert stats["max_in_flight"] == 2
+    # Every project is read one page-size window per call, never page * page_size rows.
+    assert {page_size for _, _, page_size in stats["requested_pages"]} == {3}
+
+    with pytest.raises(ValueError, match="different query"):
+        await search_mod.search_notes(
+            query="Another query",
+            search_all_projects=True,
+            page_size=3,
+            cursor=search_mod._encode_search_cursor("stale", {"alpha": 3}, page=2),
+            output_format="json",
+        )
+    with pytest.raises(ValueError, match="Invalid search cursor"):
+        await search_mod.search_notes(
+            query="MCP Test Note",
+            search_all_projects=True,
+            page_size=3,
+            cursor="bm90IGEgY3Vyc29y",
+            output_format="json",
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_notes_search_all_projects_keeps_each_projects_api_order(
+    monkeypatch, local_routing
+):
+    """The merge never re-sorts a project's results, e.g. ones a reranker reordered."""
+    search_mod = importlib.import_module("basic_memory.mcp.tools.search")
+    _serve_scored_projects(monkeypatch, {"alpha": [0.5, 0.9], "beta": [0.7]})
+
+    result = await search_mod.search_notes(
+        query="MCP Test Note",
+        search_all_projects=True,
+        page_size=5,
+        output_format="json",
+    )
+
+    assert isinstance(result, dict)
+    assert [item["title"] for item in result["results"]] == ["beta 0", "alpha 0", "alpha 1"]
@@ -4,10 +4,10 @@ from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import delete, event, select, update
 
 from basic_memory import db
-from basic_memory.models import Entity, Observation, Relation, Project
+from basic_memory.models import Entity, EntityDirectory, Observation, Relation, Project
 from basic_memory.repository.entity_repository import EntityRepository
 from basic_memory.utils import generate_permalink
 
@@ -671,6 +671,132 @@ async def test_get_distinct_directories_empty_db(
     assert directories == []
 
 
+async def _directory_index(session) -> dict[str, tuple[int, int]]:
+    rows = await session.execute(
+        select(EntityDirectory.path, EntityDirectory.file_count, EntityDirectory.total_file_count)
+    )
+    return {path: (file_count, total) for path, file_count, total in rows}
+
+
+@pytest.mark.asyncio
+async def test_directory_index_follows_entity_writes(
+    entity_repository: EntityRepository, session_maker
+):
+    """ORM and bulk creates, moves and deletes all keep the directory index exact."""
+
+    def make(file_path: str) -> Entity:
+        return Entity(
+            project_id=entity_repository.project_id,
+            title=file_path,
+            note_type="test",
+            permalink=file_path.removesuffix(".md"),
+            file_path=file_path,
+            content_type="text/markdown",
+        )
+
+    async with db.scoped_session(session_maker) as session:
+        one, two, three, four = await entity_repository.add_all(
+            session,
+            [make("a/one.md"), make("a/b/two.md"), make("a/b/three.md"), make("c/four.md")],
+        )
+        assert await _directory_index(session) == {
+            "a": (1, 3),
+            "a/b": (2, 2),
+            "c": (1, 1),
+        }
+
+        # ORM move, as entity_service.move_entity does
+        await entity_repository.update(session, one.id, {"file_path": "c/d/one.md"})
+        # Bulk move, as the project index move batch does
+        await session.execute(
+            update(Entity).where(Entity.file_path == "a/b/two.md").values(file_path="c/two.md")
+        )
+        assert await _directory_index(session) == {
+            "a": (0, 1),
+            "a/b": (1, 1),
+            "c": (2, 3),
+            "c/d": (1, 1),
+        }
+
+        # Bulk and ORM deletes; directories left without files disappear
+        await entity_repository.delete_by_ids(session, [three.id])
+        await entity_repository.delete(session, four.id)
+        assert await _directory_index(session) == {
+            "c": (1, 2),
+            "c/d": (1, 1),
+        }
+
+    async with db.scoped_session(session_maker) as session:
+        assert await entity_repository.find_directories(session, "c", max_depth=1) == ["c/d"]
+        assert await entity_repository.get_distinct_directories(session) == ["c", "c/d"]
+
+
+@pytest.mark.asyncio
+async def test_directory_index_counts_only_rows_a_statement_changed(
+    entity_repository: EntityRepository, session_maker
+):
+    """Deltas come from the rows a statement returned; callers still see their own result."""
+
+    def make(file_path: str) -> Entity:
+        return Entity(
+            project_id=entity_repository.project_id,
+            title=file_path,
+            note_type="test",
+            permalink=file_path.removesuffix(".md"),
+            file_path=file_path,
+            content_type="text/markdown",
+        )
+
+    async with db.scoped_session(session_maker) as session:
+        one, two, three, _ = await entity_repository.add_all(
+            session,
+            [make("a/one.md"), make("a/two.md"), make("b/three.md"), make("b/four.md")],
+        )
+
+        # A caller's own RETURNING columns and the repository's rowcount are unchanged.
+        deleted = await session.execute(
+            delete(Entity).where(Entity.id.in_([one.id, 999_999])).returning(Entity.id)
+        )
+        assert deleted.scalars().all() == [one.id]
+        assert await entity_repository.delete_by_ids(session, [two.id]) == 1
+        # Bulk move by primary key
+        await session.execute(update(Entity), [{"id": three.id, "file_path": "c/three.md"}])
+        # Updates that leave locations alone pass straight through
+        assert await entity_repository.update_fields(session, three.id, {"checksum": "abc"})
+
+        assert await _directory_index(session) == {"b": (1, 1), "c": (1, 1)}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_directories_repairs_drifted_counts(
+    entity_repository: EntityRepository, session_maker
+):
+    """Rebuilding recomputes the project's directory rows from entity paths."""
+    async with db.scoped_session(session_maker) as session:
+        await entity_repository.add_all(
+            session,
+            [
+                Entity(
+                    project_id=entity_repository.project_id,
+                    title=file_path,
+                    note_type="test",
+                    permalink=file_path.removesuffix(".md"),
+                    file_path=file_path,
+                    content_type="text/markdown",
+                )
+                for file_path in ["a/one.md", "a/b/two.md"]
+            ],
+        )
+        await session.execute(
+            update(EntityDirectory).where(EntityDirectory.path == "a").values(total_file_count=7)
+        )
+        await session.execute(delete(EntityDirectory).where(EntityDirectory.path == "a/b"))
+
+        await entity_repository.rebuild_directories(session)
+
+        assert await _directory_index(session) == {"a": (1, 2), "a/b": (1, 1)}
+
+
 @pytest.mark.asyncio
 async def test_find_by_directory_prefix(entity_repository: EntityRepository, session_maker):
     """Test finding entities by directory prefix."""
@@ -1026,6 +1152,49 @@ async def test_permalink_exists_project_isolation(
         assert await entity_repository.permalink_exists(session, "test/entity2") is False
 
 
+@pytest.mark.asyncio
+async def test_allocate_permalinks_skips_taken_suffixes_in_one_query(
+    entity_repository: EntityRepository, session_maker
+):
+    """The allocator fills suffix gaps and ignores look-alike permalinks."""
+    taken = ["daily/log", "daily/log-1", "daily/log-3", "daily/log-01", "daily/log-x"]
+    async with db.scoped_session(session_maker) as session:
+        session.add_all(
+            Entity(
+                project_id=entity_repository.project_id,
+                title=permalink,
+                note_type="test",
+                permalink=permalink,
+                file_path=f"{permalink}.md",
+                content_type="text/markdown",
+            )
+            for permalink in [*taken, "daily/log_1"]
+        )
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with db.scoped_session(session_maker) as session:
+        engine = (await session.connection()).engine.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            permalinks = await entity_repository.allocate_permalinks(session, "daily/log", 3)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert permalinks == ["daily/log-2", "daily/log-4", "daily/log-5"]
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+        assert await entity_repository.allocate_permalinks(session, "fresh/note", 2) == [
+            "fresh/note",
+            "fresh/note-1",
+        ]
+        assert await entity_repository.allocate_permalinks(
+            session, "fresh/note", include_base=False
+        ) == ["fresh/note-1"]
+
+
 @pytest.mark.asyncio
 async def test_get_file_path_for_permalink(
     entity_repository: EntityRepository, sample_entity: Entity, session_maker
@@ -248,6 +248,39 @@ async def test_fastembed_provider_zero_vector_does_not_raise(monkeypatch):
     assert result == [[0.0, 0.0, 0.0, 0.0]]
 
 
+@pytest.mark.asyncio
+async def test_fastembed_provider_normalizes_ndarray_batch_as_one_matrix(monkeypatch):
+    """Real FastEmbed rows are ndarrays; each row is normalized independently."""
+    np = pytest.importorskip("numpy")
+
+    class _NdarrayEmbedding:
+        def __init__(self, model_name: str, **_kwargs):
+            pass
+
+        def embed(self, texts: list[str], **_kwargs):
+            rows = {
+                "long": [3.0, 4.0, 0.0, 0.0],
+                "unit": [0.0, 0.0, 1.0, 0.0],
+                "zero": [0.0, 0.0, 0.0, 0.0],
+            }
+            for text in texts:
+                yield np.asarray(rows[text], dtype=np.float32)
+
+    module = type(sys)("fastembed")
+    setattr(module, "TextEmbedding", _NdarrayEmbedding)
+    monkeypatch.setitem(sys.modules, "fastembed", module)
+
+    provider = FastEmbedEmbeddingProvider(model_name="stub-ndarray", dimensions=4)
+    result = await provider.embed_documents(["long", "unit", "zero"])
+
+    assert result == [
+        pytest.approx([0.6, 0.8, 0.0, 0.0]),
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0],
+    ]
+    assert all(type(value) is float for row in result for value in row)
+
+
 # --- Self-heal of corrupt/partial model cache (#895) ---
 #
 # A real interrupted FastEmbed download is non-deterministic and offline-unfriendly, so we
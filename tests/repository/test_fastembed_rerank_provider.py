@@ -204,6 +204,47 @@ async def test_empty_documents_short_circuit(monkeypatch):
     assert provider._model is None
 
 
+@pytest.mark.asyncio
+async def test_concurrent_requests_queued_behind_a_model_call_share_one_batch():
+    """Requests arriving while the model is busy are scored together in one pair batch."""
+    loop = asyncio.get_running_loop()
+    first_call_started = asyncio.Event()
+    release_first_call = threading.Event()
+
+    class _PairScoringEncoder:
+        def __init__(self) -> None:
+            self.rerank_calls: list[tuple[str, list[str]]] = []
+            self.pair_batches: list[list[tuple[str, str]]] = []
+
+        def rerank(self, query, documents):
+            self.rerank_calls.append((query, list(documents)))
+            loop.call_soon_threadsafe(first_call_started.set)
+            assert release_first_call.wait(timeout=5)
+            return [0.0 for _ in documents]
+
+        def rerank_pairs(self, pairs):
+            self.pair_batches.append(list(pairs))
+            return [2.0 if query in document else -2.0 for query, document in pairs]
+
+    model = _PairScoringEncoder()
+    provider = FastEmbedRerankProvider(model_name="stub-reranker")
+    provider._model = model  # pyright: ignore [reportAttributeAccessIssue]
+
+    first = asyncio.create_task(provider.rerank("lead", ["lead doc"]))
+    await first_call_started.wait()
+    second = asyncio.create_task(provider.rerank("auth", ["auth doc", "other"]))
+    third = asyncio.create_task(provider.rerank("token", ["token doc"]))
+    await asyncio.sleep(0)
+    release_first_call.set()
+
+    assert await first == [pytest.approx(0.5)]
+    assert await second == [pytest.approx(0.8807970779778823), pytest.approx(0.11920292202211883)]
+    assert await third == [pytest.approx(0.8807970779778823)]
+    assert model.rerank_calls == [("lead", ["lead doc"])]
+    assert model.pair_batches == [[("auth", "auth doc"), ("auth", "other"), ("token", "token doc")]]
+    assert provider._drain_task is None
+
+
 @pytest.mark.asyncio
 async def test_passes_cache_dir_and_threads_to_model(monkeypatch):
     _install_stub(monkeypatch)
@@ -6,6 +6,7 @@ Verifies that the fusion formula (max + FUSION_BONUS * min):
 3. Produces zero fused score when the source score is zero
 """
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import override, Any, Optional, cast
@@ -363,3 +364,81 @@ async def test_dual_source_result_keeps_vector_matched_chunk():
     assert len(results) == 1
     # Vector result overwrites the FTS row in rows_by_id, so matched_chunk_text is preserved
     assert results[0].matched_chunk_text == vector_chunk
+
+
+@pytest.mark.asyncio
+async def test_hybrid_legs_run_concurrently():
+    """Both legs are in flight together, so neither waits for the other to finish."""
+    repo = ConcreteSearchRepo()
+    fts_started = asyncio.Event()
+    vector_started = asyncio.Event()
+
+    async def fake_fts_search(**kwargs):
+        fts_started.set()
+        await asyncio.wait_for(vector_started.wait(), timeout=1)
+        return [FakeRow(id=1, score=5.0, title="fts")]
+
+    async def fake_vector_search(**kwargs):
+        vector_started.set()
+        await asyncio.wait_for(fts_started.wait(), timeout=1)
+        return [FakeRow(id=2, score=0.8, title="vec")]
+
+    with (
+        patch.object(repo, "search", side_effect=fake_fts_search),
+        patch.object(repo, "_search_vector_only", side_effect=fake_vector_search),
+    ):
+        results = await repo._search_hybrid(**HYBRID_KWARGS)
+
+    assert [r.id for r in results] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_legs_run_sequentially_when_disabled():
+    """The sequential mode finishes the FTS leg before starting the vector leg."""
+    repo = ConcreteSearchRepo()
+    repo._semantic_hybrid_concurrent = False
+    order: list[str] = []
+
+    async def fake_fts_search(**kwargs):
+        order.append("fts")
+        return []
+
+    async def fake_vector_search(**kwargs):
+        order.append("vector")
+        return []
+
+    with (
+        patch.object(repo, "search", side_effect=fake_fts_search),
+        patch.object(repo, "_search_vector_only", side_effect=fake_vector_search),
+    ):
+        await repo._search_hybrid(**HYBRID_KWARGS)
+
+    assert order == ["fts", "vector"]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_leg_failure_cancels_sibling_leg():
+    """A failing leg surfaces its own error and does not leave the other leg running."""
+    repo = ConcreteSearchRepo()
+    vector_cancelled = asyncio.Event()
+
+    async def failing_fts_search(**kwargs):
+        await asyncio.sleep(0)
+        raise ValueError("bad query")
+
+    async def slow_vector_search(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            vector_cancelled.set()
+            raise
+        return []  # pragma: no cover
+
+    with (
+        patch.object(repo, "search", side_effect=failing_fts_search),
+        patch.object(repo, "_search_vector_only", side_effect=slow_vector_search),
+    ):
+        with pytest.raises(ValueError, match="bad query"):
+            await repo._search_hybrid(**HYBRID_KWARGS)
+
+    assert vector_cancelled.is_set()
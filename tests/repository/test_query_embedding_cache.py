@@ -0,0 +1,153 @@
+"""Tests for the query embedding cache."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.repository.query_embedding_cache import (
+    QUERY_EMBEDDING_CACHE_FILENAME,
+    QueryEmbeddingCache,
+    get_query_embedding_cache,
+    normalize_query_text,
+)
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def __call__(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return [float(len(self.calls)), 0.5]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_normalize_query_text_collapses_whitespace_but_keeps_case():
+    assert normalize_query_text("  Auth \n  flow\t") == "Auth flow"
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_hits_memory_tier():
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60)
+    embed = _CountingEmbedder()
+
+    first = await cache.get_or_embed("model:a", "auth flow", embed)
+    second = await cache.get_or_embed("model:a", "auth   flow", embed)
+
+    assert first == second
+    assert embed.calls == ["auth flow"]
+    assert cache.stats.memory_hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_identity_is_part_of_the_key():
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60)
+    embed = _CountingEmbedder()
+
+    await cache.get_or_embed("model:a", "auth", embed)
+    await cache.get_or_embed("model:b", "auth", embed)
+
+    assert len(embed.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_entry():
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+    embed = _CountingEmbedder()
+
+    await cache.get_or_embed("m", "one", embed)
+    await cache.get_or_embed("m", "two", embed)
+    await cache.get_or_embed("m", "one", embed)
+    await cache.get_or_embed("m", "three", embed)
+    await cache.get_or_embed("m", "one", embed)
+    await cache.get_or_embed("m", "two", embed)
+
+    assert embed.calls == ["one", "two", "three", "two"]
+    assert cache.stats.evictions == 2
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_re_embedded():
+    clock = _Clock()
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=10, clock=clock)
+    embed = _CountingEmbedder()
+
+    await cache.get_or_embed("m", "auth", embed)
+    clock.now += 11
+    await cache.get_or_embed("m", "auth", embed)
+
+    assert embed.calls == ["auth", "auth"]
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_a_new_cache_instance(tmp_path: Path):
+    disk_path = tmp_path / QUERY_EMBEDDING_CACHE_FILENAME
+    embed = _CountingEmbedder()
+
+    first_cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60, disk_path=disk_path)
+    stored = await first_cache.get_or_embed("m", "auth", embed)
+
+    second_cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60, disk_path=disk_path)
+    restored = await second_cache.get_or_embed("m", "auth", embed)
+
+    assert restored == stored
+    assert embed.calls == ["auth"]
+    assert second_cache.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unusable_disk_tier_falls_back_to_embedding(tmp_path: Path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("file")
+    cache = QueryEmbeddingCache(
+        max_entries=4,
+        ttl_seconds=60,
+        disk_path=blocker / QUERY_EMBEDDING_CACHE_FILENAME,
+    )
+    embed = _CountingEmbedder()
+
+    assert await cache.get_or_embed("m", "auth", embed) == [1.0, 0.5]
+    assert await cache.get_or_embed("m", "auth", embed) == [1.0, 0.5]
+    assert embed.calls == ["auth"]
+
+
+@pytest.mark.asyncio
+async def test_corrupt_disk_entry_counts_as_a_miss(tmp_path: Path):
+    disk_path = tmp_path / QUERY_EMBEDDING_CACHE_FILENAME
+    embed = _CountingEmbedder()
+    first_cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60, disk_path=disk_path)
+    await first_cache.get_or_embed("m", "auth", embed)
+    with sqlite3.connect(disk_path) as connection:
+        connection.execute("UPDATE query_embeddings SET vector = ?", (b"\x00" * 5,))
+
+    second_cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60, disk_path=disk_path)
+
+    assert await second_cache.get_or_embed("m", "auth", embed) == [2.0, 0.5]
+    assert second_cache.stats.misses == 1
+    assert embed.calls == ["auth", "auth"]
+
+
+def test_cache_is_shared_per_provider_and_disabled_at_zero_size():
+    config = BasicMemoryConfig(semantic_query_embedding_cache_size=8)
+    provider = _CountingEmbedder()
+    other_provider = _CountingEmbedder()
+
+    cache = get_query_embedding_cache(config, provider)  # pyright: ignore [reportArgumentType]
+
+    assert cache is not None
+    assert get_query_embedding_cache(config, provider) is cache  # pyright: ignore [reportArgumentType]
+    assert get_query_embedding_cache(config, other_provider) is not cache  # pyright: ignore [reportArgumentType]
+    disabled = config.model_copy(update={"semantic_query_embedding_cache_size": 0})
+    assert get_query_embedding_cache(disabled, provider) is None  # pyright: ignore [reportArgumentType]
@@ -12,6 +12,7 @@ import basic_memory.repository.sqlite_search_repository as sqlite_search_reposit
 from basic_memory.config import BasicMemoryConfig, DatabaseBackend
 from basic_memory.repository.postgres_search_repository import PostgresSearchRepository
 from basic_memory.repository.search_index_row import SearchIndexRow
+from basic_memory.repository.rerank_score_cache import RerankScoreCache
 from basic_memory.repository.rerank_provider import (
     build_rerank_document,
     demote_tail_scores,
@@ -338,6 +339,86 @@ async def test_rerank_paginate_reorders_rescore_and_demotes_tail():
     assert scores[2] < scores[1]
 
 
+@pytest.mark.asyncio
+async def test_rerank_score_cache_rescores_only_unseen_candidates():
+    """Later pages reuse cached scores; only candidates with new text reach the provider."""
+    repo = _unit_repo()
+    reranker = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9, "Charlie": 0.5})
+    repo._rerank_provider = reranker
+    repo._rerank_score_cache = RerankScoreCache(max_entries=16)
+    repo._reranker_candidates = 3
+    rows = [_row(id=1, title="Alpha"), _row(id=2, title="Bravo")]
+
+    first_page = await repo._rerank_and_paginate("auth", rows, offset=0, limit=1)
+    second_page = await repo._rerank_and_paginate("auth", rows, offset=1, limit=1)
+    assert [row.title for row in first_page + second_page] == ["Bravo", "Alpha"]
+    assert reranker.calls == 1
+
+    grown_rows = [*rows, _row(id=3, title="Charlie")]
+    result = await repo._rerank_and_paginate("auth", grown_rows, offset=0, limit=3)
+
+    assert [row.title for row in result] == ["Bravo", "Charlie", "Alpha"]
+    assert reranker.document_batches[-1] == ["snippet\nCharlie"]
+    assert reranker.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_latency_budget_moves_unscored_candidates_to_the_tail():
+    """A reranker falling behind scores only what fits; the rest keep retrieval order."""
+    repo = _unit_repo()
+    reranker = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9, "Charlie": 0.5, "Delta": 0.8})
+    repo._rerank_provider = reranker
+    repo._rerank_score_cache = RerankScoreCache(max_entries=16)
+    repo._rerank_score_cache.per_document_ms = 50.0
+    repo._reranker_latency_budget_ms = 100.0
+    repo._reranker_candidates = 4
+    rows = [
+        _row(id=1, title="Alpha"),
+        _row(id=2, title="Bravo"),
+        _row(id=3, title="Charlie"),
+        _row(id=4, title="Delta"),
+    ]
+
+    result = await repo._rerank_and_paginate("auth", rows, offset=0, limit=4)
+
+    assert reranker.document_batches == [["snippet\nAlpha", "snippet\nBravo"]]
+    assert [row.title for row in result] == ["Bravo", "Alpha", "Charlie", "Delta"]
+    scores = [row.score or 0.0 for row in result]
+    assert scores == sorted(scores, reverse=True)
+    assert scores[2] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_rerank_latency_budget_window_is_fixed_across_pages():
+    """A later page reuses the first page's cut even when the latency estimate moved."""
+    repo = _unit_repo()
+    reranker = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9, "Charlie": 0.5, "Delta": 0.8})
+    repo._rerank_provider = reranker
+    repo._rerank_score_cache = RerankScoreCache(max_entries=16)
+    repo._rerank_score_cache.per_document_ms = 50.0
+    repo._reranker_latency_budget_ms = 100.0
+    repo._reranker_candidates = 4
+    rows = [
+        _row(id=1, title="Alpha"),
+        _row(id=2, title="Bravo"),
+        _row(id=3, title="Charlie"),
+        _row(id=4, title="Delta"),
+    ]
+
+    first_page = await repo._rerank_and_paginate("auth", rows, offset=0, limit=2)
+    # The reranker caught up: a fresh decision would now score the whole pool.
+    repo._rerank_score_cache.per_document_ms = 1.0
+    second_page = await repo._rerank_and_paginate("auth", rows, offset=2, limit=2)
+
+    assert [row.title for row in first_page + second_page] == [
+        "Bravo",
+        "Alpha",
+        "Charlie",
+        "Delta",
+    ]
+    assert reranker.document_batches == [["snippet\nAlpha", "snippet\nBravo"]]
+
+
 @pytest.mark.asyncio
 async def test_rerank_paginate_preserves_pool_before_tail_at_zero_floor():
     repo = _unit_repo()
@@ -620,6 +701,55 @@ async def test_vector_search_expands_tail_from_stable_rerank_pool(
     assert candidate_limits == [18, 8]
 
 
+@pytest.mark.asyncio
+async def test_deep_pages_reuse_memoized_stable_rerank_pool(
+    rerank_search_repository,
+    monkeypatch,
+):
+    """Later pages of a reranked query retrieve once; index writes force a refetch."""
+    await _index_two_auth_notes(rerank_search_repository)
+    rerank_search_repository._semantic_vector_k = 5
+    rerank_search_repository._reranker_candidates = 2
+    rerank_search_repository._rerank_provider = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9})
+
+    candidate_limits: list[int] = []
+    run_vector_query = rerank_search_repository._run_vector_query
+
+    async def record_vector_query(
+        session: Any,
+        query_embedding: list[float],
+        candidate_limit: int,
+    ) -> list[dict[str, Any]]:
+        candidate_limits.append(candidate_limit)
+        return await run_vector_query(session, query_embedding, candidate_limit)
+
+    monkeypatch.setattr(rerank_search_repository, "_run_vector_query", record_vector_query)
+
+    async def search_page(offset: int) -> list[SearchIndexRow]:
+        return await rerank_search_repository.search(
+            search_text="auth session token",
+            retrieval_mode=SearchRetrievalMode.VECTOR,
+            limit=1,
+            offset=offset,
+        )
+
+    first_page = await search_page(0)
+    deep_page = await search_page(2)
+    assert candidate_limits == [8, 18]
+    assert [row.permalink for row in first_page] == ["specs/bravo"]
+    assert deep_page == []
+
+    candidate_limits.clear()
+    second_page = await search_page(1)
+    assert [row.permalink for row in second_page] == ["specs/alpha"]
+    assert candidate_limits == [8]
+
+    candidate_limits.clear()
+    await rerank_search_repository.delete_by_permalink("specs/missing")
+    await search_page(2)
+    assert candidate_limits == [18, 8]
+
+
 @pytest.mark.asyncio
 async def test_vector_slow_query_timing_includes_reranker(rerank_search_repository, monkeypatch):
     await _index_two_auth_notes(rerank_search_repository)
@@ -730,7 +860,9 @@ async def test_hybrid_search_preserves_candidate_windows(
 
     assert growing_prefix_results
     assert reranker.calls == 2
-    assert candidate_limits == [90, 80]
+    # The first page already retrieved the fixed rerank window, so the deeper page
+    # reuses that pool instead of running a second hybrid retrieval.
+    assert candidate_limits == [90]
 
 
 @pytest.mark.asyncio
@@ -11,6 +11,7 @@ from basic_memory.models import Entity
 from basic_memory.models.project import Project
 from basic_memory.repository.search_repository import SearchIndexRow
 from basic_memory.repository.postgres_search_repository import PostgresSearchRepository
+from basic_memory.repository.rerank_stable_pool_cache import RerankStablePoolCache
 from basic_memory.schemas.search import SearchItemType
 
 
@@ -519,6 +520,22 @@ async def test_delete_by_entity_id(search_repository, search_entity):
     assert len(results_after) == 0
 
 
+@pytest.mark.asyncio
+async def test_search_row_deletions_invalidate_stable_rerank_pools(search_repository):
+    """Purges and vector deletions must not leave a memoized pool serving removed rows."""
+    cache = RerankStablePoolCache(ttl_seconds=300)
+    search_repository._rerank_stable_pool_cache = cache
+    project_id = search_repository.project_id
+
+    cache.put(project_id, "query", [])
+    await search_repository.purge_stale_search_rows()
+    assert cache.get(project_id, "query") is None
+
+    cache.put(project_id, "query", [])
+    await search_repository.delete_project_vector_rows()
+    assert cache.get(project_id, "query") is None
+
+
 @pytest.mark.asyncio
 async def test_to_insert_includes_project_id(search_repository):
     """Test that the to_insert method includes project_id."""
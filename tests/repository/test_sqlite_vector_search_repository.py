@@ -2,6 +2,7 @@
 
 import asyncio
 import hashlib
+import struct
 from collections.abc import Sequence
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -16,6 +17,7 @@ from basic_memory.config import BasicMemoryConfig, DatabaseBackend
 from basic_memory.repository.embedding_provider import EmbeddingProvider
 from basic_memory.repository.litellm_provider import LiteLLMEmbeddingProvider
 from basic_memory.repository.prefixing_provider import PrefixingEmbeddingProvider
+from basic_memory.repository.rerank_stable_pool_cache import RerankStablePoolCache
 from basic_memory.repository import search_repository_base as search_repository_base_module
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.semantic_errors import SemanticVectorIndexExtensionError
@@ -33,7 +35,11 @@ from basic_memory.repository.semantic_vector_sync import (
 )
 from basic_memory.repository.sqlite_search_repository import SQLiteSearchRepository
 from basic_memory.repository import sqlite_vec_index as sqlite_vec_index_module
-from basic_memory.repository.sqlite_vec_index import SQLITE_VEC_MAX_K, SQLiteVecIndex
+from basic_memory.repository.sqlite_vec_index import (
+    SQLITE_VEC_MAX_K,
+    SQLiteVecIndex,
+    serialize_float32,
+)
 from basic_memory.schemas.search import SearchItemType, SearchRetrievalMode
 
 
@@ -756,7 +762,11 @@ async def test_adapter_delete_failure_stays_pending_until_retry(search_repositor
         assert failed_state.scalars().all() == ["pending"]
 
     adapter.fail_delete_entity = False
+    stable_pools = RerankStablePoolCache(ttl_seconds=300)
+    stable_pools.put(search_repository.project_id, "query", [])
+    search_repository._rerank_stable_pool_cache = stable_pools
     await search_repository.delete_entity_vector_rows(112)
+    assert stable_pools.get(search_repository.project_id, "query") is None
 
     async with db.scoped_session(search_repository.session_maker) as session:
         row_count = await session.execute(
@@ -1449,7 +1459,7 @@ async def test_run_vector_query_caps_k_at_sqlite_vec_limit(search_repository, mo
 
     assert captured_params == [
         {
-            "query": "[0.1, 0.1, 0.1, 0.1]",
+            "query": serialize_float32([0.1, 0.1, 0.1, 0.1]),
             "vector_k": SQLITE_VEC_MAX_K,
             "project_id": search_repository.project_id,
             "embedding_identity": search_repository._embedding_model_key(),
@@ -1461,3 +1471,46 @@ async def test_run_vector_query_caps_k_at_sqlite_vec_limit(search_repository, mo
     await index.search(query_embedding, limit=500)
     assert captured_params[0]["vector_k"] == 500
     assert captured_params[0]["limit"] == 500
+
+
+def test_serialize_float32_packs_native_float32_blob():
+    """Vectors bind as the raw float32 layout vec0 stores, not as JSON text."""
+    blob = serialize_float32([1.0, -0.5, 0.25])
+
+    assert blob == struct.pack("3f", 1.0, -0.5, 0.25)
+    assert len(serialize_float32([0.1] * 384)) == 384 * 4
+
+
+@pytest.mark.asyncio
+async def test_sqlite_vec_blob_and_json_vectors_share_storage(search_repository):
+    """Blob writes round-trip through vec0 exactly like legacy JSON-text writes."""
+    if not isinstance(search_repository, SQLiteSearchRepository):
+        pytest.skip("sqlite-vec storage is SQLite-specific.")
+
+    _enable_semantic(search_repository)
+    await search_repository.init_search_index()
+    index = cast(SQLiteVecIndex, search_repository._semantic_vector_index)
+
+    async with db.scoped_session(search_repository.session_maker) as session:
+        await index._ensure_loaded(session)
+        await session.execute(
+            text(
+                "INSERT INTO search_vector_embeddings (rowid, embedding) "
+                "VALUES (908, :json_embedding), (909, :blob_embedding)"
+            ),
+            {
+                "json_embedding": "[0.5, 0.5, 0.5, 0.5]",
+                "blob_embedding": serialize_float32([0.5, 0.5, 0.5, 0.5]),
+            },
+        )
+        result = await session.execute(
+            text(
+                "SELECT rowid, vec_to_json(embedding) FROM search_vector_embeddings "
+                "WHERE rowid IN (908, 909) ORDER BY rowid"
+            )
+        )
+        rows = result.fetchall()
+        await session.rollback()
+
+    assert [row[0] for row in rows] == [908, 909]
+    assert rows[0][1] == rows[1][1]
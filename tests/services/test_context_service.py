@@ -769,3 +769,85 @@ async def test_pattern_search_falls_back_for_legacy_unqualified_rows(context_ser
     permalinks = {result.primary_result.permalink for result in context.results}
     assert permalinks, "fallback did not match legacy rows"
     assert all(p and p.startswith("test-project/test/") for p in permalinks), permalinks
+
+
+def _related_rows(rows):
+    return [
+        (row.type, row.id, row.root_id, row.depth, row.title, row.permalink, row.file_path)
+        for row in rows
+    ]
+
+
+@pytest.mark.asyncio
+async def test_adjacency_index_matches_recursive_query(
+    search_repository,
+    entity_repository,
+    observation_repository,
+    session_maker,
+    app_config,
+    test_graph,
+):
+    """The in-memory traversal returns exactly what the recursive CTE returns."""
+    from basic_memory.config import DatabaseBackend
+
+    if app_config.database_backend == DatabaseBackend.POSTGRES:
+        pytest.skip("The adjacency index only replaces the SQLite recursive query")
+
+    def service(use_index: bool) -> ContextService:
+        return ContextService(
+            search_repository,
+            entity_repository,
+            observation_repository,
+            session_maker=session_maker,
+            app_config=app_config.model_copy(update={"context_adjacency_index": use_index}),
+        )
+
+    seeds = [("entity", test_graph["root"].id), ("entity", test_graph["connected2"].id)]
+    since = datetime.now(UTC) - timedelta(days=1)
+    for max_depth, max_results, since_filter in [
+        (1, 100, None),
+        (2, 100, None),
+        (3, 100, None),
+        (3, 3, None),
+        (2, 100, since),
+    ]:
+        cte_rows = await service(False).find_related(
+            seeds, max_depth=max_depth, since=since_filter, max_results=max_results
+        )
+        index_rows = await service(True).find_related(
+            seeds, max_depth=max_depth, since=since_filter, max_results=max_results
+        )
+        # Rows tied on (depth, type, id) under different roots have no SQL order.
+        assert sorted(_related_rows(index_rows)) == sorted(_related_rows(cte_rows))
+        assert [row.depth for row in index_rows] == [row.depth for row in cte_rows]
+
+
+@pytest.mark.asyncio
+async def test_adjacency_index_picks_up_new_relations(
+    context_service, test_graph, session_maker, app_config
+):
+    """A relation written after the index was built is traversed on the next call."""
+    from basic_memory.config import DatabaseBackend
+
+    if app_config.database_backend == DatabaseBackend.POSTGRES:
+        pytest.skip("The adjacency index only replaces the SQLite recursive query")
+
+    root = test_graph["root"]
+    deep = test_graph["deep"]
+    before = await context_service.find_related([("entity", root.id)], max_depth=1)
+    assert deep.id not in {row.id for row in before if row.type == "entity"}
+
+    async with db.scoped_session(session_maker) as session:
+        shortcut = Relation(
+            project_id=root.project_id,
+            from_id=root.id,
+            to_id=deep.id,
+            to_name=deep.title,
+            relation_type="shortcut_to",
+        )
+        session.add(shortcut)
+        await session.commit()
+
+    after = await context_service.find_related([("entity", root.id)], max_depth=1, max_results=100)
+    assert deep.id in {row.id for row in after if row.type == "entity"}
+    assert shortcut.id in {row.id for row in after if row.type == "relation"}
@@ -870,6 +870,75 @@ async def test_cross_project_link_resolution(
     assert resolved.project_id == other_project.id
 
 
+@pytest.mark.asyncio
+async def test_resolve_links_matches_single_link_resolution(link_resolver, test_entities):
+    """Batch resolution returns exactly what resolve_link returns for each identifier."""
+    identifiers = [
+        "components/core-service",
+        test_entities[0].permalink,
+        "Core Service",  # duplicated title: shortest path, via the single-link fallback
+        "Service Config",
+        "config/Service Config.md",
+        "specs/Core Features",
+        "[[Auth Service]]",
+        "Auth Serv",  # fuzzy search fallback
+        test_entities[3].external_id,
+        "Image.png",
+        "does-not-exist",
+    ]
+
+    resolved = await link_resolver.resolve_links(identifiers)
+
+    assert list(resolved) == identifiers
+    for identifier in identifiers:
+        expected = await link_resolver.resolve_link(identifier)
+        actual = resolved[identifier]
+        assert (actual.id if actual else None) == (expected.id if expected else None), identifier
+
+
+@pytest.mark.asyncio
+async def test_link_resolution_snapshot_cache_reloads_renamed_entities(
+    link_resolver, entity_repository, test_entities, session_maker, app_config
+):
+    """The cached identity snapshot notices a rename on its next use."""
+    from basic_memory.services.bulk_link_resolver import (
+        RelationTargetReference,
+        get_link_resolution_snapshot_cache,
+    )
+
+    cache = get_link_resolution_snapshot_cache(session_maker)
+    old_title = RelationTargetReference.parse("Auth Service")
+    new_title = RelationTargetReference.parse("Authentication Service")
+
+    async def snapshot():
+        async with db.scoped_session(session_maker) as session:
+            return await cache.snapshot(
+                [old_title, new_title],
+                current_project_id=entity_repository.project_id,
+                app_config=app_config,
+                session=session,
+            )
+
+    first = await snapshot()
+    assert first.resolve(old_title).id == test_entities[2].id
+    assert first.resolve(new_title) is None
+    project_id = entity_repository.project_id
+    # An unchanged project reuses its index instead of reloading every entity.
+    assert (await snapshot()).entity_indexes[project_id] is first.entity_indexes[project_id]
+
+    async with db.scoped_session(session_maker) as session:
+        await entity_repository.update(
+            session, test_entities[2].id, {"title": "Authentication Service"}
+        )
+
+    renamed = await snapshot()
+    assert renamed.resolve(old_title) is None
+    assert renamed.resolve(new_title).id == test_entities[2].id
+
+    resolved = await link_resolver.resolve_links(["Authentication Service"])
+    assert resolved["Authentication Service"].id == test_entities[2].id
+
+
 # ============================================================================
 # Context-aware resolution tests (source_path parameter)
 # ============================================================================
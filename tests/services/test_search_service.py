@@ -1720,3 +1720,123 @@ async def test_reindex_vectors_no_callback(
     stats = await search_service.reindex_vectors()
     assert stats["total_entities"] >= 1
     assert stats["embedded"] + stats["errors"] == stats["total_entities"]
+
+
+@pytest.mark.asyncio
+async def test_reindex_writes_only_changed_search_rows(
+    search_service, entity_service, entity_repository, session_maker, monkeypatch
+):
+    """Editing an observation rewrites search rows from that observation onward only."""
+    from basic_memory.schemas import Entity as EntitySchema
+
+    schema = EntitySchema(
+        title="Diffed Note",
+        directory="notes",
+        note_type="note",
+        content=(
+            "# Diffed Note\n"
+            "- [fact] first observation\n"
+            "- [fact] second observation\n"
+            "- [idea] third observation\n"
+        ),
+    )
+    created = await entity_service.create_entity(schema)
+    # A later note's observations sit above this one's, so SQLite cannot hand
+    # freshly inserted rows the same ids by reusing the highest rowid.
+    await entity_service.create_entity(
+        EntitySchema(
+            title="Later Note",
+            directory="notes",
+            note_type="note",
+            content="# Later Note\n- [fact] later observation\n",
+        )
+    )
+
+    async def load():
+        async with db.scoped_session(session_maker) as session:
+            entity = await entity_repository.find_by_id(session, created.id)
+        assert entity is not None
+        return entity
+
+    entity = await load()
+    await search_service.index_entity_data(entity)
+    ids_before = {obs.content: obs.id for obs in entity.observations}
+    assert len(ids_before) == 3
+
+    written: list[tuple[str, int]] = []
+    deleted: list[tuple[str, int]] = []
+    bulk_index_items = search_service.repository.bulk_index_items
+    delete_index_rows = search_service.repository.delete_index_rows
+
+    async def spy_bulk_index_items(rows):
+        written.extend((row.type, row.id) for row in rows)
+        await bulk_index_items(rows)
+
+    async def spy_delete_index_rows(keys):
+        deleted.extend(keys)
+        await delete_index_rows(keys)
+
+    monkeypatch.setattr(search_service.repository, "bulk_index_items", spy_bulk_index_items)
+    monkeypatch.setattr(search_service.repository, "delete_index_rows", spy_delete_index_rows)
+
+    schema.content = (
+        "# Diffed Note\n"
+        "- [fact] first observation\n"
+        "- [fact] second observation, edited\n"
+        "- [idea] third observation\n"
+    )
+    await entity_service.update_entity(entity, schema)
+    entity = await load()
+    ids_after = {obs.content: obs.id for obs in entity.observations}
+    await search_service.index_entity_data(entity)
+
+    # Observations read back in file order, not with the edited one moved last.
+    assert [obs.content for obs in entity.observations] == [
+        "first observation",
+        "second observation, edited",
+        "third observation",
+    ]
+    # The unchanged leading observation keeps its id, so its search row stays in
+    # place; everything from the edit onward is re-inserted to keep that order.
+    assert ids_after["first observation"] == ids_before["first observation"]
+    assert [key for key in written if key[0] == "observation"] == [
+        ("observation", ids_after["second observation, edited"]),
+        ("observation", ids_after["third observation"]),
+    ]
+    assert sorted(key for key in deleted if key[0] == "observation") == sorted(
+        [
+            ("observation", ids_before["second observation"]),
+            ("observation", ids_before["third observation"]),
+        ]
+    )
+
+    rows_after = await search_service.repository.get_entity_search_rows(entity.id)
+    assert {row.id for row in rows_after if row.type == "observation"} == set(ids_after.values())
+
+
+@pytest.mark.asyncio
+async def test_reindex_all_rebuilds_the_directory_index(search_service, test_graph, session_maker):
+    """A full reindex recomputes directory counts that drifted from the entity paths."""
+    from sqlalchemy import delete, select
+
+    from basic_memory.models import EntityDirectory
+
+    async def directory_index() -> dict[str, tuple[int, int]]:
+        async with db.scoped_session(session_maker) as session:
+            rows = await session.execute(
+                select(
+                    EntityDirectory.path,
+                    EntityDirectory.file_count,
+                    EntityDirectory.total_file_count,
+                )
+            )
+            return {path: (file_count, total) for path, file_count, total in rows}
+
+    expected = await directory_index()
+    assert expected
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(delete(EntityDirectory))
+
+    await search_service.reindex_all()
+
+    assert await directory_index() == expected
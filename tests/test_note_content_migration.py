@@ -315,3 +315,60 @@ def test_observation_repair_migration_skips_missing_search_index(
 
     assert observation_ids == [10, 12]
     assert search_index_exists is None
+
+
+def test_entity_directory_migration_backfills_directory_counts(tmp_path, monkeypatch) -> None:
+    """Existing entity paths seed one index row per directory with direct and subtree counts."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("BASIC_MEMORY_HOME", str(tmp_path / "basic-memory"))
+
+    database_path = tmp_path / "entity-directory-migration.db"
+    config = sqlite_alembic_config(database_path)
+    command.upgrade(config, "2d26b287813b")
+    timestamp = "2026-10-16 00:00:00"
+    connection = sqlite3.connect(database_path)
+    try:
+        connection.execute(
+            """
+            INSERT INTO project (
+                id, name, permalink, path, is_active, is_default,
+                created_at, updated_at, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (1, "test", "test", "/test", True, True, timestamp, timestamp, "project-1"),
+        )
+        connection.executemany(
+            """
+            INSERT INTO entity (
+                id, title, note_type, content_type, file_path,
+                created_at, updated_at, project_id, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (index, path, "note", "text/markdown", path, timestamp, timestamp, 1, path)
+                for index, path in enumerate(
+                    ["root.md", "notes/a.md", "notes/2026/b.md", "notes/2026/c.md"], start=1
+                )
+            ],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    command.upgrade(config, "head")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        rows = connection.execute(
+            """
+            SELECT project_id, path, parent_path, name, depth, file_count, total_file_count
+            FROM entity_directory ORDER BY path
+            """
+        ).fetchall()
+    finally:
+        connection.close()
+
+    assert rows == [
+        (1, "notes", "", "notes", 1, 1, 3),
+        (1, "notes/2026", "notes", "2026", 2, 2, 2),
+    ]
@@ -64,6 +64,32 @@ async def test_open_redis_read_cache_configures_pool_size(monkeypatch) -> None:
     assert client.closed
 
 
+@pytest.mark.asyncio
+async def test_open_redis_read_cache_puts_memory_tier_in_front_of_redis(monkeypatch) -> None:
+    from basic_memory.read_cache import redis as redis_adapter
+    from basic_memory.read_cache.memory import MemoryReadCache
+
+    class Client:
+        async def aclose(self) -> None:
+            pass
+
+    monkeypatch.setattr(
+        redis_adapter,
+        "create_redis_read_cache_client",
+        lambda url, *, max_connections: Client(),
+    )
+
+    async with open_redis_read_cache(
+        "redis",
+        memory_max_bytes=1024,
+        memory_generation_ttl_seconds=0.5,
+    ) as read_cache:
+        assert isinstance(read_cache, MemoryReadCache)
+        assert isinstance(read_cache.backend, redis_adapter.RedisReadCache)
+        assert read_cache.max_bytes == 1024
+        assert read_cache.generation_ttl_seconds == 0.5
+
+
 @pytest.mark.asyncio
 async def test_open_redis_read_cache_rejects_non_positive_pool_size() -> None:
     with pytest.raises(ValueError, match="max_connections must be positive"):
@@ -0,0 +1,146 @@
+"""Tests for the in-process read-cache tier in front of the shared backend."""
+
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+import pytest
+
+from basic_memory.read_cache import (
+    ReadCacheInvalidationStatus,
+    ReadCacheKey,
+    ReadCacheLookup,
+    ReadCacheOperation,
+    ReadCacheStoreStatus,
+    ReadCacheTier,
+    read_cache_request_digest,
+)
+from basic_memory.read_cache import memory
+from basic_memory.read_cache.memory import MemoryReadCache
+
+PROJECT_ID = "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
+
+
+@dataclass(slots=True)
+class SharedCache:
+    """Generation-checked backend standing in for Redis."""
+
+    generation: str = field(default_factory=lambda: uuid4().hex)
+    payloads: dict[ReadCacheKey, tuple[str, bytes]] = field(default_factory=dict)
+    lookups: int = 0
+
+    async def lookup(self, key: ReadCacheKey) -> ReadCacheLookup:
+        self.lookups += 1
+        cached = self.payloads.get(key)
+        if cached is None or cached[0] != self.generation:
+            return ReadCacheLookup(generation=self.generation)
+        return ReadCacheLookup(
+            generation=self.generation, payload=cached[1], remaining_ttl_seconds=300
+        )
+
+    async def store(
+        self,
+        key: ReadCacheKey,
+        lookup: ReadCacheLookup,
+        payload: bytes,
+        *,
+        ttl_seconds: int,
+    ) -> ReadCacheStoreStatus:
+        del ttl_seconds
+        if lookup.generation != self.generation:
+            return ReadCacheStoreStatus.superseded
+        self.payloads[key] = (lookup.generation, payload)
+        return ReadCacheStoreStatus.stored
+
+    async def invalidate_project(self, project_id: str) -> ReadCacheInvalidationStatus:
+        del project_id
+        self.generation = uuid4().hex
+        return ReadCacheInvalidationStatus.invalidated
+
+
+@dataclass(slots=True)
+class Clock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _key(name: str) -> ReadCacheKey:
+    return ReadCacheKey(
+        project_id=PROJECT_ID,
+        operation=ReadCacheOperation.entity,
+        request_digest=read_cache_request_digest(name),
+    )
+
+
+async def _fill(cache: MemoryReadCache, key: ReadCacheKey, payload: bytes) -> None:
+    lookup = await cache.lookup(key)
+    assert not lookup.is_hit
+    assert await cache.store(key, lookup, payload, ttl_seconds=300) is ReadCacheStoreStatus.stored
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_stay_local_until_the_generation_window_lapses(monkeypatch) -> None:
+    events: list[dict[str, str]] = []
+
+    class Counter:
+        def add(self, amount: int, *, attributes: dict[str, str]) -> None:
+            events.append(attributes)
+
+    monkeypatch.setattr(memory.logfire, "metric_counter", lambda name: Counter())
+    shared = SharedCache()
+    clock = Clock()
+    cache = MemoryReadCache(backend=shared, generation_ttl_seconds=1.0, clock=clock)
+
+    await _fill(cache, _key("a"), b"payload")
+    hit = await cache.lookup(_key("a"))
+
+    assert hit.payload == b"payload"
+    assert hit.generation == shared.generation
+    assert shared.lookups == 1
+    assert hit.tier is ReadCacheTier.memory
+    # Hits are counted once, by the read-through layer, from ``lookup.tier``.
+    assert events == []
+
+    # Another worker invalidated the project; once the window lapses this worker sees it.
+    shared.generation = uuid4().hex
+    clock.now = 1.5
+    assert not (await cache.lookup(_key("a"))).is_hit
+    assert shared.lookups == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_local_invalidation_takes_effect_immediately() -> None:
+    shared = SharedCache()
+    cache = MemoryReadCache(backend=shared, clock=Clock())
+    await _fill(cache, _key("a"), b"payload")
+
+    assert await cache.invalidate_project(PROJECT_ID) is ReadCacheInvalidationStatus.invalidated
+
+    assert len(cache) == 0
+    assert not (await cache.lookup(_key("a"))).is_hit
+
+
+@pytest.mark.asyncio
+async def test_shared_hits_are_promoted_and_the_byte_budget_evicts_oldest() -> None:
+    shared = SharedCache()
+    writer = MemoryReadCache(backend=shared, clock=Clock())
+    for name in ("a", "b", "c"):
+        await _fill(writer, _key(name), name.encode() * 4)
+
+    reader = MemoryReadCache(backend=shared, max_bytes=8, clock=Clock())
+    for name in ("a", "b"):
+        assert (await reader.lookup(_key(name))).payload == name.encode() * 4
+    assert reader.total_bytes == 8
+
+    await reader.lookup(_key("a"))  # local hit refreshes "a"
+    await reader.lookup(_key("c"))  # promoting "c" evicts the least recently used "b"
+
+    assert reader.total_bytes == 8
+    lookups = shared.lookups
+    assert (await reader.lookup(_key("a"))).payload == b"aaaa"
+    assert (await reader.lookup(_key("c"))).payload == b"cccc"
+    assert shared.lookups == lookups
+    await reader.lookup(_key("b"))
+    assert shared.lookups == lookups + 1
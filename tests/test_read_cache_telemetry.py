@@ -20,6 +20,7 @@ from basic_memory.read_cache import (
     read_cache_request_digest,
 )
 from basic_memory.read_cache import read_through
+from basic_memory.read_cache.memory import MemoryReadCache
 from basic_memory.read_cache.policy import (
     READ_CACHE_TTL_SECONDS,
     SEARCH_READ_CACHE_TTL_SECONDS,
@@ -154,7 +155,10 @@ async def test_hit_telemetry_reports_lookup_details_without_store(
         "cache.remaining_ttl_seconds": 241.25,
     }
     assert events == [
-        ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "hit"})
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "hit", "tier": "shared"},
+        )
     ]
     assert backend.store_ttls == []
 
@@ -187,12 +191,47 @@ async def test_miss_telemetry_keeps_lookup_and_store_outcomes_separate(
         "cache.payload_bytes": len(payload),
     }
     assert events == [
-        ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "miss"}),
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "miss", "tier": "shared"},
+        ),
         ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "stored"}),
     ]
     assert backend.store_ttls == [300]
 
 
+@pytest.mark.asyncio
+async def test_memory_tier_hits_are_counted_once_with_their_tier(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spans, events = _capture_telemetry(monkeypatch)
+    backend = RecordingCache(lookup_result=ReadCacheLookup(generation=GENERATION))
+    cache = ModelReadCache(
+        backend=MemoryReadCache(backend=backend),
+        model_type=CachedValue,
+        ttl_seconds=300,
+        max_payload_bytes=1_024,
+    )
+
+    async with cache.read(key=_key()) as cached:
+        cached.value = CachedValue(title="authoritative")
+    async with cache.read(key=_key()) as cached:
+        assert cached.value == CachedValue(title="authoritative")
+
+    assert len(spans) == 2
+    assert events == [
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "miss", "tier": "shared"},
+        ),
+        ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "stored"}),
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "hit", "tier": "memory"},
+        ),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_unavailable_lookup_remains_fail_open_and_reports_bypass(
     monkeypatch: pytest.MonkeyPatch,
@@ -278,7 +317,10 @@ async def test_invalid_cached_model_is_terminal_and_remains_fail_fast(
         "cache.remaining_ttl_seconds": 123.5,
     }
     assert events == [
-        ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "corrupt"})
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "corrupt", "tier": "shared"},
+        )
     ]
     assert backend.store_ttls == []
 
@@ -314,7 +356,10 @@ async def test_corrupt_store_error_is_terminal_and_remains_fail_fast(
         "cache.payload_bytes": len(payload),
     }
     assert events == [
-        ("basic_memory_read_cache_events_total", {"operation": "entity", "event": "miss"}),
+        (
+            "basic_memory_read_cache_events_total",
+            {"operation": "entity", "event": "miss", "tier": "shared"},
+        ),
         (
             "basic_memory_read_cache_events_total",
             {"operation": "entity", "event": "store_corrupt"},